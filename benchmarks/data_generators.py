@@ -0,0 +1,98 @@
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.schema import VideoEngagementRecord
+
+BENCHMARK_EPOCH = datetime(2025, 1, 1)
+INSERT_BATCH_SIZE = 10000
+
+
+def make_vocabulary(size: int) -> list[str]:
+    """Synthetic keyword vocabulary kw00000, kw00001, ..."""
+    return [f"kw{idx:05d}" for idx in range(size)]
+
+
+def generate_records(
+    num_records: int,
+    vocabulary_size: int = 2000,
+    keywords_per_video: int = 6,
+    seed: int = 0,
+) -> list[VideoEngagementRecord]:
+    """Synthetic records with long-tailed engagement & Zipf distributed keywords"""
+    rng = np.random.default_rng(seed)
+    vocabulary = make_vocabulary(vocabulary_size)
+    views = rng.lognormal(mean=7.0, sigma=2.0, size=num_records).astype(np.int64)
+    likes = (views * rng.uniform(0.0, 0.1, num_records)).astype(np.int64)
+    comments = (likes * rng.uniform(0.0, 0.2, num_records)).astype(np.int64)
+    age_hours = rng.integers(0, 24 * 365, num_records)
+    keyword_ids = (rng.zipf(1.3, (num_records, keywords_per_video)) - 1) % len(
+        vocabulary
+    )
+
+    return [
+        VideoEngagementRecord(
+            datetime_publish=BENCHMARK_EPOCH + timedelta(hours=int(age_hours[idx])),
+            title=f"Benchmark video {idx}",
+            description=f"Synthetic description {idx}",
+            urls=[f"https://www.youtube.com/watch?v=bench{idx:07d}"],
+            views=int(views[idx]),
+            likes=int(likes[idx]),
+            comments=int(comments[idx]),
+            keywords=[vocabulary[kw] for kw in keyword_ids[idx]],
+        )
+        for idx in range(num_records)
+    ]
+
+
+def populate_database(
+    db_path: Path,
+    num_records: int,
+    seed: int = 0,
+    records: Optional[list[VideoEngagementRecord]] = None,
+) -> DatabaseHandler:
+    """Fresh database of synthetic records, inserted in batches"""
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+    records = records or generate_records(num_records, seed=seed)
+    db_handler = DatabaseHandler(db_path, VideoEngagementRecord)
+    for start in range(0, len(records), INSERT_BATCH_SIZE):
+        with db_handler as db:
+            db.create_many(records[start : start + INSERT_BATCH_SIZE])
+    return db_handler
+
+
+class StubKeyedVectors:
+    """Small in-memory stand-in for gensim KeyedVectors.most_similar().
+
+    Random unit vectors over a synthetic vocabulary, so keyword strategy
+    benchmarks time the strategy itself without downloading a real model.
+    """
+
+    def __init__(self, vocabulary_size: int = 5000, dim: int = 50, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        self._words = make_vocabulary(vocabulary_size)
+        self._index = {word: idx for idx, word in enumerate(self._words)}
+        vectors = rng.standard_normal((vocabulary_size, dim)).astype(np.float32)
+        self._vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    def most_similar(self, word: str, topn: int = 10) -> list[tuple[str, float]]:
+        """Nearest words by cosine similarity, raises KeyError if unknown"""
+        idx = self._index[word]
+        similarity = self._vectors @ self._vectors[idx]
+        similarity[idx] = -np.inf
+        nearest = np.argpartition(-similarity, topn)[:topn]
+        nearest = nearest[np.argsort(-similarity[nearest])]
+        return [(self._words[i], float(similarity[i])) for i in nearest]
+
+
+def random_keywords(
+    num_keywords: int, vocabulary_size: int, seed: int = 0
+) -> list[str]:
+    """Sample of vocabulary words as keyword strategy input"""
+    rand = random.Random(seed)
+    return rand.sample(make_vocabulary(vocabulary_size), num_keywords)
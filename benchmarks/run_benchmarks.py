@@ -0,0 +1,366 @@
+import argparse
+import importlib.util
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from benchmarks.data_generators import (
+    StubKeyedVectors,
+    generate_records,
+    populate_database,
+    random_keywords,
+)
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.keyword_score_handler import (
+    KeywordScoreHandler,
+)
+from video_generation_analysis.database_handler.query_builder import (
+    OrderByType,
+    QueryBuilder,
+    QueryType,
+    WhereComparison,
+    WhereLogical,
+)
+from video_generation_analysis.database_handler.schema import VideoEngagementRecord
+from video_generation_analysis.video_analytics.engagement_analytics import (
+    EngagementAnalytics,
+)
+from video_generation_analysis.video_analytics.keyword_scorer import KeywordScorer
+from video_generation_analysis.video_generator.description_generator import (
+    DescriptionGenerator,
+)
+
+DEFAULT_NUM_RECORDS = 10000
+DEFAULT_REPEATS = 5
+DEFAULT_TOLERANCE = 0.25  # fraction slower than baseline counted as regression
+SINGLE_OPERATIONS = 1000  # single-row creates/updates timed per repeat
+COMPILE_OPERATIONS = 10000
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    num_records: int
+    repeats: int
+    min_seconds: float
+    median_seconds: float
+
+
+@dataclass
+class BenchmarkReport:
+    created_at: str
+    python: str
+    platform: str
+    results: dict[str, BenchmarkResult] = field(default_factory=dict)
+    skipped: dict[str, str] = field(default_factory=dict)
+
+
+class BenchmarkContext:
+    """Shared synthetic data for one record count, generated on first use"""
+
+    def __init__(self, workdir: Path, num_records: int, seed: int = 0) -> None:
+        self.workdir = workdir
+        self.num_records = num_records
+        self.seed = seed
+        self._records: Optional[list[VideoEngagementRecord]] = None
+        self._db_handler: Optional[DatabaseHandler] = None
+        self._fresh_count = 0
+
+    @property
+    def records(self) -> list[VideoEngagementRecord]:
+        if self._records is None:
+            self._records = generate_records(self.num_records, seed=self.seed)
+        return self._records
+
+    @property
+    def db_handler(self) -> DatabaseHandler:
+        """Populated database shared by read-only benchmarks"""
+        if self._db_handler is None:
+            self._db_handler = populate_database(
+                self.workdir / f"populated_{self.num_records}.sqlite",
+                self.num_records,
+                records=self.records,
+            )
+        return self._db_handler
+
+    def fresh_db_path(self) -> Path:
+        self._fresh_count += 1
+        return self.workdir / f"fresh_{self._fresh_count}.sqlite"
+
+
+# benchmark setup runs untimed & returns the operation to time
+Setup = Callable[[BenchmarkContext], Callable[[], Any]]
+
+
+def bench_create_many(ctx: BenchmarkContext) -> Callable[[], Any]:
+    records = ctx.records
+    db_handler = DatabaseHandler(ctx.fresh_db_path(), VideoEngagementRecord)
+
+    def run():
+        with db_handler as db:
+            db.create_many(records)
+
+    return run
+
+
+def bench_create_single(ctx: BenchmarkContext) -> Callable[[], Any]:
+    records = ctx.records[:SINGLE_OPERATIONS]
+    db_handler = DatabaseHandler(ctx.fresh_db_path(), VideoEngagementRecord)
+
+    def run():
+        with db_handler as db:
+            for record in records:
+                db.create(record)
+
+    return run
+
+
+def bench_read_all(ctx: BenchmarkContext) -> Callable[[], Any]:
+    db_handler = ctx.db_handler
+
+    def run():
+        with db_handler as db:
+            return db.read(QueryBuilder())
+
+    return run
+
+
+def bench_read_columns(ctx: BenchmarkContext) -> Callable[[], Any]:
+    db_handler = ctx.db_handler
+    qb = QueryBuilder().select_columns(["id", "views", "likes", "comments"])
+
+    def run():
+        with db_handler as db:
+            return db.read_columns(qb)
+
+    return run
+
+
+def bench_read_top_views(ctx: BenchmarkContext) -> Callable[[], Any]:
+    db_handler = ctx.db_handler
+    qb = (
+        QueryBuilder()
+        .select_columns(["id", "keywords"])
+        .order_by("views", OrderByType.DESCENDING)
+        .limit(10)
+    )
+
+    def run():
+        with db_handler as db:
+            return db.read(qb)
+
+    return run
+
+
+def bench_update_single(ctx: BenchmarkContext) -> Callable[[], Any]:
+    db_handler = ctx.db_handler
+    num_updates = min(SINGLE_OPERATIONS, ctx.num_records)
+
+    def run():
+        with db_handler as db:
+            for record_id in range(1, num_updates + 1):
+                db.update(record_id, {"views": record_id, "likes": 1, "comments": 0})
+
+    return run
+
+
+def bench_query_builder_compile(ctx: BenchmarkContext) -> Callable[[], Any]:
+    def run():
+        for idx in range(COMPILE_OPERATIONS):
+            (
+                QueryBuilder()
+                .select_columns(["id", "views"])
+                .where_compare("views", WhereComparison.GREATER_THAN, idx)
+                .where_logical(WhereLogical.AND)
+                .where_compare("likes", WhereComparison.LESS_THAN, idx)
+                .order_by("views", OrderByType.DESCENDING)
+                .limit(10)
+                .build("videoengagementrecords", QueryType.READ)
+            )
+
+    return run
+
+
+def bench_get_top_keywords_legacy(ctx: BenchmarkContext) -> Callable[[], Any]:
+    generator = DescriptionGenerator(ctx.db_handler, None, None)
+    return lambda: generator.get_top_keywords(num_top_videos=10)
+
+
+def bench_get_top_keywords_scored(ctx: BenchmarkContext) -> Callable[[], Any]:
+    db_handler = ctx.db_handler
+    score_handler = KeywordScoreHandler(db_handler.db_path)
+    now = datetime.now()
+    scores = KeywordScorer().score_records(
+        [
+            VideoEngagementRecord(
+                datetime_publish=record.datetime_publish,
+                views=record.views,
+                likes=record.likes,
+                comments=record.comments,
+                keywords=record.keywords,
+                last_refreshed_at=now,
+            )
+            for record in ctx.records
+        ]
+    )
+    with score_handler as score_db:
+        score_db.replace_scores(scores, now=now)
+    generator = DescriptionGenerator(
+        db_handler, None, None, keyword_score_handler=score_handler
+    )
+    return lambda: generator.get_top_keywords(num_top_videos=10)
+
+
+def bench_engagement_analytics(ctx: BenchmarkContext) -> Callable[[], Any]:
+    analytics = EngagementAnalytics(ctx.db_handler)
+
+    def run():
+        analytics.load()
+        analytics.engagement_rate_percentiles()
+        return analytics.top_keywords(20)
+
+    return run
+
+
+def bench_keyword_gensim_generate(ctx: BenchmarkContext) -> Callable[[], Any]:
+    from video_generation_analysis.video_generator.keyword_gensim_strategy import (
+        KeywordGensimStrategy,
+    )
+
+    strategy = KeywordGensimStrategy(model=StubKeyedVectors(seed=ctx.seed))
+    keywords = random_keywords(20, vocabulary_size=5000, seed=ctx.seed)
+    return lambda: strategy.generate(keywords, min_length=6, max_length=6)
+
+
+BENCHMARKS: dict[str, Setup] = {
+    "db_create_many": bench_create_many,
+    "db_create_single": bench_create_single,
+    "db_read_all": bench_read_all,
+    "db_read_columns": bench_read_columns,
+    "db_read_top_views": bench_read_top_views,
+    "db_update_single": bench_update_single,
+    "query_builder_compile": bench_query_builder_compile,
+    "get_top_keywords_legacy": bench_get_top_keywords_legacy,
+    "get_top_keywords_scored": bench_get_top_keywords_scored,
+    "engagement_analytics": bench_engagement_analytics,
+    "keyword_gensim_generate": bench_keyword_gensim_generate,
+}
+
+# benchmarks needing optional packages, skipped when not installed
+REQUIRED_MODULES = {"keyword_gensim_generate": "gensim"}
+
+
+def time_benchmark(
+    name: str, setup: Setup, ctx: BenchmarkContext, repeats: int
+) -> BenchmarkResult:
+    """Run setup then time operation, repeats times"""
+    timings = []
+    for _ in range(repeats):
+        operation = setup(ctx)
+        start = time.perf_counter()
+        operation()
+        timings.append(time.perf_counter() - start)
+    return BenchmarkResult(
+        name=name,
+        num_records=ctx.num_records,
+        repeats=repeats,
+        min_seconds=min(timings),
+        median_seconds=statistics.median(timings),
+    )
+
+
+def run_benchmarks(
+    workdir: Path,
+    sizes: list[int],
+    names: Optional[list[str]] = None,
+    repeats: int = DEFAULT_REPEATS,
+    seed: int = 0,
+) -> BenchmarkReport:
+    """Run selected benchmarks for each record count, keyed 'name[size]'"""
+    logger = logging.getLogger(__name__)
+    report = BenchmarkReport(
+        created_at=datetime.now().isoformat(),
+        python=platform.python_version(),
+        platform=platform.platform(),
+    )
+    for num_records in sizes:
+        ctx = BenchmarkContext(workdir, num_records, seed=seed)
+        for name in names or BENCHMARKS:
+            key = f"{name}[{num_records}]"
+            module = REQUIRED_MODULES.get(name)
+            if module and importlib.util.find_spec(module) is None:
+                report.skipped[key] = f"{module} not installed"
+                continue
+            result = time_benchmark(name, BENCHMARKS[name], ctx, repeats)
+            report.results[key] = result
+            logger.info(f"{key}: median {result.median_seconds:.4f}s")
+    return report
+
+
+def compare_to_baseline(
+    report: BenchmarkReport,
+    baseline: dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> dict[str, float]:
+    """Benchmarks slower than baseline by over tolerance, as slowdown ratios"""
+    regressions = {}
+    for key, result in report.results.items():
+        baseline_result = baseline.get("results", {}).get(key)
+        if baseline_result is None or baseline_result["min_seconds"] <= 0:
+            continue
+        # min is least affected by noise from other processes
+        ratio = result.min_seconds / baseline_result["min_seconds"]
+        if ratio > 1 + tolerance:
+            regressions[key] = round(ratio, 3)
+    return regressions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run performance benchmarks")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[DEFAULT_NUM_RECORDS],
+        help="Record counts to benchmark, e.g. 10000 100000 1000000",
+    )
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), default=None)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--output", type=Path, default=None, help="Results JSON")
+    parser.add_argument("--baseline", type=Path, default=None, help="Baseline JSON")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    return parser.parse_args()
+
+
+def main() -> int:
+    logging.basicConfig(level=logging.INFO)
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as workdir:
+        report = run_benchmarks(Path(workdir), args.sizes, args.only, args.repeats)
+
+    results = json.dumps(asdict(report), indent=2)
+    if args.output:
+        args.output.write_text(results)
+    else:
+        print(results)
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare_to_baseline(report, baseline, args.tolerance)
+        for key, ratio in regressions.items():
+            print(f"REGRESSION {key}: {ratio}x baseline", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
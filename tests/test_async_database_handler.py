@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+from video_generation_analysis.database_handler.async_database_handler import (
+    AsyncDatabaseHandler,
+)
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.query_builder import (
+    QueryBuilder,
+    WhereComparison,
+)
+from video_generation_analysis.database_handler.schema import VideoEngagementRecord
+
+
+@pytest.fixture
+def db_handler(tmp_path):
+    return DatabaseHandler(tmp_path / "async.sqlite", VideoEngagementRecord)
+
+
+def make_records(count):
+    return [
+        VideoEngagementRecord(title=f"Video {idx}", views=idx, keywords=["kw"])
+        for idx in range(count)
+    ]
+
+
+def test_create_read_update_delete(db_handler):
+    async def scenario():
+        async with AsyncDatabaseHandler(db_handler) as db:
+            await db.create(VideoEngagementRecord(title="Single", keywords=["a"]))
+            await db.create_many(make_records(3))
+            records = await db.read(QueryBuilder())
+            await db.update(records[0].id, {"title": "Updated"})
+            await db.delete(
+                QueryBuilder().where_compare("title", WhereComparison.EQUAL, "Video 0")
+            )
+            return await db.read(QueryBuilder().select_columns(["id", "title"]))
+
+    records = asyncio.run(scenario())
+
+    assert [record.title for record in records] == ["Updated", "Video 1", "Video 2"]
+
+
+def test_concurrent_writes_serialized_and_reads_concurrent(db_handler):
+    async def scenario():
+        async with AsyncDatabaseHandler(db_handler, num_readers=3) as db:
+            await asyncio.gather(*(db.create_many(make_records(20)) for _ in range(10)))
+            counts = await asyncio.gather(
+                *(
+                    db.read_columns(QueryBuilder().select_columns("id"))
+                    for _ in range(6)
+                )
+            )
+            return [len(columns["id"]) for columns in counts]
+
+    assert asyncio.run(scenario()) == [200] * 6
+
+
+def test_event_loop_not_blocked_by_queries(db_handler):
+    async def scenario():
+        ticks = 0
+        done = asyncio.Event()
+
+        async def ticker():
+            nonlocal ticks
+            while not done.is_set():
+                ticks += 1
+                await asyncio.sleep(0)
+
+        async with AsyncDatabaseHandler(db_handler) as db:
+            ticker_task = asyncio.create_task(ticker())
+            await db.create_many(make_records(20000))
+            await db.read(QueryBuilder())
+            done.set()
+            await ticker_task
+        return ticks
+
+    assert asyncio.run(scenario()) > 10
+
+
+def test_transaction_rolls_back_on_error(db_handler):
+    async def scenario():
+        async with AsyncDatabaseHandler(db_handler) as db:
+
+            def failing(sync_db):
+                sync_db.create_many(make_records(5))
+                raise ValueError("Simulated Rollback")
+
+            with pytest.raises(ValueError):
+                await db.transaction(failing)
+            return await db.read(QueryBuilder())
+
+    assert asyncio.run(scenario()) == []
+
+
+def test_operation_outside_context_raises(db_handler):
+    with pytest.raises(RuntimeError):
+        asyncio.run(AsyncDatabaseHandler(db_handler).read(QueryBuilder()))
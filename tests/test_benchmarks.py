@@ -0,0 +1,53 @@
+from benchmarks.data_generators import StubKeyedVectors, generate_records
+from benchmarks.run_benchmarks import (
+    BenchmarkReport,
+    BenchmarkResult,
+    compare_to_baseline,
+    run_benchmarks,
+)
+
+
+def test_generate_records_deterministic():
+    records = generate_records(50, vocabulary_size=100, seed=3)
+
+    assert len(records) == 50
+    assert records == generate_records(50, vocabulary_size=100, seed=3)
+    assert all(len(record.keywords) == 6 for record in records)
+    assert all(record.likes <= record.views for record in records)
+
+
+def test_stub_keyed_vectors_most_similar():
+    model = StubKeyedVectors(vocabulary_size=200, dim=8)
+
+    similar = model.most_similar("kw00001", topn=5)
+
+    assert len(similar) == 5
+    assert "kw00001" not in [word for word, _ in similar]
+    scores = [score for _, score in similar]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_run_benchmarks_small(tmp_path):
+    report = run_benchmarks(
+        tmp_path, sizes=[200], names=["db_create_many", "db_read_all"], repeats=1
+    )
+
+    assert set(report.results) == {"db_create_many[200]", "db_read_all[200]"}
+    assert report.results["db_read_all[200]"].min_seconds > 0
+
+
+def test_compare_to_baseline_flags_regressions():
+    report = BenchmarkReport(created_at="", python="", platform="")
+    report.results = {
+        "fast[10]": BenchmarkResult("fast", 10, 1, 1.0, 1.0),
+        "slow[10]": BenchmarkResult("slow", 10, 1, 2.0, 2.0),
+        "new[10]": BenchmarkResult("new", 10, 1, 5.0, 5.0),
+    }
+    baseline = {
+        "results": {
+            "fast[10]": {"min_seconds": 1.1},
+            "slow[10]": {"min_seconds": 1.0},
+        }
+    }
+
+    assert compare_to_baseline(report, baseline, tolerance=0.25) == {"slow[10]": 2.0}
@@ -0,0 +1,132 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.schema import VideoEngagementRecord
+from video_generation_analysis.video_analytics.candidate_scorer import CandidateScorer
+from video_generation_analysis.video_analytics.video_analytics import VideoAnalytics
+from video_generation_analysis.video_generator.description_generator import (
+    DescriptionGenerator,
+)
+
+PUBLISHED = datetime(2024, 1, 1)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = PUBLISHED + timedelta(days=30)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture
+def db_handler(tmp_path):
+    db_handler = DatabaseHandler(tmp_path / "videos.sqlite", VideoEngagementRecord)
+    with db_handler as db:
+        db.create_many(
+            [
+                video(["dragon", "neon"], views=5000),
+                video(["dragon", "city"], views=4000),
+                video(["forest", "city"], views=50),
+                video(["forest", "rain"], views=20),
+                VideoEngagementRecord(keywords=["unrefreshed"], views=-1),
+            ]
+        )
+    return db_handler
+
+
+def video(keywords: list[str], views: int) -> VideoEngagementRecord:
+    return VideoEngagementRecord(
+        datetime_publish=PUBLISHED,
+        views=views,
+        likes=0,
+        comments=0,
+        keywords=keywords,
+        last_refreshed_at=PUBLISHED + timedelta(days=10),
+    )
+
+
+def test_fit_learns_keyword_weights(db_handler):
+    scorer = CandidateScorer(alpha=0.1, page_size=2)
+
+    assert scorer.fit(db_handler) == 4
+
+    scores = scorer.score([["Dragon"], ["forest"], ["never", "seen"]])
+    assert scores[0] > scores[2] > scores[1]
+
+
+def test_rank_best_first_ties_keep_order(db_handler):
+    scorer = CandidateScorer(alpha=0.1)
+
+    assert scorer.rank(db_handler, [["forest"], ["neon", "dragon"], ["city"]]) == [
+        1,
+        2,
+        0,
+    ]
+    assert scorer.rank(db_handler, [["a"], ["b"], ["c"]]) == [0, 1, 2]
+
+
+def test_rank_refits_when_stale(db_handler):
+    clock = Clock()
+    scorer = CandidateScorer(refit_hours=24, clock=clock)
+    scorer.rank(db_handler, [["dragon"]])
+    fitted_at = scorer.fitted_at
+
+    clock.now += timedelta(hours=23)
+    scorer.rank(db_handler, [["dragon"]])
+    assert scorer.fitted_at == fitted_at
+
+    clock.now += timedelta(hours=1)
+    scorer.rank(db_handler, [["dragon"]])
+    assert scorer.fitted_at == clock.now
+
+
+def test_keyword_candidates_distinct():
+    top_keywords = ["dragon", "neon", "city", "forest", "rain", "ocean"]
+    keyword_strategy = MagicMock()
+    keyword_strategy.generate.side_effect = lambda keywords, **_: " ".join(
+        sorted(keywords)[:2]
+    )
+    description_generator = DescriptionGenerator(
+        db_handler=MagicMock(),
+        keyword_strategy=keyword_strategy,
+        description_strategy=MagicMock(),
+    )
+
+    candidates = description_generator.generate_keyword_candidates(
+        num_candidates=5, num_new_keywords=2, prompt=" ".join(top_keywords), seed=1
+    )
+
+    assert candidates[0] == ["city", "dragon"]  # all top keywords expanded first
+    assert 1 < len(candidates) <= 5
+    assert len({frozenset(keywords) for keywords in candidates}) == len(candidates)
+
+
+def test_only_best_scored_candidate_described(db_handler):
+    description_generator = MagicMock()
+    description_generator.generate_keyword_candidates.return_value = [
+        ["forest", "rain"],
+        ["neon", "dragon"],
+        ["city"],
+    ]
+    description_generator.describe.return_value = ("Neon dragon", "A neon dragon")
+    video_generator = MagicMock()
+    video_generator.create_video.return_value = None  # stop after describing
+    video_analytics = VideoAnalytics(
+        db_handler=db_handler,
+        description_generator=description_generator,
+        video_generator=video_generator,
+        video_platforms=MagicMock(),
+        candidate_scorer=CandidateScorer(alpha=0.1),
+        num_candidates=3,
+    )
+
+    with pytest.raises(ValueError):
+        video_analytics.generate_video(num_top_videos=5)
+
+    description_generator.describe.assert_called_once_with(["neon", "dragon"])
+    description_generator.generate_description.assert_not_called()
+    video_generator.create_video.assert_called_once_with("A neon dragon")
@@ -0,0 +1,253 @@
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from video_generation_analysis.video_platforms_handler.circuit_breaker import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    CircuitBreaker,
+)
+from video_generation_analysis.video_platforms_handler.platform_api_bridge import (
+    PlatformApiBridge,
+    PlatformError,
+    VideoEngagement,
+)
+from video_generation_analysis.video_platforms_handler.quota_manager import (
+    QuotaExceededError,
+)
+from video_generation_analysis.video_platforms_handler.video_platforms_handler import (
+    PlatformUnavailableError,
+    VideoPlatformsFacade,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeBridge(PlatformApiBridge):
+    def __init__(self, name: str, clock: FakeClock, latency: float = 0.0) -> None:
+        self.name = name
+        self.clock = clock
+        self.latency = latency
+        self.error: Optional[Exception] = None
+        self.calls = 0
+
+    def _call(self) -> None:
+        self.calls += 1
+        self.clock.now += self.latency
+        if self.error is not None:
+            raise self.error
+
+    def publish_video(self, video_path, title, description, tags) -> Optional[str]:
+        self._call()
+        return f"https://{self.name}/{title}"
+
+    def get_engagement_metrics(self, video_url: str) -> Optional[VideoEngagement]:
+        self._call()
+        return VideoEngagement(views=10, likes=2, comments=1)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_breaker_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker("yt", failure_threshold=3, clock=clock)
+
+    for _ in range(2):
+        breaker.record(False, 0.1)
+    breaker.record(True, 0.1)  # success resets the count
+    for _ in range(2):
+        breaker.record(False, 0.1)
+    assert breaker.state == CIRCUIT_CLOSED
+
+    breaker.record(False, 0.1)
+    assert breaker.state == CIRCUIT_OPEN
+    assert not breaker.allow()
+
+
+def test_breaker_half_open_allows_single_probe(clock):
+    breaker = CircuitBreaker(
+        "yt", failure_threshold=1, reset_timeout_seconds=60, clock=clock
+    )
+    breaker.record(False, 0.1)
+
+    clock.now = 60
+    assert breaker.state == CIRCUIT_HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()  # probe already in flight
+
+    breaker.record(False, 0.1)
+    assert breaker.state == CIRCUIT_OPEN  # failed probe reopens
+    clock.now = 120
+    assert breaker.allow()
+    breaker.record(True, 0.1)
+    assert breaker.state == CIRCUIT_CLOSED
+    assert breaker.allow()
+
+
+def test_breaker_health(clock):
+    breaker = CircuitBreaker("yt", window=4, clock=clock)
+    for success, latency in [(False, 9.0), (True, 1.0), (False, 3.0), (True, 1.0)]:
+        breaker.record(success, latency)
+    breaker.record(True, 3.0)  # oldest call leaves the window
+
+    health = breaker.health()
+
+    assert health.calls == 5
+    assert health.failures == 2
+    assert health.error_rate == 0.25
+    assert health.mean_latency_seconds == 2.0
+
+
+def test_publish_skips_open_platform_and_defers(clock, tmp_path):
+    healthy, broken = FakeBridge("a", clock), FakeBridge("b", clock)
+    broken.error = ConnectionError("down")
+    facade = VideoPlatformsFacade([healthy, broken], failure_threshold=2, clock=clock)
+    for _ in range(2):
+        with pytest.raises(PlatformError):
+            facade.publish_to_all(Path("v.mp4"), "t", "d", [])
+    published = []
+
+    with pytest.raises(PlatformUnavailableError):
+        facade.publish_to_all(
+            Path("v.mp4"),
+            "t",
+            "d",
+            [],
+            on_published=lambda idx, url: published.append((idx, url)),
+        )
+
+    assert broken.calls == 2  # not called once open
+    assert published == [(0, "https://a/t")]
+    assert [health.state for health in facade.health()] == [
+        CIRCUIT_CLOSED,
+        CIRCUIT_OPEN,
+    ]
+
+
+def test_publish_continues_past_failing_platform(clock):
+    broken, healthy = FakeBridge("a", clock), FakeBridge("b", clock)
+    broken.error = ConnectionError("down")
+    facade = VideoPlatformsFacade([broken, healthy], failure_threshold=5, clock=clock)
+    published = []
+
+    with pytest.raises(PlatformError, match="0:FakeBridge"):
+        facade.publish_to_all(
+            Path("v.mp4"),
+            "t",
+            "d",
+            [],
+            on_published=lambda idx, url: published.append((idx, url)),
+        )
+
+    assert published == [(1, "https://b/t")]
+    assert [health.failures for health in facade.health()] == [1, 0]
+
+
+def test_metrics_none_while_platform_unavailable(clock):
+    healthy, broken = FakeBridge("a", clock), FakeBridge("b", clock)
+    facade = VideoPlatformsFacade(
+        [healthy, broken], failure_threshold=1, reset_timeout_seconds=60, clock=clock
+    )
+    broken.error = PlatformError("HTTP 503")
+
+    assert facade.get_engagement_metrics_all(["a/1", "b/1"]) is None
+    assert facade.get_engagement_metrics_batch([["a/1", "b/1"]]) == [None]
+    assert broken.calls == 1
+
+    broken.error = None
+    clock.now += 60
+    engagement = facade.get_engagement_metrics_all(["a/1", "b/1"])
+
+    assert engagement == VideoEngagement(views=20, likes=4, comments=2)
+    assert facade.health()[1].state == CIRCUIT_CLOSED
+
+
+def test_slow_metrics_calls_count_as_failures(clock):
+    slow = FakeBridge("a", clock, latency=5.0)
+    facade = VideoPlatformsFacade(
+        [slow], failure_threshold=2, slow_call_seconds=1.0, clock=clock
+    )
+
+    for _ in range(2):
+        assert facade.get_engagement_metrics_all(["a/1"]) is not None
+
+    (health,) = facade.health()
+    assert health.state == CIRCUIT_OPEN
+    assert health.mean_latency_seconds == 5.0
+    assert facade.get_engagement_metrics_all(["a/1"]) is None
+
+
+def test_quota_exhaustion_does_not_open_circuit(clock):
+    bridge = FakeBridge("a", clock)
+    bridge.error = QuotaExceededError("quota")
+    facade = VideoPlatformsFacade([bridge], failure_threshold=1, clock=clock)
+
+    with pytest.raises(QuotaExceededError):
+        facade.get_engagement_metrics_all(["a/1"])
+
+    assert facade.health()[0].state == CIRCUIT_CLOSED
+
+
+def test_quota_exhaustion_releases_probe_without_outcome(clock):
+    bridge = FakeBridge("a", clock)
+    facade = VideoPlatformsFacade(
+        [bridge], failure_threshold=1, reset_timeout_seconds=60, clock=clock
+    )
+    bridge.error = PlatformError("HTTP 503")
+    assert facade.get_engagement_metrics_all(["a/1"]) is None
+    clock.now += 60
+
+    bridge.error = QuotaExceededError("quota")
+    with pytest.raises(QuotaExceededError):
+        facade.get_engagement_metrics_all(["a/1"])
+
+    (health,) = facade.health()
+    assert health.state == CIRCUIT_HALF_OPEN  # not closed without a real probe
+    assert health.calls == 1
+    bridge.error = None
+    assert facade.get_engagement_metrics_all(["a/1"]) is not None  # probe free
+    assert facade.health()[0].state == CIRCUIT_CLOSED
+
+
+def test_publish_defers_platform_out_of_quota(clock):
+    healthy, spent = FakeBridge("a", clock), FakeBridge("b", clock)
+    spent.error = QuotaExceededError("quota")
+    facade = VideoPlatformsFacade([healthy, spent], failure_threshold=1, clock=clock)
+    published = []
+
+    with pytest.raises(PlatformUnavailableError):
+        facade.publish_to_all(
+            Path("v.mp4"),
+            "t",
+            "d",
+            [],
+            on_published=lambda idx, url: published.append((idx, url)),
+        )
+
+    assert published == [(0, "https://a/t")]
+    assert [health.calls for health in facade.health()] == [1, 0]
+    assert facade.health()[1].state == CIRCUIT_CLOSED
+
+
+def test_metrics_skip_platforms_without_url(clock):
+    first, second = FakeBridge("a", clock), FakeBridge("b", clock)
+    facade = VideoPlatformsFacade([first, second], failure_threshold=1, clock=clock)
+
+    assert facade.get_engagement_metrics_all(["a/1"]) == VideoEngagement(
+        views=10, likes=2, comments=1
+    )
+    totals = facade.get_engagement_metrics_batch([["a/1", "b/1"], ["a/2"]])
+
+    assert [total.views for total in totals] == [20, 10]
+    assert second.calls == 1
+    assert [health.failures for health in facade.health()] == [0, 0]
@@ -0,0 +1,184 @@
+import multiprocessing
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.query_builder import QueryBuilder
+from video_generation_analysis.database_handler.schema import VideoEngagementRecord
+from video_generation_analysis.telemetry.telemetry import Telemetry
+
+STRESS_SECONDS = 2.0
+NUM_READERS = 3
+BATCH_SIZE = 10
+MIN_OPS_PER_PROCESS = 20
+
+
+def _make_records(batch: int) -> list[VideoEngagementRecord]:
+    return [
+        VideoEngagementRecord(title=f"Video {batch}-{idx}", views=idx, keywords=["kw"])
+        for idx in range(BATCH_SIZE)
+    ]
+
+
+def _writer(db_path: str, duration: float, results) -> None:
+    handler = DatabaseHandler(Path(db_path), VideoEngagementRecord)
+    ops = errors = 0
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        try:
+            with handler as db:
+                db.create_many(_make_records(ops))
+            ops += 1
+        except sqlite3.Error:
+            errors += 1
+    results.put(("writer", ops, errors))
+
+
+def _reader(db_path: str, duration: float, results) -> None:
+    handler = DatabaseHandler(Path(db_path), VideoEngagementRecord)
+    ops = errors = 0
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        try:
+            with handler as db:
+                db.read_columns(QueryBuilder().select_columns(["id", "views"]))
+            ops += 1
+        except sqlite3.Error:
+            errors += 1
+    results.put(("reader", ops, errors))
+
+
+def test_wal_readers_and_writer_run_concurrently(tmp_path):
+    db_path = tmp_path / "stress.sqlite"
+    with DatabaseHandler(db_path, VideoEngagementRecord):
+        pass  # create table & switch to WAL before workers start
+
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    processes = [
+        context.Process(target=_writer, args=(str(db_path), STRESS_SECONDS, results))
+    ] + [
+        context.Process(target=_reader, args=(str(db_path), STRESS_SECONDS, results))
+        for _ in range(NUM_READERS)
+    ]
+    for process in processes:
+        process.start()
+    outcomes = [results.get(timeout=60) for _ in processes]
+    for process in processes:
+        process.join(timeout=10)
+
+    assert all(errors == 0 for _, _, errors in outcomes), outcomes
+    assert all(ops >= MIN_OPS_PER_PROCESS for _, ops, _ in outcomes), outcomes
+
+    writer_ops = next(ops for role, ops, _ in outcomes if role == "writer")
+    with DatabaseHandler(db_path, VideoEngagementRecord) as db:
+        rows = db.read_columns(QueryBuilder().select_columns("id"))
+    assert len(rows["id"]) == writer_ops * BATCH_SIZE
+
+
+def test_read_not_blocked_by_open_write_transaction(tmp_path):
+    db_path = tmp_path / "wal.sqlite"
+    writer = DatabaseHandler(db_path, VideoEngagementRecord)
+    reader = DatabaseHandler(db_path, VideoEngagementRecord, busy_timeout_ms=100)
+    read_results = []
+
+    def read():
+        with reader as db:
+            read_results.append(len(db.read(QueryBuilder())))
+
+    with writer as db:
+        db.create(VideoEngagementRecord(title="Uncommitted"))
+        thread = threading.Thread(target=read)
+        thread.start()
+        thread.join(timeout=5)
+
+    assert read_results == [0]  # read committed snapshot without waiting
+
+
+def test_busy_statement_retried_with_backoff(tmp_path):
+    handler = DatabaseHandler(
+        tmp_path / "retry.sqlite",
+        VideoEngagementRecord,
+        max_retries=3,
+        retry_backoff_seconds=0.001,
+    )
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise sqlite3.OperationalError("database is locked")
+        return "done"
+
+    telemetry = Telemetry(enabled=True)
+    with telemetry.span("write") as span:
+        assert handler._with_retry(flaky) == "done"
+    assert len(attempts) == 3
+    assert span.counters == {"retries": 2}
+
+    def not_busy():
+        attempts.append(1)
+        raise sqlite3.OperationalError("no such table")
+
+    with pytest.raises(sqlite3.OperationalError):
+        handler._with_retry(not_busy)
+    assert len(attempts) == 4  # not retried
+
+
+def test_stale_read_then_write_raises_without_retry(tmp_path, caplog):
+    db_path = tmp_path / "snapshot.sqlite"
+    handler = DatabaseHandler(db_path, VideoEngagementRecord, max_retries=3)
+    other = DatabaseHandler(db_path, VideoEngagementRecord)
+
+    with pytest.raises(sqlite3.OperationalError):
+        with handler as db:
+            db._execute("BEGIN")  # deferred, as if a read opened the transaction
+            db.read(QueryBuilder())
+            with other as other_db:
+                other_db.create(VideoEngagementRecord(title="Meanwhile"))
+            db.create(VideoEngagementRecord(title="Stale"))
+
+    assert "DatabaseHandler busy" not in caplog.text  # not retried
+    with handler as db:
+        titles = [record.title for record in db.read(QueryBuilder())]
+    assert titles == ["Meanwhile"]
+
+
+def test_read_then_write_under_begin_immediate_serialized(tmp_path):
+    db_path = tmp_path / "counter.sqlite"
+    with DatabaseHandler(db_path, VideoEngagementRecord):
+        pass
+    errors = []
+
+    def increment():
+        handler = DatabaseHandler(db_path, VideoEngagementRecord)
+        try:
+            for _ in range(10):
+                with handler as db:
+                    db.begin_immediate()
+                    count = len(
+                        db.read_columns(QueryBuilder().select_columns("id"))["id"]
+                    )
+                    db.create(VideoEngagementRecord(title=f"Video {count}"))
+        except sqlite3.Error as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=increment) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    with DatabaseHandler(db_path, VideoEngagementRecord) as db:
+        titles = db.read_columns(QueryBuilder().select_columns("title"))["title"]
+    assert not errors
+    assert sorted(titles) == sorted(f"Video {idx}" for idx in range(40))
+
+
+def test_invalid_journal_mode_raises(tmp_path):
+    with pytest.raises(ValueError):
+        DatabaseHandler(tmp_path / "x.sqlite", VideoEngagementRecord, "WAL; DROP")
@@ -194,3 +194,121 @@ class TestDatabaseHandler(unittest.TestCase):
         with self.handler as db:
             with self.assertRaises(TypeError):
                 db.create({"title": "dict", "views": 1})
+
+    def test_create_many(self):
+        with self.handler as db:
+            db.create_many([self.TEST_RECORD_A, self.TEST_RECORD_B])
+            results = db.read(QueryBuilder())
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[1].title, self.TEST_RECORD_B.title)
+        self.assertEqual(results[1].urls, self.TEST_RECORD_B.urls)
+
+    def test_create_returns_id(self):
+        with self.handler as db:
+            first_id = db.create(self.TEST_RECORD_A)
+            second_id = db.create(self.TEST_RECORD_B)
+
+        self.assertEqual((first_id, second_id), (1, 2))
+
+    def test_read_columns(self):
+        with self.handler as db:
+            db.create_many([self.TEST_RECORD_A, self.TEST_RECORD_B])
+            qb = QueryBuilder().select_columns(["title", "views"])
+            columns = db.read_columns(qb)
+
+        self.assertEqual(columns["title"], ["Test Video A", "Test Video B"])
+        self.assertEqual(columns["views"], ["1000", "2000"])
+
+    def test_existing_table_migrated_with_new_columns(self):
+        conn = self._get_raw_connection()
+        conn.execute(
+            f"CREATE TABLE {self.TABLE_NAME} (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "title TEXT)"
+        )
+        conn.execute(f"INSERT INTO {self.TABLE_NAME} (title) VALUES ('Old Video')")
+        conn.commit()
+        conn.close()
+
+        with self.handler as db:
+            db.create(self.TEST_RECORD_A)
+            results = db.read(QueryBuilder().select_columns(["title", "views"]))
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0].title, "Old Video")
+        self.assertEqual(results[1].views, str(self.TEST_RECORD_A.views))
+
+    def test_persistent_handler_reuses_connection(self):
+        handler = DatabaseHandler(self.DB_PATH, VideoEngagementRecord, persistent=True)
+        with handler as db:
+            db.create(self.TEST_RECORD_A)
+            first_conn = db._conn
+        with handler as db:
+            db.create(self.TEST_RECORD_B)
+            second_conn = db._conn
+            results = db.read(QueryBuilder())
+        handler.close()
+
+        self.assertIs(first_conn, second_conn)
+        self.assertEqual(len(results), 2)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            first_conn.execute("SELECT 1")
+
+    def test_read_where_in_chunked(self):
+        with self.handler as db:
+            db.create_many([self.TEST_RECORD_A, self.TEST_RECORD_B] * 600)
+            ids = list(range(1, 1201, 2))
+            qb = QueryBuilder().select_columns("id").where_in("id", ids * 2)
+            results = db.read(qb)
+            columns = db.read_columns(qb)
+
+        self.assertEqual([result.id for result in results], ids)
+        self.assertEqual(columns["id"], ids)
+
+    def test_read_pages_keyset(self):
+        with self.handler as db:
+            db.create_many([self.TEST_RECORD_A, self.TEST_RECORD_B] * 5)
+            qb = QueryBuilder().select_columns(["id", "title"])
+            pages = list(db.read_pages(qb, page_size=4))
+
+        self.assertEqual([len(page) for page in pages], [4, 4, 2])
+        self.assertEqual(
+            [record.id for page in pages for record in page], list(range(1, 11))
+        )
+
+    def test_aggregate_group_by(self):
+        with self.handler as db:
+            db.create_many([self.TEST_RECORD_A, self.TEST_RECORD_B, self.TEST_RECORD_B])
+            qb = QueryBuilder().group_by("title").count().sum("views").order_by("title")
+            rows = db.aggregate(qb)
+
+        self.assertEqual(
+            rows,
+            [
+                {"title": "Test Video A", "count": 1, "sum_views": 1000},
+                {"title": "Test Video B", "count": 2, "sum_views": 4000},
+            ],
+        )
+
+    def test_track_revisions_in_write_order(self):
+        with self.handler as db:
+            db.create(self.TEST_RECORD_A)
+            db.track_revisions()
+            db.create_many([self.TEST_RECORD_A, self.TEST_RECORD_B])
+            db.update(1, {"views": 1})
+            db.update(2, {"views": 2})
+            qb = QueryBuilder().select_columns(["id", "revision"]).order_by("id")
+            revisions = db.read_columns(qb)["revision"]
+
+        self.assertEqual(revisions, [4, 5, 3])  # first backfilled when tracked
+
+    def test_track_revisions_never_reuses_deleted_revision(self):
+        with self.handler as db:
+            db.track_revisions()
+            db.create_many([self.TEST_RECORD_A, self.TEST_RECORD_B])
+            db.delete(QueryBuilder().where_compare("id", WhereComparison.EQUAL, 2))
+            db.update(1, {"views": 1})
+            qb = QueryBuilder().select_columns("revision")
+            revisions = db.read_columns(qb)["revision"]
+
+        self.assertEqual(revisions, [3])
@@ -3,6 +3,9 @@ import unittest
 from datetime import datetime
 
 from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.keyword_score_handler import (
+    KeywordScoreHandler,
+)
 from video_generation_analysis.database_handler.schema import VideoEngagementRecord
 from video_generation_analysis.video_generator.description_generator import (
     DescriptionGenerator,
@@ -64,6 +67,21 @@ class TestDescriptionGenerator(unittest.TestCase):
 
         self.assertEqual(result_keywords, expected_keywords)
 
+    def test_get_top_keywords_from_keyword_scores(self):
+        keyword_score_handler = KeywordScoreHandler(self.DB_PATH)
+        with keyword_score_handler as score_db:
+            score_db.add_scores({"maximum": 50.0, "python": 10.0, "games": 80.0})
+        description_generator = DescriptionGenerator(
+            db_handler=self._db_handler,
+            keyword_strategy=self.KEYWORD_STRATEGY,
+            description_strategy=self.DESCRIPTION_STRATEGY,
+            keyword_score_handler=keyword_score_handler,
+        )
+
+        result_keywords = description_generator.get_top_keywords(num_top_videos=2)
+
+        self.assertEqual(result_keywords, ["games", "maximum", "python"])
+
     def test_generate_description_no_prompt(self):
         description_generator = DescriptionGenerator(
             db_handler=self._db_handler,
@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.schema import VideoEngagementRecord
+from video_generation_analysis.video_analytics.engagement_analytics import (
+    EngagementAnalytics,
+)
+
+NOW = datetime(2025, 11, 25, 12, 0, 0)
+WEIGHTS = {"views": 1.0, "likes": 10.0, "comments": 20.0}
+
+
+@pytest.fixture
+def analytics(tmp_path):
+    db_handler = DatabaseHandler(tmp_path / "analytics.sqlite", VideoEngagementRecord)
+    records = [
+        VideoEngagementRecord(
+            datetime_publish=NOW - timedelta(days=1),
+            views=1000,
+            likes=100,
+            comments=0,
+            keywords=["python", "tutorial", "python"],
+        ),
+        VideoEngagementRecord(
+            datetime_publish=NOW - timedelta(days=10),
+            views=1000,
+            likes=0,
+            comments=10,
+            keywords=["gaming"],
+        ),
+        VideoEngagementRecord(
+            datetime_publish=NOW - timedelta(days=2),
+            views=0,
+            likes=0,
+            comments=0,
+            keywords=["python"],
+        ),
+    ]
+    with db_handler as db:
+        db.create_many(records)
+    return EngagementAnalytics(db_handler)
+
+
+def test_load_builds_csr_keywords(analytics):
+    columns = analytics.load()
+
+    assert len(columns) == 3
+    assert columns.vocabulary == ["python", "tutorial", "gaming"]
+    assert columns.keyword_indptr.tolist() == [0, 2, 3, 4]
+    assert columns.keyword_indices.tolist() == [0, 1, 2, 0]
+    assert columns.views.tolist() == [1000.0, 1000.0, 0.0]
+
+
+def test_engagement_rate_and_percentiles(analytics):
+    assert analytics.engagement_rate().tolist() == [0.1, 0.01, 0.0]
+
+    percentiles = analytics.engagement_rate_percentiles([0, 50, 100])
+
+    assert percentiles[0] == pytest.approx(0.01)
+    assert percentiles[50] == pytest.approx(0.055)
+    assert percentiles[100] == pytest.approx(0.1)
+
+
+def test_keyword_scores_weighted_and_age_normalized(analytics):
+    scores = analytics.keyword_scores(weights=WEIGHTS, now=NOW)
+
+    assert scores["python"] == pytest.approx(2000.0)  # (1000 + 10 * 100) / 1 day
+    assert scores["gaming"] == pytest.approx(120.0)  # (1000 + 20 * 10) / 10 days
+    assert analytics.top_keywords(2, weights=WEIGHTS, now=NOW) == [
+        "python",
+        "tutorial",
+    ]
+
+
+def test_keyword_lift(analytics):
+    lift = analytics.keyword_lift()
+
+    mean_rate = np.mean([0.1, 0.01, 0.0])
+    assert lift["tutorial"] == pytest.approx(0.1 / mean_rate)
+    assert lift["python"] == pytest.approx(0.05 / mean_rate)
+    assert lift["gaming"] == pytest.approx(0.01 / mean_rate)
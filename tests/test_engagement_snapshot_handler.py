@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from video_generation_analysis.database_handler.engagement_snapshot_handler import (
+    EngagementSnapshotHandler,
+)
+from video_generation_analysis.database_handler.query_builder import (
+    QueryBuilder,
+    WhereComparison,
+)
+from video_generation_analysis.database_handler.schema import EngagementSnapshot
+
+NOW = datetime(2025, 11, 25, 12, 0, 0)
+
+
+@pytest.fixture
+def snapshot_handler(tmp_path):
+    return EngagementSnapshotHandler(tmp_path / "snapshots.sqlite")
+
+
+def hourly_snapshots(video_id, start, hours, views_per_hour=10):
+    return [
+        EngagementSnapshot(
+            video_id=video_id,
+            datetime_snapshot=start + timedelta(hours=hour),
+            views=views_per_hour * hour,
+            likes=hour,
+            comments=0,
+        )
+        for hour in range(hours)
+    ]
+
+
+def test_growth_curve_ordered_and_filtered(snapshot_handler):
+    with snapshot_handler as db:
+        db.record_snapshots(hourly_snapshots(1, NOW, 5))
+        db.record_snapshots(hourly_snapshots(2, NOW, 3))
+        curve = db.growth_curve(1)
+        recent_curve = db.growth_curve(1, since=NOW + timedelta(hours=3))
+
+    assert [int(snapshot.views) for snapshot in curve] == [0, 10, 20, 30, 40]
+    assert [int(snapshot.views) for snapshot in recent_curve] == [30, 40]
+
+
+def test_growth_curve_uses_covering_index(snapshot_handler):
+    with snapshot_handler as db:
+        db._cursor.execute(
+            "EXPLAIN QUERY PLAN SELECT video_id, datetime_snapshot, views, likes, "
+            "comments FROM EngagementSnapshots WHERE video_id = ? "
+            "ORDER BY datetime_snapshot ASC",
+            (1,),
+        )
+        plan = " ".join(row["detail"] for row in db._cursor.fetchall())
+
+    assert "COVERING INDEX" in plan
+
+
+def test_compact_rolls_old_snapshots_up_daily(snapshot_handler):
+    old_start = NOW - timedelta(days=10)
+    with snapshot_handler as db:
+        db.record_snapshots(hourly_snapshots(1, old_start, 48))
+        db.record_snapshots(hourly_snapshots(1, NOW, 3))
+
+        freed = db.compact(now=NOW, rollup_after_days=7)
+        curve = db.growth_curve(1)
+        total_rows = len(db.read(QueryBuilder().select_columns("id")))
+
+    assert freed == 45
+    assert total_rows == 6  # 3 daily rollups + 3 recent raw
+    assert [snapshot.datetime_snapshot for snapshot in curve[:3]] == [
+        (old_start + timedelta(hours=11)).isoformat(),  # last of first day
+        (old_start + timedelta(hours=35)).isoformat(),
+        (old_start + timedelta(hours=47)).isoformat(),
+    ]
+    assert [int(snapshot.views) for snapshot in curve[:3]] == [110, 350, 470]
+
+
+def test_compact_on_consecutive_days_keeps_one_row_per_day(snapshot_handler):
+    with snapshot_handler as db:
+        db.record_snapshots(hourly_snapshots(1, NOW - timedelta(days=10), 24 * 5))
+
+        db.compact(now=NOW, rollup_after_days=7)
+        db.compact(now=NOW + timedelta(days=1), rollup_after_days=7)
+        daily = db.read(
+            QueryBuilder().where_compare("resolution", WhereComparison.EQUAL, "daily")
+        )
+
+    days = [snapshot.datetime_snapshot[:10] for snapshot in daily]
+    assert len(days) == 4  # whole days before the second cutoff
+    assert len(set(days)) == len(days)
@@ -0,0 +1,231 @@
+import random
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.query_builder import (
+    QueryBuilder,
+    WhereComparison,
+)
+from video_generation_analysis.database_handler.schema import VideoEngagementRecord
+from video_generation_analysis.video_analytics.engagement_store import (
+    EngagementStore,
+)
+from video_generation_analysis.video_analytics.refresh_planner import RefreshPlanner
+from video_generation_analysis.video_analytics.video_analytics import VideoAnalytics
+from video_generation_analysis.video_generator.description_generator import (
+    DescriptionGenerator,
+)
+
+NOW = datetime(2025, 11, 25, 12, 0, 0)
+
+
+@pytest.fixture
+def db_handler(tmp_path):
+    db_handler = DatabaseHandler(tmp_path / "videos.sqlite", VideoEngagementRecord)
+    with db_handler as db:
+        db.create_many(
+            [
+                VideoEngagementRecord(
+                    datetime_publish=NOW - timedelta(days=1),
+                    views=500,
+                    likes=100,
+                    comments=300,
+                    keywords=["python", "tutorial"],
+                ),
+                VideoEngagementRecord(
+                    datetime_publish=NOW - timedelta(days=10),
+                    views=900,
+                    likes=200,
+                    comments=100,
+                    keywords=["gaming", "python"],
+                    last_refreshed_at=NOW - timedelta(hours=2),
+                ),
+                VideoEngagementRecord(views=100, likes=300, keywords=["music"]),
+            ]
+        )
+    return db_handler
+
+
+def test_load_reads_all_records(db_handler):
+    store = EngagementStore(db_handler, page_size=2)
+
+    assert store.load() == 3
+
+    columns = store.columns()
+    assert columns.ids.tolist() == [1, 2, 3]
+    assert columns.views.tolist() == [500.0, 900.0, 100.0]
+    assert columns.vocabulary == ["python", "tutorial", "gaming", "music"]
+    assert columns.keyword_indptr.tolist() == [0, 2, 4, 5]
+    assert columns.keyword_indices.tolist() == [0, 1, 2, 0, 3]
+    assert np.isnan(columns.publish_seconds[2])
+    assert store.nbytes > 0
+
+
+def test_write_hook_applies_committed_writes(db_handler):
+    store = EngagementStore(db_handler)
+    store.load()
+
+    with db_handler as db:
+        db.create(VideoEngagementRecord(views=50, keywords=["news", "python"]))
+        db.update(1, {"views": 700, "keywords": ["python", "howto", "code"]})
+        db.delete(QueryBuilder().where_compare("id", WhereComparison.EQUAL, 2))
+    with pytest.raises(RuntimeError):
+        with db_handler as db:
+            db.update(1, {"views": 0})
+            raise RuntimeError("abort")
+
+    columns = store.columns()
+    assert columns.ids.tolist() == [1, 3, 4]
+    assert columns.views.tolist() == [700.0, 100.0, 50.0]
+    keywords = [
+        [columns.vocabulary[idx] for idx in columns.keyword_indices[start:end]]
+        for start, end in zip(columns.keyword_indptr[:-1], columns.keyword_indptr[1:])
+    ]
+    assert keywords == [["python", "howto", "code"], ["music"], ["news", "python"]]
+
+
+def test_sync_reads_writes_of_other_processes(db_handler):
+    store = EngagementStore(db_handler)
+    store.load()
+    other_process = DatabaseHandler(db_handler.db_path, VideoEngagementRecord)
+    with other_process as db:
+        db.create(VideoEngagementRecord(views=10, keywords=["elsewhere"]))
+        db.update(2, {"views": 1000, "last_refreshed_at": NOW})
+    with db_handler as db:
+        db.create(VideoEngagementRecord(views=20, keywords=["here"]))
+
+    assert store.sync() == 3  # ids 4 & 5, refreshed 2
+    assert store.columns().ids.tolist() == [1, 2, 3, 4, 5]
+    assert store.columns().views.tolist() == [500.0, 1000.0, 100.0, 10.0, 20.0]
+    assert store.sync() == 0
+
+
+def test_sync_reads_refresh_committed_after_a_later_one(db_handler):
+    store = EngagementStore(db_handler)
+    store.load()
+    other_process = DatabaseHandler(db_handler.db_path, VideoEngagementRecord)
+    with other_process as db:
+        db.update(1, {"views": 600, "last_refreshed_at": NOW})
+    assert store.sync() == 1
+
+    with other_process as db:  # refresh started earlier, committed later
+        db.update(3, {"views": 150, "last_refreshed_at": NOW - timedelta(minutes=5)})
+
+    assert store.sync() == 1
+    assert store.columns().views.tolist() == [600.0, 900.0, 150.0]
+
+
+def test_sync_reads_update_after_latest_revision_deleted(db_handler):
+    store = EngagementStore(db_handler)
+    store.load()
+    other_process = DatabaseHandler(db_handler.db_path, VideoEngagementRecord)
+    with other_process as db:
+        db.update(1, {"views": 2})
+    store.sync()
+
+    with other_process as db:
+        db.delete(QueryBuilder().where_compare("id", WhereComparison.EQUAL, 1))
+        db.update(2, {"views": 99})
+
+    assert store.sync() == 1
+    assert store.columns().views.tolist() == [2.0, 99.0, 100.0]  # delete unseen
+
+
+def test_top_keywords_match_database_query(db_handler):
+    store = EngagementStore(db_handler)
+    store.load()
+    description_generator = DescriptionGenerator(
+        db_handler=db_handler,
+        keyword_strategy=MagicMock(),
+        description_strategy=MagicMock(),
+    )
+
+    for num_top_videos in (1, 2, 3):
+        assert store.top_keywords(num_top_videos) == (
+            description_generator.get_top_keywords(num_top_videos)
+        ), num_top_videos
+
+
+def test_due_order_matches_due_records():
+    planner = RefreshPlanner()
+    rng = random.Random(0)
+    records = []
+    for _ in range(500):
+        refreshed_hours = rng.choice([None, rng.uniform(0, 400)])
+        records.append(
+            VideoEngagementRecord(
+                datetime_publish=rng.choice(
+                    [None, NOW - timedelta(hours=rng.uniform(0, 2000))]
+                ),
+                last_refreshed_at=(
+                    None
+                    if refreshed_hours is None
+                    else NOW - timedelta(hours=refreshed_hours)
+                ),
+                views_per_hour=rng.choice([0.0, 150.0]),
+            )
+        )
+
+    def seconds(value):
+        return (
+            np.nan if value is None else (value - datetime(1970, 1, 1)).total_seconds()
+        )
+
+    order = planner.due_order(
+        np.array([seconds(record.datetime_publish) for record in records]),
+        np.array([seconds(record.last_refreshed_at) for record in records]),
+        np.array([record.views_per_hour for record in records]),
+        now_seconds=seconds(NOW),
+        limit=50,
+    )
+
+    due = planner.due_records(records, NOW, limit=50)
+    assert [records[row] for row in order] == due
+
+
+def test_video_analytics_plans_refreshes_in_memory(db_handler):
+    def make_video_analytics(engagement_store):
+        return VideoAnalytics(
+            db_handler=db_handler,
+            description_generator=MagicMock(),
+            video_generator=MagicMock(),
+            video_platforms=MagicMock(),
+            engagement_store=engagement_store,
+        )
+
+    store = EngagementStore(db_handler)
+    in_memory = make_video_analytics(store)
+
+    assert in_memory.due_record_ids() == make_video_analytics(None).due_record_ids()
+    assert in_memory.due_record_ids(limit=2) == [1, 3]  # never refreshed first
+    assert len(store) == 3  # loaded by first planning
+
+
+def test_video_analytics_without_store_reads_only_possibly_due(db_handler):
+    with db_handler as db:
+        db.create(
+            VideoEngagementRecord(
+                datetime_publish=NOW - timedelta(days=10),
+                last_refreshed_at=NOW - timedelta(minutes=30),
+            )
+        )
+    planner = RefreshPlanner(tiers=[(24, 1), (24 * 30, 24)])
+    planner.due_records = MagicMock(wraps=planner.due_records)
+    video_analytics = VideoAnalytics(
+        db_handler=db_handler,
+        description_generator=MagicMock(),
+        video_generator=MagicMock(),
+        video_platforms=MagicMock(),
+        refresh_planner=planner,
+        clock=lambda: NOW,
+    )
+
+    assert video_analytics.due_record_ids() == [1, 3]
+    # refreshed within the shortest interval filtered out in SQL
+    (records,) = planner.due_records.call_args.args
+    assert [record.id for record in records] == [1, 2, 3]
+    assert video_analytics._due_records(NOW, None, record_ids=[2, 3, 4]) == [records[2]]
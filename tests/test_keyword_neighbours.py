@@ -0,0 +1,101 @@
+import pytest
+
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.keyword_neighbour_handler import (
+    KeywordNeighbourHandler,
+)
+from video_generation_analysis.database_handler.schema import VideoEngagementRecord
+from video_generation_analysis.video_generator.keyword_neighbour_index import (
+    KeywordNeighbourIndexer,
+)
+from video_generation_analysis.video_generator.keyword_neighbour_strategy import (
+    KeywordNeighbourStrategy,
+)
+
+SIMILAR = {
+    "cat": [("kitten", 0.9), ("dog", 0.8), ("pet", 0.7)],
+    "dog": [("puppy", 0.9), ("pet", 0.85), ("cat", 0.8)],
+    "ocean": [("sea", 0.95), ("waves", 0.6)],
+}
+
+
+class FakeModel:
+    def __init__(self) -> None:
+        self.lookups = []
+
+    def most_similar(self, word: str, topn: int) -> list[tuple[str, float]]:
+        self.lookups.append(word)
+        return SIMILAR[word][:topn]  # KeyError like gensim for unknown words
+
+
+@pytest.fixture
+def stores(tmp_path):
+    db_handler = DatabaseHandler(tmp_path / "videos.sqlite", VideoEngagementRecord)
+    with db_handler as db:
+        db.create_many(
+            [
+                VideoEngagementRecord(keywords=["Cat", "dog"]),
+                VideoEngagementRecord(keywords=["dog", "zzz"]),
+            ]
+        )
+    return db_handler, KeywordNeighbourHandler(tmp_path / "videos.sqlite")
+
+
+@pytest.fixture
+def model():
+    return FakeModel()
+
+
+def test_refresh_indexes_new_keywords_only(stores, model):
+    db_handler, neighbour_handler = stores
+    loads = []
+    indexer = KeywordNeighbourIndexer(
+        db_handler, neighbour_handler, lambda: loads.append(1) or model, page_size=1
+    )
+
+    assert indexer.refresh() == 3
+    assert sorted(model.lookups) == ["cat", "dog", "zzz"]
+    assert indexer.refresh() == 0
+    assert len(loads) == 1  # nothing new, model never loaded
+
+    with db_handler as db:
+        db.create(VideoEngagementRecord(keywords=["ocean", "cat"]))
+    assert indexer.refresh() == 1
+    assert model.lookups[-1] == "ocean"
+
+
+def test_neighbours_lookup(stores, model):
+    db_handler, neighbour_handler = stores
+    KeywordNeighbourIndexer(db_handler, neighbour_handler, lambda: model).refresh()
+
+    with neighbour_handler as db:
+        neighbours = db.neighbours(["cat", "zzz", "unseen"], topn=2)
+
+    assert neighbours == {"cat": [("kitten", 0.9), ("dog", 0.8)], "zzz": []}
+
+
+def test_strategy_ranks_like_gensim_strategy(stores, model):
+    db_handler, neighbour_handler = stores
+    KeywordNeighbourIndexer(db_handler, neighbour_handler, lambda: model).refresh()
+    strategy = KeywordNeighbourStrategy(neighbour_handler)
+
+    keywords = strategy.generate(["CAT", "dog"], min_length=3, max_length=3)
+
+    # pet 0.7 + 0.85 first, then summed similarities of both keywords' top 3
+    assert keywords.split() == ["pet", "kitten", "puppy"]
+
+
+def test_strategy_marks_unindexed_keywords_pending(stores, model):
+    db_handler, neighbour_handler = stores
+    indexer = KeywordNeighbourIndexer(db_handler, neighbour_handler, lambda: model)
+    indexer.refresh()
+    strategy = KeywordNeighbourStrategy(neighbour_handler)
+
+    assert strategy.generate(["ocean"], min_length=2, max_length=2) == ""
+    with neighbour_handler as db:
+        assert db.pending_keywords() == {"ocean"}
+
+    assert indexer.refresh() == 1
+    assert strategy.generate(["ocean"], min_length=2, max_length=2) == "sea waves"
+    with neighbour_handler as db:
+        assert db.pending_keywords() == set()
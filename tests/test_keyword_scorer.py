@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from video_generation_analysis.database_handler.keyword_score_handler import (
+    KeywordScoreHandler,
+)
+from video_generation_analysis.database_handler.schema import VideoEngagementRecord
+from video_generation_analysis.video_analytics.keyword_scorer import KeywordScorer
+from video_generation_analysis.video_platforms_handler.platform_api_bridge import (
+    VideoEngagement,
+)
+
+NOW = datetime(2025, 11, 25, 12, 0, 0)
+WEIGHTS = {"views": 1.0, "likes": 10.0, "comments": 20.0}
+
+
+@pytest.fixture
+def score_handler(tmp_path):
+    return KeywordScoreHandler(tmp_path / "scores.sqlite")
+
+
+def make_record(views, likes, comments, refreshed_at, keywords):
+    return VideoEngagementRecord(
+        datetime_publish=(NOW - timedelta(days=4)).isoformat(),
+        views=str(views),
+        likes=str(likes),
+        comments=str(comments),
+        keywords=keywords,
+        last_refreshed_at=refreshed_at.isoformat() if refreshed_at else None,
+    )
+
+
+def test_video_score_weighted_and_age_normalized():
+    scorer = KeywordScorer(weights=WEIGHTS)
+    engagement = VideoEngagement(views=100, likes=10, comments=5)
+
+    score = scorer.video_score(engagement, NOW - timedelta(days=4), NOW)
+
+    assert score == pytest.approx((100 + 100 + 100) / 4)
+    assert scorer.video_score(engagement, NOW, NOW) == pytest.approx(300)
+    assert scorer.video_score(engagement, NOW, None) == 0.0
+
+
+def test_refresh_deltas_replace_previous_contribution():
+    scorer = KeywordScorer(weights=WEIGHTS)
+    never_refreshed = make_record(0, 0, 0, None, ["cat", "cat", "dog"])
+
+    first = scorer.refresh_deltas(never_refreshed, VideoEngagement(400, 0, 0), NOW)
+    assert first == {"cat": pytest.approx(100.0), "dog": pytest.approx(100.0)}
+
+    refreshed = make_record(400, 0, 0, NOW, ["cat", "dog"])
+    later = NOW + timedelta(days=4)
+    second = scorer.refresh_deltas(refreshed, VideoEngagement(1600, 0, 0), later)
+    assert second["cat"] == pytest.approx(1600 / 8 - 100.0)
+
+
+def test_score_records_matches_accumulated_deltas():
+    scorer = KeywordScorer(weights=WEIGHTS)
+    records = [
+        make_record(400, 10, 0, NOW, ["cat", "dog"]),
+        make_record(800, 0, 0, NOW, ["cat"]),
+        make_record(5000, 0, 0, None, ["fish"]),  # never refreshed
+    ]
+
+    scores = scorer.score_records(records)
+
+    assert scores["cat"] == pytest.approx(125.0 + 200.0)
+    assert scores["dog"] == pytest.approx(125.0)
+    assert scores["fish"] == 0.0
+
+
+def test_handler_accumulates_and_ranks_numerically(score_handler):
+    with score_handler as db:
+        db.add_scores({"cat": 90.0, "dog": 1000.0, "fish": 5.0}, now=NOW)
+        db.add_scores({"cat": 2000.0, "fish": -1.0}, now=NOW)
+        top = db.top_keywords(2)
+
+    assert top == ["cat", "dog"]
+
+
+def test_handler_replace_scores(score_handler):
+    with score_handler as db:
+        db.add_scores({"cat": 1.0}, now=NOW)
+        db.replace_scores({"dog": 2.0}, now=NOW)
+        top = db.top_keywords(5)
+
+    assert top == ["dog"]
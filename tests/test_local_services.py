@@ -0,0 +1,84 @@
+import pytest
+from googleapiclient.errors import HttpError
+
+from video_generation_analysis.local_services.fake_gemini import (
+    MP4_HEADER,
+    FakeGeminiAsyncClient,
+)
+from video_generation_analysis.local_services.fake_youtube import FakeYouTubeService
+from video_generation_analysis.local_services.load_harness import (
+    build_video_analytics,
+    run_load,
+)
+from video_generation_analysis.video_generator.video_generator import VideoGenerator
+from video_generation_analysis.video_platforms_handler.youtube_api_bridge import (
+    YouTubeApiBridge,
+)
+
+
+def test_youtube_bridge_against_fake_service(tmp_path):
+    service = FakeYouTubeService(latency_seconds=0, views_per_list=100)
+    bridge = YouTubeApiBridge(service=service)
+    video_path = tmp_path / "video.mp4"
+    video_path.touch()
+
+    url = bridge.publish_video(video_path, "Title", "Desc", ["tag"])
+    bridge.get_engagement_metrics(url)
+    engagement = bridge.get_engagement_metrics(url)
+
+    assert url == "https://www.youtube.com/watch?v=fake0000000"
+    assert engagement.views == 200
+    assert engagement.likes == 10
+    assert service.calls == {"insert": 1, "list": 2}
+
+
+def test_fake_youtube_error_rate():
+    service = FakeYouTubeService(latency_seconds=0, error_rate=1.0)
+
+    with pytest.raises(HttpError):
+        service.videos().list(part="statistics", id="missing").execute()
+
+
+def test_video_generator_against_fake_gemini(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GEMINI_API_KEY", "")
+    client = FakeGeminiAsyncClient(
+        latency_seconds=0, completion_seconds=0.02, video_size_bytes=64
+    )
+    vg = VideoGenerator(client_factory=lambda: client, poll_interval_seconds=0.01)
+
+    video_path = vg.create_video("cat")
+
+    assert video_path.read_bytes().startswith(MP4_HEADER)
+    assert video_path.stat().st_size == 64
+    assert client.calls["operations.get"] >= 1
+
+
+def test_fake_gemini_failed_operation_returns_none(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    client = FakeGeminiAsyncClient(
+        latency_seconds=0, error_rate=1.0, completion_seconds=0
+    )
+    vg = VideoGenerator(client_factory=lambda: client, poll_interval_seconds=0)
+
+    assert vg.create_video("cat") is None
+
+
+def test_load_harness_reports_cycles(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    youtube = FakeYouTubeService(latency_seconds=0)
+    gemini = FakeGeminiAsyncClient(
+        latency_seconds=0, completion_seconds=0, video_size_bytes=64
+    )
+    video_analytics = build_video_analytics(
+        tmp_path / "load.sqlite", youtube, lambda: gemini, poll_interval_seconds=0
+    )
+
+    report = run_load(video_analytics, cycles=3, youtube=youtube)
+
+    assert report.cycles == 3
+    assert report.errors == {"generate_video": 0, "update_video_metrics": 0}
+    assert youtube.calls == {"insert": 3, "list": 1 + 2 + 3}
+    assert set(report.latency_ms["generate_video"]) == {"p50", "p90", "p99"}
+    assert report.max_rss_mb > 0
+    assert not list(tmp_path.glob("*.mp4"))  # videos deleted after publishing
@@ -0,0 +1,188 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.query_builder import (
+    QueryBuilder,
+    WhereComparison,
+)
+from video_generation_analysis.database_handler.schema import VideoEngagementRecord
+from video_generation_analysis.video_analytics.video_analytics import VideoAnalytics
+from video_generation_analysis.video_generator.description_generator import (
+    DescriptionGenerator,
+)
+from video_generation_analysis.video_generator.near_duplicate_index import (
+    NearDuplicateIndex,
+)
+
+TITLE = "Neon dragon over the city at night"
+DESCRIPTION = (
+    "A glowing neon dragon glides between skyscrapers as rain falls on the "
+    "busy streets below, reflections shimmering in every puddle"
+)
+
+
+@pytest.fixture
+def db_handler(tmp_path):
+    return DatabaseHandler(tmp_path / "videos.sqlite", VideoEngagementRecord)
+
+
+def test_near_duplicate_found_unrelated_not():
+    index = NearDuplicateIndex()
+    index.add([1, 2], [TITLE, "Forest sunrise"], [DESCRIPTION, "Birds sing at dawn"])
+
+    assert index.most_similar(TITLE, DESCRIPTION) == (1, 1.0)
+    record_id, similarity = index.most_similar(
+        TITLE.upper(), DESCRIPTION.replace("busy", "crowded")
+    )
+    assert record_id == 1 and 0.8 <= similarity < 1.0
+    assert index.most_similar("Ocean waves", "A quiet beach at low tide") is None
+    assert index.most_similar("", "") is None
+
+
+def test_lookups_span_sorted_bands_and_tail(monkeypatch):
+    monkeypatch.setattr(
+        "video_generation_analysis.video_generator.near_duplicate_index.TAIL_ROWS", 3
+    )
+    index = NearDuplicateIndex()
+    titles = [f"video {idx} {TITLE}" for idx in range(5)]
+    descriptions = [f"{DESCRIPTION} number {idx}" for idx in range(5)]
+    for idx in range(5):
+        index.add([idx + 1], [titles[idx]], [descriptions[idx]])
+
+    assert len(index) == 5
+    for idx in range(5):  # rows 1-3 merged into bands, 4-5 still in tail
+        assert index.most_similar(titles[idx], descriptions[idx])[0] == idx + 1
+
+
+def test_write_hook_indexes_committed_records_only(db_handler):
+    index = NearDuplicateIndex()
+    db_handler.add_write_hook(index.on_write)
+
+    with db_handler as db:
+        record_id = db.create(
+            VideoEngagementRecord(title=TITLE, description=DESCRIPTION)
+        )
+    with pytest.raises(RuntimeError):
+        with db_handler as db:
+            db.create(VideoEngagementRecord(title="Rolled back", description="gone"))
+            raise RuntimeError("abort")
+
+    assert index.most_similar(TITLE, DESCRIPTION) == (record_id, 1.0)
+    assert index.most_similar("Rolled back", "gone") is None
+
+
+def test_write_hook_sees_bulk_ids_updates_and_deletes(db_handler):
+    writes = []
+    db_handler.add_write_hook(writes.append)
+
+    with db_handler as db:
+        db.create(VideoEngagementRecord(title="first"))
+        db.create_many([VideoEngagementRecord(title=f"bulk {idx}") for idx in range(3)])
+        db.update(2, {"views": 10})
+        db.delete(QueryBuilder().where_compare("id", WhereComparison.EQUAL, 4))
+
+    (committed,) = writes
+    assert [(record.id, record.title) for record in committed.created] == [
+        (1, "first"),
+        (2, "bulk 0"),
+        (3, "bulk 1"),
+        (4, "bulk 2"),
+    ]
+    assert committed.updated == [(2, {"views": 10})]
+    assert committed.deleted == [4]
+
+
+def test_sync_indexes_records_written_elsewhere_once(db_handler):
+    index = NearDuplicateIndex()
+    db_handler.add_write_hook(index.on_write)
+    other_process = DatabaseHandler(db_handler.db_path, VideoEngagementRecord)
+    with other_process as db:
+        db.create(VideoEngagementRecord(title="Forest sunrise", description="Birds"))
+    with db_handler as db:
+        db.create(VideoEngagementRecord(title=TITLE, description=DESCRIPTION))
+
+    assert index.most_similar("Forest sunrise", "Birds") is None
+    assert index.sync(db_handler) == 1
+    assert index.most_similar("Forest sunrise", "Birds") == (1, 1.0)
+    assert len(index) == 2
+    assert index.sync(db_handler) == 0
+
+
+def make_video_analytics(db_handler, index, descriptions):
+    description_generator = MagicMock()
+    description_generator.generate_description.side_effect = [
+        (title, description, ["keyword"]) for title, description in descriptions
+    ]
+    video_generator = MagicMock()
+    video_generator.create_video.return_value = None  # stop after describing
+    return (
+        VideoAnalytics(
+            db_handler=db_handler,
+            description_generator=description_generator,
+            video_generator=video_generator,
+            video_platforms=MagicMock(),
+            near_duplicate_index=index,
+            max_regenerations=2,
+        ),
+        description_generator,
+        video_generator,
+    )
+
+
+def test_near_duplicate_description_regenerated(db_handler):
+    with db_handler as db:
+        db.create(VideoEngagementRecord(title=TITLE, description=DESCRIPTION))
+    video_analytics, description_generator, video_generator = make_video_analytics(
+        db_handler,
+        NearDuplicateIndex(),
+        [(TITLE, DESCRIPTION), ("Forest sunrise", "Birds sing at dawn")],
+    )
+
+    with pytest.raises(ValueError):
+        video_analytics.generate_video(num_top_videos=5)
+
+    skips = [
+        call.kwargs["skip_top_keywords"]
+        for call in description_generator.generate_description.call_args_list
+    ]
+    assert skips == [0, 1]
+    video_generator.create_video.assert_called_once_with("Birds sing at dawn")
+
+
+def test_video_skipped_when_all_descriptions_duplicates(db_handler):
+    with db_handler as db:
+        db.create(VideoEngagementRecord(title=TITLE, description=DESCRIPTION))
+    video_analytics, description_generator, video_generator = make_video_analytics(
+        db_handler, NearDuplicateIndex(), [(TITLE, DESCRIPTION)] * 3
+    )
+
+    video_analytics.generate_video(num_top_videos=5)
+
+    assert description_generator.generate_description.call_count == 2  # repeated
+    video_generator.create_video.assert_not_called()
+
+
+def test_prompted_regenerations_leave_out_a_prompt_word(db_handler):
+    keyword_strategy = MagicMock()
+    keyword_strategy.generate.side_effect = lambda keywords, **_: " ".join(keywords)
+    description_generator = DescriptionGenerator(
+        db_handler=db_handler,
+        keyword_strategy=keyword_strategy,
+        description_strategy=MagicMock(),
+    )
+
+    keywords = [
+        description_generator.generate_description(
+            num_new_keywords=3, prompt="neon city rain", skip_top_keywords=attempt
+        )[2]
+        for attempt in range(4)
+    ]
+
+    assert keywords == [
+        ["neon", "city", "rain"],
+        ["city", "rain"],
+        ["neon", "rain"],
+        ["neon", "city"],
+    ]
@@ -0,0 +1,141 @@
+from datetime import datetime
+
+import pytest
+
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.partition_archive import (
+    PartitionArchive,
+    months_ago,
+)
+from video_generation_analysis.database_handler.query_builder import (
+    QueryBuilder,
+    WhereComparison,
+)
+from video_generation_analysis.database_handler.schema import VideoEngagementRecord
+from video_generation_analysis.video_analytics.engagement_analytics import (
+    EngagementAnalytics,
+)
+
+
+@pytest.fixture
+def db_handler(tmp_path):
+    db_handler = DatabaseHandler(tmp_path / "videos.sqlite", VideoEngagementRecord)
+    with db_handler as db:
+        for month, views in [(1, 10), (1, 20), (2, 30), (6, 40)]:
+            db.create(
+                VideoEngagementRecord(
+                    datetime_publish=datetime(2025, month, 15, 12, 0),
+                    title=f"video {views}",
+                    urls=[f"https://youtu.be/{views}"],
+                    views=views,
+                    likes=1,
+                    comments=0,
+                    keywords=["cat", f"kw{views}"],
+                )
+            )
+        db.create(VideoEngagementRecord(title="unpublished", views=0))
+    return db_handler
+
+
+def read_titles(db_handler, archive=None):
+    with db_handler as db:
+        records = db.read(QueryBuilder().order_by("id"), archive=archive)
+    return [record.title for record in records]
+
+
+def test_months_ago():
+    assert months_ago(datetime(2025, 3, 20), 0) == datetime(2025, 3, 1)
+    assert months_ago(datetime(2025, 3, 20), 4) == datetime(2024, 11, 1)
+
+
+def test_archive_moves_old_months_to_partitions(db_handler, tmp_path):
+    archive = PartitionArchive(tmp_path / "archive")
+
+    archived = archive.archive(db_handler, before=datetime(2025, 3, 1))
+
+    assert archived == {"2025-01": 2, "2025-02": 1}
+    assert archive.months() == ["2025-01", "2025-02"]
+    assert read_titles(db_handler) == ["video 40", "unpublished"]
+
+
+def test_archived_rows_round_trip(db_handler, tmp_path):
+    archive = PartitionArchive(tmp_path / "archive")
+    archive.archive(db_handler, before=datetime(2025, 3, 1))
+
+    columns = archive.load_columns(["2025-01"])
+
+    assert columns["id"] == [1, 2]
+    assert columns["views"] == [10, 20]
+    assert columns["datetime_publish"] == [
+        "2025-01-15T12:00:00",
+        "2025-01-15T12:00:00",
+    ]
+    assert columns["last_refreshed_at"] == [None, None]
+
+
+def test_read_with_archive_unions_hot_and_cold_rows(db_handler, tmp_path):
+    archive = PartitionArchive(tmp_path / "archive")
+    archive.archive(db_handler, before=datetime(2025, 3, 1))
+
+    with db_handler as db:
+        records = db.read(
+            QueryBuilder().where_compare("views", WhereComparison.EQUAL, 20),
+            archive=archive,
+        )
+
+    assert read_titles(db_handler, archive) == [
+        "video 10",
+        "video 20",
+        "video 30",
+        "video 40",
+        "unpublished",
+    ]
+    assert records[0].keywords == ["cat", "kw20"]
+    assert records[0].urls == ["https://youtu.be/20"]
+
+
+def test_rearchiving_merges_partition(db_handler, tmp_path):
+    archive = PartitionArchive(tmp_path / "archive")
+    archive.archive(db_handler, before=datetime(2025, 2, 1))
+    with db_handler as db:
+        db.create(
+            VideoEngagementRecord(
+                datetime_publish=datetime(2025, 1, 20), title="late", views=5
+            )
+        )
+
+    assert archive.archive(db_handler, before=datetime(2025, 2, 1)) == {"2025-01": 1}
+    assert archive.load_columns(["2025-01"])["title"] == [
+        "video 10",
+        "video 20",
+        "late",
+    ]
+
+
+def test_engagement_analytics_scans_archive(db_handler, tmp_path):
+    archive = PartitionArchive(tmp_path / "archive")
+    archive.archive(db_handler, before=datetime(2025, 3, 1))
+
+    hot_only = EngagementAnalytics(db_handler).load()
+    everything = EngagementAnalytics(db_handler, archive=archive).load()
+
+    assert sorted(hot_only.views.tolist()) == [0, 40]
+    assert sorted(everything.views.tolist()) == [0, 10, 20, 30, 40]
+
+
+def test_archive_loaded_once_until_partitions_change(db_handler, tmp_path):
+    archive = PartitionArchive(tmp_path / "archive")
+    archive.archive(db_handler, before=datetime(2025, 2, 1))
+    loads = []
+    load_columns = archive.load_columns
+    archive.load_columns = lambda: loads.append(1) or load_columns()
+
+    other_handler = DatabaseHandler(db_handler.db_path, VideoEngagementRecord)
+    for handler in (db_handler, db_handler, other_handler):
+        assert len(read_titles(handler, archive)) == 5
+    assert len(loads) == 1
+
+    archive.archive(db_handler, before=datetime(2025, 3, 1))
+
+    assert len(read_titles(db_handler, archive)) == 5
+    assert len(loads) == 2
@@ -106,3 +106,94 @@ def test_invalid_where_clause_structure():
 
     with pytest.raises(ValueError):
         qb.build("users", QueryType.READ)
+
+
+def test_compiled_plan_cached_and_reused():
+    def make(name):
+        return (
+            QueryBuilder()
+            .select_columns(["id", "name"])
+            .where_compare("name", WhereComparison.EQUAL, name)
+            .limit(5)
+        )
+
+    plan_a = make("Alice").compile("users", QueryType.READ)
+    plan_b = make("Bob").compile("users", QueryType.READ)
+
+    assert plan_a is plan_b  # same shape, different parameters
+    assert hash(plan_a) == hash(plan_b)
+    assert plan_a.num_params == 1
+    assert plan_a.returns_rows
+    assert make("Bob").params() == ["Bob"]
+    assert not make("Bob").compile("users", QueryType.DELETE).returns_rows
+
+
+def test_compiled_plan_invalid_where_clause_structure():
+    qb = QueryBuilder()
+    qb.where_compare("age", WhereComparison.GREATER_THAN, 18)
+    qb.where_compare("name", WhereComparison.EQUAL, "Bob")
+
+    with pytest.raises(ValueError):
+        qb.compile("users", QueryType.READ)
+
+
+def test_where_in_and_chunks_under_variable_limit():
+    qb = (
+        QueryBuilder()
+        .where_compare("views", WhereComparison.GREATER_THAN, 10)
+        .where_logical(WhereLogical.AND)
+        .where_in("id", [1, 2, 2, 3, 4, 5])
+    )
+    query, params = qb.build("users", QueryType.READ)
+    assert query == "SELECT * FROM users WHERE views > ? AND id IN (?, ?, ?, ?, ?)"
+    assert params == [10, 1, 2, 3, 4, 5]
+
+    chunks = [chunk.build("users", QueryType.READ) for chunk in qb.chunks(3)]
+    assert [params for _, params in chunks] == [[10, 1, 2], [10, 3, 4], [10, 5]]
+    assert chunks[2][0].endswith("id IN (?)")
+    assert qb.params() == [10, 1, 2, 3, 4, 5]  # original unchanged
+
+
+def test_chunks_refused_when_results_would_differ():
+    qb = QueryBuilder().where_in("id", list(range(10))).limit(5)
+    with pytest.raises(ValueError):
+        list(qb.chunks(4))
+
+    qb = QueryBuilder().where_in("id", list(range(10))).count()
+    with pytest.raises(ValueError):
+        list(qb.chunks(4))
+
+
+def test_after_keyset_brackets_existing_conditions():
+    qb = (
+        QueryBuilder()
+        .where_compare("name", WhereComparison.EQUAL, "Alice")
+        .where_logical(WhereLogical.OR)
+        .where_compare("name", WhereComparison.EQUAL, "Bob")
+        .after("id", 40)
+        .limit(10)
+    )
+    query, params = qb.build("users", QueryType.READ)
+
+    assert query == (
+        "SELECT * FROM users WHERE (name = ? OR name = ?) AND id > ? "
+        "ORDER BY id ASC LIMIT 10"
+    )
+    assert params == ["Alice", "Bob", 40]
+
+    query, _ = (
+        QueryBuilder()
+        .after("id", 40, OrderByType.DESCENDING)
+        .build("users", QueryType.READ)
+    )
+    assert query == "SELECT * FROM users WHERE id < ? ORDER BY id DESC"
+
+
+def test_count_sum_group_by():
+    qb = QueryBuilder().group_by("country").count().sum("age", alias="total_age")
+    query, _ = qb.build("users", QueryType.READ)
+
+    assert query == (
+        "SELECT country, COUNT(*) AS count, SUM(age) AS total_age "
+        "FROM users GROUP BY country"
+    )
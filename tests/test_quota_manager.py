@@ -0,0 +1,136 @@
+import multiprocessing
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.schema import QuotaBucket
+from video_generation_analysis.video_platforms_handler.quota_manager import (
+    QuotaExceededError,
+    QuotaManager,
+)
+from video_generation_analysis.video_platforms_handler.youtube_api_bridge import (
+    YouTubeApiBridge,
+)
+
+NOW = datetime(2025, 11, 25, 12, 0, 0)
+PACIFIC = ZoneInfo("America/Los_Angeles")
+COSTS = {"videos.insert": 1600, "videos.list": 1}
+
+
+class FakeClock:
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def make_manager(db_path, clock, daily_quota=2000, upload_reserve=1600):
+    return QuotaManager(
+        DatabaseHandler(db_path, QuotaBucket),
+        daily_quota=daily_quota,
+        costs=COSTS,
+        upload_reserve=upload_reserve,
+        clock=clock,
+    )
+
+
+def test_lists_stop_at_upload_reserve(tmp_path):
+    manager = make_manager(tmp_path / "quota.sqlite", FakeClock(NOW))
+
+    spent = 0
+    while manager.try_acquire("videos.list"):
+        spent += 1
+
+    assert spent == 400  # 2000 quota - 1600 reserved for uploads
+    with pytest.raises(QuotaExceededError):
+        manager.acquire("videos.list")
+    manager.acquire("videos.insert")  # reserve still available to uploads
+    assert manager.available() == pytest.approx(0.0)
+    assert not manager.try_acquire("videos.insert")
+
+
+def test_bucket_resets_at_pacific_midnight(tmp_path):
+    pacific_now = datetime(2025, 11, 25, 1, 0, 0, tzinfo=PACIFIC)
+    clock = FakeClock(pacific_now)
+    manager = make_manager(tmp_path / "quota.sqlite", clock)
+    manager.acquire("videos.insert")
+
+    clock.now = pacific_now + timedelta(hours=22)  # 23:00, same quota day
+    assert manager.available() == pytest.approx(400)
+    assert not manager.try_acquire("videos.insert")
+
+    clock.now = pacific_now + timedelta(hours=23)  # midnight
+    assert manager.available() == pytest.approx(2000)
+    assert manager.try_acquire("videos.insert")
+
+    # a UTC clock reads the same quota day
+    clock.now = (pacific_now + timedelta(hours=30)).astimezone(timezone.utc)
+    assert manager.available() == pytest.approx(400)
+
+
+def test_batch_acquired_all_or_nothing(tmp_path):
+    manager = make_manager(tmp_path / "quota.sqlite", FakeClock(NOW))
+
+    manager.acquire("videos.list", count=300)
+    with pytest.raises(QuotaExceededError):
+        manager.acquire("videos.list", count=101)
+
+    assert manager.available() == pytest.approx(1700)  # failed batch spent nothing
+    assert manager.try_acquire("videos.list", count=100)
+
+
+def _spend_lists(db_path: str, results) -> None:
+    manager = QuotaManager(
+        DatabaseHandler(db_path, QuotaBucket),
+        daily_quota=2000,
+        costs=COSTS,
+        upload_reserve=1600,
+        clock=lambda: NOW,  # no reset during test
+    )
+    spent = 0
+    while manager.try_acquire("videos.list"):
+        spent += 1
+    results.put(spent)
+
+
+def test_budget_shared_across_processes(tmp_path):
+    db_path = tmp_path / "quota.sqlite"
+    make_manager(db_path, FakeClock(NOW)).available()  # create bucket
+
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    processes = [
+        context.Process(target=_spend_lists, args=(db_path, results)) for _ in range(3)
+    ]
+    for process in processes:
+        process.start()
+    spent = [results.get(timeout=60) for _ in processes]
+    for process in processes:
+        process.join(timeout=10)
+
+    assert sum(spent) == 400  # no unit spent twice
+
+
+def test_youtube_bridge_spends_quota(tmp_path, monkeypatch):
+    monkeypatch.setenv("YOUTUBE_CLIENT_SECRETS_FILE", "secrets.json")
+    manager = make_manager(tmp_path / "quota.sqlite", FakeClock(NOW), daily_quota=1601)
+    bridge = YouTubeApiBridge(quota_manager=manager)
+    bridge._is_authenticated = True
+    bridge._youtube_service = MagicMock()
+    bridge._youtube_service.videos().list().execute.return_value = {
+        "items": [{"statistics": {"viewCount": "7"}}]
+    }
+    video_path = tmp_path / "video.mp4"
+    video_path.touch()
+
+    engagement = bridge.get_engagement_metrics("https://www.youtube.com/watch?v=1")
+    assert engagement.views == 7
+    with pytest.raises(QuotaExceededError):
+        bridge.get_engagement_metrics("https://www.youtube.com/watch?v=1")
+    assert manager.try_acquire("videos.insert")
+    with pytest.raises(QuotaExceededError):
+        bridge.publish_video(video_path, "Title", "Desc", [])
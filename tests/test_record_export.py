@@ -0,0 +1,90 @@
+import csv
+import json
+from datetime import datetime
+
+import pytest
+
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.record_export import RecordExporter
+from video_generation_analysis.database_handler.schema import VideoEngagementRecord
+
+
+@pytest.fixture
+def exporter(tmp_path):
+    db_handler = DatabaseHandler(tmp_path / "videos.sqlite", VideoEngagementRecord)
+    with db_handler as db:
+        db.create_many(
+            [
+                VideoEngagementRecord(
+                    datetime_publish=datetime(2025, 1, idx + 1),
+                    title=f"video {idx}",
+                    urls=[f"https://youtu.be/{idx}"],
+                    views=idx * 10,
+                    keywords=["cat", f"kw{idx}"],
+                )
+                for idx in range(7)
+            ]
+        )
+    return RecordExporter(db_handler, page_size=3)
+
+
+def test_export_jsonl_all_columns_typed(exporter, tmp_path):
+    stats = exporter.export(tmp_path / "videos.jsonl")
+
+    lines = (tmp_path / "videos.jsonl").read_text().splitlines()
+    first = json.loads(lines[0])
+    assert stats.rows == len(lines) == 7
+    assert first["id"] == 1
+    assert first["views"] == 0
+    assert first["datetime_publish"] == "2025-01-01T00:00:00"
+    assert first["keywords"] == ["cat", "kw0"]
+    assert first["last_refreshed_at"] is None
+
+
+def test_export_csv_columns_and_filters(exporter, tmp_path):
+    stats = exporter.export(
+        tmp_path / "videos.csv",
+        columns=["title", "keywords"],
+        filters=[("datetime_publish", ">=", "2025-01-03"), ("title", "!=", "video 4")],
+    )
+
+    with open(tmp_path / "videos.csv", newline="") as file:
+        rows = list(csv.reader(file))
+    assert stats.rows == 4
+    assert rows[0] == ["title", "keywords"]
+    assert [row[0] for row in rows[1:]] == ["video 2", "video 3", "video 5", "video 6"]
+    assert json.loads(rows[1][1]) == ["cat", "kw2"]
+
+
+def test_export_numeric_filters_compare_numbers(exporter, tmp_path):
+    for value in (5, "5"):  # CLI filter values arrive as text
+        stats = exporter.export(
+            tmp_path / "videos.jsonl",
+            columns=["views"],
+            filters=[("views", ">=", value), ("views", "<", 50)],
+        )
+
+        lines = (tmp_path / "videos.jsonl").read_text().splitlines()
+        assert stats.rows == 4
+        assert [json.loads(line)["views"] for line in lines] == [10, 20, 30, 40]
+    with pytest.raises(ValueError):
+        exporter.export(tmp_path / "videos.csv", filters=[("views", ">", "many")])
+
+
+def test_export_rejects_unknown_format_and_columns(exporter, tmp_path):
+    with pytest.raises(ValueError):
+        exporter.export(tmp_path / "videos.xml")
+    with pytest.raises(ValueError):
+        exporter.export(tmp_path / "videos.csv", columns=["missing"])
+    with pytest.raises(ValueError):
+        exporter.export(tmp_path / "videos.csv", filters=[("views", "LIKE", "1")])
+
+
+def test_export_parquet(exporter, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    exporter.export(tmp_path / "videos.parquet", columns=["id", "views", "keywords"])
+
+    table = pq.read_table(tmp_path / "videos.parquet")
+    assert table.column("views").to_pylist() == [0, 10, 20, 30, 40, 50, 60]
+    assert table.column("keywords").to_pylist()[0] == ["cat", "kw0"]
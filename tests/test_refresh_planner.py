@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta
+
+from video_generation_analysis.database_handler.schema import VideoEngagementRecord
+from video_generation_analysis.video_analytics.refresh_planner import RefreshPlanner
+
+NOW = datetime(2025, 11, 25, 12, 0, 0)
+TIERS = [(24, 1), (24 * 7, 6), (24 * 30, 24)]
+
+
+def make_record(age_hours, refreshed_hours_ago=None, views_per_hour=0.0):
+    last_refreshed_at = None
+    if refreshed_hours_ago is not None:
+        last_refreshed_at = (NOW - timedelta(hours=refreshed_hours_ago)).isoformat()
+    return VideoEngagementRecord(
+        datetime_publish=(NOW - timedelta(hours=age_hours)).isoformat(),
+        last_refreshed_at=last_refreshed_at,
+        views_per_hour=str(views_per_hour),
+    )
+
+
+def test_refresh_interval_by_age_tier():
+    planner = RefreshPlanner(tiers=TIERS, stale_interval_hours=168)
+
+    assert planner.refresh_interval(NOW - timedelta(hours=2), 0, NOW) == timedelta(
+        hours=1
+    )
+    assert planner.refresh_interval(NOW - timedelta(days=3), 0, NOW) == timedelta(
+        hours=6
+    )
+    assert planner.refresh_interval(NOW - timedelta(days=10), 0, NOW) == timedelta(
+        hours=24
+    )
+    assert planner.refresh_interval(NOW - timedelta(days=90), 0, NOW) == timedelta(
+        hours=168
+    )
+    assert planner.refresh_interval(None, 0, NOW) == timedelta(hours=168)
+
+
+def test_min_interval_shortest_of_tiers_and_stale():
+    assert RefreshPlanner(tiers=TIERS).min_interval() == timedelta(hours=1)
+    assert RefreshPlanner(
+        tiers=[(24, 48)], stale_interval_hours=12
+    ).min_interval() == timedelta(hours=12)
+
+
+def test_fast_moving_video_promoted_one_tier():
+    planner = RefreshPlanner(tiers=TIERS, fast_views_per_hour=100)
+
+    interval = planner.refresh_interval(NOW - timedelta(days=10), 250, NOW)
+
+    assert interval == timedelta(hours=6)
+
+
+def test_due_records_never_refreshed_first_and_not_due_skipped():
+    planner = RefreshPlanner(tiers=TIERS)
+    never_refreshed = make_record(age_hours=1)
+    overdue = make_record(age_hours=48, refreshed_hours_ago=12)
+    not_due = make_record(age_hours=48, refreshed_hours_ago=2)
+    old_not_due = make_record(age_hours=24 * 60, refreshed_hours_ago=30)
+
+    due = planner.due_records([overdue, not_due, old_not_due, never_refreshed], NOW)
+
+    assert due == [never_refreshed, overdue]
+
+
+def test_due_records_limit_keeps_most_overdue():
+    planner = RefreshPlanner(tiers=TIERS)
+    slightly_overdue = make_record(age_hours=48, refreshed_hours_ago=7)
+    very_overdue = make_record(age_hours=2, refreshed_hours_ago=5)
+
+    due = planner.due_records([slightly_overdue, very_overdue], NOW, limit=1)
+
+    assert due == [very_overdue]
@@ -0,0 +1,138 @@
+import threading
+from datetime import datetime
+
+import pytest
+
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.query_builder import QueryBuilder
+from video_generation_analysis.database_handler.schema import ScheduledJobRecord
+from video_generation_analysis.scheduler.cron_expression import CronExpression
+from video_generation_analysis.scheduler.scheduler import Scheduler
+
+TEST_DATETIME = datetime(2025, 11, 25, 12, 30, 0)
+
+
+class FakeClock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture
+def db_handler(tmp_path):
+    return DatabaseHandler(tmp_path / "scheduler.sqlite", ScheduledJobRecord)
+
+
+def test_cron_hourly_next_after():
+    cron = CronExpression("0 * * * *")
+    assert cron.next_after(TEST_DATETIME) == datetime(2025, 11, 25, 13, 0)
+
+
+def test_cron_daily_next_after_rolls_day():
+    cron = CronExpression("0 9 * * *")
+    assert cron.next_after(TEST_DATETIME) == datetime(2025, 11, 26, 9, 0)
+
+
+def test_cron_step_range_and_list():
+    cron = CronExpression("*/15 8-10 1,15 * *")
+    assert cron.next_after(TEST_DATETIME) == datetime(2025, 12, 1, 8, 0)
+    assert cron.next_after(datetime(2025, 12, 1, 8, 0)) == datetime(2025, 12, 1, 8, 15)
+
+
+def test_cron_weekday():
+    cron = CronExpression("0 0 * * 1")  # mondays
+    assert cron.next_after(TEST_DATETIME) == datetime(2025, 12, 1, 0, 0)
+
+
+@pytest.mark.parametrize("expression", ["* * * *", "60 * * * *", "*/0 * * * *"])
+def test_cron_invalid_expression(expression):
+    with pytest.raises(ValueError):
+        CronExpression(expression)
+
+
+def test_never_run_job_due_immediately_and_persisted(db_handler):
+    clock = FakeClock(TEST_DATETIME)
+    scheduler = Scheduler(db_handler, clock=clock)
+    calls = []
+    scheduler.add_job("job", "0 * * * *", lambda: calls.append(clock()))
+
+    assert scheduler.run_pending() == ["job"]
+    scheduler.shutdown()
+
+    assert calls == [TEST_DATETIME]
+    assert scheduler.next_run("job") == datetime(2025, 11, 25, 13, 0)
+    with db_handler as db:
+        record = db.read(QueryBuilder())[0]
+    assert record.last_status == "success"
+    assert record.last_run_start == TEST_DATETIME.isoformat()
+
+
+def test_restart_catches_up_missed_run(db_handler):
+    clock = FakeClock(TEST_DATETIME)
+    scheduler = Scheduler(db_handler, clock=clock)
+    scheduler.add_job("job", "0 * * * *", lambda: None)
+    scheduler.run_pending()
+    scheduler.shutdown()
+
+    # restart before next occurrence is not due
+    clock.now = datetime(2025, 11, 25, 12, 45)
+    restarted = Scheduler(db_handler, clock=clock)
+    restarted.add_job("job", "0 * * * *", lambda: None)
+    assert restarted.run_pending() == []
+    restarted.shutdown()
+
+    # restart after missing 13:00 runs once immediately
+    clock.now = datetime(2025, 11, 25, 15, 10)
+    restarted = Scheduler(db_handler, clock=clock)
+    restarted.add_job("job", "0 * * * *", lambda: None)
+    assert restarted.run_pending() == ["job"]
+    restarted.shutdown()
+    assert restarted.next_run("job") == datetime(2025, 11, 25, 16, 0)
+
+
+def test_failed_job_recorded_and_retried_on_restart(db_handler):
+    clock = FakeClock(TEST_DATETIME)
+    scheduler = Scheduler(db_handler, clock=clock)
+
+    def failing_job():
+        raise RuntimeError("boom")
+
+    scheduler.add_job("job", "0 0 * * *", failing_job)
+    scheduler.run_pending()
+    scheduler.shutdown()
+
+    with db_handler as db:
+        assert db.read(QueryBuilder())[0].last_status == "failed"
+
+    restarted = Scheduler(db_handler, clock=clock)
+    restarted.add_job("job", "0 0 * * *", lambda: None)
+    assert restarted.run_pending() == ["job"]
+    restarted.shutdown()
+
+
+def test_overlapping_run_skipped(db_handler):
+    clock = FakeClock(TEST_DATETIME)
+    scheduler = Scheduler(db_handler, clock=clock)
+    release = threading.Event()
+    scheduler.add_job("slow", "* * * * *", release.wait)
+
+    assert scheduler.run_pending() == ["slow"]
+    clock.now = datetime(2025, 11, 25, 12, 31)
+    assert scheduler.run_pending() == []  # still running
+
+    release.set()
+    scheduler.shutdown()
+
+
+def test_jobs_run_concurrently(db_handler):
+    clock = FakeClock(TEST_DATETIME)
+    scheduler = Scheduler(db_handler, max_workers=2, clock=clock)
+    barrier = threading.Barrier(2, timeout=5)
+    scheduler.add_job("generate", "0 9 * * *", barrier.wait)
+    scheduler.add_job("metrics", "0 * * * *", barrier.wait)
+
+    assert sorted(scheduler.run_pending()) == ["generate", "metrics"]
+    scheduler.shutdown()
+    assert not barrier.broken
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.query_builder import QueryBuilder
+from video_generation_analysis.database_handler.schema import VideoEngagementRecord
+from video_generation_analysis.local_services.simulation import (
+    SimulatedClock,
+    SimulatedPlatform,
+    build_simulation,
+    run_simulation,
+)
+
+START = datetime(2024, 1, 1)
+
+
+def test_simulated_engagement_grows_with_clock():
+    clock = SimulatedClock(START)
+    platform = SimulatedPlatform(clock, median_views=1000, growth_days=7, seed=1)
+    url = platform.publish_video(None, "Title", "Desc", ["kw00001", "kw00002"])
+
+    assert platform.get_engagement_metrics(url).views == 0
+    clock.now += timedelta(days=7)
+    week = platform.get_engagement_metrics(url)
+    clock.now += timedelta(days=70)
+    later = platform.get_engagement_metrics(url)
+
+    assert 0 < week.views < later.views
+    assert later.likes == later.views // 25
+    assert platform.get_engagement_metrics("https://elsewhere.invalid/1") is None
+
+
+def test_run_simulation_follows_schedules_in_simulated_time(tmp_path):
+    clock = SimulatedClock(START)
+    db_path = tmp_path / "simulation.db"
+    video_analytics, description_generator = build_simulation(
+        db_path, clock, tmp_path, vocabulary_size=50, seed=1
+    )
+
+    reports = run_simulation(
+        video_analytics,
+        description_generator,
+        clock,
+        days=3,
+        db_path=db_path,
+        prompt="kw00001 kw00002",
+    )
+
+    assert [report.videos for report in reports] == [1, 2, 3]
+    assert reports[-1].runs == {
+        "update_video_metrics": 24,
+        "compact_snapshots": 1,
+        "generate_video": 1,
+        "top_keywords": 1,
+    }
+    assert not any(report.errors for report in reports)
+    assert reports[-1].db_mb > 0 and reports[-1].rss_mb > 0
+    assert clock.now == START + timedelta(days=3)
+
+    with DatabaseHandler(db_path, VideoEngagementRecord) as db:
+        records = db.read(QueryBuilder().order_by("id"))
+    assert [record.datetime_publish[:16] for record in records] == [
+        "2024-01-01T09:00",
+        "2024-01-02T09:00",
+        "2024-01-03T09:00",
+    ]
+    assert int(records[0].views) > 0
+    # keywords expanded from seeded neighbours, later videos from top keywords
+    assert all(record.keywords for record in records)
+    assert description_generator.get_top_keywords(10)
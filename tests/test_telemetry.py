@@ -0,0 +1,114 @@
+import urllib.request
+
+import pytest
+
+from video_generation_analysis.local_services.fake_gemini import FakeGeminiAsyncClient
+from video_generation_analysis.local_services.fake_youtube import FakeYouTubeService
+from video_generation_analysis.local_services.load_harness import (
+    build_video_analytics,
+    run_load,
+)
+from video_generation_analysis.telemetry.telemetry import (
+    NOOP_SPAN,
+    Telemetry,
+    current_span,
+)
+
+
+def test_disabled_telemetry_hands_out_noop_span():
+    telemetry = Telemetry(enabled=False)
+
+    with telemetry.span("publish") as span:
+        span.add("bytes", 10)
+
+    assert span is NOOP_SPAN
+    assert "stage=" not in telemetry.render()
+
+
+def test_span_histogram_and_counters_rendered():
+    telemetry = Telemetry(enabled=True, prefix="test", buckets=[1, 10])
+    for _ in range(2):
+        with telemetry.span("publish") as span:
+            span.add("bytes", 100)
+            span.add("api_calls")
+    with pytest.raises(RuntimeError):
+        with telemetry.span("publish"):
+            raise RuntimeError("upload failed")
+
+    text = telemetry.render()
+
+    assert "# TYPE test_stage_duration_seconds histogram" in text
+    assert 'test_stage_duration_seconds_bucket{stage="publish",le="1"} 3' in text
+    assert 'test_stage_duration_seconds_bucket{stage="publish",le="+Inf"} 3' in text
+    assert 'test_stage_duration_seconds_count{stage="publish"} 3' in text
+    assert 'test_stage_runs_total{stage="publish",outcome="ok"} 2' in text
+    assert 'test_stage_runs_total{stage="publish",outcome="error"} 1' in text
+    assert 'test_stage_bytes_total{stage="publish"} 200' in text
+    assert 'test_stage_api_calls_total{stage="publish"} 2' in text
+
+
+def test_current_span_is_innermost_open_span():
+    telemetry = Telemetry(enabled=True)
+
+    with telemetry.span("refresh") as outer:
+        with telemetry.span("write") as inner:
+            current_span().add("retries")
+        current_span().add("retries", 2)
+    current_span().add("retries")  # no span open, dropped
+
+    assert inner.counters == {"retries": 1}
+    assert outer.counters == {"retries": 2}
+    assert current_span() is NOOP_SPAN
+
+
+def test_write_and_serve_prometheus_text(tmp_path):
+    telemetry = Telemetry(enabled=True)
+    with telemetry.span("record"):
+        pass
+
+    telemetry.write(tmp_path / "metrics.prom")
+    server = telemetry.serve(port=0, host="127.0.0.1")
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url) as response:
+            served = response.read().decode()
+    finally:
+        telemetry.shutdown()
+
+    assert served == (tmp_path / "metrics.prom").read_text()
+    assert 'stage="record"' in served
+
+
+def test_pipeline_stages_instrumented(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    telemetry = Telemetry(enabled=True, prefix="test")
+    youtube = FakeYouTubeService(latency_seconds=0)
+    gemini = FakeGeminiAsyncClient(
+        latency_seconds=0, completion_seconds=0, video_size_bytes=64
+    )
+    video_analytics = build_video_analytics(
+        tmp_path / "load.sqlite",
+        youtube,
+        lambda: gemini,
+        poll_interval_seconds=0,
+        telemetry=telemetry,
+    )
+
+    run_load(video_analytics, cycles=2, youtube=youtube)
+    text = telemetry.render()
+
+    for stage in [
+        "describe",
+        "generate",
+        "generate_request",
+        "download",
+        "publish",
+        "record",
+        "select_due",
+        "fetch_metrics",
+        "write_metrics",
+        "write_snapshots",
+    ]:
+        assert f'test_stage_duration_seconds_count{{stage="{stage}"}} 2' in text
+    assert 'test_stage_bytes_total{stage="download"} 128' in text
+    assert 'test_stage_api_calls_total{stage="fetch_metrics"} 3' in text
@@ -4,12 +4,21 @@ from pathlib import Path
 from unittest.mock import patch
 
 from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.engagement_snapshot_handler import (
+    EngagementSnapshotHandler,
+)
+from video_generation_analysis.database_handler.keyword_score_handler import (
+    KeywordScoreHandler,
+)
 from video_generation_analysis.database_handler.query_builder import (
     OrderByType,
     QueryBuilder,
 )
 from video_generation_analysis.database_handler.schema import VideoEngagementRecord
 from video_generation_analysis.video_analytics.video_analytics import VideoAnalytics
+from video_generation_analysis.video_platforms_handler.quota_manager import (
+    QuotaExceededError,
+)
 from video_generation_analysis.video_platforms_handler.video_platforms_handler import (
     VideoEngagement,
 )
@@ -151,6 +160,171 @@ class TestVideoAnalytis(unittest.TestCase):
                 assert int(record.likes) == self.UPDATED_ENGAGEMENT.likes
                 assert int(record.comments) == self.UPDATED_ENGAGEMENT.comments
 
+    def test_update_video_metrics_refreshes_new_and_skips_recent(
+        self, mock_description, mock_platforms, mock_video_generator
+    ):
+        (
+            mock_desc_inst,
+            mock_platforms_inst,
+            mock_video_gen_inst,
+        ) = self._setup_mocks(
+            mock_desc=mock_description,
+            mock_platforms=mock_platforms,
+            mock_video_gen=mock_video_generator,
+        )
+        video_analytics = VideoAnalytics(
+            db_handler=self._db_handler,
+            description_generator=mock_desc_inst,
+            video_generator=mock_video_gen_inst,
+            video_platforms=mock_platforms_inst,
+        )
+        new_record = VideoEngagementRecord(
+            datetime_publish=datetime.now(),
+            title="New Video",
+            urls=["url_new"],
+            views=0,
+            likes=0,
+            comments=0,
+        )
+        recent_record = VideoEngagementRecord(
+            datetime_publish=datetime.now(),
+            title="Recently Refreshed Video",
+            urls=["url_recent"],
+            views=10,
+            likes=1,
+            comments=0,
+            last_refreshed_at=datetime.now(),
+        )
+
+        with self._db_handler as db:
+            db.create(new_record)
+            db.create(recent_record)
+
+        video_analytics.update_video_metrics()
+
+        mock_platforms_inst.get_engagement_metrics_all.assert_called_once_with(
+            video_url=new_record.urls
+        )
+        with self._db_handler as db:
+            records = {record.title: record for record in db.read(QueryBuilder())}
+
+        refreshed = records[new_record.title]
+        assert int(refreshed.views) == self.UPDATED_ENGAGEMENT.views
+        assert refreshed.last_refreshed_at is not None
+        assert float(refreshed.views_per_hour) > 0
+        assert int(records[recent_record.title].views) == recent_record.views
+
+        with EngagementSnapshotHandler(self.DB_PATH) as snapshot_db:
+            curve = snapshot_db.growth_curve(refreshed.id)
+        assert len(curve) == 1
+        assert int(curve[0].views) == self.UPDATED_ENGAGEMENT.views
+
+    def test_update_video_metrics_updates_keyword_scores(
+        self, mock_description, mock_platforms, mock_video_generator
+    ):
+        (
+            mock_desc_inst,
+            mock_platforms_inst,
+            mock_video_gen_inst,
+        ) = self._setup_mocks(
+            mock_desc=mock_description,
+            mock_platforms=mock_platforms,
+            mock_video_gen=mock_video_generator,
+        )
+        video_analytics = VideoAnalytics(
+            db_handler=self._db_handler,
+            description_generator=mock_desc_inst,
+            video_generator=mock_video_gen_inst,
+            video_platforms=mock_platforms_inst,
+        )
+        with self._db_handler as db:
+            db.create_many(self.test_records)
+
+        video_analytics.update_video_metrics()
+
+        with KeywordScoreHandler(self.DB_PATH) as score_db:
+            top_keywords = score_db.top_keywords(10)
+        assert sorted(top_keywords) == ["fun", "gaming", "python", "tutorial"]
+
+        video_analytics.rebuild_keyword_scores()
+
+        with KeywordScoreHandler(self.DB_PATH) as score_db:
+            assert sorted(score_db.top_keywords(10)) == sorted(top_keywords)
+
+    def test_update_video_metrics_rolls_back_with_keyword_scores(
+        self, mock_description, mock_platforms, mock_video_generator
+    ):
+        (
+            mock_desc_inst,
+            mock_platforms_inst,
+            mock_video_gen_inst,
+        ) = self._setup_mocks(
+            mock_desc=mock_description,
+            mock_platforms=mock_platforms,
+            mock_video_gen=mock_video_generator,
+        )
+        video_analytics = VideoAnalytics(
+            db_handler=self._db_handler,
+            description_generator=mock_desc_inst,
+            video_generator=mock_video_gen_inst,
+            video_platforms=mock_platforms_inst,
+        )
+        with self._db_handler as db:
+            db.create_many(self.test_records)
+
+        with patch.object(
+            KeywordScoreHandler, "add_scores", side_effect=RuntimeError("disk full")
+        ):
+            with self.assertRaises(RuntimeError):
+                video_analytics.update_video_metrics()
+
+        with self._db_handler as db:
+            records = db.read(QueryBuilder())
+        assert not any(record.last_refreshed_at for record in records)
+        with EngagementSnapshotHandler(self.DB_PATH) as snapshot_db:
+            assert snapshot_db.growth_curve(records[0].id) == []
+
+        video_analytics.update_video_metrics()
+
+        with KeywordScoreHandler(self.DB_PATH) as score_db:
+            top_keywords = score_db.top_keywords(10)
+        video_analytics.rebuild_keyword_scores()
+        with KeywordScoreHandler(self.DB_PATH) as score_db:
+            assert score_db.top_keywords(10) == top_keywords
+
+    def test_update_video_metrics_defers_when_quota_exceeded(
+        self, mock_description, mock_platforms, mock_video_generator
+    ):
+        (
+            mock_desc_inst,
+            mock_platforms_inst,
+            mock_video_gen_inst,
+        ) = self._setup_mocks(
+            mock_desc=mock_description,
+            mock_platforms=mock_platforms,
+            mock_video_gen=mock_video_generator,
+        )
+        mock_platforms_inst.get_engagement_metrics_all.side_effect = [
+            self.UPDATED_ENGAGEMENT,
+            QuotaExceededError("quota"),
+        ]
+        video_analytics = VideoAnalytics(
+            db_handler=self._db_handler,
+            description_generator=mock_desc_inst,
+            video_generator=mock_video_gen_inst,
+            video_platforms=mock_platforms_inst,
+        )
+        with self._db_handler as db:
+            db.create_many(self.test_records)
+
+        video_analytics.update_video_metrics()
+
+        with self._db_handler as db:
+            records = db.read(QueryBuilder())
+        refreshed = [record for record in records if record.last_refreshed_at]
+        assert len(refreshed) == 1
+        assert int(refreshed[0].views) == self.UPDATED_ENGAGEMENT.views
+
     def _setup_mocks(self, mock_desc, mock_platforms, mock_video_gen):
         inst_desc = mock_desc.return_value
         inst_platforms = mock_platforms.return_value
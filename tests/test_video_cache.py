@@ -0,0 +1,126 @@
+import os
+from unittest.mock import Mock
+
+from video_generation_analysis.local_services.fake_gemini import FakeGeminiAsyncClient
+from video_generation_analysis.telemetry.telemetry import Telemetry
+from video_generation_analysis.video_generator.video_cache import VideoCache
+from video_generation_analysis.video_generator.video_generator import VideoGenerator
+
+DAY_SECONDS = 86400
+
+
+def make_video(path, size=16):
+    path.write_bytes(b"v" * size)
+    return path
+
+
+def test_key_depends_on_prompt_and_config():
+    key = VideoCache.key("cat", "veo", 8, "16:9")
+
+    assert key == VideoCache.key("cat", "veo", 8, "16:9")
+    assert key != VideoCache.key("dog", "veo", 8, "16:9")
+    assert key != VideoCache.key("cat", "veo", 4, "16:9")
+    assert key != VideoCache.key("cat", "veo", 8, "9:16")
+
+
+def test_get_miss_then_hit(tmp_path):
+    cache = VideoCache(tmp_path / "cache")
+    key = VideoCache.key("cat", "veo", 8, "16:9")
+
+    assert cache.get(key, tmp_path / "out.mp4") is None
+    cache.put(key, make_video(tmp_path / "rendered.mp4"))
+    cached_path = cache.get(key, tmp_path / "out.mp4")
+
+    assert cached_path == tmp_path / "out.mp4"
+    assert cached_path.read_bytes() == b"v" * 16
+    assert (cache.hits, cache.misses, cache.hit_rate) == (1, 1, 0.5)
+
+
+def test_deleting_returned_video_keeps_entry(tmp_path):
+    cache = VideoCache(tmp_path / "cache")
+    cache.put("key", make_video(tmp_path / "rendered.mp4"))
+    (tmp_path / "rendered.mp4").unlink()
+
+    cache.get("key", tmp_path / "first.mp4").unlink()
+
+    assert cache.get("key", tmp_path / "second.mp4").exists()
+
+
+def test_evicts_least_recently_used_over_max_bytes(tmp_path):
+    cache = VideoCache(tmp_path / "cache", max_bytes=32, clock=lambda: 3000)
+    for key, mtime in [("a", 2000), ("b", 1000)]:
+        cache.put(key, make_video(tmp_path / f"{key}.mp4"))
+        os.utime(tmp_path / "cache" / f"{key}.mp4", (mtime, mtime))
+
+    cache.put("c", make_video(tmp_path / "c.mp4"))
+
+    assert sorted(path.stem for path in (tmp_path / "cache").glob("*.mp4")) == [
+        "a",
+        "c",
+    ]
+
+
+def test_expired_entry_is_a_miss(tmp_path):
+    now = [0.0]
+    cache = VideoCache(tmp_path / "cache", max_age_days=1, clock=lambda: now[0])
+    cache.put("key", make_video(tmp_path / "rendered.mp4"))
+    now[0] = os.stat(tmp_path / "cache" / "key.mp4").st_mtime + 2 * DAY_SECONDS
+
+    assert cache.get("key", tmp_path / "out.mp4") is None
+    assert not (tmp_path / "cache" / "key.mp4").exists()
+
+
+def test_video_generator_reuses_cached_render(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    client = FakeGeminiAsyncClient(
+        latency_seconds=0, completion_seconds=0, video_size_bytes=64
+    )
+    telemetry = Telemetry(enabled=True)
+    vg = VideoGenerator(
+        client_factory=lambda: client,
+        poll_interval_seconds=0,
+        telemetry=telemetry,
+        video_cache=VideoCache(tmp_path / "cache"),
+    )
+
+    first_path = vg.create_video("cat")
+    first_path.unlink()  # deleted after publishing
+    second_path = vg.create_video("cat")
+
+    assert second_path.stat().st_size == 64
+    assert client.calls["generate_videos"] == 1
+    metrics = telemetry.render()
+    assert 'video_generation_stage_hits_total{stage="cache_lookup"} 1' in metrics
+    assert 'video_generation_stage_misses_total{stage="cache_lookup"} 1' in metrics
+
+
+def test_use_does_not_extend_expiry(tmp_path):
+    now = [0.0]
+    cache = VideoCache(tmp_path / "cache", max_age_days=1, clock=lambda: now[0])
+    cache.put("key", make_video(tmp_path / "rendered.mp4"))
+    cached_at = os.stat(tmp_path / "cache" / "key.mp4").st_mtime
+
+    for hours in (12, 23):
+        now[0] = cached_at + hours * 3600
+        cache.get("key", tmp_path / f"out_{hours}.mp4").unlink()
+    now[0] = cached_at + 25 * 3600
+
+    assert cache.get("key", tmp_path / "out.mp4") is None
+
+
+def test_video_returned_when_caching_fails(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cache = VideoCache(tmp_path / "cache")
+    monkeypatch.setattr(cache, "put", Mock(side_effect=OSError("disk full")))
+    vg = VideoGenerator(
+        client_factory=lambda: FakeGeminiAsyncClient(
+            latency_seconds=0, completion_seconds=0
+        ),
+        poll_interval_seconds=0,
+        video_cache=cache,
+    )
+
+    video_path = vg.create_video("cat")
+
+    assert video_path is not None and video_path.exists()
+    cache.put.assert_called_once()
@@ -0,0 +1,357 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.query_builder import QueryBuilder
+from video_generation_analysis.database_handler.schema import (
+    VideoEngagementRecord,
+    VideoJobRecord,
+    WorkItem,
+)
+from video_generation_analysis.local_services.fake_gemini import FakeGeminiAsyncClient
+from video_generation_analysis.local_services.fake_keyword_strategy import (
+    FakeKeywordStrategy,
+)
+from video_generation_analysis.local_services.fake_youtube import FakeYouTubeService
+from video_generation_analysis.scheduler.work_queue import (
+    ITEM_DONE,
+    ITEM_PENDING,
+    WorkQueue,
+)
+from video_generation_analysis.scheduler.worker import Worker
+from video_generation_analysis.video_analytics.video_analytics import (
+    JOB_FAILED,
+    JOB_GENERATED,
+    JOB_RECORDED,
+    JOB_UPLOADED,
+    VideoAnalytics,
+)
+from video_generation_analysis.video_analytics.video_work import (
+    WORK_GENERATE_VIDEO,
+    WORK_REFRESH_METRICS,
+    enqueue_generate_video,
+    enqueue_metrics_refreshes,
+    enqueue_pending_jobs,
+    video_work_handlers,
+)
+from video_generation_analysis.video_generator.description_generator import (
+    DescriptionGenerator,
+)
+from video_generation_analysis.video_generator.video_generator import VideoGenerator
+from video_generation_analysis.video_platforms_handler.video_platforms_handler import (
+    PlatformUnavailableError,
+    VideoPlatformsFacade,
+)
+from video_generation_analysis.video_platforms_handler.youtube_api_bridge import (
+    YouTubeApiBridge,
+)
+
+
+class FakeClock:
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    db_handler = DatabaseHandler(tmp_path / "jobs.sqlite", VideoEngagementRecord)
+    gemini = FakeGeminiAsyncClient(
+        latency_seconds=0, completion_seconds=0, video_size_bytes=64
+    )
+    platforms = [FakeYouTubeService(latency_seconds=0) for _ in range(2)]
+    video_analytics = VideoAnalytics(
+        db_handler=db_handler,
+        description_generator=DescriptionGenerator(
+            db_handler, FakeKeywordStrategy(seed=1), FakeKeywordStrategy(seed=2)
+        ),
+        video_generator=VideoGenerator(
+            client_factory=lambda: gemini, poll_interval_seconds=0
+        ),
+        video_platforms=VideoPlatformsFacade(
+            [YouTubeApiBridge(service=service) for service in platforms]
+        ),
+        max_job_attempts=2,
+    )
+    return video_analytics, db_handler, gemini, platforms
+
+
+def read_jobs(db_handler):
+    with DatabaseHandler(db_handler.db_path, VideoJobRecord) as db:
+        return db.read(QueryBuilder())
+
+
+def read_videos(db_handler):
+    with db_handler as db:
+        return db.read(QueryBuilder())
+
+
+def test_generate_video_records_job(pipeline, tmp_path):
+    video_analytics, db_handler, gemini, platforms = pipeline
+
+    video_analytics.generate_video(num_top_videos=5, prompt="cat")
+
+    (job,) = read_jobs(db_handler)
+    assert job.state == JOB_RECORDED
+    assert len(job.platform_urls) == 2
+    assert read_videos(db_handler)[0].urls == job.urls
+    assert not list(tmp_path.glob("*.mp4"))
+
+
+def test_publish_to_all_skips_published_platforms(tmp_path):
+    platforms = [FakeYouTubeService(latency_seconds=0) for _ in range(2)]
+    facade = VideoPlatformsFacade(
+        [YouTubeApiBridge(service=service) for service in platforms]
+    )
+    video_path = tmp_path / "video.mp4"
+    video_path.touch()
+    published = []
+
+    urls = facade.publish_to_all(
+        video_path,
+        "Title",
+        "Desc",
+        [],
+        published=["https://www.youtube.com/watch?v=done"],
+        on_published=lambda idx, url: published.append((idx, url)),
+    )
+
+    assert urls[0] == "https://www.youtube.com/watch?v=done"
+    assert published == [(1, urls[1])]
+    assert [service.calls["insert"] for service in platforms] == [0, 1]
+
+
+def test_resume_after_publish_failure_reuses_rendered_video(pipeline, tmp_path):
+    video_analytics, db_handler, gemini, platforms = pipeline
+    for service in platforms:
+        service._error_rate = 1.0
+
+    with pytest.raises(ValueError):
+        video_analytics.generate_video(num_top_videos=5, prompt="cat")
+
+    (job,) = read_jobs(db_handler)
+    assert job.state == JOB_GENERATED
+    assert (tmp_path / job.video_path).is_file()  # render kept for resume
+
+    for service in platforms:
+        service._error_rate = 0.0
+    assert video_analytics.resume_pending_jobs() == 1
+
+    (job,) = read_jobs(db_handler)
+    assert job.state == JOB_RECORDED
+    assert gemini.calls["generate_videos"] == 1  # not rendered again
+    assert len(read_videos(db_handler)) == 1
+    assert not list(tmp_path.glob("*.mp4"))
+
+
+def test_resume_after_crash_before_record_does_not_republish(pipeline):
+    video_analytics, db_handler, gemini, platforms = pipeline
+
+    with patch.object(
+        VideoAnalytics, "_record_job_video", side_effect=RuntimeError("killed")
+    ):
+        with pytest.raises(RuntimeError):
+            video_analytics.generate_video(num_top_videos=5, prompt="cat")
+    assert read_jobs(db_handler)[0].state == JOB_UPLOADED
+
+    video_analytics.resume_pending_jobs()
+
+    assert read_jobs(db_handler)[0].state == JOB_RECORDED
+    assert [service.calls["insert"] for service in platforms] == [1, 1]
+    assert len(read_videos(db_handler)) == 1
+
+
+def test_job_marked_failed_after_max_attempts(pipeline, tmp_path):
+    video_analytics, db_handler, gemini, platforms = pipeline
+    for service in platforms:
+        service._error_rate = 1.0
+
+    with pytest.raises(ValueError):
+        video_analytics.generate_video(num_top_videos=5, prompt="cat")
+    video_analytics.resume_pending_jobs()
+
+    (job,) = read_jobs(db_handler)
+    assert job.state == JOB_FAILED
+    assert int(job.attempts) == 2
+    assert "publishing failed" in job.error
+    assert not list(tmp_path.glob("*.mp4"))
+    assert video_analytics.resume_pending_jobs() == 0
+
+
+def test_job_waits_for_every_platform_upload(pipeline, tmp_path):
+    video_analytics, db_handler, gemini, platforms = pipeline
+    platforms[0]._error_rate = 1.0
+
+    with pytest.raises(ValueError, match=r"platforms \[0\]"):
+        video_analytics.generate_video(num_top_videos=5, prompt="cat")
+
+    (job,) = read_jobs(db_handler)
+    assert job.state == JOB_GENERATED
+    assert job.platform_urls[0] == "" and job.platform_urls[1]
+    assert not read_videos(db_handler)
+    assert video_analytics.pending_jobs()
+
+    platforms[0]._error_rate = 0.0
+    video_analytics.resume_pending_jobs()
+
+    (job,) = read_jobs(db_handler)
+    assert job.state == JOB_RECORDED
+    assert [service.calls["insert"] for service in platforms] == [2, 1]
+    assert read_videos(db_handler)[0].urls == job.platform_urls
+
+
+def test_failed_job_records_urls_already_live(pipeline, tmp_path):
+    video_analytics, db_handler, gemini, platforms = pipeline
+    platforms[0]._error_rate = 1.0
+
+    with pytest.raises(ValueError):
+        video_analytics.generate_video(num_top_videos=5, prompt="cat")
+    video_analytics.resume_pending_jobs()
+
+    (job,) = read_jobs(db_handler)
+    assert job.state == JOB_FAILED
+    (video,) = read_videos(db_handler)
+    assert video.urls[0] == "" and video.urls[1] == job.platform_urls[1]
+
+
+def test_worker_resumes_generation_after_lease_expiry(pipeline, tmp_path):
+    video_analytics, db_handler, gemini, platforms = pipeline
+    clock = FakeClock(datetime(2025, 11, 25, 12, 0, 0))
+    queue = WorkQueue(
+        DatabaseHandler(tmp_path / "queue.sqlite", WorkItem),
+        visibility_timeout_seconds=60,
+        clock=clock,
+    )
+    handlers = video_work_handlers(video_analytics)
+    enqueue_generate_video(queue, num_top_videos=5, prompt="cat", now=clock())
+
+    with patch.object(
+        VideoAnalytics, "_record_job_video", side_effect=RuntimeError("killed")
+    ):
+        item = queue.lease("worker-a")
+        with pytest.raises(RuntimeError):
+            handlers[WORK_GENERATE_VIDEO](item, Worker(queue, handlers, "worker-a"))
+    clock.now += timedelta(seconds=61)  # worker-a died holding the lease
+
+    worker = Worker(queue, handlers, worker_id="worker-b")
+    assert worker.run_once()
+
+    (job,) = read_jobs(db_handler)
+    assert job.state == JOB_RECORDED
+    assert gemini.calls["generate_videos"] == 1
+    assert [service.calls["insert"] for service in platforms] == [1, 1]
+
+
+def test_metrics_refreshes_enqueued_in_batches(pipeline, tmp_path):
+    video_analytics, db_handler, gemini, platforms = pipeline
+    for idx in range(5):
+        video_analytics.generate_video(num_top_videos=5, prompt=f"cat {idx}")
+    queue = WorkQueue(DatabaseHandler(tmp_path / "queue.sqlite", WorkItem))
+
+    assert enqueue_metrics_refreshes(queue, video_analytics, batch_size=2) == 3
+    assert enqueue_metrics_refreshes(queue, video_analytics, batch_size=2) == 0
+    worker = Worker(queue, video_work_handlers(video_analytics))
+    while worker.run_once():
+        pass
+
+    assert all(video.last_refreshed_at for video in read_videos(db_handler))
+    assert queue.outstanding(WORK_REFRESH_METRICS) == 0
+
+
+def test_publish_deferred_while_platform_circuit_open(pipeline, tmp_path):
+    video_analytics, db_handler, gemini, platforms = pipeline
+    clock = FakeClock(0.0)
+    video_analytics._video_platforms = VideoPlatformsFacade(
+        [YouTubeApiBridge(service=service) for service in platforms],
+        failure_threshold=1,
+        reset_timeout_seconds=60,
+        clock=clock,
+    )
+    platforms[1]._error_rate = 1.0
+    with pytest.raises(ValueError):  # opens circuit
+        video_analytics.generate_video(num_top_videos=5, prompt="cat")
+
+    with pytest.raises(PlatformUnavailableError):
+        video_analytics.generate_video(num_top_videos=5, prompt="dog")
+
+    job = read_jobs(db_handler)[1]
+    assert job.state == JOB_GENERATED
+    assert int(job.attempts) == 0  # deferral doesn't use up an attempt
+    assert job.platform_urls[0] and platforms[1].calls["insert"] == 1
+
+    platforms[1]._error_rate = 0.0
+    clock.now += 60
+    video_analytics.resume_pending_jobs()
+
+    for job in read_jobs(db_handler):
+        assert job.state == JOB_RECORDED
+        assert all(job.urls) and len(job.urls) == 2
+
+
+def test_worker_defers_publish_while_platform_circuit_open(pipeline, tmp_path):
+    video_analytics, db_handler, gemini, platforms = pipeline
+    platform_clock = FakeClock(0.0)
+    video_analytics._video_platforms = VideoPlatformsFacade(
+        [YouTubeApiBridge(service=service) for service in platforms],
+        failure_threshold=1,
+        reset_timeout_seconds=60,
+        clock=platform_clock,
+    )
+    platforms[1]._error_rate = 1.0
+    with pytest.raises(ValueError):  # opens circuit
+        video_analytics.generate_video(num_top_videos=5, prompt="cat")
+    clock = FakeClock(datetime(2025, 11, 25, 12, 0, 0))
+    queue = WorkQueue(
+        DatabaseHandler(tmp_path / "queue.sqlite", WorkItem),
+        visibility_timeout_seconds=600,
+        max_attempts=1,
+        clock=clock,
+    )
+    worker = Worker(queue, video_work_handlers(video_analytics), "worker-a")
+    enqueue_generate_video(queue, num_top_videos=5, prompt="dog", now=clock())
+
+    assert worker.run_once()
+    for _ in range(3):
+        assert not worker.run_once()  # hidden until the circuit may be probed
+
+    (item,) = queue.outstanding_items(WORK_GENERATE_VIDEO)
+    assert (item.state, int(item.attempts)) == (ITEM_PENDING, 0)
+    assert read_jobs(db_handler)[1].state == JOB_GENERATED
+
+    platforms[1]._error_rate = 0.0
+    platform_clock.now += 60
+    clock.now += timedelta(seconds=60)
+    assert worker.run_once()
+
+    job = read_jobs(db_handler)[1]
+    assert job.state == JOB_RECORDED
+    assert len(job.urls) == 2
+    assert gemini.calls["generate_videos"] == 2
+    with DatabaseHandler(tmp_path / "queue.sqlite", WorkItem) as db:
+        assert db.read(QueryBuilder())[0].state == ITEM_DONE
+
+
+def test_dispatcher_enqueues_jobs_no_item_handles(pipeline, tmp_path):
+    video_analytics, db_handler, gemini, platforms = pipeline
+    with patch.object(
+        VideoAnalytics, "_record_job_video", side_effect=RuntimeError("killed")
+    ):
+        with pytest.raises(RuntimeError):
+            video_analytics.generate_video(num_top_videos=5, prompt="cat")
+    (job,) = read_jobs(db_handler)
+    updated_at = datetime.fromisoformat(job.updated_at)
+    queue = WorkQueue(DatabaseHandler(tmp_path / "queue.sqlite", WorkItem))
+
+    assert enqueue_pending_jobs(queue, video_analytics, now=updated_at) == 0  # idle
+    later = updated_at + timedelta(hours=1)
+    assert enqueue_pending_jobs(queue, video_analytics, now=later) == 1
+    assert enqueue_pending_jobs(queue, video_analytics, now=later) == 0  # handled
+    assert Worker(queue, video_work_handlers(video_analytics)).run_once()
+
+    assert read_jobs(db_handler)[0].state == JOB_RECORDED
+    assert enqueue_pending_jobs(queue, video_analytics, now=later) == 0
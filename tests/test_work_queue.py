@@ -0,0 +1,222 @@
+import multiprocessing
+import threading
+from datetime import datetime, timedelta
+
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.query_builder import QueryBuilder
+from video_generation_analysis.database_handler.schema import WorkItem
+from video_generation_analysis.scheduler.work_queue import (
+    ITEM_DEAD,
+    ITEM_DONE,
+    ITEM_LEASED,
+    ITEM_PENDING,
+    WorkQueue,
+    item_payload,
+)
+from video_generation_analysis.scheduler.worker import Worker
+
+NOW = datetime(2025, 11, 25, 12, 0, 0)
+
+
+class FakeClock:
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def make_queue(db_path, clock=None, max_attempts=3):
+    return WorkQueue(
+        DatabaseHandler(db_path, WorkItem),
+        visibility_timeout_seconds=60,
+        max_attempts=max_attempts,
+        clock=clock or FakeClock(NOW),
+    )
+
+
+def read_items(queue_db_path):
+    with DatabaseHandler(queue_db_path, WorkItem) as db:
+        return db.read(QueryBuilder().order_by("id"))
+
+
+def test_lease_hides_item_until_visibility_timeout(tmp_path):
+    clock = FakeClock(NOW)
+    queue = make_queue(tmp_path / "q.sqlite", clock)
+    queue.enqueue("refresh", {"record_ids": [1, 2]})
+
+    item = queue.lease("worker-a")
+
+    assert item_payload(item) == {"record_ids": [1, 2]}
+    assert queue.lease("worker-b") is None
+    clock.now = NOW + timedelta(seconds=61)  # worker-a died without heartbeats
+    retried = queue.lease("worker-b")
+    assert retried.id == item.id
+    assert int(retried.attempts) == 2
+    assert not queue.complete(item, "worker-a")  # stale lease can't complete
+    assert queue.complete(retried, "worker-b")
+    assert read_items(tmp_path / "q.sqlite")[0].state == ITEM_DONE
+
+
+def test_heartbeat_extends_lease(tmp_path):
+    clock = FakeClock(NOW)
+    queue = make_queue(tmp_path / "q.sqlite", clock)
+    queue.enqueue("refresh", {})
+    item = queue.lease("worker-a")
+
+    clock.now = NOW + timedelta(seconds=50)
+    assert queue.heartbeat(item, "worker-a")
+    clock.now = NOW + timedelta(seconds=100)
+
+    assert queue.lease("worker-b") is None
+
+
+def test_lease_filters_kinds(tmp_path):
+    queue = make_queue(tmp_path / "q.sqlite")
+    queue.enqueue("generate", {})
+    queue.enqueue("refresh", {})
+
+    assert queue.lease("worker", kinds=["refresh"]).kind == "refresh"
+    assert queue.outstanding("generate") == 1
+    assert queue.outstanding("refresh") == 1
+
+
+def test_enqueue_dedupe_key(tmp_path):
+    queue = make_queue(tmp_path / "q.sqlite")
+
+    assert queue.enqueue("generate", {}, dedupe_key="generate:09:00") is not None
+    assert queue.enqueue("generate", {}, dedupe_key="generate:09:00") is None
+    assert len(read_items(tmp_path / "q.sqlite")) == 1
+
+
+def test_failed_item_retried_then_dead_lettered(tmp_path):
+    queue = make_queue(tmp_path / "q.sqlite", max_attempts=2)
+    queue.enqueue("refresh", {})
+
+    queue.fail(queue.lease("worker"), "worker", "boom")
+    assert read_items(tmp_path / "q.sqlite")[0].state == ITEM_PENDING
+    queue.fail(queue.lease("worker"), "worker", "boom again")
+
+    (item,) = read_items(tmp_path / "q.sqlite")
+    assert item.state == ITEM_DEAD
+    assert item.error == "boom again"
+    assert queue.lease("worker") is None
+
+
+def test_expired_final_lease_dead_lettered(tmp_path):
+    clock = FakeClock(NOW)
+    queue = make_queue(tmp_path / "q.sqlite", clock, max_attempts=1)
+    queue.enqueue("refresh", {})
+    queue.lease("worker-a")
+
+    clock.now = NOW + timedelta(minutes=5)
+
+    assert queue.lease("worker-b") is None
+    assert read_items(tmp_path / "q.sqlite")[0].state == ITEM_DEAD
+
+
+def test_purge_removes_old_finished_items(tmp_path):
+    clock = FakeClock(NOW)
+    queue = WorkQueue(
+        DatabaseHandler(tmp_path / "q.sqlite", WorkItem),
+        max_attempts=1,
+        retention_days=7,
+        clock=clock,
+    )
+    for kind in ["done", "dead", "pending", "recent"]:
+        queue.enqueue(kind, {}, dedupe_key=kind)
+    queue.complete(queue.lease("worker", kinds=["done"]), "worker")
+    queue.fail(queue.lease("worker", kinds=["dead"]), "worker", "boom")
+    clock.now = NOW + timedelta(days=7, seconds=1)
+    queue.complete(queue.lease("worker", kinds=["recent"]), "worker")
+
+    queue.purge()
+
+    assert [item.kind for item in read_items(tmp_path / "q.sqlite")] == [
+        "pending",
+        "recent",
+    ]
+    assert queue.enqueue("done", {}, dedupe_key="done") is not None
+
+
+def test_worker_runs_handler_and_completes(tmp_path):
+    queue = make_queue(tmp_path / "q.sqlite", clock=datetime.now)
+    queue.enqueue("refresh", {"record_ids": [3]})
+    seen = []
+    worker = Worker(
+        queue,
+        {"refresh": lambda item, worker: seen.append(item_payload(item))},
+        worker_id="worker",
+    )
+
+    assert worker.run_once()
+    assert not worker.run_once()
+    assert seen == [{"record_ids": [3]}]
+    assert read_items(tmp_path / "q.sqlite")[0].state == ITEM_DONE
+
+
+def test_worker_heartbeats_long_running_item(tmp_path):
+    queue = WorkQueue(
+        DatabaseHandler(tmp_path / "q.sqlite", WorkItem),
+        visibility_timeout_seconds=0.3,
+    )
+    queue.enqueue("generate", {})
+    started, release = threading.Event(), threading.Event()
+
+    def handler(item, worker):
+        started.set()
+        release.wait(timeout=10)
+
+    worker = Worker(queue, {"generate": handler}, heartbeat_seconds=0.05)
+    thread = threading.Thread(target=worker.run_once)
+    thread.start()
+    started.wait(timeout=10)
+    threading.Event().wait(0.6)  # two visibility timeouts
+
+    assert queue.lease("other-worker") is None
+    release.set()
+    thread.join(timeout=10)
+    assert read_items(tmp_path / "q.sqlite")[0].state == ITEM_DONE
+
+
+def test_worker_failure_releases_item(tmp_path):
+    queue = make_queue(tmp_path / "q.sqlite", clock=datetime.now)
+    queue.enqueue("refresh", {})
+
+    def handler(item, worker):
+        raise RuntimeError("platform down")
+
+    Worker(queue, {"refresh": handler}).run_once()
+
+    (item,) = read_items(tmp_path / "q.sqlite")
+    assert item.state == ITEM_PENDING
+    assert item.error == "platform down"
+
+
+def _lease_all(db_path, results):
+    queue = WorkQueue(DatabaseHandler(db_path, WorkItem))
+    leased = []
+    while item := queue.lease(f"worker-{multiprocessing.current_process().pid}"):
+        leased.append(item.id)
+    results.put(leased)
+
+
+def test_no_item_leased_twice_across_processes(tmp_path):
+    db_path = tmp_path / "q.sqlite"
+    queue = WorkQueue(DatabaseHandler(db_path, WorkItem))
+    for idx in range(60):
+        queue.enqueue("refresh", {"idx": idx})
+
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    processes = [
+        context.Process(target=_lease_all, args=(db_path, results)) for _ in range(3)
+    ]
+    for process in processes:
+        process.start()
+    leased = [item_id for _ in processes for item_id in results.get(timeout=60)]
+    for process in processes:
+        process.join(timeout=10)
+
+    assert sorted(leased) == list(range(1, 61))
+    assert all(item.state == ITEM_LEASED for item in read_items(db_path))
@@ -0,0 +1,202 @@
+import asyncio
+import json
+from datetime import datetime
+
+import httpx
+import pytest
+
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.query_builder import QueryBuilder
+from video_generation_analysis.database_handler.schema import (
+    QuotaBucket,
+    VideoEngagementRecord,
+)
+from video_generation_analysis.local_services.fake_keyword_strategy import (
+    FakeKeywordStrategy,
+)
+from video_generation_analysis.telemetry.telemetry import Telemetry
+from video_generation_analysis.video_analytics.refresh_planner import RefreshPlanner
+from video_generation_analysis.video_analytics.video_analytics import VideoAnalytics
+from video_generation_analysis.video_generator.description_generator import (
+    DescriptionGenerator,
+)
+from video_generation_analysis.video_platforms_handler.quota_manager import (
+    QuotaExceededError,
+    QuotaManager,
+)
+from video_generation_analysis.video_platforms_handler.video_platforms_handler import (
+    VideoPlatformsFacade,
+)
+from video_generation_analysis.video_platforms_handler.youtube_api_bridge import (
+    YouTubeApiBridge,
+)
+from video_generation_analysis.video_platforms_handler.youtube_metrics import (
+    YouTubeMetricsTransport,
+)
+
+URL_PREFIX = "https://www.youtube.com/watch?v="
+
+
+class FakeVideosApi:
+    """Serves videos.list statistics, views = numeric part of id"""
+
+    def __init__(self, failures: int = 0, delay_seconds: float = 0.0) -> None:
+        self.requests: list[list[str]] = []
+        self.failures = failures
+        self.delay_seconds = delay_seconds
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay_seconds)
+            if self.failures:
+                self.failures -= 1
+                return httpx.Response(503)
+            ids = request.url.params["id"].split(",")
+            self.requests.append(ids)
+            items = [
+                {"id": video_id, "statistics": {"viewCount": video_id[1:]}}
+                for video_id in ids
+                if video_id.startswith("v")
+            ]
+            return httpx.Response(200, content=json.dumps({"items": items}))
+        finally:
+            self.in_flight -= 1
+
+    def transport(self, **kwargs) -> YouTubeMetricsTransport:
+        kwargs.setdefault("retry_backoff_seconds", 0)
+        return YouTubeMetricsTransport(
+            "key", transport=httpx.MockTransport(self.handler), **kwargs
+        )
+
+
+def test_fetch_batches_fifty_ids_per_request():
+    api = FakeVideosApi()
+
+    engagements = api.transport().fetch_statistics([f"v{idx}" for idx in range(120)])
+
+    assert [len(ids) for ids in api.requests] == [50, 50, 20]
+    assert len(engagements) == 120
+    assert engagements["v42"].views == 42
+
+
+def test_concurrency_bounded():
+    api = FakeVideosApi(delay_seconds=0.01)
+
+    api.transport(max_concurrency=2).fetch_statistics([f"v{idx}" for idx in range(500)])
+
+    assert len(api.requests) == 10
+    assert api.max_in_flight == 2
+
+
+def test_client_reused_across_calls_until_closed():
+    api = FakeVideosApi()
+    closed = []
+
+    class ClosingTransport(httpx.MockTransport):
+        async def aclose(self) -> None:
+            closed.append(1)
+
+    metrics = YouTubeMetricsTransport("key", transport=ClosingTransport(api.handler))
+    for batch in range(3):
+        metrics.fetch_statistics([f"v{batch}"])
+    assert closed == []  # one pooled client for every batch
+
+    metrics.close()
+    assert closed == [1]
+    assert metrics.fetch_statistics(["v7"])["v7"].views == 7  # reopened
+    metrics.close()
+    metrics.close()  # already closed
+    assert closed == [1, 1]
+
+
+def test_retries_server_errors():
+    api = FakeVideosApi(failures=2)
+    telemetry = Telemetry(enabled=True)
+
+    with telemetry.span("fetch_metrics") as span:
+        engagements = api.transport(max_retries=2).fetch_statistics(["v1"])
+
+    assert engagements["v1"].views == 1
+    assert span.counters == {"retries": 2}
+
+
+def test_gives_up_after_max_retries():
+    api = FakeVideosApi(failures=5)
+
+    with pytest.raises(httpx.HTTPError):
+        api.transport(max_retries=1).fetch_statistics(["v1"])
+
+
+def test_bridge_spends_quota_per_request_and_aligns_missing(tmp_path):
+    api = FakeVideosApi()
+    quota_manager = QuotaManager(
+        DatabaseHandler(tmp_path / "quota.sqlite", QuotaBucket),
+        daily_quota=10000,
+        upload_reserve=0,
+        clock=lambda: datetime(2025, 11, 25, 12, 0, 0),
+    )
+    bridge = YouTubeApiBridge(
+        quota_manager=quota_manager, service=object(), metrics_transport=api.transport()
+    )
+    urls = [f"{URL_PREFIX}v{idx}" for idx in range(60)] + [f"{URL_PREFIX}gone"]
+
+    engagements = bridge.get_engagement_metrics_many(urls)
+
+    assert [engagement.views for engagement in engagements[:3]] == [0, 1, 2]
+    assert engagements[-1] is None
+    assert quota_manager.available() == 9998  # two requests of up to 50 ids
+
+
+def test_bridge_raises_when_quota_exhausted(tmp_path):
+    quota_manager = QuotaManager(
+        DatabaseHandler(tmp_path / "quota.sqlite", QuotaBucket),
+        daily_quota=1,
+        upload_reserve=1,
+    )
+    bridge = YouTubeApiBridge(
+        quota_manager=quota_manager,
+        service=object(),
+        metrics_transport=FakeVideosApi().transport(),
+    )
+
+    with pytest.raises(QuotaExceededError):
+        bridge.get_engagement_metrics_many([f"{URL_PREFIX}v1"])
+
+
+def test_update_video_metrics_fetches_in_batches(tmp_path):
+    api = FakeVideosApi()
+    db_handler = DatabaseHandler(tmp_path / "videos.sqlite", VideoEngagementRecord)
+    with db_handler as db:
+        db.create_many(
+            [
+                VideoEngagementRecord(
+                    datetime_publish=datetime.now(),
+                    urls=[f"{URL_PREFIX}v{idx}"],
+                    keywords=["cat"],
+                )
+                for idx in range(1, 121)
+            ]
+        )
+    video_analytics = VideoAnalytics(
+        db_handler=db_handler,
+        description_generator=DescriptionGenerator(
+            db_handler, FakeKeywordStrategy(), FakeKeywordStrategy()
+        ),
+        video_generator=object(),
+        video_platforms=VideoPlatformsFacade(
+            [YouTubeApiBridge(service=object(), metrics_transport=api.transport())]
+        ),
+        refresh_planner=RefreshPlanner(tiers=[]),
+        metrics_batch_size=100,
+    )
+
+    video_analytics.update_video_metrics()
+
+    with db_handler as db:
+        records = db.read(QueryBuilder())
+    assert [len(ids) for ids in api.requests] == [50, 50, 20]
+    assert all(int(record.views) == record.id for record in records)
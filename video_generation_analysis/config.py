@@ -1,9 +1,24 @@
 # DATABASE CONFIG
 DATABASE_PATH = "video_generation_analysis.db"
+DATABASE_JOURNAL_MODE = "WAL"  # readers don't block on writer
+DATABASE_SYNCHRONOUS = "NORMAL"  # durable on WAL checkpoint, fewer fsyncs
+DATABASE_BUSY_TIMEOUT_MS = 5000
+DATABASE_MAX_RETRIES = 5  # retries of statements failing with SQLITE_BUSY
+DATABASE_RETRY_BACKOFF_SECONDS = 0.05  # doubled each retry
+DATABASE_ASYNC_READERS = 4  # reader threads of AsyncDatabaseHandler
+DATABASE_STATEMENT_CACHE_SIZE = 256  # prepared statements cached per connection
+QUERY_PLAN_CACHE_SIZE = 512  # compiled QueryBuilder plans cached per process
+SQLITE_MAX_VARIABLE_NUMBER = 999  # bound parameters per statement, older SQLite
+DATABASE_READ_PAGE_SIZE = 1000  # rows per keyset page for full table scans
+ARCHIVE_DIR = "archive"  # monthly compressed partitions of old video records
+ARCHIVE_KEEP_MONTHS = 12  # months of videos kept in hot table besides current
 
 # GENSIM KEYWORD MODEL
 GENSIM_MODEL = "glove-wiki-gigaword-50"
 
+KEYWORD_NEIGHBOURS_TOPN = 20  # neighbours precomputed per keyword for lookups
+KEYWORD_NEIGHBOURS_SCHEDULE = "15 * * * *"  # hourly, only new keywords computed
+
 # HUGGING FACE KEYWORD MODEL
 HUGGING_FACE_MODEL = "mrm8488/t5-base-finetuned-common_gen"
 
@@ -12,14 +27,94 @@ GEMINI_API_KEY_ENV = "GEMINI_API_KEY"
 GEMINI_MODEL_NAME = "veo-3.1-generate-preview"
 VIDEO_DURATION_SECONDS = 8
 VIDEO_ASPECT_RATIO = "16:9"
+VIDEO_POLL_INTERVAL_SECONDS = 5  # between generation operation status checks
+VIDEO_MAX_POLL_ATTEMPTS = 50
+VIDEO_CACHE_DIR = ".video_cache"  # rendered videos reused for repeated prompts
+VIDEO_CACHE_MAX_BYTES = 5 * 1024**3
+VIDEO_CACHE_MAX_AGE_DAYS = 30
 TITLE_MAX_LENGTH = 20
 TITLE_MIN_LENGTH = 5
 DESCRIPTION_MAX_LENGTH = 150
 DESCRIPTION_MIN_LENGTH = 50
 NUM_KEYWORDS = 6
+NUM_TOP_KEYWORDS = 20  # top scored keywords seeding keyword generation
+VIDEO_JOB_MAX_ATTEMPTS = 3  # runs of a video job before it is marked failed
+NEAR_DUPLICATE_THRESHOLD = 0.8  # title+description word shingle Jaccard similarity
+NEAR_DUPLICATE_NUM_PERM = 64  # MinHash permutations per description
+NEAR_DUPLICATE_BANDS = 16  # LSH bands of NUM_PERM / BANDS rows each
+NEAR_DUPLICATE_SHINGLE_WORDS = 2
+NEAR_DUPLICATE_MAX_REGENERATIONS = 3  # new descriptions tried before skipping video
+NUM_DESCRIPTION_CANDIDATES = 20  # keyword sets scored per video, best described
+CANDIDATE_RIDGE_ALPHA = 1.0  # L2 penalty of candidate engagement regression
+CANDIDATE_MAX_FEATURES = 2000  # most frequent keywords used as regression features
+CANDIDATE_REFIT_HOURS = 24  # candidate scorer retrained on records this often
+CANDIDATE_TRIES_PER_CANDIDATE = 3  # keyword expansions tried per distinct candidate
 
 # VIDEO UPLOAD CONFIG
 YOUTUBE_CLIENT_SECRETS_ENV = "YOUTUBE_CLIENT_SECRETS_FILE"
 YOUTUBE_SCOPES = ["https://www.googleapis.com/auth/youtube.upload"]
 YOUTUBE_SERVICE_NAME = "youtube"
 YOUTUBE_API_VERSION = "v3"
+YOUTUBE_DAILY_QUOTA = 10000  # API units per quota day
+YOUTUBE_QUOTA_TIMEZONE = "America/Los_Angeles"  # quota resets at its midnight
+YOUTUBE_QUOTA_COSTS = {"videos.insert": 1600, "videos.list": 1}
+YOUTUBE_UPLOAD_RESERVE = 1600  # units only uploads may spend, one upload a day
+YOUTUBE_API_KEY_ENV = "YOUTUBE_API_KEY"  # enables async batched metrics transport
+YOUTUBE_API_BASE_URL = "https://www.googleapis.com/youtube/v3"
+YOUTUBE_MAX_IDS_PER_LIST = 50  # video ids per videos.list request, API maximum
+YOUTUBE_METRICS_MAX_CONCURRENCY = 8  # in-flight videos.list requests
+YOUTUBE_METRICS_MAX_RETRIES = 3  # per request, on 429/5xx & connection errors
+YOUTUBE_METRICS_TIMEOUT_SECONDS = 10
+YOUTUBE_METRICS_RETRY_BACKOFF_SECONDS = 0.5  # doubled each retry
+
+# PLATFORM HEALTH CONFIG (per-platform circuit breaker in VideoPlatformsFacade)
+PLATFORM_FAILURE_THRESHOLD = 5  # consecutive failures opening circuit
+PLATFORM_RESET_TIMEOUT_SECONDS = 300  # open circuit wait before a probe call
+PLATFORM_SLOW_CALL_SECONDS = 30  # metrics calls slower than this count as failed
+PLATFORM_HEALTH_WINDOW = 100  # recent calls in error rate & latency stats
+
+# SCHEDULER CONFIG (cron: minute hour day-of-month month day-of-week)
+GENERATE_VIDEO_SCHEDULE = "0 9 * * *"  # daily 09:00
+UPDATE_METRICS_SCHEDULE = "0 * * * *"  # hourly
+COMPACT_SNAPSHOTS_SCHEDULE = "30 3 * * *"  # daily 03:30
+ARCHIVE_SCHEDULE = "0 4 1 * *"  # monthly, 1st at 04:00
+SCHEDULER_MAX_WORKERS = 2
+SCHEDULER_POLL_SECONDS = 30
+
+# WORK QUEUE CONFIG (--dispatch enqueues scheduled work, --worker processes lease it)
+WORK_QUEUE_VISIBILITY_TIMEOUT_SECONDS = 600  # lease expiry without heartbeat
+WORK_QUEUE_HEARTBEAT_SECONDS = 60  # lease extension interval while running
+WORK_QUEUE_MAX_ATTEMPTS = 3  # leases before item is dead-lettered
+WORK_QUEUE_RETENTION_DAYS = 14  # done & dead items purged after
+WORK_QUEUE_PURGE_SCHEDULE = "45 3 * * *"  # daily 03:45
+WORKER_POLL_SECONDS = 5  # wait when queue is empty
+METRICS_REFRESH_BATCH_SIZE = 100  # due videos per refresh work item
+
+# METRICS REFRESH CONFIG
+# (max video age hours, refresh interval hours), youngest videos first
+METRICS_REFRESH_TIERS = [(24, 1), (24 * 7, 6), (24 * 30, 24)]
+METRICS_REFRESH_STALE_INTERVAL_HOURS = 24 * 7  # videos older than all tiers
+METRICS_REFRESH_FAST_VIEWS_PER_HOUR = 100  # velocity promoting video one tier
+METRICS_FETCH_BATCH_SIZE = 1000  # videos per batched metrics fetch, if enabled
+
+# ENGAGEMENT SNAPSHOT CONFIG
+SNAPSHOT_ROLLUP_AFTER_DAYS = 7  # raw snapshots older than this rolled up daily
+
+# ENGAGEMENT ANALYTICS CONFIG
+KEYWORD_SCORE_WEIGHTS = {"views": 1.0, "likes": 10.0, "comments": 20.0}
+ENGAGEMENT_PERCENTILES = [50, 90, 99]
+
+# LOCAL FAKE SERVICES CONFIG (load testing without live APIs or quota)
+FAKE_SERVICE_LATENCY_SECONDS = 0.05  # per simulated API round trip
+FAKE_SERVICE_ERROR_RATE = 0.0  # fraction of calls failing
+FAKE_VIDEO_COMPLETION_SECONDS = 0.2  # until generation operation is done
+FAKE_VIDEO_SIZE_BYTES = 1024 * 1024
+SIMULATION_DAYS = 365  # simulated days of scheduled runs
+SIMULATION_VOCABULARY_SIZE = 5000  # distinct keywords of simulated videos
+SIMULATION_MEDIAN_VIEWS = 1000  # eventual views of a typical simulated video
+SIMULATION_GROWTH_DAYS = 7.0  # time constant of simulated views approaching that
+
+# TELEMETRY CONFIG (pipeline stage spans exported in Prometheus text format)
+TELEMETRY_METRIC_PREFIX = "video_generation"
+TELEMETRY_DURATION_BUCKETS = [0.01, 0.1, 0.5, 1, 5, 15, 60, 300, 900]  # seconds
+TELEMETRY_EXPORT_SCHEDULE = "* * * * *"  # metrics file rewritten every minute
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Type, TypeVar
+
+from video_generation_analysis.config import DATABASE_ASYNC_READERS
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.query_builder import QueryBuilder
+
+T = TypeVar("T")
+
+
+class AsyncDatabaseHandler:
+    """Async Context Manager running DatabaseHandler operations off the event loop.
+
+    Writes are serialized on one dedicated writer thread, reads run concurrently
+    on a small reader pool. Each operation is its own transaction on the calling
+    thread's connection, so asyncio pipelines never block on SQLite I/O.
+    """
+
+    def __init__(
+        self, db_handler: DatabaseHandler, num_readers: int = DATABASE_ASYNC_READERS
+    ) -> None:
+        self._logger: logging.Logger = logging.getLogger(__name__)
+        self._db_handler = db_handler
+        self._num_readers = num_readers
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._readers: Optional[ThreadPoolExecutor] = None
+
+    async def __aenter__(self) -> "AsyncDatabaseHandler":
+        """Start writer thread & reader pool entering 'async with' block."""
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
+        self._readers = ThreadPoolExecutor(
+            max_workers=self._num_readers, thread_name_prefix="db-reader"
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, traceback) -> bool:
+        """Wait for queued operations then stop threads on 'async with' block exit."""
+        writer, readers = self._writer, self._readers
+        self._writer = self._readers = None
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, writer.shutdown)
+        await loop.run_in_executor(None, readers.shutdown)
+        return False
+
+    async def read(self, criteria: QueryBuilder) -> list[Type]:
+        """Reads records matching criteria"""
+        return await self._run_read(lambda db: db.read(criteria))
+
+    async def read_columns(self, criteria: QueryBuilder) -> dict[str, list[Any]]:
+        """Reads records matching criteria column-wise"""
+        return await self._run_read(lambda db: db.read_columns(criteria))
+
+    async def create(self, record: Any) -> int:
+        """Inserts a new record into database, returns its id"""
+        return await self.transaction(lambda db: db.create(record))
+
+    async def create_many(self, records: list[Any]) -> None:
+        """Bulk inserts records into database"""
+        await self.transaction(lambda db: db.create_many(records))
+
+    async def update(self, record_id: int, updates: Dict[str, Any]) -> None:
+        """Update existing record by ID"""
+        await self.transaction(lambda db: db.update(record_id, updates))
+
+    async def delete(self, criteria: QueryBuilder) -> None:
+        """Deletes records matching criteria"""
+        await self.transaction(lambda db: db.delete(criteria))
+
+    async def transaction(self, operation: Callable[[DatabaseHandler], T]) -> T:
+        """Run operation(db) as one atomic transaction on the writer thread"""
+        if self._writer is None:
+            raise RuntimeError(
+                "Database operation attempted outside of 'async with' block."
+            )
+        return await self._submit(self._writer, operation)
+
+    async def _run_read(self, operation: Callable[[DatabaseHandler], T]) -> T:
+        if self._readers is None:
+            raise RuntimeError(
+                "Database operation attempted outside of 'async with' block."
+            )
+        return await self._submit(self._readers, operation)
+
+    async def _submit(
+        self, executor: ThreadPoolExecutor, operation: Callable[[DatabaseHandler], T]
+    ) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self._in_transaction, operation)
+
+    def _in_transaction(self, operation: Callable[[DatabaseHandler], T]) -> T:
+        with self._db_handler as db:
+            return operation(db)
@@ -1,42 +1,174 @@
 import json
 import logging
+import random
 import sqlite3
-from dataclasses import fields, is_dataclass
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import Field, dataclass, fields, is_dataclass, replace
 from datetime import datetime
+from functools import cache, lru_cache
+from itertools import count
 from pathlib import Path
-from typing import Any, Dict, Optional, Type, get_origin
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Self,
+    Type,
+    TypeVar,
+    get_origin,
+)
 
+from video_generation_analysis.config import (
+    DATABASE_BUSY_TIMEOUT_MS,
+    DATABASE_JOURNAL_MODE,
+    DATABASE_MAX_RETRIES,
+    DATABASE_RETRY_BACKOFF_SECONDS,
+    DATABASE_STATEMENT_CACHE_SIZE,
+    DATABASE_SYNCHRONOUS,
+)
+from video_generation_analysis.database_handler.partition_archive import (
+    PartitionArchive,
+)
 from video_generation_analysis.database_handler.query_builder import (
     QueryBuilder,
     QueryType,
 )
-from video_generation_analysis.database_handler.schema import SQLITE_TYPE_MAP
+from video_generation_analysis.database_handler.schema import (
+    SQL_TYPE_METADATA,
+    SQLITE_TYPE_MAP,
+)
+from video_generation_analysis.telemetry.telemetry import current_span
+
+T = TypeVar("T")
+JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+SYNCHRONOUS_LEVELS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+ARCHIVE_SCHEMA_PREFIX = "archive_"  # attached in-memory copies of archives
+
+# (archive dir, table) -> (partition signature, schema, connection holding it)
+_archive_databases: dict[tuple[str, str], tuple[Any, str, sqlite3.Connection]] = {}
+_archive_lock = threading.Lock()
+_archive_versions = count(1)
+
+
+@dataclass
+class CommittedWrites:
+    """Writes of one committed 'with' block, passed to write hooks"""
+
+    created: list[Any]  # records with ids set
+    updated: list[tuple[int, Dict[str, Any]]]
+    deleted: list[int]  # record ids
+
+
+WriteHook = Callable[[CommittedWrites], None]
 
 
 class DatabaseHandler:
-    """Context Manager handles all database operations for a specific SQLite file."""
+    """Context Manager handles all database operations for a specific SQLite file.
+
+    Connection & cursor are held per thread, so one handler can be shared by
+    jobs running concurrently on different threads. In WAL journal mode readers
+    never block on a writer; writers wait up to the busy timeout for each other
+    and statements still failing with SQLITE_BUSY are retried with backoff.
+
+    A persistent handler keeps each thread's connection open between 'with'
+    blocks, so prepared statements stay cached for long running processes;
+    call close() from that thread when done.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        db_schema: Type,
+        journal_mode: str = DATABASE_JOURNAL_MODE,
+        synchronous: str = DATABASE_SYNCHRONOUS,
+        busy_timeout_ms: int = DATABASE_BUSY_TIMEOUT_MS,
+        max_retries: int = DATABASE_MAX_RETRIES,
+        retry_backoff_seconds: float = DATABASE_RETRY_BACKOFF_SECONDS,
+        persistent: bool = False,
+        statement_cache_size: int = DATABASE_STATEMENT_CACHE_SIZE,
+    ) -> None:
+        if journal_mode.upper() not in JOURNAL_MODES:
+            raise ValueError(f"Unsupported journal mode '{journal_mode}'")
+        if synchronous.upper() not in SYNCHRONOUS_LEVELS:
+            raise ValueError(f"Unsupported synchronous level '{synchronous}'")
 
-    def __init__(self, db_path: Path, db_schema: Type) -> None:
         self._logger: logging.Logger = logging.getLogger(__name__)
         self._db_path: Path = db_path
         self._db_schema: Type = db_schema
+        self._journal_mode = journal_mode.upper()
+        self._synchronous = synchronous.upper()
+        self._busy_timeout_ms = busy_timeout_ms
+        self._max_retries = max_retries
+        self._retry_backoff_seconds = retry_backoff_seconds
+        self._persistent = persistent
+        self._statement_cache_size = statement_cache_size
         self._table_name: str = ""
+        self._local = threading.local()
         self._conn: Optional[sqlite3.Connection] = None
         self._cursor: Optional[sqlite3.Cursor] = None
+        self._write_hooks: list[WriteHook] = []
+
+    @property
+    def db_path(self) -> Path:
+        return self._db_path
+
+    @property
+    def db_schema(self) -> Type:
+        return self._db_schema
+
+    @property
+    def _conn(self) -> Optional[sqlite3.Connection]:
+        return getattr(self._local, "conn", None)
+
+    @_conn.setter
+    def _conn(self, conn: Optional[sqlite3.Connection]) -> None:
+        self._local.conn = conn
+
+    @property
+    def _cursor(self) -> Optional[sqlite3.Cursor]:
+        return getattr(self._local, "cursor", None)
 
-    def __enter__(self) -> "DatabaseHandler":
+    @_cursor.setter
+    def _cursor(self, cursor: Optional[sqlite3.Cursor]) -> None:
+        self._local.cursor = cursor
+
+    @property
+    def _writes(self) -> Optional[CommittedWrites]:
+        """Writes of this thread's 'with' block, None if there are no hooks"""
+        return getattr(self._local, "writes", None)
+
+    def add_write_hook(self, hook: WriteHook) -> None:
+        """Call hook with the writes of each 'with' block after it commits.
+
+        Sees create, create_many, update & delete calls on this handler, e.g.
+        to keep an in-memory index in step with the table; rolled back writes
+        are never passed on.
+        """
+        self._write_hooks.append(hook)
+
+    def __enter__(self) -> Self:
         """Context Manager establish db connection & cursor entering 'with' block."""
-        self._conn = sqlite3.connect(str(self._db_path))
-        self._conn.row_factory = sqlite3.Row
-        self._cursor = self._conn.cursor()
-        self._create_table(self._db_schema)
+        conn = getattr(self._local, "persistent_conn", None)
+        if conn is None:
+            conn = self._connect()
+            if self._persistent:
+                self._local.persistent_conn = conn
+        self._conn = conn
+        self._cursor = conn.cursor()
+        self._local.writes = CommittedWrites([], [], []) if self._write_hooks else None
         return self
 
     def __exit__(self, exc_type, exc_val, traceback) -> bool:
         """Context Manager commit/rollback & close connection on 'with' block exit."""
+        writes = getattr(self._local, "writes", None)
+        self._local.writes = None
         try:
             if exc_type is None:
-                self._conn.commit()  # commit if no exceptions
+                self._with_retry(self._conn.commit)  # commit if no exceptions
             else:
                 self._conn.rollback()
                 self._logger.error(
@@ -46,63 +178,308 @@ class DatabaseHandler:
                 )
                 return False
         finally:
-            if self._conn:
+            if self._conn and not self._persistent:
                 self._conn.close()
             self._conn = None
             self._cursor = None
 
+        if writes is not None and (writes.created or writes.updated or writes.deleted):
+            self._run_write_hooks(writes)
         return True
 
-    def create(self, record: Any) -> None:
-        """Inserts a new record into database."""
+    def close(self) -> None:
+        """Close calling thread's persistent connection, if any."""
+        conn = getattr(self._local, "persistent_conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.persistent_conn = None
+
+    @contextmanager
+    def joined(self, outer: "DatabaseHandler") -> Iterator[Self]:
+        """Use outer's open transaction on this thread instead of a connection.
+
+        For writes to another table of the same file that must commit or roll
+        back with outer's 'with' block. Write hooks of this handler don't run.
+        Join before outer's first write, as the table may need creating first.
+        """
+        if outer._conn is None:
+            raise RuntimeError("joined() needs outer handler inside 'with' block")
+        if Path(outer.db_path).resolve() != Path(self._db_path).resolve():
+            raise ValueError("joined() needs handlers of the same database file")
+        if not self._table_name:
+            if outer._conn.in_transaction:
+                raise RuntimeError("joined() must come before outer's first write")
+            with self:  # creates table in its own transaction
+                pass
+
+        self._conn = outer._conn
+        self._cursor = outer._conn.cursor()
+        try:
+            yield self
+        finally:
+            self._conn = None
+            self._cursor = None
+
+    def begin_immediate(self) -> None:
+        """Take write lock now, so read-modify-write in 'with' block is atomic.
+
+        Other processes' writers wait (busy timeout) until the block commits,
+        instead of both reading the same row and one overwriting the other.
+        """
+        if self._conn.in_transaction:
+            raise RuntimeError("begin_immediate() must be first statement of block")
+        self._execute("BEGIN IMMEDIATE")
+
+    def create(self, record: Any) -> int:
+        """Inserts a new record into database, returns its id."""
         if not is_dataclass(record):
             raise TypeError("Input must be dataclass type")
 
-        field_names = [field.name for field in fields(record) if field.name != "id"]
-        placeholders = ", ".join(["?"] * len(field_names))
-        columns = ", ".join(field_names)
-        values = [getattr(record, name) for name in field_names]
+        sql, field_names = _insert_statement(self._table_name, type(record))
+        self._execute(sql, [getattr(record, name) for name in field_names])
+        record_id = self._cursor.lastrowid
+        if self._writes is not None:
+            self._writes.created.append(replace(record, id=record_id))
+        return record_id
 
-        sql = f"INSERT INTO {self._table_name} ({columns}) VALUES ({placeholders})"
-        self._execute(sql, values)
+    def create_many(self, records: list[Any]) -> None:
+        """Bulk inserts records into database in a single statement."""
+        if not records:
+            return
+        if not all(is_dataclass(record) for record in records):
+            raise TypeError("Input must be dataclass type")
 
-    def read(self, criteria: QueryBuilder) -> list[Type]:
-        """Reads records matching criteria"""
-        sql, params = criteria.build(self._table_name, QueryType.READ)
-        record_list = self._execute(sql, params)
-        if record_list is None:
-            return []
+        sql, field_names = _insert_statement(self._table_name, type(records[0]))
+        rows = [
+            tuple(self._to_sql_value(getattr(record, name)) for name in field_names)
+            for record in records
+        ]
+        self._executemany(sql, rows)
+        if self._writes is not None:
+            # rowids are consecutive, the write lock is held until commit
+            last_id = self._execute(
+                f"SELECT MAX(id) FROM {self._table_name}", returns_rows=True
+            )[0][0]
+            first_id = last_id - len(records) + 1
+            self._writes.created += [
+                replace(record, id=first_id + idx) for idx, record in enumerate(records)
+            ]
+
+    def create_index(self, columns: list[str], unique: bool = False) -> None:
+        """Creates index over columns if not already present."""
+        index_name = f"idx_{self._table_name}_{'_'.join(columns)}".lower()
+        unique_clause = "UNIQUE " if unique else ""
+        sql = (
+            f"CREATE {unique_clause}INDEX IF NOT EXISTS {index_name} "
+            f"ON {self._table_name} ({', '.join(columns)})"
+        )
+        self._execute(sql)
+
+    def track_revisions(self, column: str = "revision") -> None:
+        """Set column from a never decreasing counter on every insert & update.
+
+        SQLite serializes writers, so revisions increase in commit order and a
+        reader resuming past the highest revision it read misses no write,
+        unlike a timestamp taken before its transaction commits. Rows written
+        before tracking get distinct revisions now.
+        """
+        table = self._table_name
+        sequence = f"{table}_{column}_sequence"
+        self.create_index([column])
+        self._execute(f"CREATE TABLE IF NOT EXISTS {sequence} (value INTEGER)")
+        self._execute(
+            f"INSERT INTO {sequence} (value) SELECT IFNULL(MAX({column}), 0) "
+            f"FROM {table} WHERE NOT EXISTS (SELECT 1 FROM {sequence})"
+        )
+        self._execute(
+            f"UPDATE {table} SET {column} = (SELECT value FROM {sequence}) + id "
+            f"WHERE {column} IS NULL"
+        )
+        self._execute(
+            f"UPDATE {sequence} SET value = "
+            f"MAX(value, (SELECT IFNULL(MAX({column}), 0) FROM {table}))"
+        )
+
+        other_columns = ", ".join(
+            field.name for field in fields(self._db_schema) if field.name != column
+        )
+        bump = (
+            f"UPDATE {sequence} SET value = value + 1; "
+            f"UPDATE {table} SET {column} = (SELECT value FROM {sequence}) "
+            f"WHERE id = NEW.id;"
+        )
+        for event in ("INSERT", f"UPDATE OF {other_columns}"):
+            trigger = f"{table}_{column}_{event.split()[0]}".lower()
+            self._execute(
+                f"CREATE TRIGGER IF NOT EXISTS {trigger} AFTER {event} "
+                f"ON {table} BEGIN {bump} END"
+            )
+
+    def read(
+        self, criteria: QueryBuilder, archive: Optional[PartitionArchive] = None
+    ) -> list[Type]:
+        """Reads records matching criteria, including archived ones if archive given"""
+        source = self._read_source(archive)
+        record_list = []
+        for chunk in criteria.chunks():
+            plan = chunk.compile(source, QueryType.READ)
+            record_list += self._execute(plan.sql, chunk.params(), plan.returns_rows)
         return self._record_list_to_dataclass(record_list)
 
+    def read_pages(
+        self, criteria: QueryBuilder, page_size: int, key_column: str = "id"
+    ) -> Iterator[list[Type]]:
+        """Reads records matching criteria a page at a time by keyset pagination.
+
+        Each page seeks past the last key of the previous page via the key's
+        index, so paging stays fast & stable however deep into the table.
+        key_column must be unique and selected by criteria.
+        """
+        page_criteria = criteria.copy().limit(page_size)
+        while True:
+            page = self.read(page_criteria)
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            page_criteria.after(key_column, getattr(page[-1], key_column))
+
+    def read_columns(
+        self, criteria: QueryBuilder, archive: Optional[PartitionArchive] = None
+    ) -> dict[str, list[Any]]:
+        """Reads records matching criteria column-wise, raw values per column.
+
+        Skips per row dataclass construction, for bulk analytics over the table.
+        """
+        source = self._read_source(archive)
+        names, rows = [], []
+        for chunk in criteria.chunks():
+            plan = chunk.compile(source, QueryType.READ)
+            names, chunk_rows = self._execute_tuples(plan.sql, chunk.params())
+            rows += chunk_rows
+        columns = list(zip(*rows)) or [()] * len(names)
+        return {name: list(column) for name, column in zip(names, columns)}
+
+    def aggregate(self, criteria: QueryBuilder) -> list[dict[str, Any]]:
+        """Runs COUNT/SUM/GROUP BY criteria in SQLite, one dict per result row"""
+        plan = criteria.compile(self._table_name, QueryType.READ)
+        names, rows = self._execute_tuples(plan.sql, criteria.params())
+        return [dict(zip(names, row)) for row in rows]
+
     def update(self, record_id: int, updates: Dict[str, Any]) -> None:
         """Update existing record by ID"""
-        set_clause = ", ".join([f"{key} = ?" for key in updates.keys()])
+        sql = _update_statement(self._table_name, tuple(updates.keys()))
         values = list(updates.values()) + [
             record_id,
         ]
-
-        sql = f"UPDATE {self._table_name} SET {set_clause} WHERE id = ?"
         self._execute(sql, values)
+        if self._writes is not None:
+            self._writes.updated.append((record_id, dict(updates)))
 
     def delete(self, criteria: QueryBuilder) -> None:
         """Deletes records matching criteria"""
-        sql, params = criteria.build(self._table_name, QueryType.DELETE)
-        self._execute(sql, params)
+        for chunk in criteria.chunks():
+            if self._writes is not None:
+                ids = (
+                    chunk.copy()
+                    .select_columns("id")
+                    .compile(self._table_name, QueryType.READ)
+                )
+                self._writes.deleted += [
+                    row[0]
+                    for row in self._execute(ids.sql, chunk.params(), returns_rows=True)
+                ]
+            plan = chunk.compile(self._table_name, QueryType.DELETE)
+            self._execute(plan.sql, chunk.params())
 
-    def _execute(self, sql: str, params: list = []) -> Optional[list[Any]]:
-        """Executes SQL command."""
+    def _read_source(self, archive: Optional[PartitionArchive]) -> str:
+        """Table to read from, or hot table unioned with archived partitions.
+
+        Archived rows are loaded once per process & archive version into a
+        shared in-memory database, which each connection attaches; rows present
+        in both (an interrupted archive run) come from the hot table.
+        """
+        if archive is None:
+            return self._table_name
+
+        schema = self._attach_archive(archive)
+        names = ", ".join(archive.columns)
+        return (
+            f"(SELECT {names} FROM {self._table_name} UNION ALL "
+            f"SELECT {names} FROM {schema}.{self._table_name} "
+            f"WHERE id NOT IN (SELECT id FROM {self._table_name}))"
+        )
+
+    def _attach_archive(self, archive: PartitionArchive) -> str:
+        """Attach current in-memory copy of archive to connection, returns schema"""
+        schema = self._load_archive(archive)
+        attached = {
+            row["name"]
+            for row in self._execute("PRAGMA database_list", returns_rows=True)
+        }
+        if schema not in attached:
+            self._execute(f"ATTACH DATABASE ? AS {schema}", [_memory_uri(schema)])
+        if not self._conn.in_transaction:  # DETACH fails inside a transaction
+            with _archive_lock:
+                current = {entry[1] for entry in _archive_databases.values()}
+            for stale in attached - current:
+                if stale.startswith(ARCHIVE_SCHEMA_PREFIX):
+                    self._execute(f"DETACH DATABASE {stale}")
+        return schema
+
+    def _load_archive(self, archive: PartitionArchive) -> str:
+        """Copy archive to shared in-memory database once per version, returns schema"""
+        key = (str(Path(archive.archive_dir).resolve()), self._table_name)
+        signature = archive.signature()
+        with _archive_lock:
+            loaded = _archive_databases.get(key)
+            if loaded is not None and loaded[0] == signature:
+                return loaded[1]
+
+            schema = f"{ARCHIVE_SCHEMA_PREFIX}{next(_archive_versions)}"
+            # holds the in-memory database open while no connection attaches it
+            holder = sqlite3.connect(
+                _memory_uri(schema), uri=True, check_same_thread=False
+            )
+            types = {field.name: _sql_type(field) for field in fields(self._db_schema)}
+            types["id"] = "INTEGER"
+            column_defs = ", ".join(
+                f"{name} {types.get(name, 'TEXT')}" for name in archive.columns
+            )
+            holder.execute(f"CREATE TABLE {self._table_name} ({column_defs})")
+            columns = archive.load_columns()
+            placeholders = ", ".join("?" for _ in archive.columns)
+            holder.executemany(
+                f"INSERT INTO {self._table_name} VALUES ({placeholders})",
+                list(zip(*(columns[name] for name in archive.columns))),
+            )
+            holder.commit()
+            _archive_databases[key] = (signature, schema, holder)
+            if loaded is not None:
+                loaded[2].close()  # freed once attached connections detach it
+        self._logger.info(f"Loaded archive {key[0]} into memory as {schema}")
+        return schema
+
+    def _run_write_hooks(self, writes: CommittedWrites) -> None:
+        """Call write hooks, a failing hook never fails the committed write"""
+        for hook in self._write_hooks:
+            try:
+                hook(writes)
+            except Exception as e:
+                self._logger.error(f"DatabaseHandler write hook {hook} failed: {e}")
+
+    def _execute(
+        self, sql: str, params: list = [], returns_rows: bool = False
+    ) -> Optional[list[Any]]:
+        """Executes SQL command, fetching result rows if returns_rows."""
         if not self._cursor:
             raise RuntimeError("Database operation attempted outside of 'with' block.")
 
-        for i in range(len(params)):
-            if isinstance(params[i], list):
-                params[i] = json.dumps(params[i])
-            elif isinstance(params[i], datetime):
-                params[i] = params[i].isoformat()
-
+        sql_params = tuple(self._to_sql_value(param) for param in params)
         try:
-            self._cursor.execute(sql, tuple(params))
-            if sql.strip().upper().startswith("SELECT"):
+            self._with_retry(lambda: self._cursor.execute(sql, sql_params))
+            if returns_rows:
                 return self._cursor.fetchall()
             return None
         except sqlite3.Error as e:
@@ -111,6 +488,102 @@ class DatabaseHandler:
             )
             raise
 
+    def _execute_tuples(
+        self, sql: str, params: list[Any]
+    ) -> tuple[list[str], list[tuple[Any, ...]]]:
+        """Executes SELECT returning column names & plain tuple rows"""
+        if not self._conn:
+            raise RuntimeError("Database operation attempted outside of 'with' block.")
+
+        cursor = self._conn.cursor()
+        cursor.row_factory = None  # plain tuples, cheaper than sqlite3.Row
+        try:
+            sql_params = tuple(map(self._to_sql_value, params))
+            rows = self._with_retry(lambda: cursor.execute(sql, sql_params).fetchall())
+            names = [description[0] for description in cursor.description]
+        except sqlite3.Error as e:
+            self._logger.error(
+                f"DatabaseHandler error {e} executing SQL: {sql} with params {params}"
+            )
+            raise
+        finally:
+            cursor.close()
+        return names, rows
+
+    def _executemany(self, sql: str, rows: list[tuple]) -> None:
+        """Executes SQL command once per row of params."""
+        if not self._cursor:
+            raise RuntimeError("Database operation attempted outside of 'with' block.")
+
+        try:
+            self._with_retry(lambda: self._cursor.executemany(sql, rows))
+        except sqlite3.Error as e:
+            self._logger.error(
+                f"DatabaseHandler error {e} executing SQL: {sql} for {len(rows)} rows"
+            )
+            raise
+
+    def _with_retry(self, operation: Callable[[], T]) -> T:
+        """Run operation, retrying with exponential backoff while db busy/locked.
+
+        Retries are counted on the innermost open telemetry span. A write after
+        a read in the same transaction can't be retried once another process
+        committed in between, so that error is raised at once.
+        """
+        attempt = 0
+        while True:
+            try:
+                return operation()
+            except sqlite3.OperationalError as e:
+                message = str(e).lower()
+                busy = "locked" in message or "busy" in message
+                if not busy or attempt >= self._max_retries:
+                    raise
+                if getattr(e, "sqlite_errorcode", None) == sqlite3.SQLITE_BUSY_SNAPSHOT:
+                    # block read before another process wrote, its snapshot
+                    # stays stale until rolled back: begin_immediate() instead
+                    raise
+                backoff = self._retry_backoff_seconds * 2**attempt
+                self._logger.warning(
+                    f"DatabaseHandler busy ({e}), retry {attempt + 1} in {backoff:.3f}s"
+                )
+                current_span().add("retries")
+                time.sleep(backoff * random.uniform(0.5, 1.5))  # jitter
+                attempt += 1
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open connection configured with journal mode, synchronous & busy timeout."""
+        conn = sqlite3.connect(
+            str(self._db_path),
+            timeout=self._busy_timeout_ms / 1000,
+            cached_statements=self._statement_cache_size,
+        )
+        conn.row_factory = sqlite3.Row
+        self._conn = conn
+        self._cursor = conn.cursor()
+        try:
+            self._with_retry(
+                lambda: conn.execute(f"PRAGMA journal_mode={self._journal_mode}")
+            )
+            conn.execute(f"PRAGMA synchronous={self._synchronous}")
+            conn.execute(f"PRAGMA busy_timeout={int(self._busy_timeout_ms)}")
+            self._create_table(self._db_schema)
+            conn.commit()
+        except Exception:
+            conn.close()
+            self._conn = None
+            self._cursor = None
+            raise
+        return conn
+
+    def _to_sql_value(self, value: Any) -> Any:
+        """Convert python value to type storable by SQLite."""
+        if isinstance(value, list):
+            return json.dumps(value)
+        elif isinstance(value, datetime):
+            return value.isoformat()
+        return value
+
     def _create_table(self, data_class: Type) -> None:
         """Creates a table based on a dataclass structure."""
         if not is_dataclass(data_class):
@@ -122,13 +595,21 @@ class DatabaseHandler:
         for field in fields(data_class):
             if field.name == "id":
                 continue
-            sql_type = SQLITE_TYPE_MAP.get(str(field.type), "TEXT")
-            column_def = f"{field.name} {sql_type}"
+            column_def = f"{field.name} {_sql_type(field)}"
             columns.append(column_def)
 
         columns_str = ", ".join(columns)
         sql = f"CREATE TABLE IF NOT EXISTS {self._table_name} ({columns_str})"
         self._execute(sql)
+        self._add_missing_columns(columns[1:])
+
+    def _add_missing_columns(self, column_defs: list[str]) -> None:
+        """Migrate table created by older schema version, adding new fields."""
+        self._cursor.execute(f"PRAGMA table_info({self._table_name})")
+        existing = {row["name"] for row in self._cursor.fetchall()}
+        for column_def in column_defs:
+            if column_def.split()[0] not in existing:
+                self._execute(f"ALTER TABLE {self._table_name} ADD COLUMN {column_def}")
 
     def _record_list_to_dataclass(self, record_list: list[Any]) -> list[Type]:
         """Convert dict of DB records to list of dataclass instances."""
@@ -148,3 +629,33 @@ class DatabaseHandler:
                         converted_list,
                     )
         return results
+
+
+def _sql_type(field: Field) -> str:
+    return field.metadata.get(
+        SQL_TYPE_METADATA, SQLITE_TYPE_MAP.get(str(field.type), "TEXT")
+    )
+
+
+def _memory_uri(schema: str) -> str:
+    """URI of in-memory database shared by all connections of this process"""
+    return f"file:{schema}?mode=memory&cache=shared"
+
+
+@cache
+def _insert_statement(table: str, data_class: Type) -> tuple[str, tuple[str, ...]]:
+    """INSERT SQL & field order for dataclass, built once per table & class"""
+    field_names = tuple(
+        field.name for field in fields(data_class) if field.name != "id"
+    )
+    placeholders = ", ".join(["?"] * len(field_names))
+    columns = ", ".join(field_names)
+    sql = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+    return sql, field_names
+
+
+@lru_cache(maxsize=DATABASE_STATEMENT_CACHE_SIZE)
+def _update_statement(table: str, columns: tuple[str, ...]) -> str:
+    """UPDATE by id SQL, built once per table & set of updated columns"""
+    set_clause = ", ".join([f"{column} = ?" for column in columns])
+    return f"UPDATE {table} SET {set_clause} WHERE id = ?"
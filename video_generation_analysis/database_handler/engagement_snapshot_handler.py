@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, Type
+
+from video_generation_analysis.config import SNAPSHOT_ROLLUP_AFTER_DAYS
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.query_builder import (
+    OrderByType,
+    QueryBuilder,
+    WhereComparison,
+    WhereLogical,
+)
+from video_generation_analysis.database_handler.schema import EngagementSnapshot
+
+RESOLUTION_RAW = "raw"
+RESOLUTION_DAILY = "daily"
+
+
+class EngagementSnapshotHandler(DatabaseHandler):
+    """Append-only time series of video engagement, one row per metrics refresh.
+
+    Raw snapshots are rolled up to one row per video per day once older than
+    the rollup age, keeping the table small while preserving growth curves.
+    """
+
+    CURVE_COLUMNS = ["video_id", "datetime_snapshot", "views", "likes", "comments"]
+
+    def __init__(self, db_path: Path) -> None:
+        super().__init__(db_path, EngagementSnapshot)
+
+    def record_snapshots(self, snapshots: list[EngagementSnapshot]) -> None:
+        """Bulk append snapshots taken during one refresh."""
+        self.create_many(snapshots)
+
+    def growth_curve(
+        self, video_id: int, since: Optional[datetime] = None
+    ) -> list[EngagementSnapshot]:
+        """Snapshots of a video oldest first, served from covering index."""
+        qb = (
+            QueryBuilder()
+            .select_columns(self.CURVE_COLUMNS)
+            .where_compare("video_id", WhereComparison.EQUAL, video_id)
+            .order_by("datetime_snapshot", OrderByType.ASCENDING)
+        )
+        if since is not None:
+            qb.where_logical(WhereLogical.AND).where_compare(
+                "datetime_snapshot", WhereComparison.GREATER_THAN_EQUAL, since
+            )
+        return self.read(qb)
+
+    def compact(
+        self,
+        now: Optional[datetime] = None,
+        rollup_after_days: int = SNAPSHOT_ROLLUP_AFTER_DAYS,
+    ) -> int:
+        """Roll raw snapshots older than cutoff into daily rows, returns rows freed.
+
+        Metrics are cumulative totals, so the last snapshot of each day is kept.
+        The cutoff is at midnight so a day is never rolled up in two parts.
+        """
+        cutoff = (now or datetime.now()) - timedelta(days=rollup_after_days)
+        cutoff = cutoff.replace(hour=0, minute=0, second=0, microsecond=0)
+        # SQLite takes bare columns from the row holding MAX(datetime_snapshot)
+        self._execute(
+            f"INSERT INTO {self._table_name} "
+            "(video_id, datetime_snapshot, views, likes, comments, resolution) "
+            "SELECT video_id, MAX(datetime_snapshot), views, likes, comments, ? "
+            f"FROM {self._table_name} "
+            "WHERE resolution = ? AND datetime_snapshot < ? "
+            "GROUP BY video_id, substr(datetime_snapshot, 1, 10)",
+            [RESOLUTION_DAILY, RESOLUTION_RAW, cutoff],
+        )
+        rolled_up = self._cursor.rowcount
+        self._execute(
+            f"DELETE FROM {self._table_name} "
+            "WHERE resolution = ? AND datetime_snapshot < ?",
+            [RESOLUTION_RAW, cutoff],
+        )
+        freed = self._cursor.rowcount - rolled_up
+        self._logger.info(f"Compacted engagement snapshots, {freed} rows freed")
+        return freed
+
+    def _create_table(self, data_class: Type) -> None:
+        super()._create_table(data_class)
+        self.create_index(self.CURVE_COLUMNS)  # covering index for growth curves
+        self.create_index(["resolution", "datetime_snapshot"])
@@ -0,0 +1,117 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Type
+
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.query_builder import (
+    QueryBuilder,
+    WhereComparison,
+    WhereLogical,
+)
+from video_generation_analysis.database_handler.schema import KeywordNeighbour
+
+PENDING_POSITION = -1  # keyword seen at generation time, neighbours not computed yet
+
+
+class KeywordNeighbourHandler(DatabaseHandler):
+    """Precomputed most similar words per keyword, indexed for lookups.
+
+    Neighbours are computed offline by KeywordNeighbourIndexer, so expanding
+    keywords at generation time is an index lookup with no model loaded.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        super().__init__(db_path, KeywordNeighbour)
+
+    def neighbours(
+        self, keywords: list[str], topn: int
+    ) -> dict[str, list[tuple[str, float]]]:
+        """Up to topn (neighbour, similarity) per computed keyword, most similar first.
+
+        Keywords without computed neighbours are left out, keywords computed
+        but not in the model vocabulary map to an empty list.
+        """
+        columns = self.read_columns(
+            QueryBuilder()
+            .select_columns(["keyword", "position", "neighbour", "similarity"])
+            .where_in("keyword", keywords)
+            .where_logical(WhereLogical.AND)
+            .where_compare("position", WhereComparison.GREATER_THAN_EQUAL, 0)
+            .where_logical(WhereLogical.AND)
+            .where_compare("position", WhereComparison.LESS_THAN_EQUAL, topn)
+        )
+        neighbours: dict[str, list[tuple[str, float]]] = {}
+        for keyword, position, neighbour, similarity in sorted(
+            zip(
+                columns.get("keyword", []),
+                columns.get("position", []),
+                columns.get("neighbour", []),
+                columns.get("similarity", []),
+            )
+        ):
+            keyword_neighbours = neighbours.setdefault(keyword, [])
+            if neighbour:
+                keyword_neighbours.append((neighbour, similarity))
+        return neighbours
+
+    def known_keywords(self) -> set[str]:
+        """Keywords with neighbours computed"""
+        return self._keywords(WhereComparison.GREATER_THAN_EQUAL, 0)
+
+    def pending_keywords(self) -> set[str]:
+        """Keywords looked up before their neighbours were computed"""
+        return self._keywords(WhereComparison.EQUAL, PENDING_POSITION)
+
+    def add_pending(self, keywords: list[str], now: Optional[datetime] = None) -> None:
+        """Mark keywords for the next precompute run, ignoring known keywords."""
+        if not keywords:
+            return
+        updated_at = (now or datetime.now()).isoformat()
+        self._executemany(
+            f"INSERT OR IGNORE INTO {self._table_name} "
+            "(keyword, position, neighbour, similarity, updated_at) "
+            "SELECT ?, ?, '', 0.0, ? WHERE NOT EXISTS "
+            f"(SELECT 1 FROM {self._table_name} WHERE keyword = ?)",
+            [
+                (keyword, PENDING_POSITION, updated_at, keyword)
+                for keyword in dict.fromkeys(keywords)
+            ],
+        )
+
+    def replace_neighbours(
+        self,
+        neighbours: dict[str, list[tuple[str, float]]],
+        now: Optional[datetime] = None,
+    ) -> None:
+        """Store computed neighbours per keyword, replacing any earlier rows."""
+        if not neighbours:
+            return
+        self.delete(QueryBuilder().where_in("keyword", list(neighbours)))
+        updated_at = now or datetime.now()
+        self.create_many(
+            [
+                KeywordNeighbour(
+                    keyword=keyword,
+                    position=position,
+                    neighbour=neighbour,
+                    similarity=similarity,
+                    updated_at=updated_at,
+                )
+                for keyword, similar in neighbours.items()
+                for position, (neighbour, similarity) in enumerate(
+                    similar or [("", 0.0)], start=1 if similar else 0
+                )
+            ]
+        )
+
+    def _keywords(self, comparison: WhereComparison, position: int) -> set[str]:
+        qb = (
+            QueryBuilder()
+            .select_columns("keyword")
+            .where_compare("position", comparison, position)
+        )
+        return set(self.read_columns(qb).get("keyword", []))
+
+    def _create_table(self, data_class: Type) -> None:
+        super()._create_table(data_class)
+        self.create_index(["keyword", "position"], unique=True)
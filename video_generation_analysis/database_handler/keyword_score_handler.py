@@ -0,0 +1,57 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Type
+
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.query_builder import (
+    OrderByType,
+    QueryBuilder,
+)
+from video_generation_analysis.database_handler.schema import KeywordScore
+
+
+class KeywordScoreHandler(DatabaseHandler):
+    """Running engagement score per keyword, indexed for top-k lookups.
+
+    Scores are updated incrementally with deltas as video metrics refresh, so
+    ranking keywords never rescans the video records.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        super().__init__(db_path, KeywordScore)
+
+    def add_scores(
+        self, deltas: dict[str, float], now: Optional[datetime] = None
+    ) -> None:
+        """Add score deltas per keyword, inserting unseen keywords."""
+        if not deltas:
+            return
+        updated_at = (now or datetime.now()).isoformat()
+        self._executemany(
+            f"INSERT INTO {self._table_name} (keyword, score, updated_at) "
+            "VALUES (?, ?, ?) ON CONFLICT(keyword) DO UPDATE SET "
+            "score = score + excluded.score, updated_at = excluded.updated_at",
+            [(keyword, delta, updated_at) for keyword, delta in deltas.items()],
+        )
+
+    def replace_scores(
+        self, scores: dict[str, float], now: Optional[datetime] = None
+    ) -> None:
+        """Replace all keyword scores, used when rebuilding from scratch."""
+        self._execute(f"DELETE FROM {self._table_name}")
+        self.add_scores(scores, now=now)
+
+    def top_keywords(self, num_keywords: int) -> list[str]:
+        """Highest scoring keywords best first, read in order from score index."""
+        qb = (
+            QueryBuilder()
+            .select_columns("keyword")
+            .order_by("score", OrderByType.DESCENDING)
+            .limit(num_keywords)
+        )
+        return [record.keyword for record in self.read(qb)]
+
+    def _create_table(self, data_class: Type) -> None:
+        super()._create_table(data_class)
+        self.create_index(["keyword"], unique=True)
+        self.create_index(["score"])
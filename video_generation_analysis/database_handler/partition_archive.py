@@ -0,0 +1,211 @@
+import argparse
+import logging
+import os
+from collections import defaultdict
+from dataclasses import fields
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Type, cast
+
+import numpy as np
+
+from video_generation_analysis.config import (
+    ARCHIVE_DIR,
+    ARCHIVE_KEEP_MONTHS,
+    DATABASE_PATH,
+)
+from video_generation_analysis.database_handler.query_builder import (
+    QueryBuilder,
+    WhereComparison,
+)
+from video_generation_analysis.database_handler.schema import VideoEngagementRecord
+
+if TYPE_CHECKING:
+    from video_generation_analysis.database_handler.database_handler import (
+        DatabaseHandler,
+    )
+
+NULL_MASK_PREFIX = "null__"  # npz array marking None values of a text column
+
+
+class PartitionArchive:
+    """Cold storage of records partitioned by publish month in compressed NumPy files.
+
+    archive() moves records published before a cutoff out of the hot SQLite
+    table into one .npz file per month, one array per column, so queries over
+    recent videos no longer scan years of cold rows. Archived partitions stay
+    readable: load_columns() scans them for analytics, and DatabaseHandler
+    read(criteria, archive=...) queries hot & archived rows together.
+    """
+
+    def __init__(
+        self,
+        archive_dir: Path,
+        data_class: Type = VideoEngagementRecord,
+        partition_column: str = "datetime_publish",
+    ) -> None:
+        self._logger: logging.Logger = logging.getLogger(__name__)
+        self._archive_dir = archive_dir
+        self._partition_column = partition_column
+        self._table_name = data_class.__name__.lower() + "s"
+        self.columns = [field.name for field in fields(data_class)]
+        self._dtypes = {
+            field.name: _numeric_dtype(field) for field in fields(data_class)
+        }
+
+    @property
+    def archive_dir(self) -> Path:
+        return self._archive_dir
+
+    def months(self) -> list[str]:
+        """Archived partitions as 'YYYY-MM', oldest first"""
+        prefix = f"{self._table_name}_"
+        return sorted(
+            path.stem[len(prefix) :]
+            for path in self._archive_dir.glob(f"{prefix}*.npz")
+        )
+
+    def signature(self) -> tuple[tuple[str, float], ...]:
+        """Partitions & modification times, changes whenever archive is written"""
+        return tuple(
+            (month, self._partition_path(month).stat().st_mtime)
+            for month in self.months()
+        )
+
+    def archive(
+        self, db_handler: "DatabaseHandler", before: datetime
+    ) -> dict[str, int]:
+        """Move records published before cutoff into monthly partitions.
+
+        Returns rows archived per month. Partition files are written before the
+        rows are deleted in the same transaction that read them, so a crash
+        never loses rows; at worst they are in both places until the next run.
+        """
+        with db_handler as db:
+            db.create_index([self._partition_column])
+            db.begin_immediate()  # no writes to cold rows while they are moved
+            raw = db.read_columns(
+                QueryBuilder()
+                .select_columns(self.columns)
+                .where_compare(
+                    self._partition_column, WhereComparison.LESS_THAN, before
+                )
+            )
+            rows_by_month: dict[str, list[int]] = defaultdict(list)
+            for row, published in enumerate(raw.get(self._partition_column, [])):
+                if published:
+                    rows_by_month[str(published)[:7]].append(row)
+
+            for month, rows in sorted(rows_by_month.items()):
+                columns = {name: [raw[name][row] for row in rows] for name in raw}
+                self._write_partition(month, columns)
+
+            ids = [raw["id"][row] for rows in rows_by_month.values() for row in rows]
+            if ids:
+                db.delete(QueryBuilder().where_in("id", ids))
+
+        archived = {month: len(rows) for month, rows in sorted(rows_by_month.items())}
+        self._logger.info(f"Archived {len(ids)} records into partitions {archived}")
+        return archived
+
+    def load_columns(self, months: Optional[list[str]] = None) -> dict[str, list[Any]]:
+        """Archived rows column-wise, same form as DatabaseHandler.read_columns"""
+        columns: dict[str, list[Any]] = {name: [] for name in self.columns}
+        for month in months if months is not None else self.months():
+            for name, values in self._read_partition(month).items():
+                columns[name] += values
+        return columns
+
+    def _write_partition(self, month: str, columns: dict[str, list[Any]]) -> None:
+        path = self._partition_path(month)
+        if path.exists():
+            # merge into earlier archive run, rows archived again replace old copies
+            existing = self._read_partition(month)
+            new_ids = set(columns["id"])
+            keep = [
+                idx
+                for idx, record_id in enumerate(existing["id"])
+                if record_id not in new_ids
+            ]
+            columns = {
+                name: [existing[name][idx] for idx in keep] + columns[name]
+                for name in self.columns
+            }
+
+        arrays = {}
+        for name in self.columns:
+            values = columns[name]
+            dtype = self._dtypes[name]
+            if dtype is not None:
+                arrays[name] = np.array([dtype(value) for value in values])
+            else:
+                arrays[name] = np.array(["" if v is None else str(v) for v in values])
+                arrays[NULL_MASK_PREFIX + name] = np.array(
+                    [value is None for value in values], dtype=bool
+                )
+
+        self._archive_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._archive_dir / f".{path.stem}.tmp.npz"
+        # kwargs typed as arrays or savez's own allow_pickle flag, names are columns
+        np.savez_compressed(tmp_path, **cast(dict[str, Any], arrays))
+        os.replace(tmp_path, path)
+
+    def _read_partition(self, month: str) -> dict[str, list[Any]]:
+        columns = {}
+        with np.load(self._partition_path(month)) as data:
+            for name in self.columns:
+                values = data[name].tolist()
+                null_mask = NULL_MASK_PREFIX + name
+                if null_mask in data:
+                    values = [
+                        None if null else value
+                        for value, null in zip(values, data[null_mask].tolist())
+                    ]
+                columns[name] = values
+        return columns
+
+    def _partition_path(self, month: str) -> Path:
+        return self._archive_dir / f"{self._table_name}_{month}.npz"
+
+
+def months_ago(now: datetime, months: int) -> datetime:
+    """Start of the month, months before now's month"""
+    month_index = now.year * 12 + now.month - 1 - months
+    return datetime(month_index // 12, month_index % 12 + 1, 1)
+
+
+def _numeric_dtype(field) -> Optional[type]:
+    if field.name == "id" or field.type is int:
+        return int
+    if field.type is float:
+        return float
+    return None
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Archive video records older than the kept months"
+    )
+    parser.add_argument("--db-path", type=Path, default=Path(DATABASE_PATH))
+    parser.add_argument("--archive-dir", type=Path, default=Path(ARCHIVE_DIR))
+    parser.add_argument("--keep-months", type=int, default=ARCHIVE_KEEP_MONTHS)
+    return parser.parse_args()
+
+
+def main():
+    from video_generation_analysis.database_handler.database_handler import (
+        DatabaseHandler,
+    )
+
+    logging.basicConfig(level=logging.INFO)
+    args = parse_args()
+    archive = PartitionArchive(args.archive_dir)
+    archived = archive.archive(
+        DatabaseHandler(args.db_path, VideoEngagementRecord),
+        before=months_ago(datetime.now(), args.keep_months),
+    )
+    print(f"Archived {sum(archived.values())} records: {archived}")
+
+
+if __name__ == "__main__":
+    main()
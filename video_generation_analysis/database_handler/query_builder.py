@@ -1,5 +1,13 @@
+import copy
+from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Any, List, Tuple
+from functools import lru_cache
+from typing import Any, Iterator, List, Optional, Tuple
+
+from video_generation_analysis.config import (
+    QUERY_PLAN_CACHE_SIZE,
+    SQLITE_MAX_VARIABLE_NUMBER,
+)
 
 
 class OrderByType(Enum):
@@ -26,6 +34,19 @@ class QueryType(Enum):
     DELETE = auto()
 
 
+@dataclass(frozen=True)
+class QueryPlan:
+    """Immutable compiled query, hashable so it can be cached and reused"""
+
+    sql: str
+    num_params: int
+    query_type: QueryType
+
+    @property
+    def returns_rows(self) -> bool:
+        return self.query_type == QueryType.READ
+
+
 class QueryBuilder:
     """Build SQL queries SELECT DELETE operations with WHERE and ORDER BY clauses"""
 
@@ -35,6 +56,11 @@ class QueryBuilder:
         self._params = []
         self._order_clause = ""
         self._limit_clause = ""
+        self._aggregates = []
+        self._group_columns = ""
+        self._keyset_clause = ""
+        self._keyset_params = []
+        self._in_lists = {}  # where clause index -> (column, values)
 
     def select_columns(self, columns: List[str] | Tuple[str] | str):
         """Specify columns to select in the query"""
@@ -51,6 +77,16 @@ class QueryBuilder:
         self._params.append(value)
         return self
 
+    def where_in(self, column: str, values: List[Any] | Tuple[Any]):
+        """Add IN list condition to WHERE clause, chunked if over variable limit"""
+        values = list(dict.fromkeys(values))  # duplicates would repeat chunk rows
+        if not values:
+            raise ValueError(f"IN list for '{column}' is empty")
+        self._in_lists[len(self._where_clauses)] = (column, values)
+        self._where_clauses.append(_in_condition(column, len(values)))
+        self._params.extend(values)
+        return self
+
     def where_logical(self, logical: WhereLogical):
         """Add logical operator (AND/OR) to WHERE clause"""
         if (
@@ -71,31 +107,159 @@ class QueryBuilder:
         self._limit_clause = f" LIMIT {count}"
         return self
 
+    def after(
+        self,
+        column: str,
+        value: Any,
+        direction: OrderByType = OrderByType.ASCENDING,
+    ):
+        """Keyset pagination, rows past value of unique column in its order"""
+        comparison = ">" if direction == OrderByType.ASCENDING else "<"
+        self._keyset_clause = f"{column} {comparison} ?"
+        self._keyset_params = [value]
+        return self.order_by(column, direction)
+
+    def count(self, column: str = "*", alias: Optional[str] = None):
+        """Add COUNT aggregate to selected columns"""
+        default_alias = "count" if column == "*" else f"count_{column}"
+        self._aggregates.append(f"COUNT({column}) AS {alias or default_alias}")
+        return self
+
+    def sum(self, column: str, alias: Optional[str] = None):
+        """Add SUM aggregate to selected columns"""
+        self._aggregates.append(f"SUM({column}) AS {alias or f'sum_{column}'}")
+        return self
+
+    def group_by(self, columns: List[str] | Tuple[str] | str):
+        """Add GROUP BY clause, grouped columns are selected with aggregates"""
+        if isinstance(columns, (list, tuple)):
+            self._group_columns = ", ".join(columns)
+        else:
+            self._group_columns = columns
+        return self
+
+    def copy(self) -> "QueryBuilder":
+        """Independent copy, e.g. to page or chunk without changing original"""
+        return copy.deepcopy(self)
+
+    def chunks(
+        self, max_variables: int = SQLITE_MAX_VARIABLE_NUMBER
+    ) -> Iterator["QueryBuilder"]:
+        """Split largest IN list so each query binds at most max_variables.
+
+        Results of the chunks are disjoint, so concatenating them equals the
+        unchunked query. Chunking is refused where that would not hold: OR
+        conditions, ORDER BY/LIMIT/keyset ordering across chunks & aggregates.
+        """
+        num_params = len(self._params) + len(self._keyset_params)
+        if num_params <= max_variables:
+            yield self
+            return
+
+        if not self._in_lists:
+            raise ValueError(
+                f"Query binds {num_params} variables, limit is {max_variables}"
+            )
+        if (
+            WhereLogical.OR.value in self._where_clauses
+            or self._order_clause
+            or self._limit_clause
+            or self._aggregates
+        ):
+            raise ValueError(
+                "IN list over variable limit can't be chunked with OR, ORDER BY, "
+                "LIMIT or aggregates"
+            )
+
+        clause_idx, (column, values) = max(
+            self._in_lists.items(), key=lambda item: len(item[1][1])
+        )
+        chunk_size = max_variables - (num_params - len(values))
+        if chunk_size < 1:
+            raise ValueError(
+                f"Query binds too many variables outside IN list on '{column}'"
+            )
+
+        param_offset = sum(
+            clause.count("?") for clause in self._where_clauses[:clause_idx]
+        )
+        for start in range(0, len(values), chunk_size):
+            chunk_values = values[start : start + chunk_size]
+            chunk = self.copy()
+            chunk._in_lists[clause_idx] = (column, chunk_values)
+            chunk._where_clauses[clause_idx] = _in_condition(column, len(chunk_values))
+            chunk._params[param_offset : param_offset + len(values)] = chunk_values
+            yield chunk
+
+    def compile(self, table: str, query_type: QueryType) -> QueryPlan:
+        """Compile to cached plan, identical query shapes share one plan"""
+        columns = self._columns
+        if self._aggregates:
+            selected = [] if columns == "*" else [columns]
+            if columns == "*" and self._group_columns:
+                selected = [self._group_columns]
+            columns = ", ".join(selected + self._aggregates)
+        return _compile_plan(
+            table,
+            query_type,
+            columns,
+            tuple(self._where_clauses),
+            self._keyset_clause,
+            self._group_columns,
+            self._order_clause,
+            self._limit_clause,
+        )
+
+    def params(self) -> List[Any]:
+        """Parameter values in order of plan's parameter slots"""
+        return self._params + self._keyset_params
+
     def build(self, table: str, query_type: QueryType) -> Tuple[str, List[Any]]:
         """Construct final SQL query and return it with parameters"""
-        if query_type == QueryType.READ:
-            query = f"SELECT {self._columns} FROM {table}"
-        elif query_type == QueryType.DELETE:
-            query = f"DELETE FROM {table}"
-        else:
-            raise ValueError("Unsupported query type")
-
-        for idx, where_clause in enumerate(self._where_clauses):
-            if idx == 0:
-                query += " WHERE"
-            if idx % 2 == 0 and where_clause not in (
-                WhereLogical.AND.value,
-                WhereLogical.OR.value,
-            ):
-                query += f" {where_clause}"
-            elif idx % 2 == 1 and where_clause in (
-                WhereLogical.AND.value,
-                WhereLogical.OR.value,
-            ):
-                query += f" {where_clause}"
-            else:
-                raise ValueError("Invalid WHERE clause structure")
-
-        query += self._order_clause
-        query += self._limit_clause
-        return query, self._params
+        return self.compile(table, query_type).sql, self.params()
+
+
+@lru_cache(maxsize=QUERY_PLAN_CACHE_SIZE)
+def _compile_plan(
+    table: str,
+    query_type: QueryType,
+    columns: str,
+    where_clauses: Tuple[str, ...],
+    keyset_clause: str,
+    group_columns: str,
+    order_clause: str,
+    limit_clause: str,
+) -> QueryPlan:
+    """Assemble & validate SQL once per distinct query shape"""
+    if query_type == QueryType.READ:
+        parts = [f"SELECT {columns} FROM {table}"]
+    elif query_type == QueryType.DELETE:
+        parts = [f"DELETE FROM {table}"]
+    else:
+        raise ValueError("Unsupported query type")
+
+    logical = (WhereLogical.AND.value, WhereLogical.OR.value)
+    for idx, where_clause in enumerate(where_clauses):
+        if (idx % 2 == 0) == (where_clause in logical):
+            raise ValueError("Invalid WHERE clause structure")
+    conditions = " ".join(where_clauses)
+
+    if keyset_clause and conditions:
+        # bracket existing conditions so an OR among them can't escape the keyset
+        conditions = f"({conditions}) AND {keyset_clause}"
+    elif keyset_clause:
+        conditions = keyset_clause
+    if conditions:
+        parts.append(f" WHERE {conditions}")
+
+    if group_columns:
+        parts.append(f" GROUP BY {group_columns}")
+    parts.append(order_clause)
+    parts.append(limit_clause)
+    num_params = sum(clause.count("?") for clause in where_clauses)
+    num_params += keyset_clause.count("?")
+    return QueryPlan(sql="".join(parts), num_params=num_params, query_type=query_type)
+
+
+def _in_condition(column: str, num_values: int) -> str:
+    return f"{column} IN ({', '.join(['?'] * num_values)})"
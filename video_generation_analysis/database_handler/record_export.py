@@ -0,0 +1,264 @@
+import csv
+import json
+import logging
+import sys
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, fields
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Optional, Type, get_args, get_origin
+
+from video_generation_analysis.config import DATABASE_READ_PAGE_SIZE
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.query_builder import (
+    QueryBuilder,
+    WhereComparison,
+    WhereLogical,
+)
+from video_generation_analysis.database_handler.schema import to_datetime
+
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+STDOUT = Path("-")
+
+
+@dataclass
+class ExportStats:
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+class RecordExporter:
+    """Streams records matching a query to CSV, JSONL or Parquet a page at a time.
+
+    Pages are read by keyset pagination and written before the next is read,
+    so memory stays constant however large the table. Values are converted to
+    their dataclass field types (the db stores most columns as text). Parquet
+    needs the optional pyarrow package.
+    """
+
+    def __init__(
+        self, db_handler: DatabaseHandler, page_size: int = DATABASE_READ_PAGE_SIZE
+    ) -> None:
+        self._logger: logging.Logger = logging.getLogger(__name__)
+        self._db_handler = db_handler
+        self._page_size = page_size
+        self._fields = {
+            field.name: field.type for field in fields(db_handler.db_schema)
+        }
+
+    def export(
+        self,
+        output: Path,
+        export_format: Optional[str] = None,
+        columns: Optional[list[str]] = None,
+        filters: Optional[list[tuple[str, str, Any]]] = None,
+    ) -> ExportStats:
+        """Write records matching filters, e.g. [("views", ">=", 100)], to output.
+
+        Format defaults to output's suffix; output '-' writes to stdout.
+        """
+        export_format = export_format or output.suffix.lstrip(".").lower()
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format '{export_format}'")
+        columns = columns or list(self._fields)
+        unknown = [column for column in columns if column not in self._fields]
+        if unknown:
+            raise ValueError(f"Unknown columns {unknown}")
+
+        start = time.perf_counter()
+        rows = 0
+        writer = _WRITERS[export_format](output, columns, self._fields)
+        try:
+            with self._db_handler as db:
+                criteria = self._criteria(columns, filters or [])
+                for page in db.read_pages(criteria, page_size=self._page_size):
+                    writer.write(
+                        [
+                            [
+                                _typed_value(
+                                    self._fields[column], getattr(record, column)
+                                )
+                                for column in columns
+                            ]
+                            for record in page
+                        ]
+                    )
+                    rows += len(page)
+        finally:
+            writer.close()
+
+        stats = ExportStats(rows=rows, seconds=time.perf_counter() - start)
+        self._logger.info(
+            f"Exported {stats.rows} rows to {output} in {stats.seconds:.2f}s "
+            f"({stats.rows_per_second:.0f} rows/s)"
+        )
+        return stats
+
+    def _criteria(
+        self, columns: list[str], filters: list[tuple[str, str, Any]]
+    ) -> QueryBuilder:
+        comparisons = {comparison.value: comparison for comparison in WhereComparison}
+        # paging seeks on id, so it's always read even if not exported
+        qb = QueryBuilder().select_columns(list(dict.fromkeys(["id", *columns])))
+        for column, operator, value in filters:
+            if column not in self._fields:
+                raise ValueError(f"Unknown filter column '{column}'")
+            if operator not in comparisons:
+                raise ValueError(f"Unsupported filter operator '{operator}'")
+            numeric_type = _numeric_type(self._fields[column])
+            if numeric_type is not None:
+                # stored as text, compare as numbers rather than strings
+                try:
+                    value = numeric_type(value)
+                except (TypeError, ValueError) as e:
+                    raise ValueError(f"Filter on '{column}' needs a number") from e
+                sql_type = "INTEGER" if numeric_type is int else "REAL"
+                column = f"CAST({column} AS {sql_type})"
+            qb.where_logical(WhereLogical.AND)
+            qb.where_compare(column, comparisons[operator], value)
+        return qb
+
+
+def _numeric_type(field_type: Any) -> Optional[type]:
+    """int or float if field holds numbers, else None"""
+    if type(None) in get_args(field_type):  # Optional[X]
+        field_type = next(arg for arg in get_args(field_type) if arg is not type(None))
+    return field_type if field_type in (int, float) else None
+
+
+def _typed_value(field_type: Any, value: Any) -> Any:
+    """Raw db value as its dataclass field type"""
+    if value is None:
+        return None
+    if get_origin(field_type) is list:
+        return value
+    if type(None) in get_args(field_type):  # Optional[X]
+        field_type = next(arg for arg in get_args(field_type) if arg is not type(None))
+    if field_type is datetime:
+        return to_datetime(value)
+    if field_type in (int, float):
+        return field_type(value)
+    return value
+
+
+def _open_text(output: Path) -> IO[str]:
+    if output == STDOUT:
+        return sys.stdout
+    return open(output, "w", newline="", encoding="utf-8")
+
+
+class _RecordWriter(ABC):
+    """Export format writing pages of rows, columns in the order given."""
+
+    @abstractmethod
+    def __init__(self, output: Path, columns: list[str], field_types: dict) -> None:
+        """Open output & write any header, field_types by column name"""
+
+    @abstractmethod
+    def write(self, rows: list[list[Any]]) -> None:
+        """Append rows, values ordered like columns"""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Flush & close output"""
+
+
+class _CsvWriter(_RecordWriter):
+    def __init__(self, output: Path, columns: list[str], field_types: dict) -> None:
+        self._file = _open_text(output)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(columns)
+
+    def write(self, rows: list[list[Any]]) -> None:
+        self._writer.writerows(
+            [
+                [
+                    json.dumps(value)
+                    if isinstance(value, list)
+                    else value.isoformat()
+                    if isinstance(value, datetime)
+                    else value
+                    for value in row
+                ]
+                for row in rows
+            ]
+        )
+
+    def close(self) -> None:
+        if self._file is not sys.stdout:
+            self._file.close()
+
+
+class _JsonlWriter(_RecordWriter):
+    def __init__(self, output: Path, columns: list[str], field_types: dict) -> None:
+        self._file = _open_text(output)
+        self._columns = columns
+
+    def write(self, rows: list[list[Any]]) -> None:
+        self._file.writelines(
+            json.dumps(dict(zip(self._columns, row)), default=_json_default) + "\n"
+            for row in rows
+        )
+
+    def close(self) -> None:
+        if self._file is not sys.stdout:
+            self._file.close()
+
+
+class _ParquetWriter(_RecordWriter):
+    def __init__(self, output: Path, columns: list[str], field_types: dict) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Parquet export needs pyarrow: poetry install --extras parquet"
+            ) from e
+
+        self._pa = pa
+        self._schema = pa.schema(
+            [(column, _arrow_type(pa, field_types[column])) for column in columns]
+        )
+        self._writer = pq.ParquetWriter(
+            sys.stdout.buffer if output == STDOUT else str(output), self._schema
+        )
+
+    def write(self, rows: list[list[Any]]) -> None:
+        arrays = [
+            self._pa.array([row[idx] for row in rows], type=field.type)
+            for idx, field in enumerate(self._schema)
+        ]
+        self._writer.write_batch(self._pa.record_batch(arrays, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def _arrow_type(pa: Any, field_type: Type) -> Any:
+    if get_origin(field_type) is list:
+        return pa.list_(pa.string())
+    if type(None) in get_args(field_type):
+        field_type = next(arg for arg in get_args(field_type) if arg is not type(None))
+    return {
+        int: pa.int64(),
+        float: pa.float64(),
+        datetime: pa.timestamp("us"),
+    }.get(field_type, pa.string())
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} not JSON serializable")
+
+
+_WRITERS: dict[str, type[_RecordWriter]] = {
+    "csv": _CsvWriter,
+    "jsonl": _JsonlWriter,
+    "parquet": _ParquetWriter,
+}
@@ -1,6 +1,9 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
+
+# field metadata key overriding SQLite column type, e.g. for numeric ordering
+SQL_TYPE_METADATA = "sql_type"
 
 
 @dataclass
@@ -14,6 +17,90 @@ class VideoEngagementRecord:
     likes: int = -1
     comments: int = -1
     keywords: list[str] = field(default_factory=list)
+    last_refreshed_at: Optional[datetime] = None
+    views_per_hour: float = 0.0
+    # bumped in commit order on every write, see DatabaseHandler.track_revisions
+    revision: Optional[int] = field(
+        default=None, metadata={SQL_TYPE_METADATA: "INTEGER"}
+    )
+
+
+@dataclass
+class ScheduledJobRecord:
+    id: Optional[int] = None
+    name: str = ""
+    cron: str = ""
+    last_run_start: Optional[datetime] = None
+    last_run_end: Optional[datetime] = None
+    last_status: str = ""
+
+
+@dataclass
+class EngagementSnapshot:
+    id: Optional[int] = None
+    video_id: int = -1
+    datetime_snapshot: Optional[datetime] = None
+    views: int = 0
+    likes: int = 0
+    comments: int = 0
+    resolution: str = "raw"  # "raw" per refresh or "daily" rollup
+
+
+@dataclass
+class KeywordScore:
+    id: Optional[int] = None
+    keyword: str = ""
+    score: float = field(default=0.0, metadata={SQL_TYPE_METADATA: "REAL"})
+    updated_at: Optional[datetime] = None
+
+
+@dataclass
+class KeywordNeighbour:
+    id: Optional[int] = None
+    keyword: str = ""
+    position: int = field(default=0, metadata={SQL_TYPE_METADATA: "INTEGER"})
+    neighbour: str = ""  # "" with position 0 marks keyword without neighbours
+    similarity: float = field(default=0.0, metadata={SQL_TYPE_METADATA: "REAL"})
+    updated_at: Optional[datetime] = None
+
+
+@dataclass
+class QuotaBucket:
+    id: Optional[int] = None
+    name: str = ""
+    tokens: float = field(default=0.0, metadata={SQL_TYPE_METADATA: "REAL"})
+    updated_at: Optional[datetime] = None
+
+
+@dataclass
+class VideoJobRecord:
+    id: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    state: str = ""  # described -> generated -> uploaded -> recorded, or failed
+    attempts: int = 0
+    title: str = ""
+    description: str = ""
+    keywords: list[str] = field(default_factory=list)
+    video_path: str = ""
+    platform_urls: list[str] = field(default_factory=list)  # "" until uploaded
+    urls: list[str] = field(default_factory=list)
+    error: str = ""
+
+
+@dataclass
+class WorkItem:
+    id: Optional[int] = None
+    kind: str = ""
+    payload: str = ""  # JSON object
+    dedupe_key: str = ""
+    state: str = ""  # pending -> leased -> done, or dead after max attempts
+    attempts: int = 0
+    visible_at: Optional[datetime] = None  # leasable from, pushed out by heartbeats
+    lease_owner: str = ""
+    enqueued_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    error: str = ""
 
 
 SQLITE_TYPE_MAP = {
@@ -22,3 +109,10 @@ SQLITE_TYPE_MAP = {
     "float": "REAL",
     "bool": "INTEGER",
 }
+
+
+def to_datetime(value: Any) -> Optional[datetime]:
+    """Convert datetime column read back from db (ISO string) to datetime."""
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
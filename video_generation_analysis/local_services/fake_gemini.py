@@ -0,0 +1,123 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from video_generation_analysis.config import (
+    FAKE_SERVICE_ERROR_RATE,
+    FAKE_SERVICE_LATENCY_SECONDS,
+    FAKE_VIDEO_COMPLETION_SECONDS,
+    FAKE_VIDEO_SIZE_BYTES,
+)
+
+# ISO base media file header, so fake downloads look like MP4 files
+MP4_HEADER = b"\x00\x00\x00\x18ftypmp42\x00\x00\x00\x00mp42isom"
+
+
+@dataclass
+class FakeVideoFile:
+    size_bytes: int
+    latency_seconds: float
+
+    async def download(self, download_path: str) -> None:
+        """Write fake video bytes to download_path"""
+        await asyncio.sleep(self.latency_seconds)
+        padding = b"\x00" * max(self.size_bytes - len(MP4_HEADER), 0)
+        Path(download_path).write_bytes(MP4_HEADER + padding)
+
+
+@dataclass
+class FakeGeneratedVideo:
+    video: FakeVideoFile
+
+
+@dataclass
+class FakeOperationResponse:
+    generated_videos: list[FakeGeneratedVideo] = field(default_factory=list)
+
+
+@dataclass
+class FakeOperationError:
+    code: int
+    message: str
+
+
+@dataclass
+class FakeOperation:
+    name: str
+    done: bool = False
+    error: Optional[FakeOperationError] = None
+    response: Optional[FakeOperationResponse] = None
+
+
+class FakeGeminiAsyncClient:
+    """Local stand-in for google.genai Client(...).aio video generation.
+
+    generate_videos() starts an operation completing after completion_seconds,
+    failing at the configured error rate, whose video downloads as fake MP4
+    bytes. Pass a factory returning one to VideoGenerator(client_factory=...).
+    """
+
+    def __init__(
+        self,
+        latency_seconds: float = FAKE_SERVICE_LATENCY_SECONDS,
+        error_rate: float = FAKE_SERVICE_ERROR_RATE,
+        completion_seconds: float = FAKE_VIDEO_COMPLETION_SECONDS,
+        video_size_bytes: int = FAKE_VIDEO_SIZE_BYTES,
+        seed: Optional[int] = None,
+    ) -> None:
+        self._latency_seconds = latency_seconds
+        self._error_rate = error_rate
+        self._completion_seconds = completion_seconds
+        self._video_size_bytes = video_size_bytes
+        self._random = random.Random(seed)
+        self._deadlines: dict[str, float] = {}
+        self._failures: set[str] = set()
+        self.models = _FakeModels(self)
+        self.operations = _FakeOperations(self)
+        self.calls: dict[str, int] = {"generate_videos": 0, "operations.get": 0}
+
+    async def aclose(self) -> None:
+        pass
+
+    async def _generate_videos(self, **kwargs: Any) -> FakeOperation:
+        self.calls["generate_videos"] += 1
+        await asyncio.sleep(self._latency_seconds)
+        name = f"operations/fake{len(self._deadlines):07d}"
+        self._deadlines[name] = time.monotonic() + self._completion_seconds
+        if self._random.random() < self._error_rate:
+            self._failures.add(name)
+        return self._status(name)
+
+    async def _get(self, operation: FakeOperation) -> FakeOperation:
+        self.calls["operations.get"] += 1
+        await asyncio.sleep(self._latency_seconds)
+        return self._status(operation.name)
+
+    def _status(self, name: str) -> FakeOperation:
+        if time.monotonic() < self._deadlines[name]:
+            return FakeOperation(name=name)
+        if name in self._failures:
+            error = FakeOperationError(code=500, message="Fake generation failure")
+            return FakeOperation(name=name, done=True, error=error)
+        video = FakeVideoFile(self._video_size_bytes, self._latency_seconds)
+        response = FakeOperationResponse([FakeGeneratedVideo(video=video)])
+        return FakeOperation(name=name, done=True, response=response)
+
+
+class _FakeModels:
+    def __init__(self, client: FakeGeminiAsyncClient) -> None:
+        self._client = client
+
+    async def generate_videos(self, **kwargs: Any) -> FakeOperation:
+        return await self._client._generate_videos(**kwargs)
+
+
+class _FakeOperations:
+    def __init__(self, client: FakeGeminiAsyncClient) -> None:
+        self._client = client
+
+    async def get(self, operation: FakeOperation) -> FakeOperation:
+        return await self._client._get(operation)
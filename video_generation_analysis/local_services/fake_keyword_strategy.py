@@ -0,0 +1,23 @@
+import random
+from typing import Optional
+
+from video_generation_analysis.video_generator.keyword_strategy import KeywordStrategy
+
+VOCABULARY = (
+    "cat dog ocean forest city night sunrise robot dragon space guitar rain "
+    "mountain river desert neon garden castle train storm snow island jungle"
+).split()
+
+
+class FakeKeywordStrategy(KeywordStrategy):
+    """Local stand-in for model backed strategies, draws words from vocabulary"""
+
+    def __init__(
+        self, vocabulary: list[str] = VOCABULARY, seed: Optional[int] = None
+    ) -> None:
+        self._vocabulary = vocabulary
+        self._random = random.Random(seed)
+
+    def generate(self, keywords: list[str], min_length: int, max_length: int) -> str:
+        """Random vocabulary words, as many as max_length"""
+        return " ".join(self._random.choices(self._vocabulary, k=max_length))
@@ -0,0 +1,107 @@
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from video_generation_analysis.config import (
+    FAKE_SERVICE_ERROR_RATE,
+    FAKE_SERVICE_LATENCY_SECONDS,
+)
+
+
+@dataclass
+class FakeVideo:
+    video_id: str
+    title: str
+    views: int = 0
+    likes: int = 0
+    comments: int = 0
+
+
+class FakeYouTubeService:
+    """Local stand-in for the googleapiclient YouTube service.
+
+    Supports the videos().insert(...).next_chunk() and videos().list(...)
+    .execute() calls YouTubeApiBridge makes, with configurable latency and
+    random HTTP 503 errors. Each list of a video adds engagement, so metrics
+    sweeps see videos grow.
+    """
+
+    def __init__(
+        self,
+        latency_seconds: float = FAKE_SERVICE_LATENCY_SECONDS,
+        error_rate: float = FAKE_SERVICE_ERROR_RATE,
+        views_per_list: int = 100,
+        seed: Optional[int] = None,
+    ) -> None:
+        self._latency_seconds = latency_seconds
+        self._error_rate = error_rate
+        self._views_per_list = views_per_list
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.videos_store: dict[str, FakeVideo] = {}
+        self.calls: dict[str, int] = {"insert": 0, "list": 0}
+
+    def videos(self) -> "_FakeVideosResource":
+        return _FakeVideosResource(self)
+
+    def _call(self, operation: str) -> None:
+        """Simulate round trip, raising HttpError at configured error rate"""
+        with self._lock:
+            self.calls[operation] += 1
+            failed = self._random.random() < self._error_rate
+        time.sleep(self._latency_seconds)
+        if failed:
+            raise HttpError(httplib2.Response({"status": 503}), b"backendError")
+
+    def _insert(self, body: dict[str, Any]) -> dict[str, Any]:
+        self._call("insert")
+        with self._lock:
+            video_id = f"fake{len(self.videos_store):07d}"
+            self.videos_store[video_id] = FakeVideo(
+                video_id=video_id, title=body["snippet"]["title"]
+            )
+        return {"id": video_id}
+
+    def _list(self, video_id: str) -> dict[str, Any]:
+        self._call("list")
+        with self._lock:
+            video = self.videos_store.get(video_id)
+            if video is None:
+                return {"items": []}
+            video.views += self._views_per_list
+            video.likes += self._views_per_list // 20
+            video.comments += self._views_per_list // 100
+            statistics = {
+                "viewCount": str(video.views),
+                "likeCount": str(video.likes),
+                "commentCount": str(video.comments),
+            }
+        return {"items": [{"id": video_id, "statistics": statistics}]}
+
+
+class _FakeVideosResource:
+    def __init__(self, service: FakeYouTubeService) -> None:
+        self._service = service
+
+    def insert(self, part: str, body: dict[str, Any], media_body: Any = None):
+        return _FakeRequest(lambda: self._service._insert(body))
+
+    def list(self, part: str, id: str):
+        return _FakeRequest(lambda: self._service._list(id))
+
+
+class _FakeRequest:
+    def __init__(self, call: Callable[[], dict[str, Any]]) -> None:
+        self._call = call
+
+    def execute(self) -> dict[str, Any]:
+        return self._call()
+
+    def next_chunk(self) -> tuple[None, dict[str, Any]]:
+        """Whole upload completes in one chunk"""
+        return None, self._call()
@@ -0,0 +1,189 @@
+import argparse
+import json
+import logging
+import resource
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+
+from video_generation_analysis.config import (
+    ENGAGEMENT_PERCENTILES,
+    FAKE_SERVICE_ERROR_RATE,
+    FAKE_SERVICE_LATENCY_SECONDS,
+    FAKE_VIDEO_COMPLETION_SECONDS,
+)
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.schema import VideoEngagementRecord
+from video_generation_analysis.local_services.fake_gemini import FakeGeminiAsyncClient
+from video_generation_analysis.local_services.fake_keyword_strategy import (
+    FakeKeywordStrategy,
+)
+from video_generation_analysis.local_services.fake_youtube import FakeYouTubeService
+from video_generation_analysis.telemetry.telemetry import Telemetry
+from video_generation_analysis.video_analytics.refresh_planner import RefreshPlanner
+from video_generation_analysis.video_analytics.video_analytics import VideoAnalytics
+from video_generation_analysis.video_generator.description_generator import (
+    DescriptionGenerator,
+)
+from video_generation_analysis.video_generator.video_generator import VideoGenerator
+from video_generation_analysis.video_platforms_handler.video_platforms_handler import (
+    VideoPlatformsFacade,
+)
+from video_generation_analysis.video_platforms_handler.youtube_api_bridge import (
+    YouTubeApiBridge,
+)
+
+STAGES = ("generate_video", "update_video_metrics")
+EVERY_CYCLE_HOURS = 1 / 3600 / 1000  # 1ms refresh interval, all videos due
+
+
+@dataclass
+class LoadReport:
+    cycles: int
+    errors: dict[str, int]
+    duration_seconds: float
+    cycles_per_second: float
+    latency_ms: dict[str, dict[str, float]] = field(default_factory=dict)
+    api_calls: dict[str, int] = field(default_factory=dict)
+    cpu_seconds: float = 0.0
+    max_rss_mb: float = 0.0
+
+
+def build_video_analytics(
+    db_path: Path,
+    youtube: FakeYouTubeService,
+    gemini_factory: Callable[[], FakeGeminiAsyncClient],
+    poll_interval_seconds: float,
+    seed: Optional[int] = None,
+    telemetry: Optional[Telemetry] = None,
+) -> VideoAnalytics:
+    """VideoAnalytics wired to local fake services, refreshing metrics every run"""
+    db_handler = DatabaseHandler(db_path, VideoEngagementRecord, persistent=True)
+    description_generator = DescriptionGenerator(
+        db_handler=db_handler,
+        keyword_strategy=FakeKeywordStrategy(seed=seed),
+        description_strategy=FakeKeywordStrategy(seed=seed),
+    )
+    return VideoAnalytics(
+        db_handler=db_handler,
+        description_generator=description_generator,
+        video_generator=VideoGenerator(
+            client_factory=gemini_factory,
+            poll_interval_seconds=poll_interval_seconds,
+            telemetry=telemetry,
+        ),
+        video_platforms=VideoPlatformsFacade([YouTubeApiBridge(service=youtube)]),
+        refresh_planner=RefreshPlanner(
+            tiers=[], stale_interval_hours=EVERY_CYCLE_HOURS
+        ),
+        telemetry=telemetry,
+    )
+
+
+def run_load(
+    video_analytics: VideoAnalytics,
+    cycles: int,
+    youtube: Optional[FakeYouTubeService] = None,
+    percentiles: list[int] = ENGAGEMENT_PERCENTILES,
+) -> LoadReport:
+    """Drive generate & metrics update cycles, timing each stage"""
+    logger = logging.getLogger(__name__)
+    latencies: dict[str, list[float]] = {stage: [] for stage in STAGES}
+    errors = {stage: 0 for stage in STAGES}
+    stages = {
+        "generate_video": lambda: video_analytics.generate_video(num_top_videos=10),
+        "update_video_metrics": video_analytics.update_video_metrics,
+    }
+    usage_start = resource.getrusage(resource.RUSAGE_SELF)
+    start = time.perf_counter()
+
+    for _ in range(cycles):
+        for stage, run_stage in stages.items():
+            stage_start = time.perf_counter()
+            try:
+                run_stage()
+            except Exception as e:
+                errors[stage] += 1
+                logger.warning(f"Load cycle stage {stage} failed: {e}")
+            latencies[stage].append((time.perf_counter() - stage_start) * 1000)
+
+    duration = time.perf_counter() - start
+    usage_end = resource.getrusage(resource.RUSAGE_SELF)
+    cpu_seconds = (usage_end.ru_utime - usage_start.ru_utime) + (
+        usage_end.ru_stime - usage_start.ru_stime
+    )
+    latency_ms = {}
+    for stage, samples in latencies.items():
+        if samples:
+            values = np.percentile(samples, percentiles)
+            latency_ms[stage] = {
+                f"p{percentile}": round(float(value), 3)
+                for percentile, value in zip(percentiles, values)
+            }
+
+    return LoadReport(
+        cycles=cycles,
+        errors=errors,
+        duration_seconds=round(duration, 3),
+        cycles_per_second=round(cycles / duration, 3) if duration else 0.0,
+        latency_ms=latency_ms,
+        api_calls=dict(youtube.calls) if youtube else {},
+        cpu_seconds=round(cpu_seconds, 3),
+        max_rss_mb=round(usage_end.ru_maxrss / 1024, 1),  # ru_maxrss in KiB on Linux
+    )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Load test video pipeline against local fake services"
+    )
+    parser.add_argument("--cycles", type=int, default=20)
+    parser.add_argument("--db-path", type=Path, default=Path("load_harness.db"))
+    parser.add_argument("--latency", type=float, default=FAKE_SERVICE_LATENCY_SECONDS)
+    parser.add_argument("--error-rate", type=float, default=FAKE_SERVICE_ERROR_RATE)
+    parser.add_argument(
+        "--completion", type=float, default=FAKE_VIDEO_COMPLETION_SECONDS
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--metrics-file",
+        type=Path,
+        default=None,
+        help="Write per-stage Prometheus metrics of the run to this file",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    youtube = FakeYouTubeService(
+        latency_seconds=args.latency, error_rate=args.error_rate, seed=args.seed
+    )
+
+    gemini = FakeGeminiAsyncClient(
+        latency_seconds=args.latency,
+        error_rate=args.error_rate,
+        completion_seconds=args.completion,
+        seed=args.seed,
+    )
+
+    telemetry = Telemetry(enabled=args.metrics_file is not None)
+    video_analytics = build_video_analytics(
+        args.db_path,
+        youtube,
+        lambda: gemini,
+        poll_interval_seconds=args.completion / 4,
+        seed=args.seed,
+        telemetry=telemetry,
+    )
+    report = run_load(video_analytics, args.cycles, youtube=youtube)
+    print(json.dumps(asdict(report), indent=2))
+    if args.metrics_file:
+        telemetry.write(args.metrics_file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,395 @@
+import argparse
+import json
+import logging
+import math
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+import zlib
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Optional
+
+from video_generation_analysis.config import (
+    COMPACT_SNAPSHOTS_SCHEDULE,
+    GENERATE_VIDEO_SCHEDULE,
+    KEYWORD_NEIGHBOURS_TOPN,
+    SIMULATION_DAYS,
+    SIMULATION_GROWTH_DAYS,
+    SIMULATION_MEDIAN_VIEWS,
+    SIMULATION_VOCABULARY_SIZE,
+    UPDATE_METRICS_SCHEDULE,
+)
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.keyword_neighbour_handler import (
+    KeywordNeighbourHandler,
+)
+from video_generation_analysis.database_handler.keyword_score_handler import (
+    KeywordScoreHandler,
+)
+from video_generation_analysis.database_handler.schema import VideoEngagementRecord
+from video_generation_analysis.local_services.fake_keyword_strategy import (
+    FakeKeywordStrategy,
+)
+from video_generation_analysis.scheduler.cron_expression import CronExpression
+from video_generation_analysis.video_analytics.candidate_scorer import CandidateScorer
+from video_generation_analysis.video_analytics.engagement_store import (
+    EngagementStore,
+)
+from video_generation_analysis.video_analytics.video_analytics import VideoAnalytics
+from video_generation_analysis.video_generator.description_generator import (
+    DescriptionGenerator,
+)
+from video_generation_analysis.video_generator.keyword_neighbour_strategy import (
+    KeywordNeighbourStrategy,
+)
+from video_generation_analysis.video_generator.near_duplicate_index import (
+    NearDuplicateIndex,
+)
+from video_generation_analysis.video_platforms_handler.platform_api_bridge import (
+    PlatformApiBridge,
+    VideoEngagement,
+)
+from video_generation_analysis.video_platforms_handler.video_platforms_handler import (
+    VideoPlatformsFacade,
+)
+
+# scheduled like main, runs at the same minute in this order
+STAGE_SCHEDULES = {
+    "generate_video": GENERATE_VIDEO_SCHEDULE,
+    "update_video_metrics": UPDATE_METRICS_SCHEDULE,
+    "compact_snapshots": COMPACT_SNAPSHOTS_SCHEDULE,
+}
+SECONDS_PER_DAY = 86400.0
+
+
+class SimulatedClock:
+    """Clock standing still until the simulation moves it"""
+
+    def __init__(self, start: datetime) -> None:
+        self.now = start
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class SimulatedPlatform(PlatformApiBridge):
+    """Platform whose videos gain engagement as simulated time passes.
+
+    Views approach a per video total, log-normally distributed around
+    median_views and scaled by a fixed appeal per keyword, so keyword ranking
+    has something to find.
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], datetime],
+        median_views: float = SIMULATION_MEDIAN_VIEWS,
+        growth_days: float = SIMULATION_GROWTH_DAYS,
+        seed: Optional[int] = None,
+    ) -> None:
+        self._clock = clock
+        self._median_views = median_views
+        self._growth_days = growth_days
+        self._random = random.Random(seed)
+        self._seed = seed or 0
+        self._videos: dict[str, tuple[datetime, float]] = {}
+
+    def publish_video(
+        self, video_path: Path, title: str, desc: str, tags: list[str]
+    ) -> Optional[str]:
+        """Registers video, returns its simulated URL"""
+        url = f"https://simulated.invalid/{len(self._videos)}"
+        appeal = math.prod(self._keyword_appeal(tag) for tag in tags)
+        total_views = self._median_views * appeal * self._random.lognormvariate(0, 1)
+        self._videos[url] = (self._clock(), total_views)
+        return url
+
+    def get_engagement_metrics(self, video_url: str) -> Optional[VideoEngagement]:
+        """Engagement of video at simulated now, None if never published here"""
+        video = self._videos.get(video_url)
+        if video is None:
+            return None
+        published, total_views = video
+        age_days = (self._clock() - published).total_seconds() / SECONDS_PER_DAY
+        views = int(
+            total_views * (1 - math.exp(-max(age_days, 0.0) / self._growth_days))
+        )
+        return VideoEngagement(views=views, likes=views // 25, comments=views // 200)
+
+    def _keyword_appeal(self, keyword: str) -> float:
+        """Fixed views multiplier of keyword, between e^-0.5 and e^0.5"""
+        keyword_hash = zlib.crc32(f"{self._seed}:{keyword}".encode())
+        return math.exp(keyword_hash / 2**32 - 0.5)
+
+
+class SimulatedVideoGenerator:
+    """Stand-in for VideoGenerator, instantly writing an empty video file"""
+
+    def __init__(self, video_dir: Path) -> None:
+        self._video_dir = video_dir
+        self._count = 0
+
+    def create_video(self, prompt: str) -> Optional[Path]:
+        self._count += 1
+        video_path = self._video_dir / f"simulated_{self._count}.mp4"
+        video_path.touch()
+        return video_path
+
+    def delete_local_video(self, video_path: Path) -> None:
+        video_path.unlink(missing_ok=True)
+
+
+@dataclass
+class DayReport:
+    day: int
+    date: str
+    videos: int  # published so far
+    runs: dict[str, int] = field(default_factory=dict)
+    errors: dict[str, int] = field(default_factory=dict)
+    latency_ms: dict[str, float] = field(default_factory=dict)  # summed over runs
+    max_latency_ms: dict[str, float] = field(default_factory=dict)
+    db_mb: float = 0.0
+    rss_mb: float = 0.0
+
+
+def build_simulation(
+    db_path: Path,
+    clock: SimulatedClock,
+    video_dir: Path,
+    vocabulary_size: int = SIMULATION_VOCABULARY_SIZE,
+    seed: Optional[int] = None,
+    engagement_store: bool = False,
+) -> tuple[VideoAnalytics, DescriptionGenerator]:
+    """Pipeline wired like main, but with simulated generation, platform & clock.
+
+    Keyword neighbours are random words of the vocabulary instead of a model's.
+    """
+    db_handler = DatabaseHandler(db_path, VideoEngagementRecord, persistent=True)
+    store = EngagementStore(db_handler) if engagement_store else None
+    keyword_score_handler = KeywordScoreHandler(db_path)
+    keyword_neighbour_handler = KeywordNeighbourHandler(db_path)
+    vocabulary = simulated_vocabulary(vocabulary_size)
+    _seed_keyword_neighbours(keyword_neighbour_handler, vocabulary, clock(), seed)
+    description_generator = DescriptionGenerator(
+        db_handler=db_handler,
+        keyword_strategy=KeywordNeighbourStrategy(keyword_neighbour_handler),
+        description_strategy=FakeKeywordStrategy(vocabulary, seed=seed),
+        keyword_score_handler=keyword_score_handler,
+        engagement_store=store,
+    )
+    video_analytics = VideoAnalytics(
+        db_handler=db_handler,
+        description_generator=description_generator,
+        video_generator=SimulatedVideoGenerator(video_dir),
+        video_platforms=VideoPlatformsFacade([SimulatedPlatform(clock, seed=seed)]),
+        keyword_score_handler=keyword_score_handler,
+        near_duplicate_index=NearDuplicateIndex(),
+        candidate_scorer=CandidateScorer(clock=clock),
+        engagement_store=store,
+        clock=clock,
+    )
+    return video_analytics, description_generator
+
+
+def simulated_vocabulary(size: int) -> list[str]:
+    return [f"kw{idx:05d}" for idx in range(size)]
+
+
+def run_simulation(
+    video_analytics: VideoAnalytics,
+    description_generator: DescriptionGenerator,
+    clock: SimulatedClock,
+    days: int,
+    db_path: Path,
+    prompt: str = "",
+    on_day: Optional[Callable[[DayReport], None]] = None,
+) -> list[DayReport]:
+    """Run each day's scheduled stages at their simulated times, timing each.
+
+    prompt seeds the keywords of the first video, like main's --prompt.
+    get_top_keywords is also timed once a day, as "top_keywords".
+    """
+    logger = logging.getLogger(__name__)
+    schedules = {
+        stage: CronExpression(expression)
+        for stage, expression in STAGE_SCHEDULES.items()
+    }
+    videos = 0
+    stages = {
+        "generate_video": lambda: video_analytics.generate_video(
+            num_top_videos=10, prompt="" if videos else prompt
+        ),
+        "update_video_metrics": video_analytics.update_video_metrics,
+        "compact_snapshots": video_analytics.compact_snapshots,
+        "top_keywords": lambda: description_generator.get_top_keywords(10),
+    }
+    stage_order = list(stages)
+    reports = []
+
+    for day in range(days):
+        day_start = clock.now
+        day_end = day_start + timedelta(days=1)
+        runs = sorted(
+            (moment, stage_order.index(stage), stage)
+            for stage, cron in schedules.items()
+            for moment in _fire_times(cron, day_start, day_end)
+        )
+        runs.append((day_end - timedelta(seconds=1), len(stage_order), "top_keywords"))
+
+        report = DayReport(day=day + 1, date=day_start.date().isoformat(), videos=0)
+        for moment, _, stage in runs:
+            clock.now = moment
+            stage_start = time.perf_counter()
+            try:
+                stages[stage]()
+                if stage == "generate_video":
+                    videos += 1
+            except Exception as e:
+                report.errors[stage] = report.errors.get(stage, 0) + 1
+                logger.warning(f"Simulated {stage} on day {day + 1} failed: {e}")
+            elapsed_ms = (time.perf_counter() - stage_start) * 1000
+            report.runs[stage] = report.runs.get(stage, 0) + 1
+            report.latency_ms[stage] = report.latency_ms.get(stage, 0.0) + elapsed_ms
+            report.max_latency_ms[stage] = max(
+                report.max_latency_ms.get(stage, 0.0), elapsed_ms
+            )
+        clock.now = day_end
+
+        report.videos = videos
+        report.latency_ms = _rounded(report.latency_ms)
+        report.max_latency_ms = _rounded(report.max_latency_ms)
+        report.db_mb = round(_database_bytes(db_path) / 2**20, 2)
+        report.rss_mb = round(_rss_bytes() / 2**20, 1)
+        reports.append(report)
+        if on_day:
+            on_day(report)
+    return reports
+
+
+def _seed_keyword_neighbours(
+    neighbour_handler: KeywordNeighbourHandler,
+    vocabulary: list[str],
+    now: datetime,
+    seed: Optional[int] = None,
+    topn: int = KEYWORD_NEIGHBOURS_TOPN,
+) -> None:
+    """Random neighbours of every vocabulary word, no model loaded"""
+    rng = random.Random(seed)
+    neighbours = {}
+    for keyword in vocabulary:
+        sampled = rng.sample(vocabulary, min(topn + 1, len(vocabulary)))
+        similar = [word for word in sampled if word != keyword][:topn]
+        similarities = sorted((rng.random() for _ in similar), reverse=True)
+        neighbours[keyword] = list(zip(similar, similarities))
+    with neighbour_handler as db:
+        db.replace_neighbours(neighbours, now=now)
+
+
+def _fire_times(cron: CronExpression, start: datetime, end: datetime) -> list[datetime]:
+    """Scheduled times from start (inclusive) to end (exclusive)"""
+    moments = []
+    moment = cron.next_after(start - timedelta(minutes=1))
+    while moment < end:
+        moments.append(moment)
+        moment = cron.next_after(moment)
+    return moments
+
+
+def _rounded(values: dict[str, float]) -> dict[str, float]:
+    return {name: round(value, 3) for name, value in values.items()}
+
+
+def _database_bytes(db_path: Path) -> int:
+    """Database file plus its write-ahead log"""
+    paths = [db_path, db_path.with_name(db_path.name + "-wal")]
+    return sum(path.stat().st_size for path in paths if path.exists())
+
+
+def _rss_bytes() -> int:
+    """Current resident memory, peak where /proc isn't available"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024  # KiB on Linux
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Fast-forward scheduled pipeline runs over simulated days, "
+        "reporting per day latency, database size & memory as JSON lines"
+    )
+    parser.add_argument("--days", type=int, default=SIMULATION_DAYS)
+    parser.add_argument("--db-path", type=Path, default=Path("simulation.db"))
+    parser.add_argument(
+        "--start",
+        type=datetime.fromisoformat,
+        default=datetime(2024, 1, 1),
+        help="Simulated start date, ISO format",
+    )
+    parser.add_argument("--vocabulary", type=int, default=SIMULATION_VOCABULARY_SIZE)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--prompt",
+        default=None,
+        help="Keywords of the first video, first vocabulary words by default",
+    )
+    parser.add_argument(
+        "--engagement-store",
+        action="store_true",
+        help="Rank keywords & plan refreshes with the in-memory engagement store",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Write day reports to this file instead of stdout",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.db_path.exists():
+        # simulated platform videos live in memory, so can't continue a database
+        sys.exit(f"{args.db_path} exists, simulation needs a new database")
+
+    clock = SimulatedClock(args.start)
+    output = args.output.open("w") if args.output else sys.stdout
+
+    def write_report(report: DayReport) -> None:
+        output.write(json.dumps(asdict(report)) + "\n")
+        output.flush()
+
+    try:
+        with tempfile.TemporaryDirectory() as video_dir:
+            video_analytics, description_generator = build_simulation(
+                args.db_path,
+                clock,
+                Path(video_dir),
+                vocabulary_size=args.vocabulary,
+                seed=args.seed,
+                engagement_store=args.engagement_store,
+            )
+            run_simulation(
+                video_analytics,
+                description_generator,
+                clock,
+                args.days,
+                args.db_path,
+                prompt=args.prompt or " ".join(simulated_vocabulary(3)),
+                on_day=write_report,
+            )
+    finally:
+        if args.output:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
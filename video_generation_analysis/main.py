@@ -1,20 +1,88 @@
 import argparse
-import time
+import logging
+import os
+import sys
+from datetime import datetime
 from pathlib import Path
 
-from video_generation_analysis.config import DATABASE_PATH
+from dotenv import load_dotenv
+
+from video_generation_analysis.config import (
+    ARCHIVE_DIR,
+    ARCHIVE_KEEP_MONTHS,
+    ARCHIVE_SCHEDULE,
+    COMPACT_SNAPSHOTS_SCHEDULE,
+    DATABASE_PATH,
+    DATABASE_READ_PAGE_SIZE,
+    GENERATE_VIDEO_SCHEDULE,
+    KEYWORD_NEIGHBOURS_SCHEDULE,
+    METRICS_FETCH_BATCH_SIZE,
+    TELEMETRY_EXPORT_SCHEDULE,
+    UPDATE_METRICS_SCHEDULE,
+    WORK_QUEUE_PURGE_SCHEDULE,
+    YOUTUBE_API_KEY_ENV,
+)
 from video_generation_analysis.database_handler.database_handler import DatabaseHandler
-from video_generation_analysis.database_handler.schema import VideoEngagementRecord
+from video_generation_analysis.database_handler.keyword_neighbour_handler import (
+    KeywordNeighbourHandler,
+)
+from video_generation_analysis.database_handler.keyword_score_handler import (
+    KeywordScoreHandler,
+)
+from video_generation_analysis.database_handler.partition_archive import (
+    PartitionArchive,
+    months_ago,
+)
+from video_generation_analysis.database_handler.record_export import (
+    EXPORT_FORMATS,
+    RecordExporter,
+)
+from video_generation_analysis.database_handler.schema import (
+    QuotaBucket,
+    ScheduledJobRecord,
+    VideoEngagementRecord,
+    WorkItem,
+)
+from video_generation_analysis.scheduler.scheduler import Scheduler
+from video_generation_analysis.scheduler.work_queue import WorkQueue
+from video_generation_analysis.scheduler.worker import Worker
+from video_generation_analysis.telemetry.telemetry import Telemetry
+from video_generation_analysis.video_analytics.candidate_scorer import CandidateScorer
+from video_generation_analysis.video_analytics.engagement_store import EngagementStore
 from video_generation_analysis.video_analytics.video_analytics import VideoAnalytics
+from video_generation_analysis.video_analytics.video_work import (
+    enqueue_generate_video,
+    enqueue_metrics_refreshes,
+    enqueue_pending_jobs,
+    video_work_handlers,
+)
 from video_generation_analysis.video_generator.description_generator import (
     DescriptionGenerator,
 )
-from video_generation_analysis.video_generator.keyword_gensim_strategy import (
-    KeywordGensimStrategy,
-)
 from video_generation_analysis.video_generator.keyword_huggingface_strategy import (
     KeywordHuggingFaceStrategy,
 )
+from video_generation_analysis.video_generator.keyword_neighbour_index import (
+    KeywordNeighbourIndexer,
+)
+from video_generation_analysis.video_generator.keyword_neighbour_strategy import (
+    KeywordNeighbourStrategy,
+)
+from video_generation_analysis.video_generator.near_duplicate_index import (
+    NearDuplicateIndex,
+)
+from video_generation_analysis.video_platforms_handler.quota_manager import (
+    QuotaManager,
+)
+from video_generation_analysis.video_platforms_handler.video_platforms_handler import (
+    VideoPlatformsFacade,
+)
+from video_generation_analysis.video_platforms_handler.youtube_api_bridge import (
+    YouTubeApiBridge,
+)
+from video_generation_analysis.video_platforms_handler.youtube_metrics import (
+    YouTubeMetricsTransport,
+)
 
 
 def parse_args():
@@ -30,32 +98,197 @@ def parse_args():
         help="Optional prompt to guide inital video generation."
         "Otherwise top keywords from database will be used.",
     )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve Prometheus pipeline stage metrics on this port at /metrics.",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        type=Path,
+        default=None,
+        help="Periodically write Prometheus pipeline stage metrics to this file.",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--dispatch",
+        action="store_true",
+        help="Enqueue scheduled video generation & metrics refreshes for workers "
+        "instead of running them in this process.",
+    )
+    mode.add_argument(
+        "--worker",
+        action="store_true",
+        help="Lease & run enqueued work items; run any number of workers.",
+    )
+
+    subparsers = parser.add_subparsers(dest="command")
+    export = subparsers.add_parser(
+        "export", help="Stream video records to CSV, JSONL or Parquet and exit."
+    )
+    export.add_argument("output", type=Path, help="Output file, '-' for stdout.")
+    export.add_argument(
+        "--format",
+        choices=EXPORT_FORMATS,
+        default=None,
+        help="Defaults to output file suffix.",
+    )
+    export.add_argument(
+        "--columns", nargs="+", default=None, help="Columns to export, default all."
+    )
+    export.add_argument(
+        "--where",
+        nargs=3,
+        action="append",
+        default=[],
+        metavar=("COLUMN", "OPERATOR", "VALUE"),
+        help="Filter, e.g. --where datetime_publish '>=' 2025-01-01; repeatable.",
+    )
+    export.add_argument("--batch-size", type=int, default=DATABASE_READ_PAGE_SIZE)
     args = parser.parse_args()
     return args
 
 
 def main():
     args = parse_args()
+    if args.command == "export":
+        exporter = RecordExporter(
+            DatabaseHandler(Path(DATABASE_PATH), VideoEngagementRecord),
+            page_size=args.batch_size,
+        )
+        stats = exporter.export(args.output, args.format, args.columns, args.where)
+        print(
+            f"Exported {stats.rows} rows in {stats.seconds:.2f}s "
+            f"({stats.rows_per_second:.0f} rows/s)",
+            file=sys.stderr,
+        )
+        return
 
-    db_handler = DatabaseHandler(Path(DATABASE_PATH), VideoEngagementRecord)
+    db_handler = DatabaseHandler(
+        Path(DATABASE_PATH), VideoEngagementRecord, persistent=True
+    )
+    keyword_score_handler = KeywordScoreHandler(Path(DATABASE_PATH))
+    keyword_neighbour_handler = KeywordNeighbourHandler(Path(DATABASE_PATH))
+    engagement_store = EngagementStore(db_handler)
     description_generator = DescriptionGenerator(
         db_handler=db_handler,
-        keyword_strategy=KeywordGensimStrategy(),
+        keyword_strategy=KeywordNeighbourStrategy(keyword_neighbour_handler),
         description_strategy=KeywordHuggingFaceStrategy(),
+        keyword_score_handler=keyword_score_handler,
+        engagement_store=engagement_store,
     )
+    telemetry = Telemetry(enabled=bool(args.metrics_port or args.metrics_file))
+    if args.metrics_port:
+        telemetry.serve(args.metrics_port)
+    quota_manager = QuotaManager(DatabaseHandler(Path(DATABASE_PATH), QuotaBucket))
+    load_dotenv()
+    youtube_api_key = os.getenv(YOUTUBE_API_KEY_ENV, "")
+    metrics_transport = (
+        YouTubeMetricsTransport(youtube_api_key) if youtube_api_key else None
+    )
+    archive = PartitionArchive(Path(ARCHIVE_DIR))
     video_analytics = VideoAnalytics(
-        db_handler=db_handler, description_generator=description_generator
+        db_handler=db_handler,
+        description_generator=description_generator,
+        video_platforms=VideoPlatformsFacade(
+            [
+                YouTubeApiBridge(
+                    quota_manager=quota_manager, metrics_transport=metrics_transport
+                )
+            ]
+        ),
+        keyword_score_handler=keyword_score_handler,
+        telemetry=telemetry,
+        metrics_batch_size=METRICS_FETCH_BATCH_SIZE if metrics_transport else 0,
+        near_duplicate_index=NearDuplicateIndex(archive=archive),
+        candidate_scorer=CandidateScorer(),
+        engagement_store=engagement_store,
     )
 
+    work_queue = WorkQueue(DatabaseHandler(Path(DATABASE_PATH), WorkItem))
+    if args.worker:
+        # interrupted work items are retried by whichever worker leases them next
+        worker = Worker(work_queue, video_work_handlers(video_analytics))
+        try:
+            worker.run_forever()
+        except KeyboardInterrupt:
+            logging.getLogger(__name__).info("Worker interrupted, shutting down")
+        finally:
+            if metrics_transport:
+                metrics_transport.close()
+            telemetry.shutdown()
+        return
+
+    def generate_video(prompt: str = "") -> None:
+        if args.dispatch:
+            # jobs no work item will retry, e.g. dead-lettered while deferred
+            enqueue_pending_jobs(work_queue, video_analytics)
+            enqueue_generate_video(work_queue, num_top_videos=10, prompt=prompt)
+        else:
+            # publish jobs deferred while a platform's circuit was open
+            video_analytics.resume_pending_jobs()
+            video_analytics.generate_video(num_top_videos=10, prompt=prompt)
+
+    def update_video_metrics() -> None:
+        if args.dispatch:
+            enqueue_metrics_refreshes(work_queue, video_analytics)
+        else:
+            video_analytics.update_video_metrics()
+
+    # neighbours of new keywords & prompt words, the only time a model is loaded
+    keyword_indexer = KeywordNeighbourIndexer(db_handler, keyword_neighbour_handler)
+    keyword_indexer.refresh((args.prompt or "").split())
+
+    # finish video jobs interrupted by a previous shutdown before new ones
+    if args.dispatch:
+        enqueue_pending_jobs(work_queue, video_analytics)
+    else:
+        video_analytics.resume_pending_jobs()
+
     # generate inital video if prompt provided
     if args.prompt:
-        video_analytics.generate_video(num_top_videos=10, prompt=args.prompt)
+        generate_video(args.prompt)
+
+    # generate new videos and update engagement metrics on separate cadences
+    scheduler = Scheduler(DatabaseHandler(Path(DATABASE_PATH), ScheduledJobRecord))
+    scheduler.add_job("generate_video", GENERATE_VIDEO_SCHEDULE, generate_video)
+    scheduler.add_job(
+        "update_video_metrics", UPDATE_METRICS_SCHEDULE, update_video_metrics
+    )
+    scheduler.add_job(
+        "index_keyword_neighbours",
+        KEYWORD_NEIGHBOURS_SCHEDULE,
+        keyword_indexer.refresh,
+    )
+    scheduler.add_job(
+        "compact_snapshots",
+        COMPACT_SNAPSHOTS_SCHEDULE,
+        video_analytics.compact_snapshots,
+    )
+
+    def archive_records() -> None:
+        archive.archive(
+            db_handler, before=months_ago(datetime.now(), ARCHIVE_KEEP_MONTHS)
+        )
 
-    # periodically generate new videos and update engagement metrics
-    while True:
-        video_analytics.generate_video(num_top_videos=10)
-        video_analytics.update_video_metrics()
-        time.sleep(86400)  # run once a day
+    scheduler.add_job("archive_records", ARCHIVE_SCHEDULE, archive_records)
+    scheduler.add_job("purge_work_queue", WORK_QUEUE_PURGE_SCHEDULE, work_queue.purge)
+    if args.metrics_file:
+        scheduler.add_job(
+            "export_metrics",
+            TELEMETRY_EXPORT_SCHEDULE,
+            lambda: telemetry.write(args.metrics_file),
+        )
+    try:
+        scheduler.run_forever()
+    except KeyboardInterrupt:
+        logging.getLogger(__name__).info("Scheduler interrupted, shutting down")
+    finally:
+        scheduler.shutdown()
+        if metrics_transport:
+            metrics_transport.close()
+        telemetry.shutdown()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta
+
+
+class CronExpression:
+    """Parses 5 field cron expression 'minute hour day-of-month month day-of-week'.
+
+    Each field supports '*', single values, ranges 'a-b', lists 'a,b' and steps
+    '*/n' or 'a-b/n'. Day-of-week is 0-6 starting Sunday (7 also Sunday).
+    """
+
+    _FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+    _MAX_SEARCH = timedelta(days=5 * 366)
+
+    def __init__(self, expression: str) -> None:
+        self.expression = expression
+        parts = expression.split()
+        if len(parts) != len(self._FIELD_RANGES):
+            raise ValueError(f"Cron expression must have 5 fields: '{expression}'")
+
+        fields = [
+            self._parse_field(part, low, high)
+            for part, (low, high) in zip(parts, self._FIELD_RANGES)
+        ]
+        self._minutes, self._hours, self._days, self._months, weekdays = fields
+        self._weekdays = {day % 7 for day in weekdays}  # 7 is also Sunday
+        self._day_restricted = parts[2] != "*"
+        self._weekday_restricted = parts[4] != "*"
+
+    def __repr__(self) -> str:
+        return f"CronExpression('{self.expression}')"
+
+    def matches(self, moment: datetime) -> bool:
+        """True if moment (to the minute) is a scheduled time."""
+        return (
+            moment.minute in self._minutes
+            and moment.hour in self._hours
+            and moment.month in self._months
+            and self._day_matches(moment)
+        )
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Earliest scheduled time strictly after moment."""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + self._MAX_SEARCH
+
+        while candidate < limit:
+            if candidate.month not in self._months:
+                candidate = self._start_of_next_month(candidate)
+            elif not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self._hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self._minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+
+        raise ValueError(f"Cron expression never matches: '{self.expression}'")
+
+    def _day_matches(self, moment: datetime) -> bool:
+        """Standard cron rule: if both day fields restricted either may match."""
+        day_ok = moment.day in self._days
+        weekday_ok = (moment.isoweekday() % 7) in self._weekdays
+        if self._day_restricted and self._weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def _start_of_next_month(self, moment: datetime) -> datetime:
+        if moment.month == 12:
+            return moment.replace(
+                year=moment.year + 1, month=1, day=1, hour=0, minute=0
+            )
+        return moment.replace(month=moment.month + 1, day=1, hour=0, minute=0)
+
+    def _parse_field(self, field: str, low: int, high: int) -> set[int]:
+        values: set[int] = set()
+        for item in field.split(","):
+            item_range, _, step_str = item.partition("/")
+            step = int(step_str) if step_str else 1
+            if step < 1:
+                raise ValueError(f"Invalid cron step '{item}'")
+
+            if item_range == "*":
+                start, end = low, high
+            elif "-" in item_range:
+                start_str, end_str = item_range.split("-", 1)
+                start, end = int(start_str), int(end_str)
+            else:
+                start = int(item_range)
+                end = high if step_str else start
+
+            if start < low or end > high or start > end:
+                raise ValueError(f"Cron field '{item}' outside range {low}-{high}")
+            values.update(range(start, end + 1, step))
+        return values
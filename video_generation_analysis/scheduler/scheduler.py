@@ -0,0 +1,168 @@
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Optional
+
+from video_generation_analysis.config import (
+    SCHEDULER_MAX_WORKERS,
+    SCHEDULER_POLL_SECONDS,
+)
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.query_builder import (
+    QueryBuilder,
+    WhereComparison,
+)
+from video_generation_analysis.database_handler.schema import (
+    ScheduledJobRecord,
+    to_datetime,
+)
+from video_generation_analysis.scheduler.cron_expression import CronExpression
+
+STATUS_RUNNING = "running"
+STATUS_SUCCESS = "success"
+STATUS_FAILED = "failed"
+
+
+@dataclass
+class ScheduledJob:
+    name: str
+    cron: CronExpression
+    func: Callable[[], None]
+    record_id: int
+    next_run: datetime
+    future: Optional[Future] = None
+
+
+class Scheduler:
+    """Runs jobs on cron schedules in a worker pool, persisting run state in db.
+
+    Each job has its own cadence and never overlaps with itself; an occurrence
+    due while the previous run is still going is skipped. On restart a job whose
+    last run failed, crashed or missed its next occurrence runs immediately once.
+    """
+
+    def __init__(
+        self,
+        db_handler: DatabaseHandler,
+        max_workers: int = SCHEDULER_MAX_WORKERS,
+        poll_seconds: float = SCHEDULER_POLL_SECONDS,
+        clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        self._logger: logging.Logger = logging.getLogger(__name__)
+        self._db_handler = db_handler
+        self._poll_seconds = poll_seconds
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="scheduler"
+        )
+        self._jobs: dict[str, ScheduledJob] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    def add_job(self, name: str, cron: str, func: Callable[[], None]) -> None:
+        """Register job, restoring last-run state from db to catch up missed runs"""
+        if name in self._jobs:
+            raise ValueError(f"Job '{name}' already scheduled")
+
+        cron_expression = CronExpression(cron)
+        now = self._clock()
+        with self._db_handler as db:
+            qb = QueryBuilder().where_compare("name", WhereComparison.EQUAL, name)
+            records = db.read(qb)
+            if records:
+                record = records[0]
+                if record.cron != cron:
+                    db.update(record.id, {"cron": cron})
+            else:
+                db.create(ScheduledJobRecord(name=name, cron=cron))
+                record = db.read(qb)[0]
+
+        next_run = self._catch_up_run(record, cron_expression, now)
+        self._jobs[name] = ScheduledJob(
+            name=name,
+            cron=cron_expression,
+            func=func,
+            record_id=record.id,
+            next_run=next_run,
+        )
+        self._logger.info(f"Scheduled job '{name}' ({cron}) next run {next_run}")
+
+    def next_run(self, name: str) -> datetime:
+        """Next time job is due to run"""
+        return self._jobs[name].next_run
+
+    def run_pending(self) -> list[str]:
+        """Submit all due jobs to worker pool, returns names of jobs started"""
+        now = self._clock()
+        started = []
+        with self._lock:
+            for job in self._jobs.values():
+                if job.next_run > now:
+                    continue
+
+                job.next_run = job.cron.next_after(now)
+                if job.future is not None and not job.future.done():
+                    self._logger.warning(
+                        f"Job '{job.name}' still running, skipping until {job.next_run}"
+                    )
+                    continue
+
+                job.future = self._executor.submit(self._run_job, job)
+                started.append(job.name)
+        return started
+
+    def run_forever(self) -> None:
+        """Dispatch due jobs until stop() is called"""
+        while not self._stop_event.is_set():
+            self.run_pending()
+            self._stop_event.wait(self._seconds_until_next_run())
+
+    def stop(self) -> None:
+        """Stop dispatch loop, running jobs are left to finish"""
+        self._stop_event.set()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop dispatching and release worker pool"""
+        self.stop()
+        self._executor.shutdown(wait=wait)
+
+    def _run_job(self, job: ScheduledJob) -> None:
+        self._save_state(
+            job, {"last_run_start": self._clock(), "last_status": STATUS_RUNNING}
+        )
+        status = STATUS_SUCCESS
+        try:
+            job.func()
+        except Exception as e:
+            status = STATUS_FAILED
+            self._logger.error(f"Scheduled job '{job.name}' failed: {e}", exc_info=True)
+        finally:
+            self._save_state(
+                job, {"last_run_end": self._clock(), "last_status": status}
+            )
+
+    def _save_state(self, job: ScheduledJob, updates: dict) -> None:
+        try:
+            with self._db_handler as db:
+                db.update(job.record_id, updates)
+        except Exception as e:
+            self._logger.error(f"Failed to persist state of job '{job.name}': {e}")
+
+    def _catch_up_run(
+        self, record: ScheduledJobRecord, cron: CronExpression, now: datetime
+    ) -> datetime:
+        """Due now if never run, last run unsuccessful or an occurrence was missed"""
+        if record.last_status != STATUS_SUCCESS or not record.last_run_start:
+            return now
+
+        scheduled = cron.next_after(to_datetime(record.last_run_start))
+        return now if scheduled <= now else scheduled
+
+    def _seconds_until_next_run(self) -> float:
+        if not self._jobs:
+            return self._poll_seconds
+        next_run = min(job.next_run for job in self._jobs.values())
+        seconds = (next_run - self._clock()).total_seconds()
+        return min(max(seconds, 0.0), self._poll_seconds)
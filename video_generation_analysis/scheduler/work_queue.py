@@ -0,0 +1,252 @@
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional
+
+from video_generation_analysis.config import (
+    WORK_QUEUE_MAX_ATTEMPTS,
+    WORK_QUEUE_RETENTION_DAYS,
+    WORK_QUEUE_VISIBILITY_TIMEOUT_SECONDS,
+)
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.query_builder import (
+    QueryBuilder,
+    WhereComparison,
+    WhereLogical,
+)
+from video_generation_analysis.database_handler.schema import WorkItem
+
+ITEM_PENDING = "pending"
+ITEM_LEASED = "leased"
+ITEM_DONE = "done"
+ITEM_DEAD = "dead"
+
+
+class WorkQueue:
+    """Work items leased by worker processes sharing one SQLite database.
+
+    A lease hides an item from other workers until its visibility timeout;
+    the holder extends it with heartbeats while working. An item whose
+    worker died becomes leasable again once the lease expires, and after
+    max_attempts leases it is dead-lettered instead of retried forever.
+    Leasing runs under BEGIN IMMEDIATE, so no two workers get the same item.
+    Done and dead items are kept retention_days for inspection, then purged.
+    """
+
+    def __init__(
+        self,
+        db_handler: DatabaseHandler,
+        visibility_timeout_seconds: float = WORK_QUEUE_VISIBILITY_TIMEOUT_SECONDS,
+        max_attempts: int = WORK_QUEUE_MAX_ATTEMPTS,
+        retention_days: float = WORK_QUEUE_RETENTION_DAYS,
+        clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        self._logger: logging.Logger = logging.getLogger(__name__)
+        self._db_handler = db_handler
+        self._visibility_timeout = timedelta(seconds=visibility_timeout_seconds)
+        self._max_attempts = max_attempts
+        self._retention = timedelta(days=retention_days)
+        self._clock = clock
+        with self._db_handler as db:
+            db.create_index(["state", "visible_at"])
+            db.create_index(["dedupe_key"])
+            db.create_index(["state", "updated_at"])
+
+    def enqueue(
+        self, kind: str, payload: dict[str, Any], dedupe_key: str = ""
+    ) -> Optional[int]:
+        """Add work item, returns its id or None if dedupe_key already enqueued"""
+        now = self._clock()
+        with self._db_handler as db:
+            db.begin_immediate()
+            if dedupe_key:
+                qb = (
+                    QueryBuilder()
+                    .select_columns("id")
+                    .where_compare("dedupe_key", WhereComparison.EQUAL, dedupe_key)
+                )
+                if db.read(qb):
+                    self._logger.debug(f"Work item '{dedupe_key}' already enqueued")
+                    return None
+            return db.create(
+                WorkItem(
+                    kind=kind,
+                    payload=json.dumps(payload),
+                    dedupe_key=dedupe_key,
+                    state=ITEM_PENDING,
+                    visible_at=now,
+                    enqueued_at=now,
+                    updated_at=now,
+                )
+            )
+
+    def lease(
+        self, worker_id: str, kinds: Optional[list[str]] = None
+    ) -> Optional[WorkItem]:
+        """Lease oldest visible item of given kinds, None if queue has none"""
+        while True:
+            now = self._clock()
+            with self._db_handler as db:
+                db.begin_immediate()  # no other worker can lease between read & write
+                qb = (
+                    QueryBuilder()
+                    .where_in("state", [ITEM_PENDING, ITEM_LEASED])
+                    .where_logical(WhereLogical.AND)
+                    .where_compare("visible_at", WhereComparison.LESS_THAN_EQUAL, now)
+                )
+                if kinds:
+                    qb.where_logical(WhereLogical.AND).where_in("kind", kinds)
+                items = db.read(qb.order_by("id").limit(1))
+                if not items:
+                    return None
+
+                item = items[0]
+                if int(item.attempts) >= self._max_attempts:
+                    # lease expired on final attempt, its worker presumably died
+                    self._set(db, item, state=ITEM_DEAD, error="Lease expired")
+                    self._logger.error(f"Work item {item.id} dead-lettered")
+                    continue
+
+                self._set(
+                    db,
+                    item,
+                    state=ITEM_LEASED,
+                    lease_owner=worker_id,
+                    attempts=int(item.attempts) + 1,
+                    visible_at=now + self._visibility_timeout,
+                )
+                return item
+
+    def heartbeat(self, item: WorkItem, worker_id: str) -> bool:
+        """Extend lease, returns False if lease was lost to another worker"""
+        with self._db_handler as db:
+            db.begin_immediate()
+            if not self._holds_lease(db, item, worker_id):
+                return False
+            self._set(db, item, visible_at=self._clock() + self._visibility_timeout)
+        return True
+
+    def complete(self, item: WorkItem, worker_id: str) -> bool:
+        """Mark leased item done, returns False if lease was lost"""
+        with self._db_handler as db:
+            db.begin_immediate()
+            if not self._holds_lease(db, item, worker_id):
+                self._logger.warning(f"Work item {item.id} lease lost before done")
+                return False
+            self._set(db, item, state=ITEM_DONE, lease_owner="")
+        return True
+
+    def fail(self, item: WorkItem, worker_id: str, error: str) -> bool:
+        """Release leased item for retry, or dead-letter it on its final attempt"""
+        with self._db_handler as db:
+            db.begin_immediate()
+            if not self._holds_lease(db, item, worker_id):
+                return False
+            if int(item.attempts) >= self._max_attempts:
+                self._set(db, item, state=ITEM_DEAD, lease_owner="", error=error)
+                self._logger.error(f"Work item {item.id} dead-lettered: {error}")
+            else:
+                self._set(
+                    db,
+                    item,
+                    state=ITEM_PENDING,
+                    lease_owner="",
+                    visible_at=self._clock(),
+                    error=error,
+                )
+        return True
+
+    def defer(
+        self, item: WorkItem, worker_id: str, delay_seconds: float, reason: str
+    ) -> bool:
+        """Release leased item without using an attempt, visible after delay.
+
+        For work that can't make progress yet, e.g. waiting for a platform to
+        recover, rather than work that failed. Returns False if lease was lost.
+        """
+        with self._db_handler as db:
+            db.begin_immediate()
+            if not self._holds_lease(db, item, worker_id):
+                return False
+            self._set(
+                db,
+                item,
+                state=ITEM_PENDING,
+                lease_owner="",
+                attempts=int(item.attempts) - 1,
+                visible_at=self._clock() + timedelta(seconds=delay_seconds),
+                error=reason,
+            )
+        return True
+
+    def update_payload(
+        self, item: WorkItem, worker_id: str, payload: dict[str, Any]
+    ) -> bool:
+        """Persist progress into leased item's payload for whoever retries it"""
+        with self._db_handler as db:
+            db.begin_immediate()
+            if not self._holds_lease(db, item, worker_id):
+                return False
+            self._set(db, item, payload=json.dumps(payload))
+        return True
+
+    def outstanding_items(self, kind: str) -> list[WorkItem]:
+        """Items of kind pending or leased, oldest first"""
+        qb = (
+            QueryBuilder()
+            .where_in("state", [ITEM_PENDING, ITEM_LEASED])
+            .where_logical(WhereLogical.AND)
+            .where_compare("kind", WhereComparison.EQUAL, kind)
+            .order_by("id")
+        )
+        with self._db_handler as db:
+            return db.read(qb)
+
+    def outstanding(self, kind: str) -> int:
+        """Number of items of kind pending or leased"""
+        qb = (
+            QueryBuilder()
+            .count()
+            .where_in("state", [ITEM_PENDING, ITEM_LEASED])
+            .where_logical(WhereLogical.AND)
+            .where_compare("kind", WhereComparison.EQUAL, kind)
+        )
+        with self._db_handler as db:
+            return int(db.aggregate(qb)[0]["count"])
+
+    def purge(self) -> None:
+        """Delete done & dead items last updated more than retention_days ago"""
+        qb = (
+            QueryBuilder()
+            .where_in("state", [ITEM_DONE, ITEM_DEAD])
+            .where_logical(WhereLogical.AND)
+            .where_compare(
+                "updated_at", WhereComparison.LESS_THAN, self._clock() - self._retention
+            )
+        )
+        with self._db_handler as db:
+            db.delete(qb)
+
+    def _holds_lease(self, db: DatabaseHandler, item: WorkItem, worker_id: str) -> bool:
+        qb = (
+            QueryBuilder()
+            .select_columns(["state", "lease_owner", "attempts"])
+            .where_compare("id", WhereComparison.EQUAL, item.id)
+        )
+        records = db.read(qb)
+        return bool(records) and (
+            records[0].state == ITEM_LEASED
+            and records[0].lease_owner == worker_id
+            and int(records[0].attempts) == int(item.attempts)
+        )
+
+    def _set(self, db: DatabaseHandler, item: WorkItem, **updates: Any) -> None:
+        updates["updated_at"] = self._clock()
+        db.update(item.id, updates)
+        for name, value in updates.items():
+            setattr(item, name, value)
+
+
+def item_payload(item: WorkItem) -> dict[str, Any]:
+    """Work item payload as dict"""
+    return json.loads(item.payload) if item.payload else {}
@@ -0,0 +1,114 @@
+import logging
+import os
+import socket
+import threading
+from typing import Callable, Optional
+from uuid import uuid4
+
+from video_generation_analysis.config import (
+    WORK_QUEUE_HEARTBEAT_SECONDS,
+    WORKER_POLL_SECONDS,
+)
+from video_generation_analysis.database_handler.schema import WorkItem
+from video_generation_analysis.scheduler.work_queue import WorkQueue
+
+# work item handler, called with the leased item & worker it runs on
+Handler = Callable[[WorkItem, "Worker"], None]
+
+
+class WorkDeferred(Exception):
+    """Raised by a handler whose item can't progress yet, e.g. platform down.
+
+    The item is retried after delay_seconds without using up an attempt.
+    """
+
+    def __init__(self, message: str, delay_seconds: float) -> None:
+        super().__init__(message)
+        self.delay_seconds = delay_seconds
+
+
+class Worker:
+    """Leases work items of the kinds it has handlers for and runs them.
+
+    Run as many worker processes as needed against the same database; each
+    item is leased by one worker at a time. While a handler runs, a heartbeat
+    thread keeps extending the lease, so only a dead worker's items are
+    picked up again by others.
+    """
+
+    def __init__(
+        self,
+        queue: WorkQueue,
+        handlers: dict[str, Handler],
+        worker_id: Optional[str] = None,
+        poll_seconds: float = WORKER_POLL_SECONDS,
+        heartbeat_seconds: float = WORK_QUEUE_HEARTBEAT_SECONDS,
+    ) -> None:
+        self._logger: logging.Logger = logging.getLogger(__name__)
+        self.queue = queue
+        self._handlers = handlers
+        self.worker_id = worker_id or (
+            f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        )
+        self._poll_seconds = poll_seconds
+        self._heartbeat_seconds = heartbeat_seconds
+        self._stop_event = threading.Event()
+
+    def run_once(self) -> bool:
+        """Lease & run one work item, returns False if none was available"""
+        item = self.queue.lease(self.worker_id, kinds=list(self._handlers))
+        if item is None:
+            return False
+
+        self._logger.info(
+            f"Worker {self.worker_id} running {item.kind} item {item.id} "
+            f"(attempt {item.attempts})"
+        )
+        heartbeat_stop = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat,
+            args=(item, heartbeat_stop),
+            name=f"heartbeat-{item.id}",
+            daemon=True,
+        )
+        heartbeat.start()
+        try:
+            self._handlers[item.kind](item, self)
+        except WorkDeferred as e:
+            self._logger.warning(
+                f"Work item {item.id} deferred {e.delay_seconds:.0f}s: {e}"
+            )
+            heartbeat_stop.set()
+            heartbeat.join()
+            self.queue.defer(item, self.worker_id, e.delay_seconds, str(e))
+        except Exception as e:
+            self._logger.error(f"Work item {item.id} failed: {e}", exc_info=True)
+            heartbeat_stop.set()
+            heartbeat.join()
+            self.queue.fail(item, self.worker_id, str(e))
+        else:
+            heartbeat_stop.set()
+            heartbeat.join()
+            self.queue.complete(item, self.worker_id)
+        return True
+
+    def run_forever(self) -> None:
+        """Process work items until stop() is called, polling when queue is empty"""
+        while not self._stop_event.is_set():
+            if not self.run_once():
+                self._stop_event.wait(self._poll_seconds)
+
+    def stop(self) -> None:
+        """Stop after current work item"""
+        self._stop_event.set()
+
+    def _heartbeat(self, item: WorkItem, stop_event: threading.Event) -> None:
+        while not stop_event.wait(self._heartbeat_seconds):
+            try:
+                if not self.queue.heartbeat(item, self.worker_id):
+                    self._logger.warning(
+                        f"Worker {self.worker_id} lost lease of item {item.id}"
+                    )
+                    return
+            except Exception as e:
+                self._logger.error(f"Heartbeat of work item {item.id} failed: {e}")
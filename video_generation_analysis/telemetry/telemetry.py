@@ -0,0 +1,215 @@
+import bisect
+import logging
+import os
+import threading
+import time
+from contextvars import ContextVar, Token
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+
+from video_generation_analysis.config import (
+    TELEMETRY_DURATION_BUCKETS,
+    TELEMETRY_METRIC_PREFIX,
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Histogram:
+    """Cumulative bucket counts, sum & count of observed values."""
+
+    def __init__(self, buckets: list[float]) -> None:
+        self.buckets = sorted(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last bucket is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Span:
+    """Timed pipeline stage, counting quantities such as bytes or API calls."""
+
+    __slots__ = ("_telemetry", "stage", "counters", "_start", "_token")
+
+    def __init__(self, telemetry: "Telemetry", stage: str) -> None:
+        self._telemetry = telemetry
+        self.stage = stage
+        self.counters: dict[str, float] = {}
+        self._start = 0.0
+        self._token: Optional[Token[AnySpan]] = None
+
+    def add(self, counter: str, value: float = 1) -> None:
+        """Add to stage counter, exported as <prefix>_stage_<counter>_total"""
+        self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, traceback) -> bool:
+        duration = time.perf_counter() - self._start
+        if self._token is not None:
+            _current_span.reset(self._token)
+        self._telemetry._record(self, duration, failed=exc_type is not None)
+        return False
+
+
+class _NoopSpan:
+    """Shared span of disabled telemetry, every call does nothing."""
+
+    __slots__ = ()
+    stage = ""
+
+    def add(self, counter: str, value: float = 1) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_val, traceback) -> bool:
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+AnySpan = Span | _NoopSpan
+_current_span: ContextVar[AnySpan] = ContextVar("current_span", default=NOOP_SPAN)
+
+
+def current_span() -> AnySpan:
+    """Innermost span open in this thread, e.g. for helpers counting retries"""
+    return _current_span.get()
+
+
+class Telemetry:
+    """Per-stage spans aggregated into Prometheus histograms & counters.
+
+    Disabled telemetry hands out one shared no-op span, so instrumented code
+    costs a method call per stage. Enabled, each span records its duration
+    into a per-stage histogram plus its counters, exported as Prometheus text
+    by render(), write() to a textfile collector path, or serve() over HTTP.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        prefix: str = TELEMETRY_METRIC_PREFIX,
+        buckets: list[float] = TELEMETRY_DURATION_BUCKETS,
+    ) -> None:
+        self._logger: logging.Logger = logging.getLogger(__name__)
+        self.enabled = enabled
+        self._prefix = prefix
+        self._buckets = buckets
+        self._lock = threading.Lock()
+        self._durations: dict[str, Histogram] = {}
+        self._outcomes: dict[tuple[str, str], int] = {}
+        self._counters: dict[tuple[str, str], float] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def span(self, stage: str) -> AnySpan:
+        """Context manager timing stage, e.g. with telemetry.span("publish")"""
+        if not self.enabled:
+            return NOOP_SPAN
+        return Span(self, stage)
+
+    def render(self) -> str:
+        """Metrics in Prometheus text exposition format"""
+        with self._lock:
+            durations = {
+                stage: (list(hist.counts), hist.sum, hist.count)
+                for stage, hist in self._durations.items()
+            }
+            outcomes = dict(self._outcomes)
+            counters = dict(self._counters)
+
+        name = f"{self._prefix}_stage_duration_seconds"
+        lines = [
+            f"# HELP {name} Pipeline stage duration in seconds.",
+            f"# TYPE {name} histogram",
+        ]
+        for stage, (counts, total, count) in sorted(durations.items()):
+            cumulative = 0
+            for bound, bucket_count in zip([*self._buckets, "+Inf"], counts):
+                cumulative += bucket_count
+                lines.append(
+                    f'{name}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}'
+                )
+            lines.append(f'{name}_sum{{stage="{stage}"}} {total}')
+            lines.append(f'{name}_count{{stage="{stage}"}} {count}')
+
+        name = f"{self._prefix}_stage_runs_total"
+        lines += [
+            f"# HELP {name} Pipeline stage runs by outcome.",
+            f"# TYPE {name} counter",
+        ]
+        for (stage, outcome), count in sorted(outcomes.items()):
+            lines.append(f'{name}{{stage="{stage}",outcome="{outcome}"}} {count}')
+
+        for counter in sorted({counter for _, counter in counters}):
+            name = f"{self._prefix}_stage_{counter}_total"
+            lines += [
+                f"# HELP {name} Pipeline stage {counter.replace('_', ' ')}.",
+                f"# TYPE {name} counter",
+            ]
+            for (stage, stage_counter), value in sorted(counters.items()):
+                if stage_counter == counter:
+                    lines.append(f'{name}{{stage="{stage}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Path) -> None:
+        """Atomically write metrics file, e.g. for node_exporter textfile collector"""
+        tmp_path = Path(f"{path}.tmp")
+        tmp_path.write_text(self.render())
+        os.replace(tmp_path, path)
+
+    def serve(self, port: int, host: str = "0.0.0.0") -> ThreadingHTTPServer:
+        """Serve metrics at http://host:port/metrics from a daemon thread"""
+        telemetry = self
+
+        class MetricsRequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = telemetry.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                pass  # scrapes would flood application log
+
+        self._server = ThreadingHTTPServer((host, port), MetricsRequestHandler)
+        threading.Thread(
+            target=self._server.serve_forever, name="metrics-http", daemon=True
+        ).start()
+        self._logger.info(f"Serving Prometheus metrics on {host}:{port}/metrics")
+        return self._server
+
+    def shutdown(self) -> None:
+        """Stop metrics HTTP server if serving"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def _record(self, span: Span, duration: float, failed: bool) -> None:
+        outcome = "error" if failed else "ok"
+        with self._lock:
+            histogram = self._durations.get(span.stage)
+            if histogram is None:
+                histogram = self._durations[span.stage] = Histogram(self._buckets)
+            histogram.observe(duration)
+            key = (span.stage, outcome)
+            self._outcomes[key] = self._outcomes.get(key, 0) + 1
+            for counter, value in span.counters.items():
+                key = (span.stage, counter)
+                self._counters[key] = self._counters.get(key, 0) + value
+        self._logger.debug(f"Stage {span.stage} {outcome} in {duration:.3f}s")
@@ -0,0 +1,160 @@
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Callable, Iterator, Optional
+
+import numpy as np
+
+from video_generation_analysis.config import (
+    CANDIDATE_MAX_FEATURES,
+    CANDIDATE_REFIT_HOURS,
+    CANDIDATE_RIDGE_ALPHA,
+    DATABASE_READ_PAGE_SIZE,
+)
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.query_builder import (
+    QueryBuilder,
+    WhereComparison,
+)
+from video_generation_analysis.video_analytics.keyword_scorer import KeywordScorer
+
+TRAINING_COLUMNS = [
+    "id",
+    "datetime_publish",
+    "views",
+    "likes",
+    "comments",
+    "keywords",
+    "last_refreshed_at",
+]
+
+
+class CandidateScorer:
+    """Predicts engagement of a video's keywords by ridge regression on past videos.
+
+    Each refreshed video record is a sample: its keywords (the most frequent
+    max_features of them) as binary features, log(1 + KeywordScorer score) as
+    target. Normal equations are accumulated a page at a time and solved in
+    closed form, so refitting is cheap and memory stays bounded.
+    """
+
+    def __init__(
+        self,
+        keyword_scorer: KeywordScorer = None,
+        alpha: float = CANDIDATE_RIDGE_ALPHA,
+        max_features: int = CANDIDATE_MAX_FEATURES,
+        refit_hours: float = CANDIDATE_REFIT_HOURS,
+        page_size: int = DATABASE_READ_PAGE_SIZE,
+        clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        self._logger: logging.Logger = logging.getLogger(__name__)
+        self._keyword_scorer = keyword_scorer or KeywordScorer()
+        self._alpha = alpha
+        self._max_features = max_features
+        self._refit_interval = timedelta(hours=refit_hours)
+        self._page_size = page_size
+        self._clock = clock
+        self._vocabulary: dict[str, int] = {}
+        self._weights = np.zeros(0)
+        self._intercept = 0.0
+        self.fitted_at: Optional[datetime] = None
+
+    def fit(self, db_handler: DatabaseHandler) -> int:
+        """Train on refreshed video records, returns number of samples"""
+        counts: Counter[str] = Counter()
+        for keyword_sets, _ in self._sample_pages(db_handler):
+            for keywords in keyword_sets:
+                counts.update(set(keywords))
+        vocabulary = {
+            keyword: column
+            for column, (keyword, _) in enumerate(
+                counts.most_common(self._max_features)
+            )
+        }
+
+        num_features = len(vocabulary)
+        xtx = np.zeros((num_features, num_features))
+        xty = np.zeros(num_features)
+        x_sum = np.zeros(num_features)
+        y_sum = 0.0
+        num_samples = 0
+        for keyword_sets, targets in self._sample_pages(db_handler):
+            features = self._features(keyword_sets, vocabulary)
+            xtx += features.T @ features
+            xty += features.T @ targets
+            x_sum += features.sum(axis=0)
+            y_sum += targets.sum()
+            num_samples += len(targets)
+
+        self._vocabulary = vocabulary
+        self.fitted_at = self._clock()
+        if not num_samples:
+            self._weights, self._intercept = np.zeros(num_features), 0.0
+            return 0
+
+        # centre features & target so the intercept isn't penalized
+        x_mean, y_mean = x_sum / num_samples, y_sum / num_samples
+        centred_xtx = xtx - num_samples * np.outer(x_mean, x_mean)
+        centred_xty = xty - num_samples * x_mean * y_mean
+        self._weights = np.linalg.solve(
+            centred_xtx + self._alpha * np.eye(num_features), centred_xty
+        )
+        self._intercept = float(y_mean - x_mean @ self._weights)
+        self._logger.info(
+            f"Candidate scorer fitted on {num_samples} videos, "
+            f"{num_features} keyword features"
+        )
+        return num_samples
+
+    def score(self, keyword_sets: list[list[str]]) -> np.ndarray:
+        """Predicted log engagement score per keyword set, unseen keywords add 0"""
+        features = self._features(keyword_sets, self._vocabulary)
+        if not self._vocabulary:
+            return np.full(len(keyword_sets), self._intercept)
+        return features @ self._weights + self._intercept
+
+    def rank(
+        self, db_handler: DatabaseHandler, keyword_sets: list[list[str]]
+    ) -> list[int]:
+        """Indices of keyword sets best predicted first, refitting if stale.
+
+        Ties keep their given order, so an untrained scorer changes nothing.
+        """
+        if self.fitted_at is None or self._clock() - self.fitted_at >= (
+            self._refit_interval
+        ):
+            self.fit(db_handler)
+        scores = self.score(keyword_sets)
+        return [int(idx) for idx in np.argsort(-scores, kind="stable")]
+
+    def _sample_pages(
+        self, db_handler: DatabaseHandler
+    ) -> Iterator[tuple[list[list[str]], np.ndarray]]:
+        """Keywords & targets of refreshed records, a page at a time"""
+        qb = (
+            QueryBuilder()
+            .select_columns(TRAINING_COLUMNS)
+            .where_compare("last_refreshed_at", WhereComparison.NOT_EQUAL, "")
+        )
+        with db_handler as db:
+            for page in db.read_pages(qb, page_size=self._page_size):
+                scores = [self._keyword_scorer.record_score(record) for record in page]
+                yield (
+                    [
+                        [keyword.lower() for keyword in record.keywords]
+                        for record in page
+                    ],
+                    np.log1p(np.maximum(scores, 0.0)),
+                )
+
+    @staticmethod
+    def _features(
+        keyword_sets: list[list[str]], vocabulary: dict[str, int]
+    ) -> np.ndarray:
+        features = np.zeros((len(keyword_sets), len(vocabulary)))
+        for row, keywords in enumerate(keyword_sets):
+            for keyword in keywords:
+                column = vocabulary.get(keyword.lower())
+                if column is not None:
+                    features[row, column] = 1.0
+        return features
@@ -0,0 +1,222 @@
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+import numpy as np
+
+from video_generation_analysis.config import (
+    ENGAGEMENT_PERCENTILES,
+    KEYWORD_SCORE_WEIGHTS,
+)
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.partition_archive import (
+    PartitionArchive,
+)
+from video_generation_analysis.database_handler.query_builder import QueryBuilder
+
+ENGAGEMENT_COLUMNS = [
+    "id",
+    "datetime_publish",
+    "views",
+    "likes",
+    "comments",
+    "keywords",
+]
+SECONDS_PER_DAY = 86400.0
+
+
+@dataclass
+class EngagementColumns:
+    """Engagement metrics of all videos as NumPy arrays, keywords in CSR form.
+
+    Keywords of video i are vocabulary[keyword_indices[indptr[i]:indptr[i + 1]]].
+    """
+
+    ids: np.ndarray
+    views: np.ndarray
+    likes: np.ndarray
+    comments: np.ndarray
+    publish_seconds: np.ndarray  # epoch seconds, NaN if unknown
+    vocabulary: list[str]
+    keyword_indptr: np.ndarray
+    keyword_indices: np.ndarray
+    keyword_rows: np.ndarray  # video row of each entry in keyword_indices
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_columns(cls, columns: dict[str, list[Any]]) -> "EngagementColumns":
+        """Build arrays from DatabaseHandler.read_columns output"""
+        keyword_lists = _parse_keyword_lists(columns["keywords"])
+        vocabulary_ids: dict[str, int] = {}
+        indices = [
+            vocabulary_ids.setdefault(keyword, len(vocabulary_ids))
+            for keywords in keyword_lists
+            for keyword in dict.fromkeys(keywords)  # unique, order kept
+        ]
+        counts = np.fromiter(
+            (len(set(keywords)) for keywords in keyword_lists),
+            dtype=np.int64,
+            count=len(keyword_lists),
+        )
+        indptr = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+
+        publish = np.array(columns["datetime_publish"], dtype="datetime64[us]")
+        publish_seconds = publish.astype(np.int64) / 1e6
+        publish_seconds[np.isnat(publish)] = np.nan
+
+        return cls(
+            ids=np.array(columns["id"], dtype=np.int64),
+            views=_to_float_array(columns["views"]),
+            likes=_to_float_array(columns["likes"]),
+            comments=_to_float_array(columns["comments"]),
+            publish_seconds=publish_seconds,
+            vocabulary=list(vocabulary_ids),
+            keyword_indptr=indptr,
+            keyword_indices=np.array(indices, dtype=np.int64),
+            keyword_rows=np.repeat(np.arange(len(counts)), counts),
+        )
+
+
+class EngagementAnalytics:
+    """Vectorized engagement analysis over all video records in database.
+
+    Given an archive, archived partitions of old videos are analysed too.
+    """
+
+    def __init__(
+        self, db_handler: DatabaseHandler, archive: Optional[PartitionArchive] = None
+    ) -> None:
+        self._db_handler = db_handler
+        self._archive = archive
+        self._columns: Optional[EngagementColumns] = None
+
+    @property
+    def columns(self) -> EngagementColumns:
+        if self._columns is None:
+            self.load()
+        return self._columns
+
+    def load(self) -> EngagementColumns:
+        """Bulk read engagement columns of all records into arrays"""
+        with self._db_handler as db:
+            raw = db.read_columns(
+                QueryBuilder().select_columns(ENGAGEMENT_COLUMNS), archive=self._archive
+            )
+        self._columns = EngagementColumns.from_columns(raw)
+        return self._columns
+
+    def engagement_rate(self) -> np.ndarray:
+        """(likes + comments) / views per video, 0 for videos without views"""
+        columns = self.columns
+        interactions = columns.likes + columns.comments
+        return np.divide(
+            interactions,
+            columns.views,
+            out=np.zeros_like(interactions),
+            where=columns.views > 0,
+        )
+
+    def engagement_rate_percentiles(
+        self, percentiles: list[float] = ENGAGEMENT_PERCENTILES
+    ) -> dict[float, float]:
+        """Engagement rate at each percentile over videos with views"""
+        rates = self.engagement_rate()[self.columns.views > 0]
+        if rates.size == 0:
+            return {percentile: 0.0 for percentile in percentiles}
+        values = np.percentile(rates, percentiles)
+        return dict(zip(percentiles, values.tolist()))
+
+    def video_scores(
+        self,
+        weights: dict[str, float] = KEYWORD_SCORE_WEIGHTS,
+        now: Optional[datetime] = None,
+    ) -> np.ndarray:
+        """Weighted engagement per video divided by age in days (min 1 day)"""
+        columns = self.columns
+        scores = (
+            weights.get("views", 0.0) * columns.views
+            + weights.get("likes", 0.0) * columns.likes
+            + weights.get("comments", 0.0) * columns.comments
+        )
+        now_seconds = _epoch_seconds(now or datetime.now())
+        age_days = (now_seconds - columns.publish_seconds) / SECONDS_PER_DAY
+        age_days = np.nan_to_num(age_days, nan=1.0)
+        return scores / np.maximum(age_days, 1.0)
+
+    def keyword_scores(
+        self,
+        weights: dict[str, float] = KEYWORD_SCORE_WEIGHTS,
+        now: Optional[datetime] = None,
+    ) -> dict[str, float]:
+        """Sum of age normalized weighted engagement of videos using each keyword"""
+        totals = self._keyword_score_totals(weights=weights, now=now)
+        return dict(zip(self.columns.vocabulary, totals.tolist()))
+
+    def keyword_lift(self, metric: str = "engagement_rate") -> dict[str, float]:
+        """Mean metric of videos with keyword relative to mean of all videos"""
+        columns = self.columns
+        values = (
+            self.engagement_rate()
+            if metric == "engagement_rate"
+            else getattr(columns, metric)
+        )
+        overall_mean = values.mean() if len(values) else 0.0
+        if overall_mean == 0:
+            return {keyword: 0.0 for keyword in columns.vocabulary}
+
+        vocabulary_size = len(columns.vocabulary)
+        totals = np.bincount(
+            columns.keyword_indices,
+            weights=values[columns.keyword_rows],
+            minlength=vocabulary_size,
+        )
+        counts = np.bincount(columns.keyword_indices, minlength=vocabulary_size)
+        lift = totals / np.maximum(counts, 1) / overall_mean
+        return dict(zip(columns.vocabulary, lift.tolist()))
+
+    def top_keywords(
+        self,
+        num_keywords: int,
+        weights: dict[str, float] = KEYWORD_SCORE_WEIGHTS,
+        now: Optional[datetime] = None,
+    ) -> list[str]:
+        """Keywords with highest weighted engagement score, best first"""
+        totals = self._keyword_score_totals(weights=weights, now=now)
+        order = np.argsort(-totals, kind="stable")[:num_keywords]
+        vocabulary = self.columns.vocabulary
+        return [vocabulary[idx] for idx in order]
+
+    def _keyword_score_totals(
+        self, weights: dict[str, float], now: Optional[datetime]
+    ) -> np.ndarray:
+        columns = self.columns
+        scores = self.video_scores(weights=weights, now=now)
+        return np.bincount(
+            columns.keyword_indices,
+            weights=scores[columns.keyword_rows],
+            minlength=len(columns.vocabulary),
+        )
+
+
+def _epoch_seconds(moment: datetime) -> float:
+    """Naive datetime as epoch seconds, matching numpy datetime64 conversion"""
+    return np.datetime64(moment, "us").astype(np.int64) / 1e6
+
+
+def _parse_keyword_lists(values: list[Any]) -> list[list[str]]:
+    """Decode JSON keyword lists in one call rather than one per row"""
+    if all(isinstance(value, str) for value in values):
+        return json.loads("[" + ",".join(values) + "]")
+    return [
+        json.loads(value) if isinstance(value, str) else (value or [])
+        for value in values
+    ]
+
+
+def _to_float_array(values: list[Any]) -> np.ndarray:
+    """Metrics are stored as text, None for missing"""
+    return np.array([0 if value is None else value for value in values], dtype=float)
@@ -0,0 +1,332 @@
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Optional
+
+import numpy as np
+
+from video_generation_analysis.config import DATABASE_READ_PAGE_SIZE
+from video_generation_analysis.database_handler.database_handler import (
+    CommittedWrites,
+    DatabaseHandler,
+)
+from video_generation_analysis.database_handler.query_builder import (
+    OrderByType,
+    QueryBuilder,
+    WhereComparison,
+)
+from video_generation_analysis.video_analytics.engagement_analytics import (
+    ENGAGEMENT_COLUMNS,
+    EngagementColumns,
+)
+from video_generation_analysis.video_analytics.refresh_planner import RefreshPlanner
+
+METRIC_COLUMNS = ["views", "likes", "comments", "views_per_hour"]
+TIME_COLUMNS = ["datetime_publish", "last_refreshed_at"]  # kept as epoch seconds
+STORE_COLUMNS = ENGAGEMENT_COLUMNS + ["last_refreshed_at", "views_per_hour"]
+REVISION_COLUMN = "revision"
+SYNC_COLUMNS = STORE_COLUMNS + [REVISION_COLUMN]
+UPDATED_COLUMNS = METRIC_COLUMNS + ["last_refreshed_at"]  # synced for held records
+TOP_KEYWORDS_METRICS = ["comments", "views", "likes"]  # DescriptionGenerator order
+
+
+class EngagementStore:
+    """In-memory columnar copy of video engagement records.
+
+    Metrics and times are NumPy arrays ordered by record id, keywords are
+    interned ids in CSR form like EngagementColumns. Loaded once, then kept in
+    sync by a DatabaseHandler write hook, plus sync() for records created or
+    updated by other processes. Records deleted by other processes stay
+    until the next load().
+    """
+
+    def __init__(
+        self, db_handler: DatabaseHandler, page_size: int = DATABASE_READ_PAGE_SIZE
+    ) -> None:
+        self._logger: logging.Logger = logging.getLogger(__name__)
+        self._db_handler = db_handler
+        self._page_size = page_size
+        self._lock = threading.Lock()
+        self._synced_revision: Optional[int] = None  # None until first sync
+        self._reset()
+        db_handler.add_write_hook(self.on_write)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the arrays, vocabulary strings excluded"""
+        arrays: list[np.ndarray] = [
+            self._ids,
+            self._keyword_indptr,
+            self._keyword_indices,
+        ]
+        return sum(array.nbytes for array in arrays + list(self._values.values()))
+
+    def load(self) -> int:
+        """Discard & read all records, returns number loaded"""
+        with self._lock:
+            self._reset()
+        self.sync()
+        self._logger.info(
+            f"Loaded {len(self)} videos into engagement store, "
+            f"{self.nbytes / 1e6:.1f} MB"
+        )
+        return len(self)
+
+    def sync(self) -> int:
+        """Read records created or updated since last sync, returns rows read.
+
+        The first sync loads the whole table by id, later ones page by the
+        commit ordered revision column, so no write of another process is
+        missed whenever it commits.
+        """
+        with self._db_handler as db:
+            if self._synced_revision is None:
+                db.track_revisions(REVISION_COLUMN)
+                # before paging, writes committed meanwhile are read next sync
+                self._synced_revision = self._last_revision(db)
+                read = self._read_changes(db, "id", 0)
+            else:
+                read = self._read_changes(db, REVISION_COLUMN, self._synced_revision)
+        return read
+
+    def on_write(self, writes: CommittedWrites) -> None:
+        """DatabaseHandler write hook applying committed writes to the arrays"""
+        created = [record for record in writes.created if record.id is not None]
+        with self._lock:
+            if created:
+                self._append(
+                    {
+                        name: [getattr(record, name) for record in created]
+                        for name in STORE_COLUMNS
+                    }
+                )
+            for record_id, updates in writes.updated:
+                self._update(record_id, updates)
+            if writes.deleted:
+                self._delete(writes.deleted)
+
+    def columns(self) -> EngagementColumns:
+        """Current arrays as EngagementColumns, e.g. for EngagementAnalytics"""
+        with self._lock:
+            vocabulary = list(self._vocabulary)
+            indptr = self._keyword_indptr
+            return EngagementColumns(
+                ids=self._ids,
+                views=self._values["views"],
+                likes=self._values["likes"],
+                comments=self._values["comments"],
+                publish_seconds=self._values["datetime_publish"],
+                vocabulary=vocabulary,
+                keyword_indptr=indptr,
+                keyword_indices=self._keyword_indices,
+                keyword_rows=np.repeat(np.arange(len(self._ids)), np.diff(indptr)),
+            )
+
+    def top_keywords(self, num_top_videos: int) -> list[str]:
+        """Keywords of the top videos per engagement type, most frequent first.
+
+        Same ranking as DescriptionGenerator's database query, but metrics
+        compare as numbers rather than stored text.
+        """
+        counts: dict[int, int] = {}
+        with self._lock:
+            for metric in TOP_KEYWORDS_METRICS:
+                for row in self._top_rows(self._values[metric], num_top_videos):
+                    start, end = self._keyword_indptr[row : row + 2]
+                    for keyword_id in self._keyword_indices[start:end].tolist():
+                        counts[keyword_id] = counts.get(keyword_id, 0) + 1
+            ranked = sorted(counts.items(), key=lambda item: item[1], reverse=True)
+            return [self._vocabulary[keyword_id] for keyword_id, _ in ranked]
+
+    def due_ids(
+        self,
+        refresh_planner: RefreshPlanner,
+        now: datetime,
+        limit: Optional[int] = None,
+        record_ids: Optional[list[int]] = None,
+    ) -> list[int]:
+        """Ids of videos due a metrics refresh, most overdue first"""
+        with self._lock:
+            rows = np.arange(len(self._ids))
+            if record_ids is not None:
+                rows = self._rows(np.asarray(record_ids, dtype=np.int64))
+            order = refresh_planner.due_order(
+                self._values["datetime_publish"][rows],
+                self._values["last_refreshed_at"][rows],
+                self._values["views_per_hour"][rows],
+                now_seconds=_epoch_seconds([now])[0],
+                limit=limit,
+            )
+            return self._ids[rows[order]].tolist()
+
+    def _reset(self) -> None:
+        self._ids = np.empty(0, dtype=np.int64)
+        self._values = {name: np.empty(0) for name in METRIC_COLUMNS + TIME_COLUMNS}
+        self._vocabulary: list[str] = []
+        self._vocabulary_ids: dict[str, int] = {}
+        self._keyword_indptr = np.zeros(1, dtype=np.int64)
+        self._keyword_indices = np.empty(0, dtype=np.int32)
+        self._synced_revision = None
+
+    def _read_changes(self, db: DatabaseHandler, key_column: str, after: int) -> int:
+        """Apply records with key_column past after, a page at a time"""
+        read = 0
+        while True:
+            qb = (
+                QueryBuilder()
+                .select_columns(SYNC_COLUMNS)
+                .where_compare(key_column, WhereComparison.GREATER_THAN, after)
+                .order_by(key_column)
+                .limit(self._page_size)
+            )
+            columns = db.read_columns(qb)
+            ids = columns.get("id")
+            if not ids:
+                return read
+            after = columns[key_column][-1]
+            with self._lock:
+                held = self._rows(np.array(ids, dtype=np.int64)) >= 0
+                self._append(columns)
+                for row in np.nonzero(held)[0].tolist():
+                    self._update(
+                        int(ids[row]),
+                        {name: columns[name][row] for name in UPDATED_COLUMNS},
+                    )
+                if key_column == REVISION_COLUMN:
+                    self._synced_revision = after
+            read += len(ids)
+
+    @staticmethod
+    def _last_revision(db: DatabaseHandler) -> int:
+        qb = (
+            QueryBuilder()
+            .select_columns(REVISION_COLUMN)
+            .order_by(REVISION_COLUMN, OrderByType.DESCENDING)
+            .limit(1)
+        )
+        revisions = db.read_columns(qb).get(REVISION_COLUMN)
+        return (revisions[0] or 0) if revisions else 0
+
+    def _append(self, columns: dict[str, list[Any]]) -> None:
+        """Add records not held yet, keeping rows in id order"""
+        ids = np.array(columns["id"], dtype=np.int64)
+        new = self._rows(ids) < 0
+        if not new.any():
+            return
+        new_rows = np.nonzero(new)[0].tolist()
+        columns = {
+            name: [values[row] for row in new_rows] for name, values in columns.items()
+        }
+        parsed = EngagementColumns.from_columns(columns)
+
+        # page vocabulary ids to store vocabulary ids
+        mapping = np.array(
+            [self._intern(keyword) for keyword in parsed.vocabulary], dtype=np.int32
+        )
+        self._keyword_indices = np.concatenate(
+            [self._keyword_indices, mapping[parsed.keyword_indices]]
+        )
+        self._keyword_indptr = np.concatenate(
+            [self._keyword_indptr, self._keyword_indptr[-1] + parsed.keyword_indptr[1:]]
+        )
+        appended = {
+            "views": parsed.views,
+            "likes": parsed.likes,
+            "comments": parsed.comments,
+            "views_per_hour": _to_floats(columns["views_per_hour"]),
+            "datetime_publish": parsed.publish_seconds,
+            "last_refreshed_at": _epoch_seconds(columns["last_refreshed_at"]),
+        }
+        previous_last_id = self._ids[-1] if len(self._ids) else 0
+        self._ids = np.concatenate([self._ids, parsed.ids])
+        for name, values in appended.items():
+            self._values[name] = np.concatenate([self._values[name], values])
+
+        # ids created by other processes can interleave ours
+        if parsed.ids.min() < previous_last_id or np.any(np.diff(parsed.ids) < 0):
+            self._take(np.argsort(self._ids, kind="stable"))
+
+    def _update(self, record_id: int, updates: dict[str, Any]) -> None:
+        (row,) = self._rows(np.array([record_id], dtype=np.int64))
+        if row < 0:
+            return
+        for name, value in updates.items():
+            if name in METRIC_COLUMNS:
+                self._values[name][row] = _to_floats([value])[0]
+            elif name in TIME_COLUMNS:
+                self._values[name][row] = _epoch_seconds([value])[0]
+        if "keywords" in updates:
+            self._set_keywords(row, updates["keywords"])
+
+    def _delete(self, record_ids: list[int]) -> None:
+        rows = self._rows(np.asarray(record_ids, dtype=np.int64))
+        keep = np.ones(len(self._ids), dtype=bool)
+        keep[rows[rows >= 0]] = False
+        if not keep.all():
+            self._take(np.nonzero(keep)[0])
+
+    def _take(self, rows: np.ndarray) -> None:
+        """Keep only given rows, in given order"""
+        counts = np.diff(self._keyword_indptr)[rows]
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        offsets = np.repeat(self._keyword_indptr[rows] - indptr[:-1], counts)
+        self._keyword_indices = self._keyword_indices[np.arange(indptr[-1]) + offsets]
+        self._keyword_indptr = indptr
+        self._ids = self._ids[rows]
+        for name, values in self._values.items():
+            self._values[name] = values[rows]
+
+    def _set_keywords(self, row: int, keywords: list[str]) -> None:
+        """Replace keywords of a row, rebuilding CSR arrays (keywords rarely change)"""
+        keyword_ids = np.array(
+            [self._intern(keyword) for keyword in dict.fromkeys(keywords)],
+            dtype=np.int32,
+        )
+        start, end = self._keyword_indptr[row : row + 2]
+        self._keyword_indices = np.concatenate(
+            [
+                self._keyword_indices[:start],
+                keyword_ids,
+                self._keyword_indices[end:],
+            ]
+        )
+        self._keyword_indptr[row + 1 :] += len(keyword_ids) - (end - start)
+
+    def _rows(self, ids: np.ndarray) -> np.ndarray:
+        """Row of each id, -1 if not held"""
+        rows = np.searchsorted(self._ids, ids)
+        found = rows < len(self._ids)
+        found[found] = self._ids[rows[found]] == ids[found]
+        return np.where(found, rows, -1)
+
+    def _intern(self, keyword: str) -> int:
+        keyword_id = self._vocabulary_ids.get(keyword)
+        if keyword_id is None:
+            keyword_id = self._vocabulary_ids[keyword] = len(self._vocabulary)
+            self._vocabulary.append(keyword)
+        return keyword_id
+
+    @staticmethod
+    def _top_rows(values: np.ndarray, num_rows: int) -> np.ndarray:
+        """Rows of the num_rows largest values, largest first"""
+        if num_rows >= len(values):
+            return np.argsort(-values, kind="stable")
+        rows = np.argpartition(-values, num_rows)[:num_rows]
+        return rows[np.lexsort((rows, -values[rows]))]
+
+
+def _epoch_seconds(values: list[Any]) -> np.ndarray:
+    """Datetimes or ISO strings as epoch seconds, NaN for None"""
+    times = np.array(values, dtype="datetime64[us]")
+    seconds = times.astype(np.int64) / 1e6
+    seconds[np.isnat(times)] = np.nan
+    return seconds
+
+
+def _to_floats(values: list[Any]) -> np.ndarray:
+    """Metrics are stored as text, None for missing"""
+    return np.array([0 if value is None else value for value in values], dtype=float)
@@ -0,0 +1,75 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Optional
+
+from video_generation_analysis.config import KEYWORD_SCORE_WEIGHTS
+from video_generation_analysis.database_handler.schema import to_datetime
+from video_generation_analysis.video_platforms_handler.platform_api_bridge import (
+    VideoEngagement,
+)
+
+SECONDS_PER_DAY = 86400.0
+
+
+class KeywordScorer:
+    """Scores keywords by weighted engagement of their videos, normalized by age.
+
+    A video contributes weighted(views, likes, comments) / age in days (min 1)
+    to each of its keywords, measured at its last metrics refresh. Videos never
+    refreshed contribute nothing, so refreshes can apply exact score deltas.
+    """
+
+    def __init__(self, weights: dict[str, float] = KEYWORD_SCORE_WEIGHTS) -> None:
+        self._weights = weights
+
+    def video_score(
+        self,
+        engagement: VideoEngagement,
+        datetime_publish: Optional[datetime],
+        measured_at: Optional[datetime],
+    ) -> float:
+        """Contribution of one video's engagement measured at given time"""
+        if measured_at is None:
+            return 0.0
+        weighted = (
+            self._weights.get("views", 0.0) * engagement.views
+            + self._weights.get("likes", 0.0) * engagement.likes
+            + self._weights.get("comments", 0.0) * engagement.comments
+        )
+        age_days = 1.0
+        if datetime_publish is not None:
+            age = measured_at - datetime_publish
+            age_days = age.total_seconds() / SECONDS_PER_DAY
+        return weighted / max(age_days, 1.0)
+
+    def record_score(self, record: Any) -> float:
+        """Contribution of a stored record at its last refresh"""
+        engagement = VideoEngagement(
+            views=int(record.views),
+            likes=int(record.likes),
+            comments=int(record.comments),
+        )
+        return self.video_score(
+            engagement,
+            to_datetime(record.datetime_publish),
+            to_datetime(record.last_refreshed_at),
+        )
+
+    def refresh_deltas(
+        self, record: Any, engagement: VideoEngagement, refreshed_at: datetime
+    ) -> dict[str, float]:
+        """Keyword score changes from refreshing record with new engagement"""
+        new_score = self.video_score(
+            engagement, to_datetime(record.datetime_publish), refreshed_at
+        )
+        delta = new_score - self.record_score(record)
+        return {keyword: delta for keyword in set(record.keywords)}
+
+    def score_records(self, records: list[Any]) -> dict[str, float]:
+        """Keyword scores from scratch over records, for rebuilding score table"""
+        scores: dict[str, float] = defaultdict(float)
+        for record in records:
+            score = self.record_score(record)
+            for keyword in set(record.keywords):
+                scores[keyword] += score
+        return dict(scores)
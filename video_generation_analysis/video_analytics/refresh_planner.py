@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+import numpy as np
+
+from video_generation_analysis.config import (
+    METRICS_REFRESH_FAST_VIEWS_PER_HOUR,
+    METRICS_REFRESH_STALE_INTERVAL_HOURS,
+    METRICS_REFRESH_TIERS,
+)
+from video_generation_analysis.database_handler.schema import to_datetime
+
+
+class RefreshPlanner:
+    """Decides which videos are due an engagement metrics refresh.
+
+    Refresh interval is chosen by video age tier, young videos refreshing most
+    often. Videos gaining views fast are promoted one tier. Never refreshed
+    videos are always due.
+    """
+
+    def __init__(
+        self,
+        tiers: list[tuple[int, int]] = METRICS_REFRESH_TIERS,
+        stale_interval_hours: int = METRICS_REFRESH_STALE_INTERVAL_HOURS,
+        fast_views_per_hour: float = METRICS_REFRESH_FAST_VIEWS_PER_HOUR,
+    ) -> None:
+        self._tiers = [
+            (timedelta(hours=max_age), timedelta(hours=interval))
+            for max_age, interval in sorted(tiers)
+        ]
+        self._stale_interval = timedelta(hours=stale_interval_hours)
+        self._fast_views_per_hour = fast_views_per_hour
+
+    def refresh_interval(
+        self,
+        datetime_publish: Optional[datetime],
+        views_per_hour: float,
+        now: datetime,
+    ) -> timedelta:
+        """Time between refreshes for video of given age and view velocity"""
+        intervals = [interval for _, interval in self._tiers] + [self._stale_interval]
+        tier = len(self._tiers)  # unknown age treated as stale
+        if datetime_publish is not None:
+            age = now - datetime_publish
+            tier = next(
+                (idx for idx, (max_age, _) in enumerate(self._tiers) if age < max_age),
+                len(self._tiers),
+            )
+
+        if views_per_hour >= self._fast_views_per_hour and tier > 0:
+            tier -= 1
+        return intervals[tier]
+
+    def min_interval(self) -> timedelta:
+        """Shortest refresh interval of any video, none is due sooner"""
+        return min([interval for _, interval in self._tiers] + [self._stale_interval])
+
+    def due_records(
+        self, records: list[Any], now: datetime, limit: Optional[int] = None
+    ) -> list[Any]:
+        """Records due a refresh, most overdue (relative to interval) first"""
+        due = []
+        for record in records:
+            last_refreshed_at = to_datetime(record.last_refreshed_at)
+            if last_refreshed_at is None:
+                due.append((float("inf"), record))
+                continue
+
+            interval = self.refresh_interval(
+                to_datetime(record.datetime_publish),
+                float(record.views_per_hour or 0),
+                now,
+            )
+            elapsed = now - last_refreshed_at
+            if elapsed >= interval:
+                due.append((elapsed / interval, record))
+
+        due.sort(key=lambda item: item[0], reverse=True)
+        if limit:
+            due = due[:limit]
+        return [record for _, record in due]
+
+    def due_order(
+        self,
+        publish_seconds: np.ndarray,
+        refreshed_seconds: np.ndarray,
+        views_per_hour: np.ndarray,
+        now_seconds: float,
+        limit: Optional[int] = None,
+    ) -> np.ndarray:
+        """due_records over column arrays, indices of due rows most overdue first.
+
+        Times are epoch seconds, NaN if unknown or never refreshed.
+        """
+        max_ages = np.array([max_age.total_seconds() for max_age, _ in self._tiers])
+        intervals = np.array(
+            [interval.total_seconds() for _, interval in self._tiers]
+            + [self._stale_interval.total_seconds()]
+        )
+        # first tier younger than its max age, unknown (NaN) age sorts last: stale
+        tiers = np.searchsorted(max_ages, now_seconds - publish_seconds, side="right")
+        tiers -= (views_per_hour >= self._fast_views_per_hour) & (tiers > 0)
+        never_refreshed = np.isnan(refreshed_seconds)
+        elapsed = now_seconds - refreshed_seconds
+        overdue = np.where(never_refreshed, np.inf, elapsed / intervals[tiers])
+
+        due = np.nonzero(never_refreshed | (elapsed >= intervals[tiers]))[0]
+        order = due[np.argsort(-overdue[due], kind="stable")]
+        if limit:
+            order = order[:limit]
+        return order
@@ -1,93 +1,437 @@
+import logging
+from collections import defaultdict
 from datetime import datetime
+from itertools import count, islice
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Iterator, Optional, TypeVar
 
-from video_generation_analysis.config import NUM_KEYWORDS
+from video_generation_analysis.config import (
+    DATABASE_READ_PAGE_SIZE,
+    NEAR_DUPLICATE_MAX_REGENERATIONS,
+    NUM_DESCRIPTION_CANDIDATES,
+    NUM_KEYWORDS,
+    VIDEO_JOB_MAX_ATTEMPTS,
+)
 from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.engagement_snapshot_handler import (
+    EngagementSnapshotHandler,
+)
+from video_generation_analysis.database_handler.keyword_score_handler import (
+    KeywordScoreHandler,
+)
 from video_generation_analysis.database_handler.query_builder import (
-    OrderByType,
     QueryBuilder,
     WhereComparison,
+    WhereLogical,
 )
-from video_generation_analysis.database_handler.schema import VideoEngagementRecord
+from video_generation_analysis.database_handler.schema import (
+    EngagementSnapshot,
+    VideoEngagementRecord,
+    VideoJobRecord,
+    to_datetime,
+)
+from video_generation_analysis.telemetry.telemetry import Telemetry
+from video_generation_analysis.video_analytics.candidate_scorer import CandidateScorer
+from video_generation_analysis.video_analytics.engagement_store import EngagementStore
+from video_generation_analysis.video_analytics.keyword_scorer import KeywordScorer
+from video_generation_analysis.video_analytics.refresh_planner import RefreshPlanner
 from video_generation_analysis.video_generator.description_generator import (
     DescriptionGenerator,
 )
+from video_generation_analysis.video_generator.near_duplicate_index import (
+    NearDuplicateIndex,
+)
 from video_generation_analysis.video_generator.video_generator import VideoGenerator
+from video_generation_analysis.video_platforms_handler.quota_manager import (
+    QuotaExceededError,
+)
 from video_generation_analysis.video_platforms_handler.video_platforms_handler import (
+    PlatformUnavailableError,
     VideoPlatformsFacade,
 )
 from video_generation_analysis.video_platforms_handler.youtube_api_bridge import (
     YouTubeApiBridge,
 )
 
+JOB_DESCRIBED = "described"
+JOB_GENERATED = "generated"
+JOB_UPLOADED = "uploaded"
+JOB_RECORDED = "recorded"
+JOB_FAILED = "failed"
+
+H = TypeVar("H", bound=DatabaseHandler)
+
 
 class VideoAnalytics:
     def __init__(
         self,
         db_handler: DatabaseHandler,
         description_generator: DescriptionGenerator,
-        video_generator: VideoGenerator = None,
-        video_platforms: VideoPlatformsFacade = None,
+        video_generator: Optional[VideoGenerator] = None,
+        video_platforms: Optional[VideoPlatformsFacade] = None,
+        refresh_planner: Optional[RefreshPlanner] = None,
+        snapshot_handler: Optional[EngagementSnapshotHandler] = None,
+        keyword_score_handler: Optional[KeywordScoreHandler] = None,
+        keyword_scorer: Optional[KeywordScorer] = None,
+        telemetry: Optional[Telemetry] = None,
+        job_handler: Optional[DatabaseHandler] = None,
+        max_job_attempts: int = VIDEO_JOB_MAX_ATTEMPTS,
+        metrics_batch_size: int = 0,
+        near_duplicate_index: Optional[NearDuplicateIndex] = None,
+        max_regenerations: int = NEAR_DUPLICATE_MAX_REGENERATIONS,
+        candidate_scorer: Optional[CandidateScorer] = None,
+        num_candidates: int = NUM_DESCRIPTION_CANDIDATES,
+        engagement_store: Optional[EngagementStore] = None,
+        clock: Callable[[], datetime] = datetime.now,
     ):
+        self._logger: logging.Logger = logging.getLogger(__name__)
+        self._clock = clock
+        self._telemetry = telemetry or Telemetry()
         self._database_handler = db_handler
         self._description_generator = description_generator
-        self._video_generator = video_generator or VideoGenerator()
+        self._video_generator = video_generator or VideoGenerator(
+            telemetry=self._telemetry
+        )
         self._video_platforms = video_platforms or VideoPlatformsFacade(
             [YouTubeApiBridge()]
         )
-
-    def generate_video(self, num_top_videos: int, prompt: str = "") -> None:
-        """Create video from prompt, publish to platforms, put engagement db record"""
-        title, description, keywords = self._description_generator.generate_description(
-            num_new_keywords=NUM_KEYWORDS,
-            num_top_videos=num_top_videos,
-            prompt=prompt,
+        self._refresh_planner = refresh_planner or RefreshPlanner()
+        self._snapshot_handler = snapshot_handler or EngagementSnapshotHandler(
+            db_handler.db_path
+        )
+        self._keyword_score_handler = keyword_score_handler or KeywordScoreHandler(
+            db_handler.db_path
         )
+        self._keyword_scorer = keyword_scorer or KeywordScorer()
+        self._job_handler = job_handler or DatabaseHandler(
+            db_handler.db_path, VideoJobRecord
+        )
+        self._max_job_attempts = max_job_attempts
+        # >0 fetches metrics of that many videos per platform call, 0 one by one
+        self._metrics_batch_size = metrics_batch_size
+        self._near_duplicate_index = near_duplicate_index
+        self._max_regenerations = max_regenerations
+        if near_duplicate_index is not None:
+            db_handler.add_write_hook(near_duplicate_index.on_write)
+        # keyword sets are ranked by predicted engagement before describing
+        self._candidate_scorer = candidate_scorer
+        self._num_candidates = num_candidates
+        # due refreshes planned in memory, only due records read from db
+        self._engagement_store = engagement_store
 
-        video_file = self._video_generator.create_video(description)
-        if video_file is None:
-            raise ValueError("Video generation failed")
+    def generate_video(
+        self,
+        num_top_videos: int,
+        prompt: str = "",
+        on_job_created: Optional[Callable[[int], None]] = None,
+    ) -> None:
+        """Create video from prompt, publish to platforms, put engagement db record.
+
+        With a candidate scorer, many keyword sets are generated and only the
+        best predicted is described & rendered. Descriptions near duplicating a
+        published video are regenerated, from the next best keywords if scored;
+        the video is skipped if every attempt is a near duplicate.
+        """
+        attempts = 0
+        for title, description, keywords in islice(
+            self._descriptions(num_top_videos, prompt), self._max_regenerations + 1
+        ):
+            attempts += 1
+            if not self._is_near_duplicate(title, description):
+                break
+        else:
+            self._logger.warning(
+                f"Skipping video, {attempts} descriptions all near duplicates"
+            )
+            return
 
-        urls = self._video_platforms.publish_to_all(
-            file_path=video_file,
+        now = self._clock()
+        job = VideoJobRecord(
+            created_at=now,
+            updated_at=now,
+            state=JOB_DESCRIBED,
             title=title,
             description=description,
-            tags=keywords,
+            keywords=keywords,
         )
-        if not urls:
-            raise ValueError("Video publishing failed")
+        with self._job_handler as db:
+            job.id = db.create(job)
+        if on_job_created:
+            on_job_created(job.id)
+        self._run_job(job)
+
+    def _descriptions(
+        self, num_top_videos: int, prompt: str
+    ) -> Iterator[tuple[str, str, list[str]]]:
+        """Descriptions to try in turn, best predicted engagement first if scored"""
+        if self._candidate_scorer is None or self._num_candidates <= 1:
+            tried = set()
+            for attempt in count():
+                with self._telemetry.span("describe"):
+                    generated = self._description_generator.generate_description(
+                        num_new_keywords=NUM_KEYWORDS,
+                        num_top_videos=num_top_videos,
+                        prompt=prompt,
+                        skip_top_keywords=attempt,
+                    )
+                title, description, _ = generated
+                if (title, description) in tried:
+                    return  # input stopped changing, so will the description
+                tried.add((title, description))
+                yield generated
+            return
+
+        with self._telemetry.span("score_candidates") as span:
+            candidates = self._description_generator.generate_keyword_candidates(
+                num_candidates=self._num_candidates,
+                num_new_keywords=NUM_KEYWORDS,
+                num_top_videos=num_top_videos,
+                prompt=prompt,
+            )
+            ranking = self._candidate_scorer.rank(self._database_handler, candidates)
+            span.add("candidates", len(candidates))
+        for idx in ranking:
+            with self._telemetry.span("describe"):
+                title, description = self._description_generator.describe(
+                    candidates[idx]
+                )
+            yield title, description, candidates[idx]
+
+    def _is_near_duplicate(self, title: str, description: str) -> bool:
+        if self._near_duplicate_index is None:
+            return False
+        with self._telemetry.span("dedupe") as span:
+            # pick up videos recorded by other processes since last check
+            self._near_duplicate_index.sync(self._database_handler)
+            match = self._near_duplicate_index.most_similar(title, description)
+            if match is None:
+                return False
+            span.add("duplicates")
+        record_id, similarity = match
+        self._logger.info(
+            f"Description '{title}' is {similarity:.0%} similar to video {record_id}"
+        )
+        return True
+
+    def resume_job(self, job_id: int) -> bool:
+        """Finish video job from its last completed step, False if already ended"""
+        with self._job_handler as db:
+            jobs = db.read(
+                QueryBuilder().where_compare("id", WhereComparison.EQUAL, job_id)
+            )
+        if not jobs or jobs[0].state in (JOB_RECORDED, JOB_FAILED):
+            return False
+        self._run_job(jobs[0])
+        return True
+
+    def resume_pending_jobs(self) -> int:
+        """Finish video jobs interrupted mid-pipeline, returns number resumed.
+
+        Each job continues from its last completed step, so a rendered video is
+        not rendered again and a platform already uploaded to is skipped.
+        """
+        jobs = self.pending_jobs()
+        for job in jobs:
+            self._logger.info(f"Resuming video job {job.id} from state {job.state}")
+            try:
+                self._run_job(job)
+            except Exception as e:
+                self._logger.error(f"Resumed video job {job.id} failed: {e}")
+        return len(jobs)
+
+    def pending_jobs(self) -> list[VideoJobRecord]:
+        """Video jobs neither recorded nor failed, oldest first"""
+        with self._job_handler as db:
+            return [
+                job
+                for job in db.read(QueryBuilder().order_by("id"))
+                if job.state not in (JOB_RECORDED, JOB_FAILED)
+            ]
+
+    def _run_job(self, job: VideoJobRecord) -> None:
+        """Advance job through remaining states, persisting each completed step"""
+        job.attempts = int(job.attempts) + 1
+        self._update_job(job, attempts=job.attempts)
+        try:
+            if job.state == JOB_GENERATED and not Path(job.video_path).is_file():
+                self._logger.warning(f"Video of job {job.id} missing, regenerating")
+                self._update_job(job, state=JOB_DESCRIBED, video_path="")
+            if job.state == JOB_DESCRIBED:
+                self._generate_job_video(job)
+            if job.state == JOB_GENERATED:
+                self._publish_job_video(job)
+            if job.state == JOB_UPLOADED:
+                self._record_job_video(job)
+        except PlatformUnavailableError as e:
+            # deferred until the platform recovers, not a failed attempt
+            job.attempts -= 1
+            self._update_job(job, attempts=job.attempts, error=str(e))
+            raise
+        except Exception as e:
+            updates = {"error": str(e)}
+            if job.attempts >= self._max_job_attempts:
+                updates["state"] = JOB_FAILED
+                if any(job.platform_urls):
+                    # already live on some platforms, keep tracking those
+                    self._create_video_record(job, list(job.platform_urls))
+                if job.video_path:
+                    self._video_generator.delete_local_video(Path(job.video_path))
+            self._update_job(job, **updates)
+            raise
+
+    def _generate_job_video(self, job: VideoJobRecord) -> None:
+        with self._telemetry.span("generate"):
+            video_file = self._video_generator.create_video(job.description)
+        if video_file is None:
+            raise ValueError("Video generation failed")
+        self._update_job(job, state=JOB_GENERATED, video_path=str(video_file))
+
+    def _publish_job_video(self, job: VideoJobRecord) -> None:
+        video_file = Path(job.video_path)
+        platform_urls = list(job.platform_urls)
 
-        self._video_generator.delete_local_video(video_file)
+        def on_published(idx: int, url: str) -> None:
+            # persist each upload at once so a restart never publishes it twice
+            platform_urls.extend([""] * (idx + 1 - len(platform_urls)))
+            platform_urls[idx] = url
+            self._update_job(job, platform_urls=list(platform_urls))
 
+        with self._telemetry.span("publish") as span:
+            if self._telemetry.enabled:
+                span.add("bytes", video_file.stat().st_size)
+            urls = self._video_platforms.publish_to_all(
+                file_path=video_file,
+                title=job.title,
+                description=job.description,
+                tags=job.keywords,
+                published=job.platform_urls,
+                on_published=on_published,
+            )
+            span.add("uploads", sum(1 for url in urls if url))
+        failed = [idx for idx, url in enumerate(urls) if not url]
+        if not urls or failed:
+            # stays generated, the next attempt uploads to failed platforms only
+            raise ValueError(f"Video publishing failed on platforms {failed}")
+        self._update_job(job, state=JOB_UPLOADED, urls=urls)
+
+    def _record_job_video(self, job: VideoJobRecord) -> None:
+        self._create_video_record(job, job.urls)
+        self._update_job(job, state=JOB_RECORDED)
+        self._video_generator.delete_local_video(Path(job.video_path))
+
+    def _create_video_record(self, job: VideoJobRecord, urls: list[str]) -> None:
+        """Engagement record of job's video, URLs by platform index"""
         video_record = VideoEngagementRecord(
-            datetime_publish=datetime.now(),
-            title=title,
-            description=description,
-            keywords=keywords,
+            datetime_publish=self._clock(),
+            title=job.title,
+            description=job.description,
+            keywords=job.keywords,
             urls=urls,
             views=0,
             likes=0,
             comments=0,
         )
 
-        with self._database_handler as db:
-            db.create(video_record)
-
-    def update_video_metrics(self, top_n_records: int = None) -> None:
-        """Update engagement metrics of all published videos in database"""
-        with self._database_handler as db:
+        with self._telemetry.span("record"), self._database_handler as db:
+            db.begin_immediate()  # no other worker can record between read & write
+            # job may have died after recording but before being marked recorded
             qb = (
                 QueryBuilder()
-                .select_columns(["id", "urls"])
-                .where_compare("views", WhereComparison.GREATER_THAN, 0)
-                .order_by("views", OrderByType.DESCENDING)
+                .select_columns("id")
+                .where_compare("urls", WhereComparison.EQUAL, urls)
             )
-            if top_n_records:
-                qb.limit(top_n_records)
-            records = db.read(qb)  # views > 0
+            if not db.read(qb):
+                db.create(video_record)
 
-            for record in records:
-                engagement = self._video_platforms.get_engagement_metrics_all(
-                    video_url=record.urls
+    def _update_job(self, job: VideoJobRecord, **updates: Any) -> None:
+        updates["updated_at"] = self._clock()
+        with self._job_handler as db:
+            db.update(job.id, updates)
+        for name, value in updates.items():
+            setattr(job, name, value)
+
+    def update_video_metrics(
+        self,
+        top_n_records: Optional[int] = None,
+        record_ids: Optional[list[int]] = None,
+    ) -> None:
+        """Update engagement metrics of published videos due a refresh.
+
+        record_ids restricts the refresh to those videos, e.g. one worker's batch.
+        """
+        now = self._clock()
+        with self._telemetry.span("select_due"):
+            records = self._due_records(now, top_n_records, record_ids)
+
+        # fetch from platforms outside any transaction so writers aren't blocked
+        engagements = []
+        batch_size = self._metrics_batch_size or 1
+        with self._telemetry.span("fetch_metrics") as span:
+            for start in range(0, len(records), batch_size):
+                batch = records[start : start + batch_size]
+                try:
+                    if self._metrics_batch_size:
+                        engagements += (
+                            self._video_platforms.get_engagement_metrics_batch(
+                                [record.urls for record in batch]
+                            )
+                        )
+                    else:
+                        engagements.append(
+                            self._video_platforms.get_engagement_metrics_all(
+                                video_url=batch[0].urls
+                            )
+                        )
+                    span.add(
+                        "api_calls",
+                        sum(
+                            len([url for url in record.urls if url]) for record in batch
+                        ),
+                    )
+                except QuotaExceededError:
+                    self._logger.warning(
+                        f"API quota low, deferring {len(records) - len(engagements)} "
+                        "metrics refreshes to next run"
+                    )
+                    span.add("deferred", len(records) - len(engagements))
+                    break
+
+            # None when a platform failed or its circuit is open, retried next run
+            refreshed = [
+                (record, engagement)
+                for record, engagement in zip(records, engagements)
+                if engagement is not None
+            ]
+            skipped = len(engagements) - len(refreshed)
+            if skipped:
+                self._logger.warning(
+                    f"Platform unavailable, skipping {skipped} metrics refreshes "
+                    "until next run"
+                )
+                span.add("skipped", skipped)
+
+        snapshots = []
+        keyword_deltas: dict[str, float] = defaultdict(float)
+        write_span = self._telemetry.span("write_metrics")
+        # one transaction, so keyword scores never count a refresh twice or miss it
+        with (
+            write_span,
+            self._database_handler as db,
+            self._joined(self._snapshot_handler, db) as snapshot_db,
+            self._joined(self._keyword_score_handler, db) as score_db,
+        ):
+            for record, engagement in refreshed:
+                deltas = self._keyword_scorer.refresh_deltas(record, engagement, now)
+                for keyword, delta in deltas.items():
+                    keyword_deltas[keyword] += delta
+                snapshots.append(
+                    EngagementSnapshot(
+                        video_id=record.id,
+                        datetime_snapshot=now,
+                        views=engagement.views,
+                        likes=engagement.likes,
+                        comments=engagement.comments,
+                    )
                 )
                 db.update(
                     record.id,
@@ -95,5 +439,114 @@ class VideoAnalytics:
                         "views": engagement.views,
                         "likes": engagement.likes,
                         "comments": engagement.comments,
+                        "last_refreshed_at": now,
+                        "views_per_hour": self._views_per_hour(
+                            record, engagement.views, now
+                        ),
                     },
                 )
+
+            write_span.add("rows", len(refreshed))
+
+            with self._telemetry.span("write_snapshots") as span:
+                snapshot_db.record_snapshots(snapshots)
+                score_db.add_scores(keyword_deltas, now=now)
+                span.add("rows", len(snapshots) + len(keyword_deltas))
+
+    @staticmethod
+    def _joined(handler: H, db: DatabaseHandler) -> ContextManager[H]:
+        """handler's 'with' block, in db's transaction when it's the same file"""
+        if Path(handler.db_path).resolve() == Path(db.db_path).resolve():
+            return handler.joined(db)
+        return handler
+
+    def due_record_ids(self, limit: Optional[int] = None) -> list[int]:
+        """Ids of published videos due a metrics refresh, most urgent first"""
+        return [record.id for record in self._due_records(self._clock(), limit)]
+
+    def _due_records(
+        self,
+        now: datetime,
+        limit: Optional[int],
+        record_ids: Optional[list[int]] = None,
+    ) -> list[VideoEngagementRecord]:
+        qb = QueryBuilder().select_columns(
+            [
+                "id",
+                "urls",
+                "datetime_publish",
+                "views",
+                "likes",
+                "comments",
+                "keywords",
+                "last_refreshed_at",
+                "views_per_hour",
+            ]
+        )
+        if record_ids is not None and not record_ids:
+            return []
+        if self._engagement_store is not None:
+            self._engagement_store.sync()
+            due_ids = self._engagement_store.due_ids(
+                self._refresh_planner, now, limit=limit, record_ids=record_ids
+            )
+            if not due_ids:
+                return []
+            qb.where_in("id", due_ids)
+            with self._database_handler as db:
+                records = {record.id: record for record in db.read(qb)}
+            return [records[record_id] for record_id in due_ids if record_id in records]
+
+        # coarse filter in SQL, planner decides on the few that may be due;
+        # never refreshed ('' sorts before any ISO datetime) always pass
+        qb.where_compare(
+            "IFNULL(last_refreshed_at, '')",
+            WhereComparison.LESS_THAN_EQUAL,
+            now - self._refresh_planner.min_interval(),
+        )
+        if record_ids is not None:
+            qb.where_logical(WhereLogical.AND).where_in("id", record_ids)
+        with self._database_handler as db:
+            records = db.read(qb)
+        return self._refresh_planner.due_records(records, now=now, limit=limit)
+
+    def rebuild_keyword_scores(self) -> None:
+        """Recompute keyword score table from all records, e.g. after weights change"""
+        scores: dict[str, float] = defaultdict(float)
+        with self._database_handler as db:
+            qb = QueryBuilder().select_columns(
+                [
+                    "id",
+                    "datetime_publish",
+                    "views",
+                    "likes",
+                    "comments",
+                    "keywords",
+                    "last_refreshed_at",
+                ]
+            )
+            for page in db.read_pages(qb, page_size=DATABASE_READ_PAGE_SIZE):
+                for keyword, score in self._keyword_scorer.score_records(page).items():
+                    scores[keyword] += score
+        with self._keyword_score_handler as score_db:
+            score_db.replace_scores(scores, now=self._clock())
+
+    def compact_snapshots(self) -> int:
+        """Roll up old engagement snapshots, returns number of rows freed"""
+        with self._snapshot_handler as snapshot_db:
+            return snapshot_db.compact(now=self._clock())
+
+    def _views_per_hour(
+        self, record: VideoEngagementRecord, views: int, now: datetime
+    ) -> float:
+        """View velocity since last refresh (or since publish if never refreshed)"""
+        last_refreshed_at = to_datetime(record.last_refreshed_at)
+        if last_refreshed_at is not None:
+            since, previous_views = last_refreshed_at, int(record.views)
+        else:
+            since, previous_views = to_datetime(record.datetime_publish), 0
+        if since is None:
+            return 0.0
+
+        hours = max((now - since).total_seconds() / 3600, 1 / 60)
+        return round(max(views - previous_views, 0) / hours, 3)
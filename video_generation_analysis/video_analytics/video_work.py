@@ -0,0 +1,132 @@
+import logging
+from datetime import datetime, timedelta
+
+from video_generation_analysis.config import (
+    METRICS_REFRESH_BATCH_SIZE,
+    WORK_QUEUE_VISIBILITY_TIMEOUT_SECONDS,
+)
+from video_generation_analysis.database_handler.schema import WorkItem
+from video_generation_analysis.scheduler.work_queue import WorkQueue, item_payload
+from video_generation_analysis.scheduler.worker import Handler, WorkDeferred, Worker
+from video_generation_analysis.video_analytics.video_analytics import VideoAnalytics
+from video_generation_analysis.video_platforms_handler.video_platforms_handler import (
+    PlatformUnavailableError,
+)
+
+WORK_GENERATE_VIDEO = "generate_video"
+WORK_REFRESH_METRICS = "refresh_metrics"
+
+
+def enqueue_generate_video(
+    queue: WorkQueue, num_top_videos: int, prompt: str = "", now: datetime = None
+) -> bool:
+    """Enqueue video generation, once per minute however many dispatchers run"""
+    now = now or datetime.now()
+    return (
+        queue.enqueue(
+            WORK_GENERATE_VIDEO,
+            {"num_top_videos": num_top_videos, "prompt": prompt},
+            dedupe_key=f"{WORK_GENERATE_VIDEO}:{now:%Y-%m-%dT%H:%M}:{prompt}",
+        )
+        is not None
+    )
+
+
+def enqueue_pending_jobs(
+    queue: WorkQueue,
+    video_analytics: VideoAnalytics,
+    idle_seconds: float = WORK_QUEUE_VISIBILITY_TIMEOUT_SECONDS,
+    now: datetime = None,
+) -> int:
+    """Enqueue resumes of unfinished video jobs no work item is handling.
+
+    Dispatcher counterpart of VideoAnalytics.resume_pending_jobs, e.g. for jobs
+    started in process or whose item was dead-lettered. Jobs updated within
+    idle_seconds are left to the worker that may be linking them to its item.
+    Returns number enqueued.
+    """
+    now = now or datetime.now()
+    handled = {
+        item_payload(item).get("job_id")
+        for item in queue.outstanding_items(WORK_GENERATE_VIDEO)
+    }
+    enqueued = 0
+    for job in video_analytics.pending_jobs():
+        updated_at = datetime.fromisoformat(str(job.updated_at or job.created_at))
+        if job.id in handled or now - updated_at < timedelta(seconds=idle_seconds):
+            continue
+        if queue.enqueue(
+            WORK_GENERATE_VIDEO,
+            {"job_id": job.id},
+            dedupe_key=f"{WORK_GENERATE_VIDEO}:job:{job.id}:{job.updated_at}",
+        ):
+            enqueued += 1
+    if enqueued:
+        logging.getLogger(__name__).info(f"Enqueued {enqueued} video job resumes")
+    return enqueued
+
+
+def enqueue_metrics_refreshes(
+    queue: WorkQueue,
+    video_analytics: VideoAnalytics,
+    batch_size: int = METRICS_REFRESH_BATCH_SIZE,
+    now: datetime = None,
+) -> int:
+    """Split videos due a refresh into work item batches, returns batches enqueued.
+
+    Skipped while a previous sweep is outstanding, so slow workers never get
+    the same videos queued twice.
+    """
+    logger = logging.getLogger(__name__)
+    outstanding = queue.outstanding(WORK_REFRESH_METRICS)
+    if outstanding:
+        logger.warning(f"{outstanding} metrics refresh batches outstanding, skipping")
+        return 0
+
+    now = now or datetime.now()
+    record_ids = video_analytics.due_record_ids()
+    enqueued = 0
+    for start in range(0, len(record_ids), batch_size):
+        if queue.enqueue(
+            WORK_REFRESH_METRICS,
+            {"record_ids": record_ids[start : start + batch_size]},
+            dedupe_key=f"{WORK_REFRESH_METRICS}:{now:%Y-%m-%dT%H:%M}:{start}",
+        ):
+            enqueued += 1
+    logger.info(f"Enqueued {len(record_ids)} due videos in {enqueued} batches")
+    return enqueued
+
+
+def video_work_handlers(video_analytics: VideoAnalytics) -> dict[str, Handler]:
+    """Worker handlers running video analytics work items"""
+
+    def generate_video(item: WorkItem, worker: Worker) -> None:
+        payload = item_payload(item)
+        job_id = payload.get("job_id")
+
+        def on_job_created(new_job_id: int) -> None:
+            payload["job_id"] = new_job_id
+            worker.queue.update_payload(item, worker.worker_id, payload)
+
+        try:
+            if job_id is not None:
+                # previous lease holder died or deferred mid-job, continue it
+                video_analytics.resume_job(job_id)
+                return
+            video_analytics.generate_video(
+                num_top_videos=payload["num_top_videos"],
+                prompt=payload.get("prompt", ""),
+                on_job_created=on_job_created,
+            )
+        except PlatformUnavailableError as e:
+            raise WorkDeferred(str(e), e.retry_after_seconds) from e
+
+    def refresh_metrics(item: WorkItem, worker: Worker) -> None:
+        video_analytics.update_video_metrics(
+            record_ids=item_payload(item)["record_ids"]
+        )
+
+    return {
+        WORK_GENERATE_VIDEO: generate_video,
+        WORK_REFRESH_METRICS: refresh_metrics,
+    }
@@ -1,14 +1,23 @@
+import random
+from typing import Optional
+
 from video_generation_analysis.config import (
+    CANDIDATE_TRIES_PER_CANDIDATE,
     DESCRIPTION_MAX_LENGTH,
     DESCRIPTION_MIN_LENGTH,
+    NUM_TOP_KEYWORDS,
     TITLE_MAX_LENGTH,
     TITLE_MIN_LENGTH,
 )
 from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.keyword_score_handler import (
+    KeywordScoreHandler,
+)
 from video_generation_analysis.database_handler.query_builder import (
     OrderByType,
     QueryBuilder,
 )
+from video_generation_analysis.video_analytics.engagement_store import EngagementStore
 from video_generation_analysis.video_generator.keyword_strategy import KeywordStrategy
 
 
@@ -20,25 +29,75 @@ class DescriptionGenerator:
         db_handler: DatabaseHandler,
         keyword_strategy: KeywordStrategy,
         description_strategy: KeywordStrategy,
+        keyword_score_handler: Optional[KeywordScoreHandler] = None,
+        engagement_store: Optional[EngagementStore] = None,
     ):
         self._db_handler = db_handler
+        self._engagement_store = engagement_store
+        self._keyword_score_handler = keyword_score_handler
         self._keyword_strategy = keyword_strategy
         self._description_strategy = description_strategy
 
     def generate_description(
-        self, num_new_keywords, num_top_videos: int = 10, prompt: str = ""
+        self,
+        num_new_keywords,
+        num_top_videos: int = 10,
+        prompt: str = "",
+        skip_top_keywords: int = 0,
     ) -> tuple[str, str, list[str]]:
-        """Gets top keywords from db, generates new keywords by strategy algorithm."""
+        """Gets top keywords from db, generates new keywords by strategy algorithm.
+
+        skip_top_keywords leaves out that many best keywords, or one prompt word
+        in turn, for a description different to one already generated.
+        """
         if prompt:
             top_keywords = prompt.split()
+            if skip_top_keywords and len(top_keywords) > 1:
+                del top_keywords[(skip_top_keywords - 1) % len(top_keywords)]
         else:
             top_keywords = self.get_top_keywords(num_top_videos=num_top_videos)
+            top_keywords = top_keywords[skip_top_keywords:]
 
-        keywords = self._keyword_strategy.generate(
-            keywords=top_keywords,
-            max_length=num_new_keywords,
-            min_length=num_new_keywords,
-        ).split()
+        keywords = self._new_keywords(top_keywords, num_new_keywords)
+        title, description = self.describe(keywords)
+        return title, description, keywords
+
+    def generate_keyword_candidates(
+        self,
+        num_candidates: int,
+        num_new_keywords: int,
+        num_top_videos: int = 10,
+        prompt: str = "",
+        seed: Optional[int] = None,
+    ) -> list[list[str]]:
+        """Distinct new keyword sets, cheap to generate compared to describing.
+
+        The first expands all top keywords like generate_description, the rest
+        expand random halves of them.
+        """
+        if prompt:
+            top_keywords = prompt.split()
+        else:
+            top_keywords = self.get_top_keywords(num_top_videos=num_top_videos)
+
+        rng = random.Random(seed)
+        candidates: list[list[str]] = []
+        seen: set[frozenset[str]] = set()
+        subset = top_keywords
+        for _ in range(num_candidates * CANDIDATE_TRIES_PER_CANDIDATE):
+            keywords = self._new_keywords(subset, num_new_keywords)
+            if keywords and frozenset(keywords) not in seen:
+                seen.add(frozenset(keywords))
+                candidates.append(keywords)
+                if len(candidates) == num_candidates:
+                    break
+            if not top_keywords:
+                break
+            subset = rng.sample(top_keywords, max(len(top_keywords) // 2, 1))
+        return candidates
+
+    def describe(self, keywords: list[str]) -> tuple[str, str]:
+        """Title & description of keywords by description strategy"""
         title = self._description_strategy.generate(
             keywords=keywords,
             max_length=TITLE_MAX_LENGTH,
@@ -49,11 +108,34 @@ class DescriptionGenerator:
             max_length=DESCRIPTION_MAX_LENGTH,
             min_length=DESCRIPTION_MIN_LENGTH,
         )
+        return title, description
 
-        return title, description, keywords
+    def _new_keywords(
+        self, top_keywords: list[str], num_new_keywords: int
+    ) -> list[str]:
+        return self._keyword_strategy.generate(
+            keywords=top_keywords,
+            max_length=num_new_keywords,
+            min_length=num_new_keywords,
+        ).split()
 
     def get_top_keywords(self, num_top_videos: int) -> list[str]:
-        """Retrieves top keywords from database based on engagement metrics."""
+        """Retrieves top keywords from database based on engagement metrics.
+
+        Uses incrementally maintained keyword scores when available, falling back
+        to counting keywords of the top videos per engagement type, in memory
+        given an engagement store.
+        """
+        if self._keyword_score_handler is not None:
+            with self._keyword_score_handler as score_db:
+                scored_keywords = score_db.top_keywords(NUM_TOP_KEYWORDS)
+            if scored_keywords:
+                return scored_keywords
+
+        if self._engagement_store is not None:
+            self._engagement_store.sync()
+            return self._engagement_store.top_keywords(num_top_videos)
+
         views_keywords = self._top_database_records_keywords(
             num_records=num_top_videos, engagement_type="views"
         )
@@ -85,7 +167,7 @@ class DescriptionGenerator:
         with self._db_handler as db_handler:
             top_enagement_record = db_handler.read(query_builder)
 
-        top_engagement_keywords = {}
+        top_engagement_keywords: dict[str, int] = {}
         for record in top_enagement_record:
             for keyword in record.keywords:
                 if keyword in top_engagement_keywords:
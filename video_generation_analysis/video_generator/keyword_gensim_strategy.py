@@ -1,4 +1,5 @@
 import logging
+from typing import Any, Optional
 
 import gensim.downloader as api
 
@@ -9,9 +10,11 @@ from video_generation_analysis.video_generator.keyword_strategy import KeywordSt
 class KeywordGensimStrategy(KeywordStrategy):
     """Generates new keywords using Gensim word2vec model similarity"""
 
-    def __init__(self):
+    def __init__(self, model: Optional[Any] = None):
         self._logger: logging.Logger = logging.getLogger(__name__)
-        self._model = None
+        self._model = model  # any object with most_similar(word, topn), e.g. stub
+        if self._model is not None:
+            return
         try:
             self._model = api.load(GENSIM_MODEL)
         except Exception as e:
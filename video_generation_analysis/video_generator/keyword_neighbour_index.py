@@ -0,0 +1,113 @@
+import argparse
+import logging
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from video_generation_analysis.config import (
+    DATABASE_PATH,
+    DATABASE_READ_PAGE_SIZE,
+    GENSIM_MODEL,
+    KEYWORD_NEIGHBOURS_TOPN,
+)
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.keyword_neighbour_handler import (
+    KeywordNeighbourHandler,
+)
+from video_generation_analysis.database_handler.query_builder import QueryBuilder
+from video_generation_analysis.database_handler.schema import VideoEngagementRecord
+
+
+def load_gensim_model() -> Optional[Any]:
+    """Gensim word vectors, imported here so only the precompute job loads them"""
+    try:
+        import gensim.downloader as api
+
+        return api.load(GENSIM_MODEL)
+    except Exception as e:
+        logging.getLogger(__name__).error(f"Failed to load gensim model: {e}")
+        return None
+
+
+class KeywordNeighbourIndexer:
+    """Precomputes top-k similar words of every stored keyword.
+
+    Each run finds keywords of video records (and prompt words looked up at
+    generation time) without neighbours yet, and only loads the word vector
+    model if there are any, so runs are incremental and mostly model free.
+    """
+
+    def __init__(
+        self,
+        db_handler: DatabaseHandler,
+        neighbour_handler: KeywordNeighbourHandler,
+        model_loader: Callable[[], Optional[Any]] = load_gensim_model,
+        topn: int = KEYWORD_NEIGHBOURS_TOPN,
+        page_size: int = DATABASE_READ_PAGE_SIZE,
+    ) -> None:
+        self._logger: logging.Logger = logging.getLogger(__name__)
+        self._db_handler = db_handler
+        self._neighbour_handler = neighbour_handler
+        self._model_loader = model_loader  # any object with most_similar(word, topn)
+        self._topn = topn
+        self._page_size = page_size
+
+    def vocabulary(self) -> set[str]:
+        """Lowercased keywords of all stored video records"""
+        vocabulary = set()
+        qb = QueryBuilder().select_columns(["id", "keywords"])
+        with self._db_handler as db:
+            for page in db.read_pages(qb, page_size=self._page_size):
+                for record in page:
+                    vocabulary.update(keyword.lower() for keyword in record.keywords)
+        return vocabulary
+
+    def refresh(self, extra_keywords: Optional[list[str]] = None) -> int:
+        """Compute neighbours of keywords not yet indexed, returns number computed"""
+        with self._neighbour_handler as db:
+            known = db.known_keywords()
+            pending = db.pending_keywords()
+        extra = {keyword.lower() for keyword in extra_keywords or []}
+        new_keywords = sorted((self.vocabulary() | pending | extra) - known)
+        if not new_keywords:
+            return 0
+
+        model = self._model_loader()
+        if model is None:
+            return 0
+        neighbours = {}
+        for keyword in new_keywords:
+            try:
+                similar = model.most_similar(keyword, topn=self._topn)
+                neighbours[keyword] = [(word, float(score)) for word, score in similar]
+            except KeyError:
+                neighbours[keyword] = []  # not in model vocabulary, don't retry
+
+        with self._neighbour_handler as db:
+            db.replace_neighbours(neighbours)
+        self._logger.info(f"Precomputed neighbours of {len(neighbours)} keywords")
+        return len(neighbours)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Precompute similar words of keywords without neighbours yet"
+    )
+    parser.add_argument("--db-path", type=Path, default=Path(DATABASE_PATH))
+    parser.add_argument("--topn", type=int, default=KEYWORD_NEIGHBOURS_TOPN)
+    parser.add_argument("keywords", nargs="*", help="Extra keywords, e.g. prompts.")
+    return parser.parse_args()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    args = parse_args()
+    indexer = KeywordNeighbourIndexer(
+        DatabaseHandler(args.db_path, VideoEngagementRecord),
+        KeywordNeighbourHandler(args.db_path),
+        topn=args.topn,
+    )
+    print(f"Precomputed neighbours of {indexer.refresh(args.keywords)} keywords")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import logging
+
+from video_generation_analysis.database_handler.keyword_neighbour_handler import (
+    KeywordNeighbourHandler,
+)
+from video_generation_analysis.video_generator.keyword_strategy import KeywordStrategy
+
+
+class KeywordNeighbourStrategy(KeywordStrategy):
+    """Generates new keywords from neighbours precomputed by KeywordNeighbourIndexer.
+
+    Ranks neighbours like KeywordGensimStrategy but reads them from an indexed
+    table, so no model is loaded. Keywords not indexed yet are marked pending
+    for the next precompute run.
+    """
+
+    def __init__(self, neighbour_handler: KeywordNeighbourHandler):
+        self._logger: logging.Logger = logging.getLogger(__name__)
+        self._neighbour_handler = neighbour_handler
+
+    def generate(self, keywords: list[str], min_length: int, max_length: int) -> str:
+        """Generates new keywords based on current keywords' precomputed neighbours"""
+        lower_keywords = [keyword.lower() for keyword in keywords]
+        with self._neighbour_handler as db:
+            neighbours = db.neighbours(lower_keywords, topn=max_length)
+            missing = [
+                keyword for keyword in lower_keywords if keyword not in neighbours
+            ]
+            if missing:
+                self._logger.debug(f"Neighbours of {missing} not precomputed yet")
+                db.add_pending(missing)
+
+        new_keywords: dict[str, float] = {}
+        for keyword in lower_keywords:
+            for word, similarity in neighbours.get(keyword, []):
+                new_keywords[word] = new_keywords.get(word, 0.0) + similarity
+
+        sorted_keywords = sorted(
+            new_keywords.items(), key=lambda item: item[1], reverse=True
+        )
+        keywords = [keyword[0] for keyword in sorted_keywords]
+        return " ".join(keywords[:max_length])
@@ -0,0 +1,272 @@
+import logging
+import re
+import threading
+import zlib
+from typing import Optional
+
+import numpy as np
+
+from video_generation_analysis.config import (
+    DATABASE_READ_PAGE_SIZE,
+    NEAR_DUPLICATE_BANDS,
+    NEAR_DUPLICATE_NUM_PERM,
+    NEAR_DUPLICATE_SHINGLE_WORDS,
+    NEAR_DUPLICATE_THRESHOLD,
+)
+from video_generation_analysis.database_handler.database_handler import (
+    CommittedWrites,
+    DatabaseHandler,
+)
+from video_generation_analysis.database_handler.partition_archive import (
+    PartitionArchive,
+)
+from video_generation_analysis.database_handler.query_builder import (
+    QueryBuilder,
+    WhereComparison,
+)
+
+TOKEN_PATTERN = re.compile(r"\w+")
+SHINGLE_WORD_MIX = np.uint64(0x9E3779B97F4A7C15)  # combines word hashes of shingle
+MINHASH_CHUNK_TEXTS = 256
+TAIL_ROWS = 4096  # recently added rows scanned linearly before merging into bands
+
+
+class NearDuplicateIndex:
+    """MinHash LSH index of published video titles & descriptions.
+
+    Each text is reduced to a MinHash signature of its word shingles, split
+    into bands; records sharing any band with a query are candidates, whose
+    similarity is estimated from their full signatures. Band keys are kept in
+    sorted NumPy arrays searched by bisection, with recent rows in a small
+    unsorted tail, so lookups stay sub-millisecond at millions of records.
+    """
+
+    def __init__(
+        self,
+        threshold: float = NEAR_DUPLICATE_THRESHOLD,
+        num_perm: int = NEAR_DUPLICATE_NUM_PERM,
+        bands: int = NEAR_DUPLICATE_BANDS,
+        shingle_words: int = NEAR_DUPLICATE_SHINGLE_WORDS,
+        archive: Optional[PartitionArchive] = None,
+        seed: int = 0,
+    ) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self._logger: logging.Logger = logging.getLogger(__name__)
+        self._threshold = threshold
+        self._bands = bands
+        self._rows_per_band = num_perm // bands
+        self._shingle_words = shingle_words
+        self._archive = archive  # archived videos count as published too
+        rng = np.random.default_rng(seed)
+        # multiply-shift hash functions standing in for random permutations
+        self._hash_a = rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) | 1
+        self._hash_b = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+        self._band_mix = rng.integers(
+            1, 2**31, size=self._rows_per_band, dtype=np.uint64
+        )
+
+        self._lock = threading.Lock()
+        self._size = 0
+        self._ids = np.empty(0, dtype=np.int64)
+        # low 16 bits of each min hash, enough to estimate similarity
+        self._signatures = np.empty((0, num_perm), dtype=np.uint16)
+        self._band_keys = np.empty((bands, 0), dtype=np.uint32)  # sorted per band
+        self._band_rows = np.empty((bands, 0), dtype=np.int32)
+        self._tail_keys = np.empty((0, bands), dtype=np.uint32)
+        self._synced_id = 0
+        self._hooked_ids: set[int] = set()  # added by write hook, not synced yet
+
+    def __len__(self) -> int:
+        return self._size
+
+    def most_similar(self, title: str, description: str) -> Optional[tuple[int, float]]:
+        """(record id, similarity) of the closest record over threshold, or None"""
+        signatures, valid = self._minhash([_text(title, description)])
+        if not valid[0]:
+            return None
+        keys = self._keys(signatures)[0]
+        signature = signatures[0].astype(np.uint16)
+
+        with self._lock:
+            candidates = []
+            for band in range(self._bands):
+                band_keys = self._band_keys[band]
+                start = np.searchsorted(band_keys, keys[band], "left")
+                end = np.searchsorted(band_keys, keys[band], "right")
+                candidates.append(self._band_rows[band, start:end])
+            first_tail_row = self._size - len(self._tail_keys)
+            tail_rows = np.nonzero((self._tail_keys == keys).any(axis=1))[0]
+            candidates.append((first_tail_row + tail_rows).astype(np.int32))
+            rows = np.unique(np.concatenate(candidates))
+            if not rows.size:
+                return None
+            similarity = (self._signatures[rows] == signature).mean(axis=1)
+            best = int(np.argmax(similarity))
+            if similarity[best] < self._threshold:
+                return None
+            return int(self._ids[rows[best]]), float(similarity[best])
+
+    def add(self, ids: list[int], titles: list[str], descriptions: list[str]) -> None:
+        """Index records, texts without words are skipped"""
+        signatures, valid = self._minhash(
+            [
+                _text(title, description)
+                for title, description in zip(titles, descriptions)
+            ]
+        )
+        ids_array = np.asarray(ids, dtype=np.int64)[valid]
+        signatures = signatures[valid]
+        keys = self._keys(signatures)
+        with self._lock:
+            self._append(ids_array, signatures.astype(np.uint16), keys)
+
+    def on_write(self, writes: CommittedWrites) -> None:
+        """DatabaseHandler write hook indexing created records once committed.
+
+        Deleted records stay indexed, archiving a video doesn't unpublish it.
+        """
+        records = [record for record in writes.created if record.id is not None]
+        if not records:
+            return
+        with self._lock:
+            self._hooked_ids.update(record.id for record in records)
+        self.add(
+            [record.id for record in records],
+            [record.title for record in records],
+            [record.description for record in records],
+        )
+
+    def sync(
+        self, db_handler: DatabaseHandler, page_size: int = DATABASE_READ_PAGE_SIZE
+    ) -> int:
+        """Index records added since last sync, e.g. by other processes.
+
+        The first sync indexes the whole table and archive. Returns number of
+        records indexed.
+        """
+        added = 0
+        archive = self._archive if self._synced_id == 0 else None
+        with db_handler as db:
+            while True:
+                qb = (
+                    QueryBuilder()
+                    .select_columns(["id", "title", "description"])
+                    .where_compare("id", WhereComparison.GREATER_THAN, self._synced_id)
+                    .order_by("id")
+                    .limit(page_size)
+                )
+                columns = db.read_columns(qb, archive=archive)
+                ids = [int(record_id) for record_id in columns.get("id", [])]
+                if not ids:
+                    break
+                new = [
+                    idx
+                    for idx, record_id in enumerate(ids)
+                    if record_id not in self._hooked_ids
+                ]
+                self.add(
+                    [ids[idx] for idx in new],
+                    [columns["title"][idx] or "" for idx in new],
+                    [columns["description"][idx] or "" for idx in new],
+                )
+                added += len(new)
+                self._synced_id = ids[-1]
+
+        with self._lock:
+            self._hooked_ids = {
+                record_id
+                for record_id in self._hooked_ids
+                if record_id > self._synced_id
+            }
+        if added:
+            self._logger.info(f"Indexed {added} video descriptions, {self._size} total")
+        return added
+
+    def _append(
+        self, ids: np.ndarray, signatures: np.ndarray, keys: np.ndarray
+    ) -> None:
+        if not len(ids):
+            return
+        if self._size + len(ids) > len(self._ids):
+            capacity = max(2 * len(self._ids), self._size + len(ids), 1024)
+            self._ids = np.resize(self._ids, capacity)
+            self._signatures = np.resize(
+                self._signatures, (capacity, self._signatures.shape[1])
+            )
+        self._ids[self._size : self._size + len(ids)] = ids
+        self._signatures[self._size : self._size + len(ids)] = signatures
+        self._size += len(ids)
+        self._tail_keys = np.concatenate([self._tail_keys, keys])
+        if len(self._tail_keys) >= TAIL_ROWS:
+            self._merge_tail()
+
+    def _merge_tail(self) -> None:
+        """Move tail rows into the sorted band arrays"""
+        first_row = self._size - len(self._tail_keys)
+        tail_rows = np.arange(first_row, self._size, dtype=np.int32)
+        keys = np.concatenate([self._band_keys, self._tail_keys.T], axis=1)
+        rows = np.concatenate(
+            [self._band_rows, np.broadcast_to(tail_rows, self._tail_keys.T.shape)],
+            axis=1,
+        )
+        order = np.argsort(keys, axis=1, kind="stable")
+        self._band_keys = np.take_along_axis(keys, order, axis=1)
+        self._band_rows = np.take_along_axis(rows, order, axis=1)
+        self._tail_keys = self._tail_keys[:0]
+
+    def _minhash(self, texts: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        """MinHash signature per text & mask of texts having any words"""
+        shingles, counts = self._shingles(texts)
+        valid = counts > 0
+        signatures = np.zeros((len(texts), len(self._hash_a)), dtype=np.uint32)
+        if not valid.any():
+            return signatures, valid
+
+        valid_rows = np.nonzero(valid)[0]
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        # chunked so the (permutations x shingles) hashes stay cache sized
+        for first in range(0, len(valid_rows), MINHASH_CHUNK_TEXTS):
+            rows = valid_rows[first : first + MINHASH_CHUNK_TEXTS]
+            begin, end = starts[rows[0]], starts[rows[-1]] + counts[rows[-1]]
+            hashed = self._hash_a[:, None] * shingles[begin:end]
+            hashed += self._hash_b[:, None]
+            hashed >>= np.uint64(32)
+            minimums = np.minimum.reduceat(hashed, starts[rows] - begin, axis=1)
+            signatures[rows] = minimums.T
+        return signatures, valid
+
+    def _shingles(self, texts: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        """Hash of each word & the words after it in its text, shingles per text"""
+        tokens = [TOKEN_PATTERN.findall(text.lower()) for text in texts]
+        counts = np.array([len(text_tokens) for text_tokens in tokens], dtype=np.int64)
+        words = np.fromiter(
+            (
+                zlib.crc32(token.encode())
+                for text_tokens in tokens
+                for token in text_tokens
+            ),
+            dtype=np.uint64,
+            count=int(counts.sum()),
+        )
+        text_ends = np.repeat(np.cumsum(counts), counts)
+        positions = np.arange(len(words))
+        shingles = words.copy()
+        for offset in range(1, self._shingle_words):
+            following = positions + offset
+            inside = following < text_ends  # past the text's end hashes as 0
+            shingles *= SHINGLE_WORD_MIX
+            shingles += np.where(
+                inside, words[np.minimum(following, len(words) - 1)], 0
+            )
+        return shingles, counts
+
+    def _keys(self, signatures: np.ndarray) -> np.ndarray:
+        """Hash of each band of each signature, shape (records, bands)"""
+        bands = signatures.reshape(len(signatures), self._bands, self._rows_per_band)
+        mixed = (bands.astype(np.uint64) * self._band_mix).sum(axis=2)
+        return (mixed ^ (mixed >> np.uint64(32))).astype(np.uint32)
+
+
+def _text(title: str, description: str) -> str:
+    return f"{title} {description}"
@@ -0,0 +1,123 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+from uuid import uuid4
+
+from video_generation_analysis.config import (
+    VIDEO_CACHE_MAX_AGE_DAYS,
+    VIDEO_CACHE_MAX_BYTES,
+)
+
+SECONDS_PER_DAY = 86400
+CACHE_SUFFIX = ".mp4"
+
+
+class VideoCache:
+    """On-disk cache of rendered videos keyed by hash of prompt & generation config.
+
+    Entries are handed out as hard links (copies across filesystems), so the
+    caller may delete its file after publishing without evicting the entry.
+    Entries cached more than max_age_days ago are dropped, then least recently
+    used ones until the cache fits in max_bytes. An entry's mtime is when it
+    was cached, its atime when it was last used. Files are written atomically,
+    so processes can share one cache directory.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_bytes: int = VIDEO_CACHE_MAX_BYTES,
+        max_age_days: float = VIDEO_CACHE_MAX_AGE_DAYS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._logger: logging.Logger = logging.getLogger(__name__)
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes
+        self._max_age_seconds = max_age_days * SECONDS_PER_DAY
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(prompt: str, model: str, duration_seconds: int, aspect_ratio: str) -> str:
+        """Content address of video rendered from prompt with generation config"""
+        config = [prompt, model, duration_seconds, aspect_ratio]
+        return hashlib.sha256(json.dumps(config).encode()).hexdigest()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: str, output_path: Path) -> Optional[Path]:
+        """Place cached video at output_path, None if not cached or expired"""
+        entry = self._entry_path(key)
+        try:
+            cached_at = entry.stat().st_mtime
+            if self._clock() - cached_at > self._max_age_seconds:
+                entry.unlink(missing_ok=True)
+                raise FileNotFoundError(entry)
+            _link_or_copy(entry, output_path)
+            os.utime(entry, (self._clock(), cached_at))  # used now, age unchanged
+        except FileNotFoundError:
+            self._count(hit=False)
+            return None
+
+        self._count(hit=True)
+        self._logger.info(f"Video cache hit {key[:12]}, hit rate {self.hit_rate:.0%}")
+        return output_path
+
+    def put(self, key: str, video_path: Path) -> None:
+        """Add rendered video to cache, then evict to stay within bounds"""
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._cache_dir / f".{uuid4()}.tmp"
+        _link_or_copy(video_path, tmp_path)
+        os.replace(tmp_path, self._entry_path(key))
+        self.evict()
+
+    def evict(self) -> int:
+        """Drop expired then least recently used entries, returns number dropped"""
+        entries = []
+        for entry in self._cache_dir.glob(f"*{CACHE_SUFFIX}"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue  # evicted by another process
+            entries.append((stat.st_atime, stat.st_mtime, stat.st_size, entry))
+
+        entries.sort()  # least recently used first
+        now = self._clock()
+        total_bytes = sum(size for _, _, size, _ in entries)
+        evicted = 0
+        for _, cached_at, size, entry in entries:
+            expired = now - cached_at > self._max_age_seconds
+            if not expired and total_bytes <= self._max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total_bytes -= size
+            evicted += 1
+        return evicted
+
+    def _entry_path(self, key: str) -> Path:
+        return self._cache_dir / f"{key}{CACHE_SUFFIX}"
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+def _link_or_copy(source: Path, destination: Path) -> None:
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
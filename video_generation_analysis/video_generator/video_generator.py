@@ -3,7 +3,7 @@ import logging
 import os
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 from uuid import uuid4
 
 from dotenv import load_dotenv
@@ -14,19 +14,34 @@ from video_generation_analysis.config import (
     GEMINI_API_KEY_ENV,
     GEMINI_MODEL_NAME,
     VIDEO_ASPECT_RATIO,
+    VIDEO_CACHE_DIR,
     VIDEO_DURATION_SECONDS,
+    VIDEO_MAX_POLL_ATTEMPTS,
+    VIDEO_POLL_INTERVAL_SECONDS,
 )
+from video_generation_analysis.telemetry.telemetry import Telemetry
+from video_generation_analysis.video_generator.video_cache import VideoCache
 
 
 class VideoGenerator:
     """VideoGenerator uses Google Gemini API to create videos from text prompts"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        client_factory: Optional[Callable[[], Any]] = None,
+        poll_interval_seconds: float = VIDEO_POLL_INTERVAL_SECONDS,
+        telemetry: Optional[Telemetry] = None,
+        video_cache: Optional[VideoCache] = None,
+    ):
         load_dotenv()
         self._gemini_api_key = os.getenv(GEMINI_API_KEY_ENV, "")
         self._logger = logging.getLogger(__name__)
+        self._client_factory = client_factory  # e.g. local fake for load testing
+        self._poll_interval_seconds = poll_interval_seconds
+        self._telemetry = telemetry or Telemetry()
+        self._video_cache = video_cache or VideoCache(Path(VIDEO_CACHE_DIR))
 
-        if not self._gemini_api_key:
+        if not self._gemini_api_key and client_factory is None:
             self._logger.error(
                 f"Failed {GEMINI_API_KEY_ENV} not found in environment variables"
             )
@@ -39,21 +54,39 @@ class VideoGenerator:
         """Context manager to ensure the asynchronous client is open/closed"""
         aclient = None
         try:
-            aclient = Client(api_key=self._gemini_api_key).aio
+            if self._client_factory is not None:
+                aclient = self._client_factory()
+            else:
+                aclient = Client(api_key=self._gemini_api_key).aio
             yield aclient
         finally:
             if aclient:
                 await aclient.aclose()
 
     def create_video(self, prompt: str) -> Optional[Path]:
-        """Generate video, wait for result and download it locally"""
+        """Generate video (or reuse cached render), download it locally"""
+        cache_key = VideoCache.key(
+            prompt, GEMINI_MODEL_NAME, VIDEO_DURATION_SECONDS, VIDEO_ASPECT_RATIO
+        )
+        with self._telemetry.span("cache_lookup") as span:
+            cached_path = self._video_cache.get(cache_key, Path(f"{uuid4()}.mp4"))
+            span.add("hits" if cached_path else "misses")
+        if cached_path:
+            return cached_path
+
         try:
             video_path = asyncio.run(self._await_create_video(prompt))
-            if video_path:
-                return Path(video_path)
         except Exception as e:
             self._logger.error(f"Unhandled error in synchronous wrapper: {e}")
-        return None
+            return None
+        if not video_path:
+            return None
+
+        try:
+            self._video_cache.put(cache_key, Path(video_path))
+        except OSError as e:  # the render is paid for, use it uncached
+            self._logger.warning(f"Failed caching video {video_path}: {e}")
+        return Path(video_path)
 
     def delete_local_video(self, video_path: Path) -> None:
         """Delete local video file"""
@@ -63,14 +96,16 @@ class VideoGenerator:
     async def _poll_for_completion(
         self, aclient: Client.aio, operation: Operation
     ) -> Operation:
-        max_poll_attempts = 50
-        poll_interval_seconds = 5
-        for attempt in range(max_poll_attempts):
-            if operation.done:
-                return operation
+        max_poll_attempts = VIDEO_MAX_POLL_ATTEMPTS
+        poll_interval_seconds = self._poll_interval_seconds
+        with self._telemetry.span("generate_poll") as span:
+            for attempt in range(max_poll_attempts):
+                if operation.done:
+                    return operation
 
-            await asyncio.sleep(poll_interval_seconds)
-            operation = await aclient.operations.get(operation)
+                await asyncio.sleep(poll_interval_seconds)
+                operation = await aclient.operations.get(operation)
+                span.add("api_calls")
 
         raise TimeoutError(
             f"Video generation timed out {max_poll_attempts * poll_interval_seconds}s"
@@ -79,14 +114,16 @@ class VideoGenerator:
     async def _await_create_video(self, prompt: str) -> Optional[str]:
         async with self._get_async_client() as aclient:
             try:
-                request = await aclient.models.generate_videos(
-                    model=GEMINI_MODEL_NAME,
-                    prompt=prompt,
-                    config=types.GenerateVideosConfig(
-                        duration_seconds=VIDEO_DURATION_SECONDS,
-                        aspect_ratio=VIDEO_ASPECT_RATIO,
-                    ),
-                )
+                with self._telemetry.span("generate_request") as span:
+                    request = await aclient.models.generate_videos(
+                        model=GEMINI_MODEL_NAME,
+                        prompt=prompt,
+                        config=types.GenerateVideosConfig(
+                            duration_seconds=VIDEO_DURATION_SECONDS,
+                            aspect_ratio=VIDEO_ASPECT_RATIO,
+                        ),
+                    )
+                    span.add("api_calls")
 
                 operation = await self._poll_for_completion(aclient, request)
 
@@ -104,7 +141,10 @@ class VideoGenerator:
 
                 generated_video = operation.response.generated_videos[0]
                 video_title = f"{uuid4()}.mp4"
-                await generated_video.video.download(download_path=video_title)
+                with self._telemetry.span("download") as span:
+                    await generated_video.video.download(download_path=video_title)
+                    if self._telemetry.enabled:
+                        span.add("bytes", Path(video_title).stat().st_size)
 
                 return video_title
 
@@ -0,0 +1,134 @@
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from video_generation_analysis.config import (
+    PLATFORM_FAILURE_THRESHOLD,
+    PLATFORM_HEALTH_WINDOW,
+    PLATFORM_RESET_TIMEOUT_SECONDS,
+)
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+@dataclass
+class PlatformHealth:
+    name: str
+    state: str
+    calls: int
+    failures: int
+    consecutive_failures: int
+    error_rate: float  # over last health window calls
+    mean_latency_seconds: float  # over last health window calls
+
+
+class CircuitBreaker:
+    """Stops calling a failing platform until it has had time to recover.
+
+    After failure_threshold consecutive failures the circuit opens and calls
+    are refused. Once reset_timeout_seconds have passed a single probe call
+    is let through (half open): success closes the circuit, failure reopens
+    it for another timeout. Latency & outcome of recent calls are kept for
+    health reporting.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = PLATFORM_FAILURE_THRESHOLD,
+        reset_timeout_seconds: float = PLATFORM_RESET_TIMEOUT_SECONDS,
+        window: int = PLATFORM_HEALTH_WINDOW,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._logger: logging.Logger = logging.getLogger(__name__)
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CIRCUIT_CLOSED
+        self._opened_at: Optional[float] = None
+        self._probe_in_flight = False
+        self._consecutive_failures = 0
+        self._calls = 0
+        self._failures = 0
+        self._recent: deque[tuple[bool, float]] = deque(maxlen=window)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def allow(self) -> bool:
+        """Whether a call may be made now, claims the probe when half open"""
+        with self._lock:
+            state = self._current_state()
+            if state == CIRCUIT_CLOSED:
+                return True
+            if state == CIRCUIT_HALF_OPEN and not self._probe_in_flight:
+                self._state = CIRCUIT_HALF_OPEN
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def release(self) -> None:
+        """Give back an allowed call that never reached the platform, no outcome"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record(self, success: bool, latency_seconds: float) -> None:
+        """Record outcome of an allowed call, opening or closing the circuit"""
+        with self._lock:
+            self._calls += 1
+            self._recent.append((success, latency_seconds))
+            was_probe = self._probe_in_flight
+            self._probe_in_flight = False
+            if success:
+                self._consecutive_failures = 0
+                if self._state != CIRCUIT_CLOSED:
+                    self._state = CIRCUIT_CLOSED
+                    self._opened_at = None
+                    self._logger.info(f"Platform {self.name} recovered, circuit closed")
+                return
+
+            self._failures += 1
+            self._consecutive_failures += 1
+            if was_probe or self._consecutive_failures >= self._failure_threshold:
+                if self._state != CIRCUIT_OPEN or was_probe:
+                    self._logger.warning(
+                        f"Platform {self.name} failing, circuit open for "
+                        f"{self._reset_timeout_seconds}s"
+                    )
+                self._state = CIRCUIT_OPEN
+                self._opened_at = self._clock()
+
+    def health(self) -> PlatformHealth:
+        with self._lock:
+            recent = list(self._recent)
+            return PlatformHealth(
+                name=self.name,
+                state=self._current_state(),
+                calls=self._calls,
+                failures=self._failures,
+                consecutive_failures=self._consecutive_failures,
+                error_rate=(
+                    sum(not ok for ok, _ in recent) / len(recent) if recent else 0.0
+                ),
+                mean_latency_seconds=(
+                    sum(latency for _, latency in recent) / len(recent)
+                    if recent
+                    else 0.0
+                ),
+            )
+
+    def _current_state(self) -> str:
+        if self._state == CIRCUIT_OPEN:
+            assert self._opened_at is not None  # set whenever circuit opens
+            if self._clock() - self._opened_at >= self._reset_timeout_seconds:
+                return CIRCUIT_HALF_OPEN
+        return self._state
@@ -4,6 +4,10 @@ from pathlib import Path
 from typing import Optional
 
 
+class PlatformError(Exception):
+    """Raised when a platform API call fails, unlike a video not being found."""
+
+
 @dataclass
 class VideoEngagement:
     views: int = 0
@@ -28,5 +32,14 @@ class PlatformApiBridge(ABC):
 
     @abstractmethod
     def get_engagement_metrics(self, video_url: str) -> Optional[VideoEngagement]:
-        """Fetches engagement metrics [views, likes, comments] for URL"""
+        """Fetches engagement metrics [views, likes, comments] for URL.
+
+        Returns None if video isn't found, raises PlatformError if the call fails.
+        """
         pass
+
+    def get_engagement_metrics_many(
+        self, video_urls: list[str]
+    ) -> list[Optional[VideoEngagement]]:
+        """Engagement metrics per URL, platforms with batch APIs override this"""
+        return [self.get_engagement_metrics(video_url) for video_url in video_urls]
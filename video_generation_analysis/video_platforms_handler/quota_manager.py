@@ -0,0 +1,114 @@
+import logging
+from datetime import date, datetime
+from typing import Callable, Mapping
+from zoneinfo import ZoneInfo
+
+from video_generation_analysis.config import (
+    YOUTUBE_DAILY_QUOTA,
+    YOUTUBE_QUOTA_COSTS,
+    YOUTUBE_QUOTA_TIMEZONE,
+    YOUTUBE_UPLOAD_RESERVE,
+)
+from video_generation_analysis.database_handler.database_handler import DatabaseHandler
+from video_generation_analysis.database_handler.query_builder import (
+    QueryBuilder,
+    WhereComparison,
+)
+from video_generation_analysis.database_handler.schema import QuotaBucket, to_datetime
+
+UPLOAD_OPERATION = "videos.insert"
+
+
+class QuotaExceededError(Exception):
+    """Raised when an API operation can't be afforded from remaining quota."""
+
+
+class QuotaManager:
+    """Token bucket of API quota units shared by all processes via SQLite.
+
+    The bucket is reset to daily_quota units at midnight of the quota day's
+    timezone, like the platform's own quota, so a day never spends more than
+    daily_quota. Each operation spends its configured cost; all but uploads
+    must leave upload_reserve units in the bucket, so a large metrics sweep is
+    deferred rather than starving the day's uploads.
+    """
+
+    def __init__(
+        self,
+        db_handler: DatabaseHandler,
+        bucket_name: str = "youtube",
+        daily_quota: float = YOUTUBE_DAILY_QUOTA,
+        costs: Mapping[str, float] = YOUTUBE_QUOTA_COSTS,
+        upload_reserve: float = YOUTUBE_UPLOAD_RESERVE,
+        timezone: str = YOUTUBE_QUOTA_TIMEZONE,
+        clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        self._logger: logging.Logger = logging.getLogger(__name__)
+        self._db_handler = db_handler
+        self._bucket_name = bucket_name
+        self._daily_quota = daily_quota
+        self._costs = costs
+        self._upload_reserve = upload_reserve
+        self._timezone = ZoneInfo(timezone)
+        self._clock = clock
+
+    def try_acquire(self, operation: str, count: int = 1) -> bool:
+        """Spend cost of count operations if affordable, returns whether spent.
+
+        All or nothing, so a batch never spends units it then can't use.
+        """
+        cost = self._costs[operation] * count
+        floor = 0.0 if operation == UPLOAD_OPERATION else self._upload_reserve
+        with self._db_handler as db:
+            db.begin_immediate()  # no other process can spend between read & write
+            bucket = self._read_bucket(db)
+            tokens = self._current_tokens(bucket)
+            if tokens - cost < floor:
+                return False
+            db.update(bucket.id, {"tokens": tokens - cost, "updated_at": self._clock()})
+        return True
+
+    def acquire(self, operation: str, count: int = 1) -> None:
+        """Spend cost of count operations, raises QuotaExceededError if unaffordable"""
+        if not self.try_acquire(operation, count):
+            self._logger.warning(
+                f"Quota '{self._bucket_name}' too low for {count} {operation}, "
+                "deferring"
+            )
+            raise QuotaExceededError(
+                f"Quota '{self._bucket_name}' can't afford {count} {operation}"
+            )
+
+    def available(self) -> float:
+        """Units currently in bucket, including a reset since last spend"""
+        with self._db_handler as db:
+            return self._current_tokens(self._read_bucket(db))
+
+    def _read_bucket(self, db: DatabaseHandler) -> QuotaBucket:
+        qb = QueryBuilder().where_compare(
+            "name", WhereComparison.EQUAL, self._bucket_name
+        )
+        buckets = db.read(qb)
+        if buckets:
+            return buckets[0]
+
+        db.create(
+            QuotaBucket(
+                name=self._bucket_name,
+                tokens=self._daily_quota,
+                updated_at=self._clock(),
+            )
+        )
+        return db.read(qb)[0]
+
+    def _current_tokens(self, bucket: QuotaBucket) -> float:
+        updated_at = to_datetime(bucket.updated_at)
+        if updated_at is None or self._quota_day(updated_at) != self._quota_day(
+            self._clock()
+        ):
+            return self._daily_quota  # reset since last spend
+        return float(bucket.tokens)
+
+    def _quota_day(self, moment: datetime) -> date:
+        """Quota day of moment, naive moments being local time"""
+        return moment.astimezone(self._timezone).date()
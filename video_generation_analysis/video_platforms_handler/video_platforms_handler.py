@@ -1,38 +1,229 @@
 import logging
+import time
 from pathlib import Path
+from typing import Callable, Optional, TypeVar
 
+from video_generation_analysis.config import (
+    PLATFORM_FAILURE_THRESHOLD,
+    PLATFORM_RESET_TIMEOUT_SECONDS,
+    PLATFORM_SLOW_CALL_SECONDS,
+)
+from video_generation_analysis.video_platforms_handler.circuit_breaker import (
+    CircuitBreaker,
+    PlatformHealth,
+)
 from video_generation_analysis.video_platforms_handler.platform_api_bridge import (
     PlatformApiBridge,
+    PlatformError,
     VideoEngagement,
 )
+from video_generation_analysis.video_platforms_handler.quota_manager import (
+    QuotaExceededError,
+)
+
+T = TypeVar("T")
+
+
+class PlatformUnavailableError(Exception):
+    """Raised when work for a platform is deferred, its circuit open or quota spent."""
+
+    def __init__(
+        self,
+        message: str,
+        retry_after_seconds: float = PLATFORM_RESET_TIMEOUT_SECONDS,
+    ) -> None:
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds  # when a probe is allowed
 
 
 class VideoPlatformsFacade:
-    """Facade to handle publishing videos to multiple platforms."""
+    """Facade to handle publishing videos to multiple platforms.
+
+    Each platform has a circuit breaker tracking its latency & failures; once
+    open, that platform is skipped instead of stalling every call on its
+    timeouts, until a probe call after the reset timeout succeeds.
+    """
 
-    def __init__(self, publishers: list[PlatformApiBridge]):
+    def __init__(
+        self,
+        publishers: list[PlatformApiBridge],
+        failure_threshold: int = PLATFORM_FAILURE_THRESHOLD,
+        reset_timeout_seconds: float = PLATFORM_RESET_TIMEOUT_SECONDS,
+        slow_call_seconds: float = PLATFORM_SLOW_CALL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self._publishers = publishers
         self._logger: logging.Logger = logging.getLogger(__name__)
+        self._slow_call_seconds = slow_call_seconds
+        self._reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+        self._breakers = [
+            CircuitBreaker(
+                f"{idx}:{publisher.__class__.__name__}",
+                failure_threshold=failure_threshold,
+                reset_timeout_seconds=reset_timeout_seconds,
+                clock=clock,
+            )
+            for idx, publisher in enumerate(publishers)
+        ]
+
+    def health(self) -> list[PlatformHealth]:
+        """Circuit state, error rate & latency of each platform"""
+        return [breaker.health() for breaker in self._breakers]
 
     def publish_to_all(
-        self, file_path: Path, title: str, description: str, tags: list[str]
+        self,
+        file_path: Path,
+        title: str,
+        description: str,
+        tags: list[str],
+        published: Optional[list[str]] = None,
+        on_published: Optional[Callable[[int, str], None]] = None,
     ) -> list[str]:
-        """Provides a simple interface to publish to all configured platforms"""
-        urls = []
-        for publisher in self._publishers:
+        """Provides a simple interface to publish to all configured platforms
+
+        Returns URLs by platform index, "" where the upload failed. published
+        holds URLs by platform index from an earlier partial run, those
+        platforms are skipped. on_published(index, url) is called after each
+        upload so progress can be persisted before the next one. A platform
+        failing doesn't stop uploads to the rest: afterwards PlatformError is
+        raised if any upload raised, else PlatformUnavailableError if any
+        platform's circuit is open or its quota spent, so the video is
+        published there on a later retry.
+        """
+        published = published or []
+        urls = [""] * len(self._publishers)
+        deferred = []
+        out_of_quota = []
+        errors = []
+        for idx, publisher in enumerate(self._publishers):
+            if idx < len(published) and published[idx]:
+                urls[idx] = published[idx]
+                continue
+            if not self._breakers[idx].allow():
+                deferred.append(self._breakers[idx].name)
+                continue
+
             self._logger.info(
                 f"Publishing video '{title}' to {publisher.__class__.__name__}"
             )
-            url = publisher.publish_video(file_path, title, description, tags)
+            try:
+                url = self._call(
+                    idx,
+                    lambda: publisher.publish_video(
+                        file_path, title, description, tags
+                    ),
+                    failed=lambda url: not url,
+                )
+            except QuotaExceededError as e:
+                self._logger.warning(
+                    f"Publishing to {self._breakers[idx].name} deferred: {e}"
+                )
+                out_of_quota.append(self._breakers[idx].name)
+                continue
+            except PlatformError as e:
+                errors.append(f"{self._breakers[idx].name}: {e}")
+                continue
             if url:
-                urls.append(url)
+                urls[idx] = url
+                if on_published is not None:
+                    on_published(idx, url)
+
+        if errors:
+            raise PlatformError(f"Video publishing failed on {errors}")
+        if deferred or out_of_quota:
+            raise PlatformUnavailableError(
+                f"Publishing deferred, circuit open: {deferred}, "
+                f"quota spent: {out_of_quota}",
+                retry_after_seconds=self._reset_timeout_seconds,
+            )
         return urls
 
-    def get_engagement_metrics_all(self, video_url: list[str]) -> VideoEngagement:
-        """Provides a simple interface to get engagement metrics from all platforms"""
+    def get_engagement_metrics_all(
+        self, video_url: list[str]
+    ) -> Optional[VideoEngagement]:
+        """Engagement metrics summed over all platforms.
+
+        None if any platform failed or has an open circuit, so the caller can
+        retry the video later rather than store a partial total. Platforms
+        without a URL for the video are skipped.
+        """
         total_engagement = VideoEngagement()
         for idx, publisher in enumerate(self._publishers):
-            engagement = publisher.get_engagement_metrics(video_url[idx])
+            url = video_url[idx] if idx < len(video_url) else ""
+            if not url:
+                continue
+            if not self._breakers[idx].allow():
+                return None
+            try:
+                engagement = self._call(
+                    idx,
+                    lambda: publisher.get_engagement_metrics(url),
+                    slow_call_seconds=self._slow_call_seconds,
+                )
+            except PlatformError:
+                return None
             if engagement:
                 total_engagement.add(engagement)
         return total_engagement
+
+    def get_engagement_metrics_batch(
+        self, video_urls: list[list[str]]
+    ) -> list[Optional[VideoEngagement]]:
+        """Engagement metrics summed over platforms for each video's URLs.
+
+        Each platform is asked for all videos in one call, so platforms with
+        batch APIs fetch them in a few requests instead of one per video.
+        All entries are None if any platform failed or has an open circuit.
+        """
+        totals = [VideoEngagement() for _ in video_urls]
+        for idx, publisher in enumerate(self._publishers):
+            # videos with a URL on this platform, built before the call so our
+            # own errors are never blamed on the platform
+            rows = [
+                row
+                for row, urls in enumerate(video_urls)
+                if idx < len(urls) and urls[idx]
+            ]
+            platform_urls = [video_urls[row][idx] for row in rows]
+            if not platform_urls:
+                continue
+            if not self._breakers[idx].allow():
+                return [None] * len(video_urls)
+            try:
+                engagements = self._call(
+                    idx,
+                    lambda: publisher.get_engagement_metrics_many(platform_urls),
+                    slow_call_seconds=self._slow_call_seconds,
+                )
+            except PlatformError:
+                return [None] * len(video_urls)
+            for row, engagement in zip(rows, engagements):
+                if engagement:
+                    totals[row].add(engagement)
+        return totals
+
+    def _call(
+        self,
+        idx: int,
+        operation: Callable[[], T],
+        failed: Callable[[T], bool] = lambda result: False,
+        slow_call_seconds: Optional[float] = None,
+    ) -> T:
+        """Run platform operation, recording its outcome & latency in its breaker"""
+        start = self._clock()
+        try:
+            result = operation()
+        except QuotaExceededError:
+            # our own budget, the platform was never called: no outcome to record
+            self._breakers[idx].release()
+            raise
+        except Exception as e:
+            self._breakers[idx].record(False, self._clock() - start)
+            self._logger.error(f"Platform {self._breakers[idx].name} call failed: {e}")
+            raise PlatformError(str(e)) from e
+
+        latency = self._clock() - start
+        slow = slow_call_seconds is not None and latency > slow_call_seconds
+        self._breakers[idx].record(not (failed(result) or slow), latency)
+        return result
@@ -1,8 +1,9 @@
 import logging
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+import httpx
 from dotenv import load_dotenv
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
@@ -17,19 +18,36 @@ from video_generation_analysis.config import (
 )
 from video_generation_analysis.video_platforms_handler.platform_api_bridge import (
     PlatformApiBridge,
+    PlatformError,
     VideoEngagement,
 )
+from video_generation_analysis.video_platforms_handler.quota_manager import (
+    QuotaManager,
+)
+from video_generation_analysis.video_platforms_handler.youtube_metrics import (
+    YouTubeMetricsTransport,
+)
 
 
 class YouTubeApiBridge(PlatformApiBridge):
-    def __init__(self):
+    def __init__(
+        self,
+        quota_manager: Optional[QuotaManager] = None,
+        service: Any = None,
+        metrics_transport: Optional[YouTubeMetricsTransport] = None,
+    ):
         load_dotenv()
+        self._quota_manager = quota_manager
+        self._metrics_transport = metrics_transport
         self._client_secrets = os.getenv(YOUTUBE_CLIENT_SECRETS_ENV, "")
         self._logger = logging.getLogger(__name__)
         self._YOUTUBE_URL_PREFIX = "https://www.youtube.com/watch?v="
         self._is_authenticated = False
 
-        if not self._client_secrets:
+        if service is not None:  # pre-built service, e.g. local fake
+            self._youtube_service = service
+            self._is_authenticated = True
+        elif not self._client_secrets:
             self._logger.error(
                 f"Failed {YOUTUBE_CLIENT_SECRETS_ENV} not found environment variable"
             )
@@ -44,6 +62,9 @@ class YouTubeApiBridge(PlatformApiBridge):
         if not video_path.is_file():
             raise OSError(f"File not found: {video_path}")
 
+        # QuotaExceededError propagates so the upload is deferred, not failed
+        self._spend_quota("videos.insert")
+
         if not self._is_authenticated:
             self._authenticate_youtube()
 
@@ -95,6 +116,9 @@ class YouTubeApiBridge(PlatformApiBridge):
             len(self._YOUTUBE_URL_PREFIX) :
         ]  # extract video ID from URL
 
+        # QuotaExceededError propagates so callers stop sweeping metrics
+        self._spend_quota("videos.list")
+
         if not self._is_authenticated:
             self._authenticate_youtube()
 
@@ -118,7 +142,34 @@ class YouTubeApiBridge(PlatformApiBridge):
 
         except HttpError as e:
             self._logger.error(f"YouTube API Fetching Engagement HTTP Error: {e}")
-            return None
+            raise PlatformError(f"YouTube videos.list failed: {e}") from e
+
+    def get_engagement_metrics_many(
+        self, video_urls: list[str]
+    ) -> list[Optional[VideoEngagement]]:
+        """Engagement metrics per URL, in batched async requests if transport set"""
+        if self._metrics_transport is None:
+            return super().get_engagement_metrics_many(video_urls)
+
+        video_ids = [url[len(self._YOUTUBE_URL_PREFIX) :] for url in video_urls]
+        # all requests paid at once, QuotaExceededError stops the metrics sweep
+        self._spend_quota(
+            "videos.list", self._metrics_transport.num_requests(len(set(video_ids)))
+        )
+        try:
+            engagements = self._metrics_transport.fetch_statistics(video_ids)
+        except httpx.HTTPError as e:
+            self._logger.error(f"YouTube API Fetching Engagement HTTP Error: {e}")
+            raise PlatformError(f"YouTube videos.list failed: {e}") from e
+
+        missing = [video_id for video_id in video_ids if video_id not in engagements]
+        if missing:
+            self._logger.warning(f"No videos found with IDs: {missing}")
+        return [engagements.get(video_id) for video_id in video_ids]
+
+    def _spend_quota(self, operation: str, count: int = 1) -> None:
+        if self._quota_manager is not None:
+            self._quota_manager.acquire(operation, count)
 
     def _authenticate_youtube(self):
         flow = InstalledAppFlow.from_client_secrets_file(
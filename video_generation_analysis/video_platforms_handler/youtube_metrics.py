@@ -0,0 +1,180 @@
+import asyncio
+import importlib.util
+import logging
+import random
+import threading
+from typing import Optional
+
+import httpx
+
+from video_generation_analysis.config import (
+    YOUTUBE_API_BASE_URL,
+    YOUTUBE_MAX_IDS_PER_LIST,
+    YOUTUBE_METRICS_MAX_CONCURRENCY,
+    YOUTUBE_METRICS_MAX_RETRIES,
+    YOUTUBE_METRICS_RETRY_BACKOFF_SECONDS,
+    YOUTUBE_METRICS_TIMEOUT_SECONDS,
+)
+from video_generation_analysis.telemetry.telemetry import AnySpan, current_span
+from video_generation_analysis.video_platforms_handler.platform_api_bridge import (
+    VideoEngagement,
+)
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class YouTubeMetricsTransport:
+    """Fetches video statistics with concurrent batched videos.list requests.
+
+    Each request asks for up to 50 video ids, at most max_concurrency are in
+    flight over one pooled keep-alive httpx client (HTTP/2 if the h2 package
+    is installed). Requests failing with 429/5xx or connection errors are
+    retried with jittered exponential backoff, so a sweep over thousands of
+    videos costs a few round trips instead of one per video. The client lives
+    on an event loop thread of its own, so connections are reused across
+    calls until close().
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = YOUTUBE_API_BASE_URL,
+        max_concurrency: int = YOUTUBE_METRICS_MAX_CONCURRENCY,
+        max_retries: int = YOUTUBE_METRICS_MAX_RETRIES,
+        timeout_seconds: float = YOUTUBE_METRICS_TIMEOUT_SECONDS,
+        retry_backoff_seconds: float = YOUTUBE_METRICS_RETRY_BACKOFF_SECONDS,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self._logger: logging.Logger = logging.getLogger(__name__)
+        self._api_key = api_key
+        self._base_url = base_url
+        self._max_concurrency = max_concurrency
+        self._max_retries = max_retries
+        self._timeout_seconds = timeout_seconds
+        self._retry_backoff_seconds = retry_backoff_seconds
+        self._transport = transport  # e.g. httpx.MockTransport in tests
+        self._http2 = transport is None and importlib.util.find_spec("h2") is not None
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._client: Optional[httpx.AsyncClient] = None  # used on loop thread only
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @staticmethod
+    def num_requests(num_videos: int) -> int:
+        """videos.list requests needed for num_videos, each costs quota"""
+        return -(-num_videos // YOUTUBE_MAX_IDS_PER_LIST)
+
+    def fetch_statistics(self, video_ids: list[str]) -> dict[str, VideoEngagement]:
+        """Engagement by video id, ids not found on YouTube are left out"""
+        if not video_ids:
+            return {}
+        # caller blocks until done, so loop thread can count on caller's span
+        return asyncio.run_coroutine_threadsafe(
+            self._fetch_all(list(dict.fromkeys(video_ids)), current_span()),
+            self._event_loop(),
+        ).result()
+
+    def close(self) -> None:
+        """Close pooled connections & stop event loop thread, reopened on next fetch"""
+        with self._lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is None or thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._close_client(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="youtube-metrics-loop",
+                    daemon=True,
+                )
+                self._loop_thread.start()
+            return self._loop
+
+    async def _close_client(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._semaphore = None
+
+    async def _fetch_all(
+        self, video_ids: list[str], span: AnySpan
+    ) -> dict[str, VideoEngagement]:
+        if self._client is None or self._semaphore is None:
+            limits = httpx.Limits(
+                max_connections=self._max_concurrency,
+                max_keepalive_connections=self._max_concurrency,
+            )
+            self._client = httpx.AsyncClient(
+                base_url=self._base_url,
+                http2=self._http2,
+                limits=limits,
+                timeout=self._timeout_seconds,
+                transport=self._transport,
+            )
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        client, semaphore = self._client, self._semaphore
+        chunks = [
+            video_ids[start : start + YOUTUBE_MAX_IDS_PER_LIST]
+            for start in range(0, len(video_ids), YOUTUBE_MAX_IDS_PER_LIST)
+        ]
+        results = await asyncio.gather(
+            *(self._fetch_chunk(client, semaphore, chunk, span) for chunk in chunks)
+        )
+
+        engagements = {}
+        for result in results:
+            engagements.update(result)
+        return engagements
+
+    async def _fetch_chunk(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        video_ids: list[str],
+        span: AnySpan,
+    ) -> dict[str, VideoEngagement]:
+        params = {"part": "statistics", "id": ",".join(video_ids), "key": self._api_key}
+        attempt = 0
+        async with semaphore:
+            while True:
+                try:
+                    response = await client.get("/videos", params=params)
+                    if response.status_code not in RETRY_STATUS_CODES:
+                        response.raise_for_status()
+                        return _parse_statistics(response.json())
+                    error = f"HTTP {response.status_code}"
+                except httpx.TransportError as e:
+                    error = str(e) or type(e).__name__
+
+                if attempt >= self._max_retries:
+                    raise httpx.HTTPError(
+                        f"videos.list failed after {attempt + 1} attempts: {error}"
+                    )
+                backoff = self._retry_backoff_seconds * 2**attempt
+                self._logger.warning(
+                    f"videos.list {error}, retry {attempt + 1} in {backoff:.2f}s"
+                )
+                span.add("retries")
+                await asyncio.sleep(backoff * random.uniform(0.5, 1.5))  # jitter
+                attempt += 1
+
+
+def _parse_statistics(response: dict) -> dict[str, VideoEngagement]:
+    engagements = {}
+    for item in response.get("items", []):
+        stats = item.get("statistics", {})
+        engagements[item["id"]] = VideoEngagement(
+            views=int(stats.get("viewCount", 0)),
+            likes=int(stats.get("likeCount", 0)),
+            comments=int(stats.get("commentCount", 0)),
+        )
+    return engagements